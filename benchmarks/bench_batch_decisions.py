@@ -0,0 +1,65 @@
+"""
+Benchmark: batch decisions vs sequential single calls (requests/sec).
+
+Library: N x decide() in sequence vs one decide_many() of N.
+HTTP (in-process ASGI, no network): N x POST /decision vs one POST /decision/batch.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_batch_decisions
+"""
+import asyncio
+import time
+
+import httpx
+
+from src.api import app
+from src.core.gate import decide, decide_many
+from src.core.models import DecisionRequest
+
+TEXTS = ["这个产品收益率多少？", "产品保本吗", "我要申请退款", "帮我改地址", "查订单物流"]
+BATCH_SIZES = (50, 500)
+ROUNDS = 5
+
+
+def _payloads(n: int) -> list:
+    return [{"text": TEXTS[i % len(TEXTS)], "debug": False} for i in range(n)]
+
+
+async def _rps(fn, n: int) -> float:
+    await fn()  # warm up (matrix load, table compile)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await fn()
+    return n * ROUNDS / (time.perf_counter() - start)
+
+
+async def main():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'mode':>8} {'batch':>6} {'sequential_rps':>15} {'batch_rps':>10}")
+        for n in BATCH_SIZES:
+            payloads = _payloads(n)
+            reqs = [DecisionRequest(**p) for p in payloads]
+
+            async def lib_sequential():
+                for r in reqs:
+                    await decide(r)
+
+            async def lib_batch():
+                await decide_many(reqs)
+
+            async def http_sequential():
+                for p in payloads:
+                    resp = await client.post("/decision", json=p)
+                    resp.raise_for_status()
+
+            async def http_batch():
+                resp = await client.post("/decision/batch", json={"requests": payloads})
+                resp.raise_for_status()
+
+            print(f"{'library':>8} {n:>6} {await _rps(lib_sequential, n):>15.0f} {await _rps(lib_batch, n):>10.0f}")
+            print(f"{'http':>8} {n:>6} {await _rps(http_sequential, n):>15.0f} {await _rps(http_batch, n):>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
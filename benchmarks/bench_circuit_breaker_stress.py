@@ -0,0 +1,201 @@
+"""
+Stress benchmark: CircuitBreaker under thousands of concurrent callers.
+
+A flaky provider behind one breaker with a short cooldown, so the breaker
+cycles CLOSED -> OPEN -> HALF_OPEN many times. A call times out
+(TIMEOUT_RATE), succeeds, or returns unavailable evidence (UNAVAILABLE_RATE,
+no outcome recorded). Probes in flight are counted per HALF_OPEN period and
+the maximum is checked against half_open_max_probes.
+
+- asyncio: CALLERS tasks awaiting between asking and reporting. With the
+  permit-less API (should_call_provider / record_*), a late success of a call
+  started before the circuit opened closes HALF_OPEN, and calls without an
+  outcome leak their probe slot for good (the breaker ends up skipping
+  every call). Permits (acquire_call / release_permit) prevent both.
+- threads: THREAD_COUNTS threads on one breaker (and racing on the registry),
+  ops/s and the probe invariant, against an unlocked breaker.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_circuit_breaker_stress
+"""
+import asyncio
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from src.core import gate_helpers
+from src.core.gate_helpers import CircuitBreaker, CircuitBreakerState
+
+CALLERS = 5000
+CALLS_PER_CALLER = 20
+THREAD_COUNTS = (1, 8, 32)
+THREAD_OPS = 20000
+MAX_PROBES = 2
+TIMEOUT_RATE = 0.45
+UNAVAILABLE_RATE = 0.1
+
+
+class _NoLock:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def _breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        "stress", timeout_threshold=3, initial_cooldown_ms=1, max_cooldown_ms=2,
+        half_open_max_probes=MAX_PROBES,
+    )
+
+
+class _ProbeTracker:
+    """Probes in flight per HALF_OPEN period (epoch) and the maximum seen."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = defaultdict(int)
+        self.max_in_flight = 0
+        self.probes = 0
+        self.stale_closes = 0
+
+    def start(self, epoch: int) -> None:
+        with self._lock:
+            self._in_flight[epoch] += 1
+            self.probes += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight[epoch])
+
+    def finish(self, epoch: int) -> None:
+        with self._lock:
+            self._in_flight[epoch] -= 1
+
+
+def _now_ms() -> int:
+    return int(time.monotonic() * 1000)
+
+
+def _report(breaker: CircuitBreaker, permit, probe: bool, rng: random.Random, tracker: _ProbeTracker):
+    outcome = rng.random()
+    if outcome < TIMEOUT_RATE:
+        breaker.record_timeout(_now_ms(), permit)
+    elif outcome < TIMEOUT_RATE + UNAVAILABLE_RATE:
+        if permit is not None:
+            breaker.release_permit(permit)
+    else:
+        half_open = breaker.state == CircuitBreakerState.HALF_OPEN
+        breaker.record_success(_now_ms(), permit)
+        if half_open and not probe and breaker.state == CircuitBreakerState.CLOSED:
+            tracker.stale_closes += 1
+
+
+async def _async_stress(use_permits: bool) -> tuple:
+    breaker, tracker, rng = _breaker(), _ProbeTracker(), random.Random(1)
+
+    async def caller():
+        for _ in range(CALLS_PER_CALLER):
+            if use_permits:
+                permit = breaker.acquire_call(_now_ms())
+                if permit is None:
+                    await asyncio.sleep(0)
+                    continue
+                probe, epoch = permit.probe, permit.epoch
+            else:
+                if not breaker.should_call_provider(_now_ms()):
+                    await asyncio.sleep(0)
+                    continue
+                # Legacy callers cannot tell; a call let through in HALF_OPEN is a probe.
+                probe = breaker.state == CircuitBreakerState.HALF_OPEN
+                epoch = breaker._half_open_epoch
+                permit = None
+            if probe:
+                tracker.start(epoch)
+            await asyncio.sleep(rng.random() * 0.002)
+            _report(breaker, permit, probe, rng, tracker)
+            if probe:
+                tracker.finish(epoch)
+
+    await asyncio.gather(*(caller() for _ in range(CALLERS)))
+    # Nothing is in flight any more: remaining probe slots are leaked.
+    await asyncio.sleep(0.01)
+    breaker.should_call_provider(_now_ms())
+    return tracker, breaker._half_open_probe_count, breaker.state.value
+
+
+def _thread_stress(threads: int, breaker: CircuitBreaker) -> tuple:
+    tracker = _ProbeTracker()
+    per_thread = THREAD_OPS // threads
+    barrier = threading.Barrier(threads)
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(per_thread):
+            permit = breaker.acquire_call(_now_ms())
+            if permit is None:
+                continue
+            if permit.probe:
+                tracker.start(permit.epoch)
+            _report(breaker, permit, permit.probe, rng, tracker)
+            if permit.probe:
+                tracker.finish(permit.epoch)
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return per_thread * threads / elapsed, tracker
+
+
+def _registry_race(threads: int) -> int:
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+    barrier = threading.Barrier(threads)
+    seen = []
+
+    def worker():
+        barrier.wait()
+        seen.append(id(gate_helpers.get_or_create_circuit_breaker_for_provider("stress")))
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+    return len(set(seen))
+
+
+def main():
+    print(f"asyncio: {CALLERS} callers x {CALLS_PER_CALLER} calls, half_open_max_probes={MAX_PROBES}")
+    print(f"{'api':<8} {'probes':>7} {'max_in_flight':>14} {'stale_closes':>13} "
+          f"{'leaked_slots':>13} {'final_state':>12}")
+    for api, use_permits in (("legacy", False), ("permits", True)):
+        tracker, leaked, state = asyncio.run(_async_stress(use_permits))
+        print(f"{api:<8} {tracker.probes:>7} {tracker.max_in_flight:>14} {tracker.stale_closes:>13} "
+              f"{leaked:>13} {state:>12}")
+
+    # Switch threads as often as possible to provoke check-then-act races.
+    sys.setswitchinterval(1e-6)
+    print()
+    print(f"{'lock':<8} {'threads':>7} {'ops_per_s':>11} {'probes':>7} {'max_in_flight':>14} "
+          f"{'registry_instances':>19}")
+    for threads in THREAD_COUNTS:
+        for lock in ("locked", "none"):
+            breaker = _breaker()
+            if lock == "none":
+                breaker._lock = _NoLock()
+            ops, tracker = _thread_stress(threads, breaker)
+            if lock == "locked":
+                assert tracker.max_in_flight <= MAX_PROBES, tracker.max_in_flight
+            registry = _registry_race(threads) if lock == "locked" else "-"
+            print(f"{lock:<8} {threads:>7} {ops:>11.0f} {tracker.probes:>7} {tracker.max_in_flight:>14} "
+                  f"{registry:>19}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: collect_all_evidence with and without per-request TextAnalysis reuse.
+
+"before" emulates the pre-memoization behaviour: every provider re-derives its
+facts (fresh analysis per access, keyword scans not shared).
+"after" is the current path where each fact is computed once per request.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_collect_evidence
+"""
+import asyncio
+import time
+
+from src.core import keyword_engine
+from src.core.gate_helpers import collect_all_evidence
+from src.core.models import GateContext
+from src.core.text_analysis import TextAnalysis
+
+TEXTS = {
+    "short": "我要申请退款，不处理就投诉",
+    "long": ("请帮我看看订单物流到哪了，另外这个政策能不能退，" * 400)[:10000],
+}
+ITERATIONS = 300
+
+
+class _RederivingContext(GateContext):
+    """Context whose analysis is rebuilt on every access (no sharing)."""
+
+    @property
+    def analysis(self):
+        return TextAnalysis(self.text)
+
+
+def _make_ctx(cls, text: str) -> GateContext:
+    return cls(
+        request_id="bench",
+        session_id=None,
+        user_id=None,
+        text=text,
+        debug=False,
+        verbose=False,
+        context={"role": "normal_user"},
+        structured_input=None,
+    )
+
+
+async def _time_us(cls, text: str, share_scans: bool) -> float:
+    cached_scan = keyword_engine._scan_cached
+    if not share_scans:
+        keyword_engine._scan_cached = lambda automaton, t: automaton.find_all(t)
+    try:
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            cached_scan.cache_clear()
+            await collect_all_evidence(_make_ctx(cls, text), [])
+        return (time.perf_counter() - start) / ITERATIONS * 1e6
+    finally:
+        keyword_engine._scan_cached = cached_scan
+
+
+async def main():
+    print(f"{'text':>6} {'before_us':>10} {'after_us':>10}")
+    for name, text in TEXTS.items():
+        before = await _time_us(_RederivingContext, text, share_scans=False)
+        after = await _time_us(GateContext, text, share_scans=True)
+        print(f"{name:>6} {before:>10.1f} {after:>10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
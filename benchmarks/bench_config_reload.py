@@ -0,0 +1,79 @@
+"""
+Benchmark: YAML config hot reload cost and its effect on request latency.
+
+Reports the off-path snapshot build (parse + validate + matrices + keyword
+automaton, in a worker thread), the on-loop swap, and decide() latency
+percentiles with and without a reload every RELOAD_EVERY_S while traffic runs.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_config_reload
+"""
+import asyncio
+import time
+
+from src.core import gate
+from src.core.config_manager import build_config_snapshot, install_config_snapshot, reload_config_async
+from src.core.models import DecisionRequest
+
+ROUNDS = 20
+REQUESTS = 3000
+RELOAD_EVERY_S = 0.05
+TEXTS = ["退款多久到账", "帮我查一下订单", "我要申请退款，不处理就投诉", "保本理财推荐一下"]
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def _latencies_us(reload: bool):
+    stop = asyncio.Event()
+    reloads = 0
+
+    async def reloader():
+        nonlocal reloads
+        while not stop.is_set():
+            await asyncio.sleep(RELOAD_EVERY_S)
+            await reload_config_async()
+            reloads += 1
+
+    task = asyncio.ensure_future(reloader()) if reload else None
+    samples = []
+    for i in range(REQUESTS):
+        req = DecisionRequest(text=TEXTS[i % len(TEXTS)], context={"role": "normal_user"})
+        start = time.perf_counter()
+        await gate.decide(req)
+        samples.append((time.perf_counter() - start) * 1e6)
+        # Let the reloader's thread hand-off run between requests.
+        await asyncio.sleep(0)
+    if task is not None:
+        stop.set()
+        await task
+    return samples, reloads
+
+
+async def main():
+    await gate.decide(DecisionRequest(text="warm-up"))
+
+    build_ms, install_us = [], []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        snapshot = build_config_snapshot()
+        build_ms.append((time.perf_counter() - start) * 1e3)
+        start = time.perf_counter()
+        install_config_snapshot(snapshot)
+        install_us.append((time.perf_counter() - start) * 1e6)
+
+    print(f"{'build_ms_p50':>13} {'build_ms_max':>13} {'swap_us_p50':>12} {'swap_us_max':>12}")
+    print(f"{_percentile(build_ms, 50):>13.2f} {max(build_ms):>13.2f} "
+          f"{_percentile(install_us, 50):>12.1f} {max(install_us):>12.1f}")
+    print()
+    print(f"{'mode':<14} {'reloads':>8} {'p50_us':>9} {'p99_us':>9} {'max_us':>9}")
+    for mode, reload in (("steady", False), ("reloading", True)):
+        samples, reloads = await _latencies_us(reload)
+        print(f"{mode:<14} {reloads:>8} {_percentile(samples, 50):>9.1f} "
+              f"{_percentile(samples, 99):>9.1f} {max(samples):>9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Benchmark: decide() latency and per-decision memory with the record-based pipeline.
+
+Modes:
+- "pydantic_ctx": emulates the previous pipeline, where the per-request context
+  was a validated GateContext model.
+- "records": current decide() (PipelineContext inside, DecisionResponse built
+  once at the end).
+- "outcome_only": the pipeline without materializing DecisionResponse
+  (what internal callers of _decide() pay).
+
+Latency is the mean over ITERATIONS sequential decisions; peak_kib is the mean
+tracemalloc peak above baseline while a single decision runs.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_decide_pipeline
+"""
+import asyncio
+import time
+import tracemalloc
+
+from src.core import gate
+from src.core.models import DecisionRequest, GateContext
+
+REQUESTS = {
+    "info": DecisionRequest(text="请问这个政策的退货时间是多久？"),
+    "refund": DecisionRequest(
+        text="我要申请退款",
+        context={"tool_id": "refund.create", "amount": 100, "order_id": "o-1"},
+        debug=True,
+    ),
+}
+ITERATIONS = 2000
+MEMORY_SAMPLES = 200
+
+
+async def _run_once(mode: str, req: DecisionRequest):
+    if mode == "outcome_only":
+        return await gate._decide(req, "matrices/v0.1.yaml", None)
+    return await gate.decide(req)
+
+
+async def _latency_us(mode: str, req: DecisionRequest) -> float:
+    for _ in range(50):
+        await _run_once(mode, req)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await _run_once(mode, req)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+async def _peak_kib(mode: str, req: DecisionRequest) -> float:
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(MEMORY_SAMPLES):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await _run_once(mode, req)
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - current
+        return total / MEMORY_SAMPLES / 1024
+    finally:
+        tracemalloc.stop()
+
+
+async def _measure(mode: str, req: DecisionRequest):
+    original = gate.PipelineContext
+    if mode == "pydantic_ctx":
+        gate.PipelineContext = GateContext
+    try:
+        return await _latency_us(mode, req), await _peak_kib(mode, req)
+    finally:
+        gate.PipelineContext = original
+
+
+async def main():
+    print(f"{'request':>8} {'mode':>13} {'latency_us':>11} {'peak_kib':>9}")
+    for name, req in REQUESTS.items():
+        for mode in ("pydantic_ctx", "records", "outcome_only"):
+            latency, peak = await _measure(mode, req)
+            print(f"{name:>8} {mode:>13} {latency:>11.1f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+"""
+Benchmark: decide() with the whole-decision cache off / on.
+
+Traffic mixes a small set of hot FAQ texts (HOT_SHARE of requests) with
+one-off texts, so it also shows frequency-based admission keeping the hot
+entries when the cache is smaller than the number of distinct requests.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_decision_cache
+"""
+import asyncio
+import random
+import time
+
+from src.core import gate
+from src.core.decision_cache import clear_decision_cache, decision_cache_stats
+from src.core.models import DecisionRequest
+from src.core.runtime_config import reload_runtime_config
+
+REQUESTS = 5000
+HOT_TEXTS = [f"退款多久到账？问题{i}" for i in range(20)]
+HOT_SHARE = 0.8
+CACHE_SIZE = 64
+
+
+def _traffic(seed: int = 7):
+    rng = random.Random(seed)
+    for i in range(REQUESTS):
+        if rng.random() < HOT_SHARE:
+            text = rng.choice(HOT_TEXTS)
+        else:
+            text = f"一次性问题 {i}"
+        yield DecisionRequest(text=text, context={"role": "normal_user"})
+
+
+async def _time_us(enabled: bool) -> float:
+    reload_runtime_config({
+        "AI_GATE_DECISION_CACHE_ENABLED": "true" if enabled else "false",
+        "AI_GATE_DECISION_CACHE_SIZE": str(CACHE_SIZE),
+    })
+    clear_decision_cache()
+    requests = list(_traffic())
+    start = time.perf_counter()
+    for req in requests:
+        await gate.decide(req)
+    return (time.perf_counter() - start) / REQUESTS * 1e6
+
+
+async def main():
+    await gate.decide(DecisionRequest(text="warm-up"))
+    off = await _time_us(False)
+    on = await _time_us(True)
+    stats = decision_cache_stats()
+    hit_pct = stats["hits"] / (stats["hits"] + stats["misses"]) * 100
+    reload_runtime_config()
+    print(f"{'cache_off_us':>13} {'cache_on_us':>12} {'hit_%':>7} {'rejected':>9} {'evicted':>8}")
+    print(f"{off:>13.1f} {on:>12.1f} {hit_pct:>7.1f} {stats['rejections']:>9} {stats['evictions']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
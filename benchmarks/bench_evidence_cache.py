@@ -0,0 +1,73 @@
+"""
+Benchmark: collect_all_evidence with the per-provider evidence cache off / on.
+
+"local" uses the YAML-backed providers; "remote" points permission and
+knowledge at the in-process fake server (own thread, SERVER_LATENCY_MS per
+call). Requests cycle through a few (role, text) combinations, as real
+traffic repeats the same permission / knowledge inputs.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_evidence_cache
+"""
+import asyncio
+import itertools
+import time
+
+from src.core import gate_helpers
+from src.core.models import GateContext
+from src.core.runtime_config import GateRuntimeConfig
+from src.evidence import http_provider
+from src.evidence.cache import clear_evidence_caches, evidence_cache_stats
+from src.evidence.fake_server import FakeEvidenceServerThread
+
+ITERATIONS = 1000
+SERVER_LATENCY_MS = 2.0
+ROLES = ("normal_user", "admin", "guest")
+TEXTS = ("我要申请退款", "查询订单物流", "帮我改一下收货地址", "这个产品保本吗")
+
+
+def _make_ctx(config: GateRuntimeConfig, role: str, text: str) -> GateContext:
+    ctx = GateContext(
+        request_id="bench",
+        session_id=None,
+        user_id=None,
+        text=text,
+        debug=False,
+        verbose=False,
+        context={"role": role},
+        structured_input=None,
+    )
+    object.__setattr__(ctx, "runtime_config", config)
+    return ctx
+
+
+async def _time_us(env) -> float:
+    config = GateRuntimeConfig.from_env(env)
+    clear_evidence_caches()
+    inputs = itertools.cycle(itertools.product(ROLES, TEXTS))
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        role, text = next(inputs)
+        await gate_helpers.collect_all_evidence(_make_ctx(config, role, text), [])
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+async def main():
+    print(f"{'providers':>10} {'cache_off_us':>13} {'cache_on_us':>12} {'perm_hit_%':>11}")
+    with FakeEvidenceServerThread(latency_ms=SERVER_LATENCY_MS) as server:
+        http_provider.get_shared_http_client()
+        remote = {
+            "AI_GATE_PERMISSION_PROVIDER_URL": server.base_url,
+            "AI_GATE_KNOWLEDGE_PROVIDER_URL": server.base_url,
+        }
+        for name, env in (("local", {}), ("remote", remote)):
+            off = await _time_us({**env, "AI_GATE_EVIDENCE_CACHE_ENABLED": "false"})
+            on = await _time_us(env)
+            perm = evidence_cache_stats()["permission"]
+            hit_pct = perm["hits"] / (perm["hits"] + perm["misses"]) * 100
+            print(f"{name:>10} {off:>13.1f} {on:>12.1f} {hit_pct:>11.1f}")
+        await http_provider.aclose_shared_http_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
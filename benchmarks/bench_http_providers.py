@@ -0,0 +1,83 @@
+"""
+Benchmark: remote permission + knowledge providers against the in-process
+fake server (on its own thread), with the shared keep-alive pool vs a
+connection per request.
+
+Each round runs N concurrent collect_all_evidence calls; reported
+latencies are per call, compared with the 80ms evidence budget.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_http_providers
+"""
+import asyncio
+import time
+
+from src.core import gate_helpers
+from src.core.models import GateContext
+from src.core.runtime_config import GateRuntimeConfig
+from src.evidence import http_provider
+from src.evidence.fake_server import FakeEvidenceServerThread
+
+ROUNDS = 50
+CONCURRENCY_LEVELS = (1, 8, 16)
+SERVER_LATENCY_MS = 2.0
+BUDGET_MS = 80.0
+
+
+def _make_ctx(config: GateRuntimeConfig) -> GateContext:
+    ctx = GateContext(
+        request_id="bench",
+        session_id=None,
+        user_id=None,
+        text="我要申请退款",
+        debug=False,
+        verbose=False,
+        context={"role": "normal_user"},
+        structured_input=None,
+    )
+    object.__setattr__(ctx, "runtime_config", config)
+    return ctx
+
+
+async def _one(config: GateRuntimeConfig) -> float:
+    start = time.perf_counter()
+    await gate_helpers.collect_all_evidence(_make_ctx(config), [])
+    return (time.perf_counter() - start) * 1000
+
+
+def _pct(sorted_ms, q: float) -> float:
+    return sorted_ms[min(len(sorted_ms) - 1, int(q * len(sorted_ms)))]
+
+
+async def _run(keepalive: bool, concurrency: int):
+    with FakeEvidenceServerThread(latency_ms=SERVER_LATENCY_MS) as server:
+        config = GateRuntimeConfig.from_env({
+            "AI_GATE_PERMISSION_PROVIDER_URL": server.base_url,
+            "AI_GATE_KNOWLEDGE_PROVIDER_URL": server.base_url,
+        })
+        http_provider.HTTP_MAX_KEEPALIVE_CONNECTIONS = 50 if keepalive else 0
+        http_provider.get_shared_http_client()
+        try:
+            await asyncio.gather(*(_one(config) for _ in range(concurrency)))  # warm-up
+            server.connections = 0
+            samples = []
+            for _ in range(ROUNDS):
+                samples.extend(await asyncio.gather(*(_one(config) for _ in range(concurrency))))
+        finally:
+            await http_provider.aclose_shared_http_client()
+        samples.sort()
+        over = sum(1 for s in samples if s > BUDGET_MS) / len(samples) * 100
+        return _pct(samples, 0.5), _pct(samples, 0.99), over, server.connections
+
+
+async def main():
+    print(f"{'mode':>10} {'conc':>5} {'p50_ms':>8} {'p99_ms':>8} {'over_budget_%':>14} {'connections':>12}")
+    for concurrency in CONCURRENCY_LEVELS:
+        for name, keepalive in (("pooled", True), ("no_reuse", False)):
+            p50, p99, over, conns = await _run(keepalive, concurrency)
+            print(f"{name:>10} {concurrency:>5} {p50:>8.2f} {p99:>8.2f} {over:>14.2f} {conns:>12}")
+    http_provider.HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
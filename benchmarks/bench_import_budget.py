@@ -0,0 +1,94 @@
+"""
+Benchmark: `python -c "import src.api"` wall time and peak RSS against a budget.
+
+Each run is a fresh interpreter (no policy bundle, so nothing is served from a
+prebuilt cache). Reports the median wall time, the median peak RSS of the
+child and the number of YAML files parsed during the import (0: configs load
+on first use, see src/core/config_registry.py).
+
+Exits with status 1 when a median exceeds the budget recorded in
+benchmarks/import_budget.json; --record rewrites the budget from this
+machine's measurement plus HEADROOM.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_import_budget [--record]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RUNS = 9
+HEADROOM = 1.5
+BUDGET_PATH = Path(__file__).with_name("import_budget.json")
+
+_CHILD = r"""
+import json, resource
+import yaml
+calls = []
+_safe_load = yaml.safe_load
+yaml.safe_load = lambda *a, **k: calls.append(1) or _safe_load(*a, **k)
+import src.api
+print(json.dumps({
+    "yaml_parses": len(calls),
+    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+
+def _run(bundle_path: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=".", AI_RESPONSIBILITY_GATE_POLICY_BUNDLE=bundle_path)
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    wall_ms = (time.perf_counter() - start) * 1e3
+    return dict(json.loads(out.strip().splitlines()[-1]), wall_ms=wall_ms)
+
+
+def measure() -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        missing = str(Path(tmp) / "missing.bundle")
+        _run(missing)  # warm the OS page cache and __pycache__
+        runs = [_run(missing) for _ in range(RUNS)]
+    return {
+        "wall_ms": statistics.median(r["wall_ms"] for r in runs),
+        "peak_rss_kb": statistics.median(r["peak_rss_kb"] for r in runs),
+        "yaml_parses": max(r["yaml_parses"] for r in runs),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--record", action="store_true", help="write the budget from this run")
+    args = parser.parse_args(argv)
+
+    result = measure()
+    if args.record:
+        budget = {
+            "wall_ms": round(result["wall_ms"] * HEADROOM),
+            "peak_rss_kb": round(result["peak_rss_kb"] * HEADROOM),
+            "yaml_parses": result["yaml_parses"],
+        }
+        BUDGET_PATH.write_text(json.dumps(budget, indent=2) + "\n", encoding="utf-8")
+    budget = json.loads(BUDGET_PATH.read_text(encoding="utf-8"))
+
+    print(f"{'metric':<12} {'median':>10} {'budget':>10}")
+    over = []
+    for metric in ("wall_ms", "peak_rss_kb", "yaml_parses"):
+        print(f"{metric:<12} {result[metric]:>10.0f} {budget[metric]:>10}")
+        if result[metric] > budget[metric]:
+            over.append(metric)
+    if over:
+        print(f"import budget exceeded: {', '.join(over)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Benchmark: collect_all_evidence with CPU-only providers run inline vs as tasks.
+
+"tasks" forces every provider through asyncio.wait_for + gather (the previous
+execution path); "inline" is the current path where @cpu_only providers run
+without a task or timer. Both are measured with the timeout guard off and on.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_inline_providers
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+from src.core import gate_helpers
+from src.core.models import GateContext
+from src.core.runtime_config import GateRuntimeConfig
+
+ITERATIONS = 3000
+TEXT = "我要申请退款，不处理就投诉"
+
+
+def _make_ctx() -> GateContext:
+    return GateContext(
+        request_id="bench",
+        session_id=None,
+        user_id=None,
+        text=TEXT,
+        debug=False,
+        verbose=False,
+        context={"role": "normal_user"},
+        structured_input=None,
+    )
+
+
+async def _time_us(config: GateRuntimeConfig) -> float:
+    with patch.object(gate_helpers, "get_runtime_config", return_value=config):
+        for _ in range(100):
+            await gate_helpers.collect_all_evidence(_make_ctx(), [])
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            await gate_helpers.collect_all_evidence(_make_ctx(), [])
+        return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+async def main():
+    print(f"{'guard':>6} {'tasks_us':>10} {'inline_us':>10} {'speedup':>8}")
+    for guard in (False, True):
+        config = GateRuntimeConfig.from_env(
+            {"AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED": "true" if guard else "false"}
+        )
+        with patch.object(gate_helpers, "is_cpu_only", return_value=False):
+            tasks = await _time_us(config)
+        inline = await _time_us(config)
+        print(f"{str(guard):>6} {tasks:>10.1f} {inline:>10.1f} {tasks / inline:>7.1f}x")
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+"""
+Benchmark: per-matcher `kw in text` loops vs one shared Aho-Corasick scan.
+
+The baseline replays what a request used to do: risk rules, routing hints
+(routing, tool and action routing), classifier and postcheck each loop over
+their own keywords. The shared engine scans once and every matcher reads its
+slice of the hit set. Synthetic keyword lists show how both scale.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_keyword_scan
+"""
+import random
+import time
+
+from src.core.keyword_engine import KeywordAutomaton
+from src.core.classifier import OPERATION_KEYWORDS
+from src.core.postcheck import GUARANTEE_KEYWORDS
+from src.evidence.risk import RULES
+from src.evidence.routing import ROUTING_HINTS
+
+TEXT_LENGTHS = (20, 1000, 10000)
+EXTRA_KEYWORDS = (0, 1000)
+
+
+def _keyword_groups(extra: int, rng: random.Random) -> list:
+    risk = [kw for rule in RULES for kw in rule.get("keywords", [])]
+    hints = [kw for hint in ROUTING_HINTS for kw in hint.get("keywords", [])]
+    synthetic = [
+        "".join(rng.choice("甲乙丙丁戊己庚辛壬癸子丑寅卯辰巳") for _ in range(3)) for _ in range(extra)
+    ]
+    # routing, tool and action routing each walk the routing hints.
+    return [risk + synthetic, hints, hints, hints, list(OPERATION_KEYWORDS), list(GUARANTEE_KEYWORDS)]
+
+
+def _make_text(length: int, keywords: list, rng: random.Random) -> str:
+    filler = "这是一个普通的客服咨询内容请帮我看一下谢谢"
+    chars = [rng.choice(filler) for _ in range(length)]
+    for _ in range(max(1, length // 200)):
+        kw = rng.choice(keywords)
+        pos = rng.randrange(0, max(1, length - len(kw)))
+        chars[pos:pos + len(kw)] = kw
+    return "".join(chars)[:length]
+
+
+def _time_us(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'keywords':>9} {'text_len':>9} {'loops_us':>10} {'shared_us':>10}")
+    for extra in EXTRA_KEYWORDS:
+        groups = _keyword_groups(extra, rng)
+        all_keywords = [kw for group in groups for kw in group]
+        automaton = KeywordAutomaton(all_keywords)
+        for length in TEXT_LENGTHS:
+            text = _make_text(length, all_keywords, rng)
+            repeat = max(20, 20000 // length)
+
+            def loops():
+                return [[kw for kw in group if kw in text] for group in groups]
+
+            def shared():
+                hits = automaton.find_all(text)
+                return [[kw for kw in group if kw in hits] for group in groups]
+
+            assert loops() == shared()
+            print(
+                f"{len(automaton):>9} {length:>9} "
+                f"{_time_us(loops, repeat):>10.1f} {_time_us(shared, repeat):>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: Matrix.match_rule cost as the number of rules grows.
+
+Builds synthetic matrices with N rules (N = 10 ... 5000) where the matching
+rule sits at the end of the list (worst case for a linear scan), then times
+the compiled index lookup against the reference linear scan.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_matrix_lookup
+"""
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from src.core.matrix import Matrix
+
+RULE_COUNTS = (10, 100, 1000, 5000)
+LOOKUPS = 20000
+
+
+def _synthetic_rules(n: int) -> list:
+    rules = []
+    for i in range(n - 1):
+        rules.append({
+            "rule_id": f"SYNTH_{i}",
+            "match": {"risk_level": f"R{i % 4}", "action_types": [f"ACTION_{i}"]},
+            "decision": "ONLY_SUGGEST",
+            "primary_reason": f"SYNTH_{i}",
+        })
+    # Target rule last: every linear scan must walk the full list.
+    rules.append({
+        "rule_id": "TARGET",
+        "match": {"risk_level": "R3", "action_types": ["MONEY"]},
+        "decision": "HITL",
+        "primary_reason": "TARGET",
+    })
+    return rules
+
+
+def _time_per_call_us(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    print(f"{'rules':>8} {'index_us':>10} {'linear_us':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in RULE_COUNTS:
+            path = Path(tmp) / f"matrix_{n}.yaml"
+            path.write_text(
+                yaml.safe_dump({"version": f"bench_{n}", "rules": _synthetic_rules(n)}),
+                encoding="utf-8",
+            )
+            matrix = Matrix(str(path))
+            assert matrix.match_rule("Information", "MONEY", "R3")["rule_id"] == "TARGET"
+
+            index_us = _time_per_call_us(
+                lambda: matrix.match_rule("Information", "MONEY", "R3"), LOOKUPS
+            )
+            linear_lookups = max(LOOKUPS // n, 20)
+            linear_us = _time_per_call_us(
+                lambda: matrix._scan_rules("MONEY", "R3"), linear_lookups
+            )
+            print(f"{n:>8} {index_us:>10.3f} {linear_us:>10.3f} {linear_us / index_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
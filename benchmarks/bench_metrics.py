@@ -0,0 +1,93 @@
+"""
+Benchmark: cost of the /metrics instrumentation on the decision hot path.
+
+Per decision the pipeline records one observe_decision() and five
+observe_evidence() calls. Reports that cost per store (in-process list, and
+the mmap'ed worker file used with AI_GATE_METRICS_DIR), decide() latency with
+the instrumentation replaced by no-ops vs live, and the time to render
+/metrics over WORKER_FILES worker files.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_metrics
+"""
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from src.core import gate, gate_helpers, metrics
+from src.core.models import DecisionRequest
+from src.core.runtime_config import reload_runtime_config
+
+OPS = 100_000
+DECISIONS = 2_000
+WORKER_FILES = 8
+PROVIDERS = ("tool", "routing", "knowledge", "risk", "permission")
+TEXTS = ["帮我查订单物流", "我要申请退款，不处理就投诉", "改价", "你好"]
+REASONS = tuple(f"REASON_{i}" for i in range(8))
+
+
+def _record_one_decision(i: int) -> None:
+    metrics.observe_decision("ALLOW", REASONS[i % len(REASONS)], "NONE", 0.0004)
+    for provider in PROVIDERS:
+        metrics.observe_evidence(provider, "OK", 0.00002)
+
+
+def _hot_path_us() -> float:
+    _record_one_decision(0)
+    start = time.perf_counter()
+    for i in range(OPS):
+        _record_one_decision(i)
+    return (time.perf_counter() - start) / OPS * 1e6
+
+
+def _decide_us() -> float:
+    requests = [DecisionRequest(text=TEXTS[i % len(TEXTS)]) for i in range(DECISIONS)]
+
+    async def run():
+        samples = []
+        for req in requests:
+            start = time.perf_counter()
+            await gate.decide(req)
+            samples.append(time.perf_counter() - start)
+        return statistics.median(samples) * 1e6
+
+    return asyncio.run(run())
+
+
+def main():
+    print(f"{'store':<10} {'per_decision_us':>16}")
+    metrics.reset_metrics()
+    print(f"{'memory':<10} {_hot_path_us():>16.2f}")
+    with tempfile.TemporaryDirectory() as tmp:
+        reload_runtime_config({"AI_GATE_METRICS_DIR": tmp})
+        metrics.reset_metrics()
+        print(f"{'mmap file':<10} {_hot_path_us():>16.2f}")
+
+        # Other workers' files, then one render over all of them.
+        own = metrics.get_metrics_store().path
+        for n in range(WORKER_FILES - 1):
+            (Path(tmp) / f"metrics_{10_000_000 + n}.db").write_bytes(own.read_bytes())
+        start = time.perf_counter()
+        text = metrics.render_metrics()
+        render_ms = (time.perf_counter() - start) * 1000
+        metrics.reset_metrics()
+        reload_runtime_config()
+    print(f"render over {WORKER_FILES} worker files: {render_ms:.2f} ms ({len(text.splitlines())} lines)")
+
+    print()
+    print(f"{'metrics':<8} {'decide_p50_us':>14}")
+    _decide_us()  # warm up configs, caches and automaton
+    live = (gate.observe_decision, gate_helpers.observe_evidence)
+    gate.observe_decision = lambda *args: None
+    gate_helpers.observe_evidence = lambda *args: None
+    try:
+        print(f"{'off':<8} {_decide_us():>14.1f}")
+    finally:
+        gate.observe_decision, gate_helpers.observe_evidence = live
+    print(f"{'on':<8} {_decide_us():>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
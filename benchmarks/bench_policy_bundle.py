@@ -0,0 +1,87 @@
+"""
+Benchmark: cold start from YAML vs the compiled policy bundle.
+
+Each run is a fresh interpreter that imports src.api, then serves its first
+decision (matrix load + decision table compile on the YAML path). Config load
+time is the time spent in yaml.safe_load / reading the bundle.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_policy_bundle
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+RUNS = 7
+
+_CHILD = r"""
+import json, time
+start = time.perf_counter()
+import yaml
+config_s = 0.0
+_safe_load = yaml.safe_load
+def timed_safe_load(*args, **kwargs):
+    global config_s
+    t = time.perf_counter()
+    try:
+        return _safe_load(*args, **kwargs)
+    finally:
+        config_s += time.perf_counter() - t
+yaml.safe_load = timed_safe_load
+from src.core import policy_bundle
+_read = policy_bundle.read_policy_bundle
+def timed_read(path):
+    global config_s
+    t = time.perf_counter()
+    try:
+        return _read(path)
+    finally:
+        config_s += time.perf_counter() - t
+policy_bundle.read_policy_bundle = timed_read
+
+import asyncio
+import src.api
+from src.core.gate import decide
+from src.core.models import DecisionRequest
+imported = time.perf_counter()
+asyncio.run(decide(DecisionRequest(text="退款多久到账")))
+done = time.perf_counter()
+print(json.dumps({
+    "bundle": policy_bundle.get_policy_bundle() is not None,
+    "import_ms": (imported - start) * 1e3,
+    "first_decision_ms": (done - imported) * 1e3,
+    "config_ms": config_s * 1e3,
+}))
+"""
+
+
+def _run(bundle_path: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=".", AI_RESPONSIBILITY_GATE_POLICY_BUNDLE=bundle_path)
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle = str(Path(tmp) / "policy.bundle")
+        subprocess.run(
+            [sys.executable, "-m", "src.core.policy_bundle", "--output", bundle],
+            env=dict(os.environ, PYTHONPATH="."), check=True, capture_output=True,
+        )
+        print(f"{'mode':<8} {'import_ms':>10} {'first_decision_ms':>18} {'config_ms':>10}")
+        for mode, path in (("yaml", str(Path(tmp) / "missing.bundle")), ("bundle", bundle)):
+            runs = [_run(path) for _ in range(RUNS)]
+            assert all(r["bundle"] == (mode == "bundle") for r in runs)
+            print(f"{mode:<8} {statistics.median(r['import_ms'] for r in runs):>10.1f} "
+                  f"{statistics.median(r['first_decision_ms'] for r in runs):>18.1f} "
+                  f"{statistics.median(r['config_ms'] for r in runs):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: per-process vs shared circuit breakers across worker processes.
+
+WORKERS processes each serve REQUESTS requests against a dead provider: a
+request the breaker lets through pays the full provider budget (80 ms, not
+slept here) and records a timeout. Reports the timeouts paid host-wide before
+every breaker is open, and the cost of one should_call_provider() +
+record_success() pair per backend.
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.bench_shared_circuit_breaker
+"""
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from src.core.gate_helpers import EVIDENCE_PROVIDER_TIMEOUT_S, CircuitBreaker
+from src.core.shared_circuit_breaker import SharedBreakerSegment, SharedCircuitBreaker
+
+WORKERS = 16
+REQUESTS = 50
+THRESHOLD = 3
+OPS = 20000
+
+
+def _breaker(segment_path):
+    if segment_path is None:
+        return CircuitBreaker("permission", timeout_threshold=THRESHOLD)
+    return SharedCircuitBreaker(
+        "permission", SharedBreakerSegment(Path(segment_path)), timeout_threshold=THRESHOLD,
+    )
+
+
+def _worker(segment_path) -> int:
+    breaker = _breaker(segment_path)
+    paid = 0
+    now_ms = int(time.time() * 1000)
+    for _ in range(REQUESTS):
+        if breaker.should_call_provider(now_ms):
+            paid += 1
+            breaker.record_timeout(now_ms)
+    return paid
+
+
+def _op_us(segment_path) -> float:
+    breaker = _breaker(segment_path)
+    start = time.perf_counter()
+    for i in range(OPS):
+        breaker.should_call_provider(i)
+        breaker.record_success(i)
+    return (time.perf_counter() - start) / OPS * 1e6
+
+
+def main():
+    ctx = multiprocessing.get_context("fork")
+    print(f"{'backend':<8} {'workers':>8} {'timeouts_paid':>14} {'budget_burned_ms':>17} {'op_pair_us':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend, path in (("memory", None), ("shared", str(Path(tmp) / "breakers"))):
+            with ctx.Pool(WORKERS) as pool:
+                paid = sum(pool.map(_worker, [path] * WORKERS))
+            op_path = None if path is None else str(Path(tmp) / "breakers-ops")
+            print(f"{backend:<8} {WORKERS:>8} {paid:>14} "
+                  f"{paid * EVIDENCE_PROVIDER_TIMEOUT_S * 1000:>17.0f} {_op_us(op_path):>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
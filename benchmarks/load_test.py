@@ -0,0 +1,356 @@
+"""
+Load test: what one worker of src.api:app sustains on /decision and /feedback.
+
+Drives the app in process through httpx's ASGI transport (no network; the app's
+lifespan runs around the test, and /feedback writes to a temporary file), or a
+running server given by --url (start one with
+`python3 -m uvicorn src.api:app --port 8000`; its /feedback appends to its own
+data/feedback.jsonl).
+
+Modes:
+- closed: --concurrency workers, each sending its next request when the
+  previous one completes.
+- open: requests start at a fixed --rate whether or not earlier ones have
+  completed; latency is measured from each request's scheduled start, so
+  queueing behind a saturated worker is counted. At most --max-in-flight
+  requests are outstanding; requests beyond that are counted as dropped.
+
+Requests follow --mix (endpoint=weight): /decision bodies are the turn inputs
+of the replay cases (cases/*.json), /feedback bodies pair a synthetic trace id
+with a case's expected decision, and the sequence is seeded. Reports
+throughput, p50/p95/p99/p99.9/max latency and error rate per endpoint and
+overall, and the event-loop lag seen by a LAG_INTERVAL_S sleeper (in process
+this is the app's own loop).
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.load_test [--mode closed --concurrency 16 | --mode open --rate 500] [--duration 10] [--mix decision=9,feedback=1] [--url http://127.0.0.1:8000] [--output load.json]
+    PYTHONPATH=. python3 -m benchmarks.load_test --compare base.json head.json [--threshold 10]
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from benchmarks.suite import CASES_DIR, git_revision, percentile
+
+SCHEMA_VERSION = 1
+SEED = 7
+LAG_INTERVAL_S = 0.01
+PERCENTILES = (50, 95, 99, 99.9)
+# Error rate is compared in absolute terms: a rise above this is a regression.
+ERROR_RATE_TOLERANCE = 0.01
+DEFAULT_THRESHOLD_PCT = 10.0
+ENDPOINTS = {"decision": "/decision", "feedback": "/feedback"}
+
+
+def parse_mix(spec: str) -> dict:
+    """"decision=9,feedback=1" -> {"decision": 9.0, "feedback": 1.0}."""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"unknown endpoint in mix: {name!r} (known: {', '.join(ENDPOINTS)})")
+        mix[name] = float(weight or 1)
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("mix needs a positive weight")
+    return mix
+
+
+def case_payloads(cases_dir: Path = CASES_DIR) -> tuple:
+    """/decision bodies and expected decisions of the replay cases' turns."""
+    bodies, expected = [], []
+    for path in sorted(Path(cases_dir).glob("*.json")):
+        case = json.loads(path.read_text(encoding="utf-8"))
+        turns = case.get("turns") or [{"input": case["input"], "expected": case.get("expected", {})}]
+        for turn in turns:
+            bodies.append({k: v for k, v in turn["input"].items() if k in ("text", "session_id", "user_id", "context")})
+            expected.append(turn.get("expected_decision") or turn.get("expected", {}).get("decision") or "ALLOW")
+    return bodies, expected
+
+
+class RequestMix:
+    """Seeded sequence of (endpoint, JSON body) following the mix weights."""
+
+    def __init__(self, mix: dict, cases_dir: Path = CASES_DIR, seed: int = SEED):
+        self._rng = random.Random(seed)
+        self._names = list(mix)
+        self._weights = [mix[name] for name in self._names]
+        self._bodies, self._expected = case_payloads(cases_dir)
+        self._sent = 0
+
+    def next(self) -> tuple:
+        name = self._rng.choices(self._names, self._weights)[0]
+        i = self._sent % len(self._bodies)
+        self._sent += 1
+        if name == "decision":
+            return name, self._bodies[i]
+        return name, {
+            "trace_id": f"load-{self._sent}",
+            "gate_decision": self._expected[i],
+            "human_decision": self._expected[i],
+            "reason_code": "LOAD_TEST",
+        }
+
+
+class Recorder:
+    """Per-request outcomes and the event-loop lag samples of one run."""
+
+    def __init__(self):
+        # (endpoint, status code or 0 on a client error, latency seconds)
+        self.results = []
+        self.dropped = 0
+        self.lags = []
+
+    async def send(self, client: httpx.AsyncClient, name: str, body: dict, started: float) -> None:
+        try:
+            response = await client.post(ENDPOINTS[name], json=body)
+            status = response.status_code
+        except httpx.HTTPError:
+            status = 0
+        self.results.append((name, status, time.perf_counter() - started))
+
+    async def monitor_lag(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(LAG_INTERVAL_S)
+            self.lags.append(time.perf_counter() - start - LAG_INTERVAL_S)
+
+
+async def _closed_loop(client, recorder: Recorder, requests: RequestMix, concurrency: int, duration_s: float):
+    deadline = time.perf_counter() + duration_s
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            name, body = requests.next()
+            await recorder.send(client, name, body, time.perf_counter())
+            # In process nothing suspends on I/O: yield so the other workers
+            # and the lag monitor get the loop between requests.
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def _open_loop(client, recorder: Recorder, requests: RequestMix, rate: float, duration_s: float,
+                     max_in_flight: int):
+    start = time.perf_counter()
+    in_flight = set()
+    for i in range(int(rate * duration_s)):
+        scheduled = start + i / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        name, body = requests.next()
+        if len(in_flight) >= max_in_flight:
+            recorder.dropped += 1
+            continue
+        task = asyncio.create_task(recorder.send(client, name, body, scheduled))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+    if in_flight:
+        await asyncio.gather(*in_flight)
+
+
+def _latency_stats(latencies: list) -> dict:
+    ordered = sorted(latencies)
+    stats = {f"p{p:g}_ms": round(percentile(ordered, p) * 1000, 3) for p in PERCENTILES}
+    stats["max_ms"] = round(ordered[-1] * 1000, 3)
+    return stats
+
+
+def summarize(recorder: Recorder, elapsed_s: float) -> dict:
+    """Per endpoint and overall: requests, errors, error rate, throughput, latency."""
+    groups = {"overall": recorder.results}
+    for name in ENDPOINTS:
+        group = [r for r in recorder.results if r[0] == name]
+        if group:
+            groups[name] = group
+    summary = {}
+    for name, group in groups.items():
+        if not group:
+            continue
+        errors = sum(1 for _, status, _ in group if not 200 <= status < 400)
+        summary[name] = {
+            "requests": len(group),
+            "errors": errors,
+            "error_rate": round(errors / len(group), 4),
+            "throughput_rps": round(len(group) / elapsed_s, 1),
+            **_latency_stats([latency for _, _, latency in group]),
+        }
+    return summary
+
+
+async def _run(args, mix: dict) -> dict:
+    requests = RequestMix(mix, Path(args.cases_dir), args.seed)
+    recorder = Recorder()
+
+    async def drive(client):
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(recorder.monitor_lag(stop))
+        start = time.perf_counter()
+        if args.mode == "closed":
+            await _closed_loop(client, recorder, requests, args.concurrency, args.duration)
+        else:
+            await _open_loop(client, recorder, requests, args.rate, args.duration, args.max_in_flight)
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await lag_task
+        return elapsed
+
+    limits = httpx.Limits(max_connections=max(args.concurrency, args.max_in_flight))
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+            elapsed = await drive(client)
+    else:
+        from src.api import app
+        from src.feedback import store
+
+        feedback_file = store.FEEDBACK_FILE
+        with tempfile.TemporaryDirectory() as tmp:
+            store.FEEDBACK_FILE = Path(tmp) / "feedback.jsonl"
+            try:
+                transport = httpx.ASGITransport(app=app)
+                async with app.router.lifespan_context(app):
+                    async with httpx.AsyncClient(transport=transport, base_url="http://gate",
+                                                 timeout=args.timeout) as client:
+                        elapsed = await drive(client)
+            finally:
+                store.FEEDBACK_FILE = feedback_file
+
+    lags = sorted(recorder.lags) or [0.0]
+    return {
+        "schema": SCHEMA_VERSION,
+        "revision": git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "target": args.url or "asgi",
+        "mode": args.mode,
+        "config": {
+            "duration_s": args.duration,
+            "concurrency": args.concurrency if args.mode == "closed" else None,
+            "rate_rps": args.rate if args.mode == "open" else None,
+            "max_in_flight": args.max_in_flight if args.mode == "open" else None,
+            "mix": mix,
+            "seed": args.seed,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "dropped": recorder.dropped,
+        "endpoints": summarize(recorder, elapsed),
+        "loop_lag_ms": {
+            "p50": round(percentile(lags, 50) * 1000, 3),
+            "p99": round(percentile(lags, 99) * 1000, 3),
+            "max": round(lags[-1] * 1000, 3),
+        },
+    }
+
+
+# metric -> True when higher is better
+COMPARED_METRICS = {"throughput_rps": True, "p50_ms": False, "p99_ms": False, "p99.9_ms": False}
+
+
+def compare(base: dict, head: dict, threshold_pct: float = DEFAULT_THRESHOLD_PCT) -> list:
+    """
+    Per endpoint present in both runs: each compared metric's change (percent,
+    positive = worse) and whether it regressed beyond threshold_pct, plus the
+    error rate's absolute change against ERROR_RATE_TOLERANCE.
+    """
+    rows = []
+    for name, head_stats in head["endpoints"].items():
+        base_stats = base["endpoints"].get(name)
+        if base_stats is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            before, after = base_stats[metric], head_stats[metric]
+            if before == 0:
+                continue
+            change = (after - before) / before * 100
+            if higher_is_better:
+                change = -change
+            rows.append({
+                "endpoint": name, "metric": metric, "base": before, "head": after,
+                "change_pct": round(change, 1), "regression": change > threshold_pct,
+            })
+        before, after = base_stats["error_rate"], head_stats["error_rate"]
+        rows.append({
+            "endpoint": name, "metric": "error_rate", "base": before, "head": after,
+            "change_pct": round((after - before) * 100, 1),
+            "regression": after - before > ERROR_RATE_TOLERANCE,
+        })
+    return rows
+
+
+def print_results(results: dict) -> None:
+    config = results["config"]
+    load = f"concurrency={config['concurrency']}" if results["mode"] == "closed" else f"rate={config['rate_rps']}/s"
+    print(f"target {results['target']}  mode {results['mode']} {load}  {results['elapsed_s']}s  "
+          f"revision {results['revision'][:12]}")
+    print(f"{'endpoint':<10} {'requests':>9} {'err_rate':>9} {'rps':>9} {'p50_ms':>8} {'p95_ms':>8} "
+          f"{'p99_ms':>8} {'p999_ms':>8} {'max_ms':>8}")
+    for name, s in results["endpoints"].items():
+        print(f"{name:<10} {s['requests']:>9} {s['error_rate']:>9.4f} {s['throughput_rps']:>9.1f} "
+              f"{s['p50_ms']:>8.2f} {s['p95_ms']:>8.2f} {s['p99_ms']:>8.2f} {s['p99.9_ms']:>8.2f} "
+              f"{s['max_ms']:>8.2f}")
+    lag = results["loop_lag_ms"]
+    print(f"event-loop lag ms: p50 {lag['p50']:.2f}  p99 {lag['p99']:.2f}  max {lag['max']:.2f}"
+          f"  dropped {results['dropped']}")
+
+
+def print_comparison(rows: list, threshold_pct: float) -> bool:
+    """Print the comparison; True when something regressed."""
+    print(f"{'endpoint':<10} {'metric':<15} {'base':>10} {'head':>10} {'worse_%':>8}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['endpoint']:<10} {row['metric']:<15} {row['base']:>10.3f} {row['head']:>10.3f} "
+              f"{row['change_pct']:>8.1f}{flag}")
+    regressed = [row for row in rows if row["regression"]]
+    print(f"{len(regressed)} regression(s) (threshold {threshold_pct:g}%, "
+          f"error rate +{ERROR_RATE_TOLERANCE * 100:g} points)")
+    return bool(regressed)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mode", choices=("closed", "open"), default="closed")
+    parser.add_argument("--concurrency", type=int, default=16, help="closed loop: concurrent workers")
+    parser.add_argument("--rate", type=float, default=200.0, help="open loop: requests per second")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="open loop: outstanding request cap")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--mix", default="decision=9,feedback=1", help="endpoint=weight,...")
+    parser.add_argument("--url", help="base URL of a running server (default: in process)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout (seconds)")
+    parser.add_argument("--cases-dir", default=str(CASES_DIR))
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE_JSON", "HEAD_JSON"))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT, help="percent")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        base, head = (json.loads(Path(p).read_text(encoding="utf-8")) for p in args.compare)
+        for key in ("target", "mode", "config"):
+            if base[key] != head[key]:
+                print(f"warning: runs differ in {key}: {base[key]} vs {head[key]}")
+        return int(print_comparison(compare(base, head, args.threshold), args.threshold))
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    results = asyncio.run(_run(args, mix))
+    print_results(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+"""
+Benchmark suite: the decision pipeline and its hot components, with
+machine-readable results and regression checks between revisions.
+
+Workloads (inputs are the turns of the replay cases, cases/*.json, plus
+SYNTHETIC seeded synthetic texts, so every run measures the same work; default runtime
+configuration, caches included):
+
+- decide: decide() per turn
+- collect_all_evidence: evidence collection per turn
+- risk.collect: the risk provider per turn
+- matrix.match_rule: Matrix.match_rule over every (type, action, risk) combination
+- circuit_breaker.should_call_provider: a CLOSED breaker
+
+Each workload reports throughput (ops/s), latency percentiles (p50/p90/p99/max
+in microseconds; sub-microsecond ops are timed in batches of BATCH and divided)
+and allocations from a separate tracemalloc pass (peak KiB above baseline per
+op, and allocated blocks still alive per op).
+
+Usage:
+    PYTHONPATH=. python3 -m benchmarks.suite [--workload NAME ...] [--quick] [--output results.json]
+    PYTHONPATH=. python3 -m benchmarks.suite --compare base.json head.json [--threshold 10]
+    PYTHONPATH=. python3 -m benchmarks.suite --revisions BASE HEAD [--threshold 10] [--output-dir DIR]
+
+--compare and --revisions exit with status 1 when a workload regresses by
+more than --threshold percent (p50 latency, throughput or peak allocation).
+--revisions checks both revisions out into temporary git worktrees and runs
+this suite (from the current tree, on the current cases/) against each; only
+committed files are in a worktree, and a workload whose setup fails on a
+revision is reported as an error and left out of the comparison.
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+SCHEMA_VERSION = 1
+SEED = 7
+SYNTHETIC = 64
+ITERATIONS = 2000
+QUICK_ITERATIONS = 100
+WARMUP = 50
+ALLOC_SAMPLES = 100
+DEFAULT_THRESHOLD_PCT = 10.0
+
+CASES_DIR = Path(__file__).resolve().parent.parent / "cases"
+_FRAGMENTS = (
+    "帮我查订单物流", "我要申请退款", "不处理就投诉", "这个政策能不能退", "改价", "你好",
+    "我要买一百万，帮我操作", "保证收益吗", "修改收货地址", "开通管理员权限", "订单号 123456",
+    "谢谢", "请问", "马上", "金额 5000 元",
+)
+
+
+def case_inputs(cases_dir: Path = CASES_DIR) -> list:
+    """Turn inputs of the replay cases (cases_dir/*.json, sorted)."""
+    inputs = []
+    for path in sorted(Path(cases_dir).glob("*.json")):
+        case = json.loads(path.read_text(encoding="utf-8"))
+        turns = case.get("turns") or [{"input": case["input"]}]
+        inputs.extend(turn["input"] for turn in turns)
+    return inputs
+
+
+def synthetic_inputs(n: int = SYNTHETIC, seed: int = SEED) -> list:
+    rng = random.Random(seed)
+    return [
+        {"text": "，".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(1, 4)))}
+        for _ in range(n)
+    ]
+
+
+def _requests(cases_dir: Path) -> list:
+    from src.core.models import DecisionRequest
+
+    requests = []
+    for data in case_inputs(cases_dir) + synthetic_inputs():
+        requests.append(DecisionRequest(
+            session_id=data.get("session_id"),
+            user_id=data.get("user_id"),
+            text=data.get("text"),
+            structured_input=data.get("structured_input"),
+            debug=data.get("debug", False),
+            context=data.get("context"),
+        ))
+    return requests
+
+
+def _contexts(cases_dir: Path) -> list:
+    from src.core.models import GateContext
+
+    return [
+        GateContext(
+            request_id=f"bench-{i}", session_id=req.session_id, user_id=req.user_id,
+            text=req.text, debug=False, verbose=False, context=req.context,
+            structured_input=req.structured_input,
+        )
+        for i, req in enumerate(_requests(cases_dir))
+    ]
+
+
+# Workload builders: (cases_dir) -> list of zero-argument ops (plain or async),
+# run round-robin.
+
+def _decide_ops(cases_dir: Path) -> list:
+    from src.core.gate import decide
+
+    return [lambda req=req: decide(req) for req in _requests(cases_dir)]
+
+
+def _collect_all_evidence_ops(cases_dir: Path) -> list:
+    from src.core.gate_helpers import collect_all_evidence
+
+    return [lambda ctx=ctx: collect_all_evidence(ctx, []) for ctx in _contexts(cases_dir)]
+
+
+def _risk_collect_ops(cases_dir: Path) -> list:
+    from src.evidence.risk import collect
+
+    return [lambda ctx=ctx: collect(ctx) for ctx in _contexts(cases_dir)]
+
+
+def _match_rule_ops(cases_dir: Path) -> list:
+    from src.core.matrix import load_matrix
+
+    matrix = load_matrix("matrices/v0.1.yaml")
+    resp_types = ("Information", "RiskNotice", "EntitlementDecision", "Unknown")
+    action_types = ("READ", "WRITE", "MONEY", "ENTITLEMENT", "POLICY", "OTHER")
+    risk_levels = ("R0", "R1", "R2", "R3", "R9")
+    return [
+        lambda r=r, a=a, k=k: matrix.match_rule(r, a, k)
+        for r in resp_types for a in action_types for k in risk_levels
+    ]
+
+
+def _should_call_provider_ops(cases_dir: Path) -> list:
+    from src.core.gate_helpers import CircuitBreaker
+
+    breaker = CircuitBreaker("bench")
+    return [lambda: breaker.should_call_provider(1_000)]
+
+
+# name -> (builder, ops per timing sample)
+WORKLOADS = {
+    "decide": (_decide_ops, 1),
+    "collect_all_evidence": (_collect_all_evidence_ops, 1),
+    "risk.collect": (_risk_collect_ops, 1),
+    "matrix.match_rule": (_match_rule_ops, 100),
+    "circuit_breaker.should_call_provider": (_should_call_provider_ops, 100),
+}
+
+
+async def _call(op):
+    result = op()
+    if inspect.isawaitable(result):
+        await result
+
+
+async def _is_async(ops: list) -> bool:
+    result = ops[0]()
+    if inspect.isawaitable(result):
+        await result
+        return True
+    return False
+
+
+async def _latencies_ns(ops: list, iterations: int, batch: int) -> tuple:
+    """Per-sample latency (ns per op) and total wall time of iterations samples."""
+    for i in range(WARMUP):
+        await _call(ops[i % len(ops)])
+    is_async = await _is_async(ops)
+    samples = []
+    position = 0
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        sample_start = time.perf_counter_ns()
+        for _ in range(batch):
+            # Sync ops are called directly so the harness adds no await.
+            if is_async:
+                await ops[position]()
+            else:
+                ops[position]()
+            position = position + 1 if position + 1 < len(ops) else 0
+        samples.append((time.perf_counter_ns() - sample_start) / batch)
+    return samples, time.perf_counter_ns() - start
+
+
+async def _allocations(ops: list) -> tuple:
+    """Mean tracemalloc peak above baseline (KiB) and blocks still allocated, per op."""
+    tracemalloc.start()
+    try:
+        peak_total = 0
+        blocks_before = sys.getallocatedblocks()
+        for i in range(ALLOC_SAMPLES):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await _call(ops[i % len(ops)])
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - current
+        blocks_after = sys.getallocatedblocks()
+    finally:
+        tracemalloc.stop()
+    return peak_total / ALLOC_SAMPLES / 1024, (blocks_after - blocks_before) / ALLOC_SAMPLES
+
+
+def percentile(sorted_samples: list, p: float) -> float:
+    """Nearest-rank percentile of ascending samples."""
+    rank = max(1, -(-p * len(sorted_samples) // 100))
+    return sorted_samples[int(rank) - 1]
+
+
+async def run_workload(name: str, cases_dir: Path, iterations: int) -> dict:
+    build, batch = WORKLOADS[name]
+    try:
+        ops = build(cases_dir)
+        samples, wall_ns = await _latencies_ns(ops, iterations, batch)
+        peak_kib, net_blocks = await _allocations(ops)
+    except Exception as e:
+        # e.g. a revision without this component: reported, not compared.
+        return {"error": f"{type(e).__name__}: {e}"}
+    ordered = sorted(samples)
+    return {
+        "inputs": len(ops),
+        "ops": iterations * batch,
+        "ops_per_s": round(iterations * batch / (wall_ns / 1e9), 1),
+        "mean_us": round(statistics.fmean(samples) / 1000, 3),
+        "p50_us": round(percentile(ordered, 50) / 1000, 3),
+        "p90_us": round(percentile(ordered, 90) / 1000, 3),
+        "p99_us": round(percentile(ordered, 99) / 1000, 3),
+        "max_us": round(ordered[-1] / 1000, 3),
+        "peak_kib": round(peak_kib, 2),
+        "net_blocks": round(net_blocks, 2),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_suite(names: list, cases_dir: Path = CASES_DIR, quick: bool = False) -> dict:
+    iterations = QUICK_ITERATIONS if quick else ITERATIONS
+    workloads = {}
+    for name in names:
+        workloads[name] = asyncio.run(run_workload(name, cases_dir, iterations))
+    return {
+        "schema": SCHEMA_VERSION,
+        "revision": git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "seed": SEED,
+        "workloads": workloads,
+    }
+
+
+# metric -> True when higher is better
+COMPARED_METRICS = {"p50_us": False, "ops_per_s": True, "peak_kib": False}
+
+
+def compare(base: dict, head: dict, threshold_pct: float = DEFAULT_THRESHOLD_PCT) -> list:
+    """
+    Per workload and compared metric: base, head, change (percent, positive =
+    worse) and whether it is a regression beyond threshold_pct. Workloads with
+    an error or missing on either side are skipped.
+    """
+    rows = []
+    for name, head_result in head["workloads"].items():
+        base_result = base["workloads"].get(name)
+        if not base_result or "error" in base_result or "error" in head_result:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            before, after = base_result[metric], head_result[metric]
+            if before == 0:
+                continue
+            change = (after - before) / before * 100
+            if higher_is_better:
+                change = -change
+            rows.append({
+                "workload": name, "metric": metric, "base": before, "head": after,
+                "change_pct": round(change, 1), "regression": change > threshold_pct,
+            })
+    return rows
+
+
+def print_results(results: dict) -> None:
+    print(f"revision {results['revision']}  python {results['python']}  quick={results['quick']}")
+    print(f"{'workload':<38} {'ops_per_s':>11} {'p50_us':>9} {'p90_us':>9} {'p99_us':>9} "
+          f"{'peak_kib':>9} {'net_blocks':>11}")
+    for name, r in results["workloads"].items():
+        if "error" in r:
+            print(f"{name:<38} error: {r['error']}")
+            continue
+        print(f"{name:<38} {r['ops_per_s']:>11.0f} {r['p50_us']:>9.2f} {r['p90_us']:>9.2f} "
+              f"{r['p99_us']:>9.2f} {r['peak_kib']:>9.2f} {r['net_blocks']:>11.2f}")
+
+
+def print_comparison(rows: list, threshold_pct: float) -> bool:
+    """Print the comparison; True when something regressed."""
+    print(f"{'workload':<38} {'metric':<10} {'base':>11} {'head':>11} {'worse_%':>8}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['workload']:<38} {row['metric']:<10} {row['base']:>11.2f} {row['head']:>11.2f} "
+              f"{row['change_pct']:>8.1f}{flag}")
+    regressed = [row for row in rows if row["regression"]]
+    print(f"{len(regressed)} regression(s) beyond {threshold_pct:g}%")
+    return bool(regressed)
+
+
+def run_revision(revision: str, workdir: Path, args) -> dict:
+    """Run this suite against revision (checked out into a temporary worktree)."""
+    tree = workdir / f"tree-{revision.replace('/', '_')}"
+    output = workdir / f"{revision.replace('/', '_')}.json"
+    subprocess.run(["git", "worktree", "add", "--detach", str(tree), revision], check=True)
+    try:
+        command = [
+            sys.executable, str(Path(__file__).resolve()), "--output", str(output),
+            "--cases-dir", str(Path(args.cases_dir).resolve()), "--workload", *args.workload,
+        ]
+        if args.quick:
+            command.append("--quick")
+        subprocess.run(command, cwd=tree, env={**os.environ, "PYTHONPATH": str(tree)}, check=True)
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", str(tree)], check=False)
+    results = json.loads(output.read_text(encoding="utf-8"))
+    results["revision"] = f"{revision} ({results['revision'][:12]})"
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workload", nargs="+", default=list(WORKLOADS), choices=list(WORKLOADS))
+    parser.add_argument("--quick", action="store_true", help=f"{QUICK_ITERATIONS} samples per workload")
+    parser.add_argument("--cases-dir", default=str(CASES_DIR))
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE_JSON", "HEAD_JSON"))
+    parser.add_argument("--revisions", nargs=2, metavar=("BASE_REV", "HEAD_REV"))
+    parser.add_argument("--output-dir", help="keep the per-revision JSON results here")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT, help="percent")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        base, head = (json.loads(Path(p).read_text(encoding="utf-8")) for p in args.compare)
+        return int(print_comparison(compare(base, head, args.threshold), args.threshold))
+
+    if args.revisions:
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(args.output_dir) if args.output_dir else Path(tmp)
+            workdir.mkdir(parents=True, exist_ok=True)
+            base, head = (run_revision(rev, workdir, args) for rev in args.revisions)
+        print_results(base)
+        print_results(head)
+        print()
+        return int(print_comparison(compare(base, head, args.threshold), args.threshold))
+
+    results = run_suite(args.workload, Path(args.cases_dir), args.quick)
+    print_results(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
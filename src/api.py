@@ -1,11 +1,50 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field, ValidationError
+from typing import Any, Dict, List, Optional
 from .core.models import DecisionRequest, DecisionResponse
-from .core.gate import decide
+from .core.gate import decide_many, decide_timed
+from .core.config_manager import ConfigReloadError, ConfigWatcher, get_config_snapshot, reload_config_async
+from .core.gate_helpers import get_circuit_breaker_snapshots, load_evidence_timeout_config
+from .core.metrics import render_metrics, set_circuit_breaker
+from .core.timings import get_timing_window
+from .core.keyword_engine import get_shared_automaton
+from .core.runtime_config import get_runtime_config
+from .evidence.http_provider import aclose_shared_http_client, get_shared_http_client
 from .feedback import FeedbackRecord, save_feedback
 
-app = FastAPI(title="AI Responsibility Gate")
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Fail fast on an invalid config/evidence_timeouts.yaml (per-provider budgets).
+    load_evidence_timeout_config()
+    # Load the policy configs (lazy at import) and the keyword automaton before
+    # the first request instead of on it; a broken config fails startup.
+    get_config_snapshot()
+    get_shared_automaton()
+    # Build the pooled HTTP client for remote evidence providers up front.
+    get_shared_http_client()
+    runtime_config = get_runtime_config()
+    # Map the shared circuit breaker segment up front: a segment file of another
+    # format fails startup instead of every request.
+    if runtime_config.circuit_breaker_backend == "shared":
+        from .core.shared_circuit_breaker import get_shared_segment
+        get_shared_segment(runtime_config.circuit_breaker_shm_path)
+    # Optional mtime watcher for YAML config hot reload.
+    watcher = None
+    interval_s = runtime_config.config_watch_interval_s
+    if interval_s > 0:
+        watcher = ConfigWatcher(interval_s).start()
+    yield
+    if watcher is not None:
+        await watcher.stop()
+    # Pooled keep-alive connections of remote evidence providers.
+    await aclose_shared_http_client()
+
+app = FastAPI(title="AI Responsibility Gate", lifespan=lifespan)
 
 class FeedbackRequest(BaseModel):
     trace_id: str = Field(..., description="Request ID from /decision response")
@@ -15,8 +54,42 @@ class FeedbackRequest(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes")
     context: Optional[dict] = Field(None, description="Additional context")
 
+class DecisionBatchRequest(BaseModel):
+    # Items are validated one by one so a malformed item only fails itself.
+    requests: List[Dict[str, Any]] = Field(..., min_length=1, max_length=500, description="DecisionRequest payloads")
+
+class DecisionBatchError(BaseModel):
+    status_code: int
+    detail: Any
+
+class DecisionBatchItem(BaseModel):
+    index: int
+    response: Optional[DecisionResponse] = None
+    error: Optional[DecisionBatchError] = None
+
+class DecisionBatchResponse(BaseModel):
+    results: List[DecisionBatchItem]
+
+def _batch_error(exc: Exception) -> DecisionBatchError:
+    """Map a per-item failure to the same status/detail /decision would return."""
+    if isinstance(exc, ValidationError):
+        # Drop "ctx" (may hold exception objects that are not JSON serializable).
+        errors = [
+            {k: v for k, v in err.items() if k != "ctx"}
+            for err in exc.errors(include_url=False)
+        ]
+        return DecisionBatchError(status_code=422, detail=errors)
+    if isinstance(exc, RuntimeError):
+        return DecisionBatchError(status_code=500, detail=f"System configuration error: {str(exc)}")
+    if isinstance(exc, ValueError):
+        return DecisionBatchError(status_code=400, detail=f"Invalid request: {str(exc)}")
+    # Unexpected: /decision would let it reach the server error handler, which
+    # logs the traceback; the batch answers for the item, so log it here.
+    logger.exception("Unhandled error in /decision/batch item", exc_info=exc)
+    return DecisionBatchError(status_code=500, detail="Internal Server Error")
+
 @app.post("/decision", response_model=DecisionResponse)
-async def decision(req: DecisionRequest) -> DecisionResponse:
+async def decision(req: DecisionRequest, response: Response) -> DecisionResponse:
     """
     Make a decision on whether AI can answer the user's request.
     
@@ -24,9 +97,15 @@ async def decision(req: DecisionRequest) -> DecisionResponse:
     - decision: ALLOW, ONLY_SUGGEST, HITL, or DENY
     - explanation: Why this decision was made
     - policy: Matrix version and rules fired
+    - timings: per-stage microseconds, when requested with timings=true
+
+    Stage timings are also sent as a Server-Timing header (unless disabled).
     """
     try:
-        return await decide(req)
+        result, timings = await decide_timed(req)
+        if timings is not None and get_runtime_config().server_timing_enabled:
+            response.headers["Server-Timing"] = timings.server_timing()
+        return result
     except RuntimeError as e:
         # System configuration errors (matrix not found, invalid config, etc.)
         raise HTTPException(
@@ -40,6 +119,71 @@ async def decision(req: DecisionRequest) -> DecisionResponse:
             detail=f"Invalid request: {str(e)}"
         ) from e
 
+@app.post("/decision/batch", response_model=DecisionBatchResponse)
+async def decision_batch(req: DecisionBatchRequest) -> DecisionBatchResponse:
+    """
+    Make decisions for a batch of requests (e.g. candidate tool calls of one turn).
+
+    Results are returned in input order. Each item carries either a response or
+    an error with the status code /decision would have returned for it.
+    """
+    results: List[Optional[DecisionBatchItem]] = [None] * len(req.requests)
+    valid_indices = []
+    valid_requests = []
+    for i, payload in enumerate(req.requests):
+        try:
+            valid_requests.append(DecisionRequest.model_validate(payload))
+            valid_indices.append(i)
+        except ValidationError as e:
+            results[i] = DecisionBatchItem(index=i, error=_batch_error(e))
+
+    outcomes = await decide_many(valid_requests)
+    for i, outcome in zip(valid_indices, outcomes):
+        if isinstance(outcome, Exception):
+            results[i] = DecisionBatchItem(index=i, error=_batch_error(outcome))
+        else:
+            results[i] = DecisionBatchItem(index=i, response=outcome)
+
+    return DecisionBatchResponse(results=results)
+
+@app.get("/admin/config")
+async def admin_config():
+    """Versions of the active YAML config snapshot."""
+    return get_config_snapshot().version_info()
+
+@app.post("/admin/config/reload")
+async def admin_config_reload():
+    """
+    Re-read config/, tools/ and matrices/ and swap the new snapshot in.
+
+    Parsing and validation run in a worker thread; an invalid file rejects the
+    reload (400) and the active configuration stays. In-flight requests finish
+    on the snapshot they started with.
+    """
+    try:
+        snapshot = await reload_config_async()
+    except ConfigReloadError as e:
+        raise HTTPException(status_code=400, detail=f"Config reload rejected: {e}") from e
+    return snapshot.version_info()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """
+    Prometheus text format metrics (see src/core/metrics.py).
+
+    Covers every worker when AI_GATE_METRICS_DIR is set, else this process.
+    """
+    # Breaker gauges change on transitions; refresh this worker's from the live state.
+    for snapshot in get_circuit_breaker_snapshots():
+        set_circuit_breaker(snapshot.provider_id, snapshot.state.value, snapshot.open_count)
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+@app.get("/debug/timings")
+async def debug_timings():
+    """Per-stage percentiles (microseconds) over this process's recent decisions."""
+    window = get_timing_window()
+    return {"window": window.size, "recorded": window.recorded, "stages": window.summary()}
+
 @app.post("/feedback")
 async def feedback(req: FeedbackRequest):
     """
@@ -1,4 +1,10 @@
 from .models import ClassifierResult, ResponsibilityType, GateContext
+from .keyword_engine import register_keywords
+
+# Existing business heuristic: detect "operation"-like intents.
+OPERATION_KEYWORDS = ["买", "卖", "操作", "执行", "交易"]
+
+register_keywords(OPERATION_KEYWORDS)
 
 
 async def classify(ctx: GateContext) -> ClassifierResult:
@@ -9,11 +15,8 @@ async def classify(ctx: GateContext) -> ClassifierResult:
     - Future scenarios (e.g., PR) can use ctx.structured_input or ctx.context
       without changing this signature.
     """
-    text = ctx.text or ""
-
-    # Existing business heuristic: detect \"operation\"-like intents.
-    operation_keywords = ["买", "卖", "操作", "执行", "交易"]
-    is_operation = any(kw in text for kw in operation_keywords)
+    keyword_hits = ctx.analysis.keyword_hits
+    is_operation = any(kw in keyword_hits for kw in OPERATION_KEYWORDS)
 
     if is_operation:
         return ClassifierResult(
@@ -22,6 +22,11 @@ if os.getenv("AI_RESPONSIBILITY_GATE_CONFIG_DIR"):
 if os.getenv("AI_RESPONSIBILITY_GATE_MATRICES_DIR"):
     MATRICES_DIR = Path(os.getenv("AI_RESPONSIBILITY_GATE_MATRICES_DIR")).resolve()
 
+# Compiled policy bundle (src/core/policy_bundle.py)
+POLICY_BUNDLE_PATH = _PROJECT_ROOT / "build" / "policy.bundle"
+if os.getenv("AI_RESPONSIBILITY_GATE_POLICY_BUNDLE"):
+    POLICY_BUNDLE_PATH = Path(os.getenv("AI_RESPONSIBILITY_GATE_POLICY_BUNDLE")).resolve()
+
 def get_config_path(filename: str) -> Path:
     """Get absolute path to a config file."""
     path = CONFIG_DIR / filename
@@ -62,6 +67,20 @@ def get_tools_path(filename: str) -> Path:
         )
     return path
 
+# Configuration generation: bumped whenever loaded configuration (matrices,
+# YAML configs) is reloaded, so caches derived from it can detect staleness.
+_config_generation = 0
+
+def get_config_generation() -> int:
+    """Current configuration generation."""
+    return _config_generation
+
+def bump_config_generation() -> int:
+    """Mark loaded configuration as changed; returns the new generation."""
+    global _config_generation
+    _config_generation += 1
+    return _config_generation
+
 def get_project_root() -> Path:
     """Get the project root directory."""
     return _PROJECT_ROOT
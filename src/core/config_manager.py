@@ -0,0 +1,322 @@
+"""
+Hot reload of the YAML policy configuration (config/, tools/, matrices/).
+
+The risk / keyword / permission / knowledge configs and the tool catalog are
+loaded on first use by the config registry (config_registry.py), matrices by
+load_matrix(). A ConfigSnapshot is an immutable view of one consistent set of
+them:
+
+- build_config_snapshot() reads, parses and validates every watched file,
+  builds the matrices currently in use (with their decision tables) and the
+  keyword automaton. It changes no module state, so it runs off the request
+  path: in a worker thread for reload_config_async() and ConfigWatcher.
+- install_config_snapshot() swaps a snapshot in with one synchronous step:
+  the registry's documents are replaced, the prebuilt matrices and automaton
+  are installed and the config generation is bumped
+  (decision / evidence caches drop their entries). A file that fails to parse
+  or validate rejects the whole reload; the active snapshot stays in place.
+
+In-flight requests finish on the snapshot they started with. _decide pins the
+snapshot in its PipelineContext and holds its Matrix objects; every stage
+reads the pinned documents (config_registry.pinned_document) and scans text
+with the pinned automaton (TextAnalysis), never the registry. A request
+awaits between its stages (HTTP providers, worker threads), so a swap can
+land in the middle of it; the snapshot is what keeps it on one config.
+
+Reloads are triggered by POST /admin/config/reload or by ConfigWatcher, which
+polls file mtimes every AI_GATE_CONFIG_WATCH_INTERVAL_S seconds (0: off).
+config/evidence_timeouts.yaml is read once at startup and is not reloaded.
+"""
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import yaml
+
+from . import config as config_paths
+from .config import bump_config_generation, get_config_generation
+from .config_registry import WATCHED_CONFIGS, get_document, install_documents
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCH_INTERVAL_S = 2.0
+
+
+class ConfigReloadError(ValueError):
+    """A watched file is missing, is not valid YAML or fails validation."""
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    One consistent set of parsed configuration.
+
+    documents and matrices are shared with the consumer modules and must be
+    treated as read-only.
+    """
+    # Config generation this snapshot was installed as (0 until installed).
+    generation: int
+    # Build order; a snapshot never replaces one built after it.
+    sequence: int
+    # Watched file path -> (mtime_ns, size) when the snapshot was read.
+    fingerprints: Mapping[str, Tuple[int, int]]
+    # Document name (WATCHED_CONFIGS) -> parsed YAML.
+    documents: Mapping[str, Any]
+    # load_matrix() path -> Matrix, for the matrices in use at build time.
+    matrices: Mapping[str, Any]
+    built_at: float
+    # Keyword automaton over the snapshot's keywords (the shared one for the
+    # initial snapshot).
+    automaton: Any = None
+    automaton_keywords: Tuple[str, ...] = ()
+
+    def version_info(self) -> Dict[str, Any]:
+        return {
+            "generation": self.generation,
+            "sequence": self.sequence,
+            "built_at": self.built_at,
+            "documents": {
+                name: doc.get("version") if isinstance(doc, dict) else None
+                for name, doc in self.documents.items()
+            },
+            "matrices": {path: m.version for path, m in self.matrices.items()},
+        }
+
+
+def watched_files() -> List[Path]:
+    """Every file a reload reads: the watched configs and all matrix YAML files."""
+    files = [resolve(name) for resolve, name, _ in WATCHED_CONFIGS.values()]
+    files.extend(sorted(Path(config_paths.MATRICES_DIR).glob("*.yaml")))
+    return files
+
+
+def scan_fingerprints() -> Dict[str, Tuple[int, int]]:
+    """(mtime_ns, size) of every watched file; missing files are left out."""
+    fingerprints = {}
+    for path in watched_files():
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        fingerprints[str(path)] = (st.st_mtime_ns, st.st_size)
+    return fingerprints
+
+
+def load_config_document(name: str) -> Any:
+    resolve, filename, required = WATCHED_CONFIGS[name]
+    try:
+        with open(resolve(filename), encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+    except FileNotFoundError as e:
+        raise ConfigReloadError(f"Config file not found: {filename}: {e}") from e
+    except yaml.YAMLError as e:
+        raise ConfigReloadError(f"Invalid YAML in {filename}: {e}") from e
+    if not isinstance(data, dict):
+        raise ConfigReloadError(f"Invalid config {filename}: expected a mapping")
+    missing = [key for key in required if key not in data]
+    if missing:
+        raise ConfigReloadError(f"Invalid config {filename}: missing {', '.join(missing)}")
+    return data
+
+
+def validate_config_documents(documents: Mapping[str, Any]) -> None:
+    """Cross-field checks the consumer modules rely on at request time."""
+    tools = documents["catalog"]["tools"]
+    if not isinstance(tools, list) or not all(isinstance(t, dict) and "tool_id" in t for t in tools):
+        raise ConfigReloadError("Invalid config catalog.yaml: every tool needs a tool_id")
+    if "default" not in (documents["risk_keywords"].get("disclaimer_templates") or {}):
+        raise ConfigReloadError("Invalid config risk_keywords.yaml: missing disclaimer_templates.default")
+    for rule in documents["risk_rules"]["rules"] or []:
+        if not isinstance(rule, dict) or "rule_id" not in rule or "type" not in rule:
+            raise ConfigReloadError("Invalid config risk_rules.yaml: every rule needs rule_id and type")
+
+
+_snapshot: Optional[ConfigSnapshot] = None
+_sequence = 0
+_build_lock = threading.Lock()
+_install_lock = threading.Lock()
+
+
+def _initial_snapshot() -> ConfigSnapshot:
+    """Snapshot of the documents in the config registry (loaded on first use)."""
+    from . import matrix
+    from .keyword_engine import get_shared_automaton, registered_keywords
+
+    documents = {name: get_document(name) for name in WATCHED_CONFIGS}
+    return ConfigSnapshot(
+        generation=get_config_generation(),
+        sequence=0,
+        fingerprints=MappingProxyType(scan_fingerprints()),
+        documents=MappingProxyType(documents),
+        matrices=MappingProxyType(dict(matrix._matrices)),
+        built_at=time.time(),
+        automaton=get_shared_automaton(),
+        automaton_keywords=registered_keywords(),
+    )
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    """Return the active snapshot (read once per request)."""
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is None:
+        with _install_lock:
+            if _snapshot is None:
+                _snapshot = _initial_snapshot()
+            snapshot = _snapshot
+    return snapshot
+
+
+def build_config_snapshot() -> ConfigSnapshot:
+    """
+    Read, parse and validate all watched files into a new (not yet installed)
+    snapshot. Raises ConfigReloadError; never touches the active configuration.
+    """
+    global _sequence
+    from .gate import _get_decision_table
+    from .keyword_engine import KeywordAutomaton, keywords_for
+    from .matrix import Matrix, _matrices
+
+    with _build_lock:
+        _sequence += 1
+        sequence = _sequence
+        # Fingerprints first: a write racing with the read is seen as a change
+        # on the next poll instead of being missed.
+        fingerprints = scan_fingerprints()
+        documents = {name: load_config_document(name) for name in WATCHED_CONFIGS}
+        validate_config_documents(documents)
+
+        matrices = {}
+        for path in list(_matrices):
+            try:
+                matrices[path] = Matrix(path)
+            except (FileNotFoundError, ValueError) as e:
+                raise ConfigReloadError(f"Invalid matrix {path}: {e}") from e
+            _get_decision_table(matrices[path])
+        for path in sorted(Path(config_paths.MATRICES_DIR).glob("*.yaml")):
+            if path.name not in matrices:
+                try:
+                    Matrix(path.name)
+                except (FileNotFoundError, ValueError) as e:
+                    raise ConfigReloadError(f"Invalid matrix {path.name}: {e}") from e
+
+        keywords = keywords_for(documents)
+        automaton = KeywordAutomaton(keywords)
+
+    return ConfigSnapshot(
+        generation=0,
+        sequence=sequence,
+        fingerprints=MappingProxyType(fingerprints),
+        documents=MappingProxyType(documents),
+        matrices=MappingProxyType(matrices),
+        built_at=time.time(),
+        automaton=automaton,
+        automaton_keywords=keywords,
+    )
+
+
+def install_config_snapshot(snapshot: ConfigSnapshot) -> ConfigSnapshot:
+    """
+    Make a built snapshot the active configuration.
+
+    Must run on the event loop thread serving requests (or with no requests in
+    flight) so the swap lands between request steps. A snapshot older than the
+    active one is ignored and the active one returned.
+    """
+    from . import matrix
+    from .keyword_engine import install_automaton
+    from .policy_bundle import release_policy_bundle
+
+    global _snapshot
+    with _install_lock:
+        current = _snapshot
+        if current is not None and snapshot.sequence <= current.sequence:
+            return current
+        # Matrices loaded later must come from the reloaded YAML, not the bundle.
+        release_policy_bundle()
+        install_documents(snapshot.documents)
+        if snapshot.automaton is not None:
+            install_automaton(snapshot.automaton, snapshot.automaton_keywords)
+        matrix._matrices = dict(snapshot.matrices)
+        installed = replace(snapshot, generation=bump_config_generation())
+        _snapshot = installed
+    return installed
+
+
+def reload_config() -> ConfigSnapshot:
+    """Build and install a snapshot synchronously (CLI, tests, no running loop)."""
+    return install_config_snapshot(build_config_snapshot())
+
+
+async def reload_config_async() -> ConfigSnapshot:
+    """Build the snapshot in a worker thread, then install it on the running loop."""
+    snapshot = await asyncio.to_thread(build_config_snapshot)
+    return install_config_snapshot(snapshot)
+
+
+def config_changed(snapshot: Optional[ConfigSnapshot] = None) -> bool:
+    """True when a watched file differs from what the snapshot was read from."""
+    if snapshot is None:
+        snapshot = get_config_snapshot()
+    return scan_fingerprints() != dict(snapshot.fingerprints)
+
+
+class ConfigWatcher:
+    """
+    Poll watched file mtimes and hot-reload on change (asyncio task).
+
+    Stat calls and the reload build run in a worker thread. A failed reload is
+    logged and retried only after the files change again.
+    """
+
+    def __init__(self, interval_s: float = DEFAULT_WATCH_INTERVAL_S):
+        self.interval_s = interval_s
+        self.reloads = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._rejected: Optional[Dict[str, Tuple[int, int]]] = None
+
+    def start(self) -> "ConfigWatcher":
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def poll_once(self) -> bool:
+        """Reload if the files changed; returns True when a snapshot was installed."""
+        fingerprints = await asyncio.to_thread(scan_fingerprints)
+        if fingerprints == dict(get_config_snapshot().fingerprints) or fingerprints == self._rejected:
+            return False
+        try:
+            await reload_config_async()
+        except ConfigReloadError as e:
+            self.failures += 1
+            self.last_error = str(e)
+            self._rejected = fingerprints
+            logger.warning("Config reload rejected, keeping active config: %s", e)
+            return False
+        self.reloads += 1
+        self._rejected = None
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            try:
+                await self.poll_once()
+            except Exception:
+                logger.exception("Config watcher poll failed")
@@ -0,0 +1,149 @@
+"""
+Lazy, process-wide registry of the parsed YAML policy documents.
+
+Every watched config (WATCHED_CONFIGS) is read at most once per process, on
+first use, and shared by all consumer modules: catalog.yaml feeds routing,
+tool lookup and action type inference; risk_keywords.yaml feeds postcheck and
+the generation stub. Importing a module parses nothing.
+
+    get_document("catalog")        # the parsed document (bundle first, then YAML)
+    pinned_document(ctx, "catalog")  # the request's config snapshot, else the active one
+    tools_by_id()                  # tool_id -> tool, built once per document
+    tool_action_types()            # tool_id -> action_type, built once per document
+
+Derived indexes are keyed by the identity of the document they were built
+from, so a hot reload (config_manager) only has to install_documents(); the
+next lookup rebuilds them from the new document.
+
+Load errors are raised unchanged (FileNotFoundError / yaml.YAMLError) and
+nothing is cached, so consumers can wrap them in their own messages and a
+later call retries.
+"""
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import yaml
+
+from . import config as config_paths
+
+# Document name -> (path resolver, file name, required top-level keys)
+WATCHED_CONFIGS: Mapping[str, Tuple[Callable[[str], Path], str, Tuple[str, ...]]] = MappingProxyType({
+    "risk_rules": (lambda name: config_paths.get_config_path(name), "risk_rules.yaml", ("rules",)),
+    "risk_keywords": (
+        lambda name: config_paths.get_config_path(name), "risk_keywords.yaml",
+        ("guarantee_claim_keywords", "disclaimer_templates"),
+    ),
+    "permission_policies": (
+        lambda name: config_paths.get_config_path(name), "permission_policies.yaml",
+        ("action_permissions",),
+    ),
+    "kb_meta": (
+        lambda name: config_paths.get_config_path(name), "kb_meta.yaml",
+        ("version", "kb_id", "expired"),
+    ),
+    "catalog": (lambda name: config_paths.get_tools_path(name), "catalog.yaml", ("tools",)),
+})
+
+_documents: Dict[str, Any] = {}
+# Index name -> (source document, index)
+_derived: Dict[str, Tuple[Any, Any]] = {}
+_lock = threading.RLock()
+
+
+def _load(name: str) -> Any:
+    from .policy_bundle import bundled_document
+
+    document = bundled_document(name)
+    if document is not None:
+        return document
+    resolve, filename, _ = WATCHED_CONFIGS[name]
+    with open(resolve(filename), encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def get_document(name: str) -> Any:
+    """Parsed document for a WATCHED_CONFIGS name, loaded on first use."""
+    try:
+        return _documents[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name not in _documents:
+            _documents[name] = _load(name)
+        return _documents[name]
+
+
+def pinned_document(ctx: Any, name: str) -> Any:
+    """
+    Document `name` of the config snapshot pinned on a request context
+    (PipelineContext.config_snapshot), so every stage of a request reads the
+    same config across a reload; the active document for contexts without
+    one (a plain GateContext).
+    """
+    snapshot = getattr(ctx, "config_snapshot", None)
+    if snapshot is None:
+        return get_document(name)
+    return snapshot.documents[name]
+
+
+def loaded_documents() -> Tuple[str, ...]:
+    """Names of the documents loaded so far."""
+    return tuple(_documents)
+
+
+def install_documents(documents: Mapping[str, Any]) -> None:
+    """Replace documents (config reload); derived indexes rebuild on next use."""
+    global _documents
+    with _lock:
+        _documents = {**_documents, **documents}
+        _derived.clear()
+
+
+def clear_documents() -> None:
+    """Forget every loaded document; the next access loads it again."""
+    global _documents
+    with _lock:
+        _documents = {}
+        _derived.clear()
+
+
+def derived(name: str, document: Any, build: Callable[[Any], Any]) -> Any:
+    """Index `name` built from document, reused while document is unchanged."""
+    entry = _derived.get(name)
+    if entry is not None and entry[0] is document:
+        return entry[1]
+    value = build(document)
+    _derived[name] = (document, value)
+    return value
+
+
+def _build_tools_by_id(catalog: dict) -> Dict[str, dict]:
+    from .policy_bundle import bundled_document, bundled_table
+
+    if catalog is bundled_document("catalog"):
+        return bundled_table("tools_by_id")
+    return {t["tool_id"]: t for t in catalog["tools"]}
+
+
+def tools_by_id(catalog: Optional[dict] = None) -> Dict[str, dict]:
+    """tool_id -> tool entry (last entry wins, like a dict built from the list)."""
+    if catalog is None:
+        catalog = get_document("catalog")
+    return derived("tools_by_id", catalog, _build_tools_by_id)
+
+
+def _build_tool_action_types(catalog: dict) -> Dict[str, str]:
+    action_types: Dict[str, str] = {}
+    for t in catalog.get("tools", []):
+        if t.get("tool_id"):
+            action_types.setdefault(t["tool_id"], t.get("action_type", "READ"))
+    return action_types
+
+
+def tool_action_types(catalog: Optional[dict] = None) -> Dict[str, str]:
+    """tool_id -> action_type (first catalog entry wins, as in a linear scan)."""
+    if catalog is None:
+        catalog = get_document("catalog")
+    return derived("tool_action_types", catalog, _build_tool_action_types)
@@ -0,0 +1,221 @@
+"""
+Whole-decision memoization cache (opt-in).
+
+Repeated (text, context, structured_input) requests, typical of FAQ traffic,
+can reuse a previous DecisionOutcome instead of re-running the pipeline.
+
+- Key: canonical hash of the request inputs that can influence the decision
+  (text, context, structured_input, debug, matrix path), the effective matrix
+  version and the versions of the risk / keyword / permission / knowledge /
+  tool configs.
+- Bounded LRU with frequency-based admission (TinyLFU style): when the cache
+  is full, a new key is only admitted if it has been requested more often than
+  the LRU victim, so one-off requests do not evict hot entries. Frequencies are
+  kept in a fixed-size count-min sketch that is halved periodically (aging).
+- Entries expire after ttl_s and are all dropped when the configuration
+  generation (matrix / YAML reload) or the runtime config snapshot changes.
+- Only outcomes computed from complete evidence are stored (no unavailable
+  providers, no timeout degradation), and verbose requests bypass the cache.
+- A hit returns a copy with a fresh request_id, the caller's session_id and
+  the hit's own latency_ms.
+
+Enabled with AI_GATE_DECISION_CACHE_ENABLED (runtime config).
+"""
+import hashlib
+import json
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_config_generation
+from .models import DecisionRequest
+from .records import DecisionOutcome
+from .timings import StageTimings
+
+DEFAULT_MAXSIZE = 10000
+DEFAULT_TTL_S = 300.0
+
+
+def config_versions() -> Tuple[Any, ...]:
+    """Versions of the YAML configs that feed the pipeline (read at call time)."""
+    from .config_registry import get_document
+
+    return tuple(
+        get_document(name).get("version")
+        for name in ("risk_rules", "risk_keywords", "permission_policies", "kb_meta", "catalog")
+    )
+
+
+def decision_cache_key(req: DecisionRequest, matrix_path: str, matrix_version: Any) -> str:
+    """Canonical hash of everything that can change the decision for req."""
+    payload = [
+        req.text,
+        req.context,
+        req.structured_input,
+        req.debug,
+        matrix_path,
+        matrix_version,
+        config_versions(),
+    ]
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class FrequencySketch:
+    """Count-min sketch with periodic halving (bounded-memory frequency estimate)."""
+
+    DEPTH = 4
+
+    def __init__(self, width: int, sample_size: int):
+        self.width = max(64, width)
+        self.sample_size = max(1, sample_size)
+        self._rows: List[List[int]] = [[0] * self.width for _ in range(self.DEPTH)]
+        self._additions = 0
+
+    def _indexes(self, key: str):
+        # Double hashing over one stable digest (str hash() is salted per process).
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.DEPTH):
+            yield (h1 + i * h2) % self.width
+
+    def increment(self, key: str) -> None:
+        for row, index in zip(self._rows, self._indexes(key)):
+            row[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def _age(self) -> None:
+        for row in self._rows:
+            for i, count in enumerate(row):
+                row[i] = count >> 1
+        self._additions //= 2
+
+
+class DecisionCache:
+    """LRU + TTL store of DecisionOutcome with frequency-based admission."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl_s: float = DEFAULT_TTL_S):
+        self.maxsize = max(1, maxsize)
+        self.ttl_s = ttl_s
+        self.version: Any = None
+        self._entries: "OrderedDict[str, Tuple[float, DecisionOutcome]]" = OrderedDict()
+        self._sketch = FrequencySketch(width=self.maxsize * 4, sample_size=self.maxsize * 10)
+        self.hits = 0
+        self.misses = 0
+        self.admissions = 0
+        self.rejections = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def check_version(self, version: Any) -> None:
+        """Drop every entry when the configuration version changed."""
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self.version = version
+
+    def get(self, key: str, now: Optional[float] = None) -> Optional[DecisionOutcome]:
+        self._sketch.increment(key)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now is None:
+                now = time.monotonic()
+            if entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, outcome: DecisionOutcome, now: Optional[float] = None) -> bool:
+        """Store outcome; returns False when admission rejected it."""
+        if now is None:
+            now = time.monotonic()
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            victim = next(iter(self._entries))
+            if self._sketch.estimate(key) <= self._sketch.estimate(victim):
+                self.rejections += 1
+                return False
+            del self._entries[victim]
+            self.evictions += 1
+        self._entries[key] = (now + self.ttl_s, outcome)
+        self._entries.move_to_end(key)
+        self.admissions += 1
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "admissions": self.admissions,
+            "rejections": self.rejections,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def outcome_for_hit(
+    cached: DecisionOutcome, req: DecisionRequest, request_start: float,
+    timings: Optional[StageTimings] = None,
+) -> DecisionOutcome:
+    """Copy of a cached outcome with a fresh request_id and this request's latency / timings."""
+    return DecisionOutcome(
+        request_id=str(uuid.uuid4()),
+        session_id=req.session_id,
+        responsibility_type=cached.responsibility_type,
+        decision=cached.decision,
+        primary_reason=cached.primary_reason,
+        suggested_action=cached.suggested_action,
+        summary=cached.summary,
+        evidence_used=list(cached.evidence_used),
+        trigger_spans=list(cached.trigger_spans),
+        matrix_version=cached.matrix_version,
+        rules_fired=list(cached.rules_fired) if cached.rules_fired is not None else None,
+        latency_ms=int((time.perf_counter() - request_start) * 1000),
+        timeout_guard_reason=cached.timeout_guard_reason,
+        timings=timings,
+    )
+
+
+_decision_cache: Optional[DecisionCache] = None
+
+
+def get_decision_cache(maxsize: int = DEFAULT_MAXSIZE, ttl_s: float = DEFAULT_TTL_S) -> DecisionCache:
+    """Process-wide cache, rebuilt when the configured size / TTL change."""
+    global _decision_cache
+    cache = _decision_cache
+    if cache is None or cache.maxsize != maxsize or cache.ttl_s != ttl_s:
+        cache = _decision_cache = DecisionCache(maxsize, ttl_s)
+    return cache
+
+
+def decision_cache_stats() -> Dict[str, int]:
+    return _decision_cache.stats() if _decision_cache is not None else {}
+
+
+def clear_decision_cache() -> None:
+    """Drop the cache and its counters."""
+    global _decision_cache
+    _decision_cache = None
+
+
+def current_cache_version(runtime_config_version: int) -> Tuple[int, int]:
+    return get_config_generation(), runtime_config_version
@@ -0,0 +1,276 @@
+"""
+Precomputed decision table for pipeline stages 2-5.
+
+Stages 2-5 (type upgrade, matrix lookup, missing evidence policy, conflict
+resolution & overrides) only depend on a small finite input domain:
+
+- responsibility type (classifier)
+- action_type / risk_level (folded to the values the matrix actually names)
+- whether RISK_GUARANTEE_CLAIM fired
+- permission_ok
+- which evidence is missing (permission > risk > knowledge precedence)
+- confidence below confidence_thresholds.low
+- routing weak signal hit (confidence >= 0.7 with hinted tools)
+
+The table is compiled by running the real stage functions once per domain point,
+so it can never drift from the staged implementation. Entries hold intermediate
+states only (indices, reason codes); Decision enum is still created in gate.py.
+"""
+from typing import Callable, List, Optional, Tuple
+
+from .models import ClassifierResult, ResponsibilityType
+from .matrix import Matrix
+from .gate_stages import (
+    apply_type_upgrade_rules,
+    lookup_matrix,
+    apply_missing_evidence_policy,
+    apply_conflict_resolution_and_overrides,
+)
+
+# Stand-in for "a value no rule / stage mentions explicitly".
+_OTHER = "\x00other"
+
+# Literals the stages compare against directly (besides matrix-configured values).
+_STAGE_ACTION_TYPES = ("READ", "MONEY", "ENTITLEMENT")
+_STAGE_RISK_LEVELS = ("R3",)
+
+# Missing evidence slots, in the precedence order of apply_missing_evidence_policy.
+MISSING_NONE = 0
+MISSING_PERMISSION = 1
+MISSING_RISK = 2
+MISSING_KNOWLEDGE = 3
+
+_ROUTING_WEAK_SIGNAL_THRESHOLD = 0.7
+
+# (final_resp_type, decision_index, primary_reason, rules_fired)
+DecisionTableEntry = Tuple[ResponsibilityType, int, str, Tuple[str, ...]]
+
+
+class _Availability:
+    __slots__ = ("available",)
+
+    def __init__(self, available: bool):
+        self.available = available
+
+
+def _missing_evidence_slot(evidence: dict) -> int:
+    if not evidence["permission"].available:
+        return MISSING_PERMISSION
+    if not evidence["risk"].available:
+        return MISSING_RISK
+    if not evidence["knowledge"].available:
+        return MISSING_KNOWLEDGE
+    return MISSING_NONE
+
+
+def _evidence_for_slot(slot: int) -> dict:
+    return {
+        "permission": _Availability(slot != MISSING_PERMISSION),
+        "risk": _Availability(slot != MISSING_RISK),
+        "knowledge": _Availability(slot != MISSING_KNOWLEDGE),
+    }
+
+
+class DecisionTable:
+    """Dense array of stage 2-5 outcomes addressed by a mixed-radix index."""
+
+    __slots__ = (
+        "_resp_types", "_action_types", "_risk_levels", "_low_threshold",
+        "_strides", "_entries",
+    )
+
+    def __init__(
+        self,
+        resp_types: Tuple[ResponsibilityType, ...],
+        action_types: Tuple[str, ...],
+        risk_levels: Tuple[str, ...],
+        low_threshold: float,
+    ):
+        self._resp_types = {t: i for i, t in enumerate(resp_types)}
+        self._action_types = {a: i for i, a in enumerate(action_types)}
+        self._risk_levels = {r: i for i, r in enumerate(risk_levels)}
+        self._low_threshold = low_threshold
+        # Dimension sizes, outermost first:
+        # resp_type, action_type, risk_level, guarantee, permission_ok,
+        # missing evidence slot, low confidence, routing hit
+        sizes = (len(resp_types), len(action_types), len(risk_levels), 2, 2, 4, 2, 2)
+        strides = []
+        acc = 1
+        for size in reversed(sizes):
+            strides.append(acc)
+            acc *= size
+        self._strides = tuple(reversed(strides))
+        self._entries: List[Optional[DecisionTableEntry]] = [None] * acc
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _offset(
+        self,
+        resp_idx: int,
+        action_idx: int,
+        risk_idx: int,
+        guarantee: bool,
+        permission_ok: bool,
+        missing_slot: int,
+        low_confidence: bool,
+        routing_hit: bool,
+    ) -> int:
+        s = self._strides
+        return (
+            resp_idx * s[0] + action_idx * s[1] + risk_idx * s[2]
+            + guarantee * s[3] + permission_ok * s[4] + missing_slot * s[5]
+            + low_confidence * s[6] + routing_hit * s[7]
+        )
+
+    def lookup(
+        self,
+        classifier_result: ClassifierResult,
+        action_type: str,
+        risk_level: str,
+        risk_rules: List[str],
+        permission_ok: bool,
+        evidence: dict,
+        routing_data: dict,
+    ) -> Optional[DecisionTableEntry]:
+        """
+        Return the precomputed stage 2-5 outcome, or None when the inputs fall
+        outside the compiled domain (caller must use the staged path).
+        """
+        resp_idx = self._resp_types.get(classifier_result.type)
+        if resp_idx is None:
+            return None
+        other_action = self._action_types[_OTHER]
+        other_risk = self._risk_levels[_OTHER]
+        try:
+            action_idx = self._action_types.get(action_type, other_action)
+            risk_idx = self._risk_levels.get(risk_level, other_risk)
+        except TypeError:
+            # Unhashable action_type / risk_level: leave it to the staged path.
+            return None
+        routing_hit = bool(
+            routing_data
+            and routing_data.get("confidence", 0.0) >= _ROUTING_WEAK_SIGNAL_THRESHOLD
+            and routing_data.get("hinted_tools", [])
+        )
+        return self._entries[self._offset(
+            resp_idx,
+            action_idx,
+            risk_idx,
+            "RISK_GUARANTEE_CLAIM" in risk_rules,
+            bool(permission_ok),
+            _missing_evidence_slot(evidence),
+            classifier_result.confidence < self._low_threshold,
+            routing_hit,
+        )]
+
+
+def _run_stages(
+    matrix: Matrix,
+    config_str_to_index: Callable[[str], int],
+    classifier_result: ClassifierResult,
+    action_type: str,
+    risk_level: str,
+    risk_rules: List[str],
+    permission_ok: bool,
+    evidence: dict,
+    routing_data: dict,
+) -> DecisionTableEntry:
+    """Run stages 2-5 exactly as gate.decide does (without trace)."""
+    final_resp_type = apply_type_upgrade_rules(matrix, classifier_result, action_type, [])
+    matrix_result = lookup_matrix(
+        matrix, final_resp_type, action_type, risk_level, risk_rules, permission_ok, []
+    )
+    if "config_decision_str" in matrix_result:
+        decision_index = config_str_to_index(matrix_result["config_decision_str"])
+    elif "decision_index" in matrix_result:
+        decision_index = matrix_result["decision_index"]
+    else:
+        decision_index = 0
+    primary_reason = matrix_result["primary_reason"]
+    rules_fired = tuple(matrix_result["rules_fired"])
+
+    missing_policy_result = apply_missing_evidence_policy(
+        decision_index, primary_reason, evidence, matrix, []
+    )
+    conflict_result = apply_conflict_resolution_and_overrides(
+        missing_policy_result["decision_index"],
+        missing_policy_result["primary_reason"],
+        matrix, classifier_result, final_resp_type,
+        action_type, risk_level, permission_ok, routing_data, [],
+    )
+    return (
+        final_resp_type,
+        conflict_result["decision_index"],
+        conflict_result["primary_reason"],
+        rules_fired,
+    )
+
+
+def compile_decision_table(
+    matrix: Matrix,
+    config_str_to_index: Callable[[str], int],
+) -> DecisionTable:
+    """
+    Enumerate the stage 2-5 input domain for a matrix and store every outcome.
+
+    config_str_to_index is injected by gate.py so the config string → index
+    conversion keeps a single owner. Domain points whose staged evaluation
+    raises (e.g. a malformed rule) are left empty, so decide() falls back to
+    the staged path and surfaces the same error as before.
+    """
+    action_types = set(_STAGE_ACTION_TYPES) | set(matrix._indexed_action_types)
+    for rule in matrix.type_upgrade_rules:
+        tool_action = (rule.get("when") or {}).get("tool_action")
+        if isinstance(tool_action, str):
+            action_types.add(tool_action)
+    risk_levels = set(_STAGE_RISK_LEVELS) | set(matrix._indexed_risk_levels)
+
+    resp_types = tuple(ResponsibilityType)
+    action_domain = (*sorted(action_types), _OTHER)
+    risk_domain = (*sorted(risk_levels), _OTHER)
+    low_threshold = matrix.get_low_threshold()
+    table = DecisionTable(resp_types, action_domain, risk_domain, low_threshold)
+
+    classifier_results = {
+        (resp_type, low): ClassifierResult(
+            type=resp_type,
+            confidence=low_threshold - 1.0 if low else low_threshold,
+            trigger_spans=[],
+        )
+        for resp_type in resp_types
+        for low in (False, True)
+    }
+    routing_samples = {
+        False: {},
+        True: {
+            "confidence": _ROUTING_WEAK_SIGNAL_THRESHOLD,
+            "hinted_tools": [{"tool_id": _OTHER, "confidence": _ROUTING_WEAK_SIGNAL_THRESHOLD}],
+        },
+    }
+    evidence_samples = {slot: _evidence_for_slot(slot) for slot in range(4)}
+
+    for resp_idx, resp_type in enumerate(resp_types):
+        for action_idx, action_type in enumerate(action_domain):
+            for risk_idx, risk_level in enumerate(risk_domain):
+                for guarantee in (False, True):
+                    risk_rules = ["RISK_GUARANTEE_CLAIM"] if guarantee else []
+                    for permission_ok in (False, True):
+                        for slot in range(4):
+                            for low in (False, True):
+                                for routing_hit in (False, True):
+                                    try:
+                                        entry = _run_stages(
+                                            matrix, config_str_to_index,
+                                            classifier_results[(resp_type, low)],
+                                            action_type, risk_level, risk_rules,
+                                            permission_ok, evidence_samples[slot],
+                                            routing_samples[routing_hit],
+                                        )
+                                    except Exception:
+                                        entry = None
+                                    table._entries[table._offset(
+                                        resp_idx, action_idx, risk_idx, guarantee,
+                                        permission_ok, slot, low, routing_hit,
+                                    )] = entry
+    return table
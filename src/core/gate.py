@@ -5,17 +5,21 @@ This module is the ONLY place where Decision enum is created and written to resp
 All stages return intermediate states (strings, indices, dictionaries) that are
 mapped to Decision enum only in this module.
 """
+import asyncio
 import uuid
 import time
-import os
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from .models import (
     Decision, DecisionRequest, DecisionResponse, GateContext,
     Explanation, PolicyInfo, ResponsibilityType, ClassifierResult,
     PostcheckResult
 )
+from .records import PipelineContext, DecisionOutcome
+from .trace import DecisionTrace, emit_trace
+from .runtime_config import GateRuntimeConfig, get_runtime_config, normalize_risk_tier
+from .config_manager import ConfigSnapshot, get_config_snapshot
 from .classifier import classify
-from .matrix import load_matrix, resolve_matrix_path, resolve_effective_matrix_path_for_loop
+from .matrix import Matrix, load_matrix, resolve_matrix_path, resolve_effective_matrix_path_for_loop
 from .postcheck import postcheck
 from .gate_helpers import collect_all_evidence
 from .gate_stages import (
@@ -24,7 +28,16 @@ from .gate_stages import (
     apply_missing_evidence_policy,
     apply_conflict_resolution_and_overrides,
 )
-from .loop_guard import parse_loop_state, evaluate_loop_guard
+from .decision_table import DecisionTable, compile_decision_table
+from .decision_cache import (
+    current_cache_version,
+    decision_cache_key,
+    get_decision_cache,
+    outcome_for_hit,
+)
+from .loop_guard import LoopState, parse_loop_state, evaluate_loop_guard
+from .metrics import observe_decision
+from .timings import StageTimings, get_timing_window
 
 # Decision strict order (only used for mapping intermediate states to Decision enum)
 STRICT_ORDER = ["ALLOW", "ONLY_SUGGEST", "HITL", "DENY"]
@@ -36,41 +49,13 @@ TIMEOUT_GUARD_REASON_DEGRADED_ONLY = "DEGRADED_ONLY"
 TIMEOUT_GUARD_REASON_HITL_AND_DEGRADED = "HITL_AND_DEGRADED"
 
 
-def _env_flag(name: str, default: bool) -> bool:
-    """
-    Read a boolean-ish environment variable with a safe default.
-
-    Accepts: "1", "true", "yes", "y", "on" (case-insensitive) as True.
-    Any other explicit value is treated as False.
-    """
-    raw = os.getenv(name)
-    if raw is None:
-        return default
-    return raw.strip().lower() in ("1", "true", "yes", "y", "on")
-
-
-def _normalize_risk_tier(value: str) -> str:
-    """
-    Normalize a risk tier string into one of the supported tiers.
-
-    Supported tiers: R0, R1, R2, R3. Any unknown value falls back to R2.
-    """
-    allowed = {"R0", "R1", "R2", "R3"}
-    if not isinstance(value, str):
-        return "R2"
-    upper = value.strip().upper()
-    if upper in allowed:
-        return upper
-    return "R2"
-
-
-def _resolve_risk_tier(req: DecisionRequest) -> tuple[str, str]:
+def _resolve_risk_tier(req: DecisionRequest, runtime_config: GateRuntimeConfig) -> tuple[str, str]:
     """
     Resolve effective risk tier for timeout guard overlays.
 
     Priority (highest to lowest):
     1. Request field (if present, future-compatible)
-    2. Environment variable AI_GATE_RISK_TIER
+    2. Environment variable AI_GATE_RISK_TIER (resolved in the runtime config snapshot)
     3. Default "R2"
 
     Returns (tier, source) where source is one of {"req", "env", "default"}.
@@ -79,17 +64,11 @@ def _resolve_risk_tier(req: DecisionRequest) -> tuple[str, str]:
     # prefer it here without changing helpers or Evidence layer.
     tier_from_req = getattr(req, "risk_tier", None)
     if isinstance(tier_from_req, str) and tier_from_req.strip():
-        normalized = _normalize_risk_tier(tier_from_req)
+        normalized = normalize_risk_tier(tier_from_req)
         source = "req" if normalized == tier_from_req.strip().upper() else "default"
         return normalized, source
 
-    env_val = os.getenv("AI_GATE_RISK_TIER")
-    if env_val:
-        normalized = _normalize_risk_tier(env_val)
-        source = "env" if normalized == env_val.strip().upper() else "default"
-        return normalized, source
-
-    return "R2", "default"
+    return runtime_config.risk_tier, runtime_config.risk_tier_source
 
 def _config_str_to_index(decision_str: str) -> int:
     """Convert config string (from matrix YAML) to index. Only conversion point."""
@@ -109,6 +88,76 @@ def _map_string_to_decision(decision_str: str) -> Decision:
     """Map decision string to Decision enum. Only function that creates Decision."""
     return Decision(decision_str)
 
+def _get_decision_table(matrix) -> Optional[DecisionTable]:
+    """
+    Return the compiled stage 2-5 decision table for a loaded matrix.
+
+    Compiled once per Matrix instance (load_matrix caches instances), using
+    _config_str_to_index so gate.py stays the only config string conversion point.
+    Non-Matrix objects (e.g. test doubles) have no table and use the staged path.
+    """
+    if not isinstance(matrix, Matrix):
+        return None
+    if matrix.decision_table is None:
+        matrix.decision_table = compile_decision_table(matrix, _config_str_to_index)
+    return matrix.decision_table
+
+def _load_matrix_for_batch(path: str, matrices: Optional[Dict[str, Matrix]]) -> Matrix:
+    """Load a matrix, memoized per batch when a batch-local dict is given."""
+    if matrices is None:
+        return load_matrix(path)
+    matrix = matrices.get(path)
+    if matrix is None:
+        matrix = load_matrix(path)
+        matrices[path] = matrix
+    return matrix
+
+# Default cap on in-flight items of one decide_many() batch. Bounds event-loop
+# queueing so per-provider evidence timeouts are not consumed by batch backlog.
+DECIDE_MANY_MAX_CONCURRENCY = 32
+
+async def decide_many(
+    requests: Sequence[DecisionRequest],
+    matrix_path: str = "matrices/v0.1.yaml",
+    max_concurrency: int = DECIDE_MANY_MAX_CONCURRENCY,
+) -> List[Union[DecisionResponse, Exception]]:
+    """
+    Batch decision API.
+
+    - Each distinct (profile / loop-routed) matrix path is resolved and loaded once per batch.
+    - Items run concurrently (at most max_concurrency in flight), so evidence
+      collection for the batch is interleaved on the event loop instead of one
+      request at a time.
+    - Results are returned in input order; a failing item yields its exception
+      (e.g. RuntimeError for configuration errors) without affecting the others.
+    """
+    matrices: Dict[str, Matrix] = {}
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _bounded(req: DecisionRequest) -> DecisionResponse:
+        async with semaphore:
+            start = time.perf_counter()
+            outcome = await _decide_cached(req, matrix_path, matrices)
+            _observe_outcome(outcome, start)
+        return outcome.to_response(include_timings=req.timings)
+
+    return await asyncio.gather(
+        *(_bounded(req) for req in requests),
+        return_exceptions=True,
+    )
+
+def _observe_outcome(outcome: DecisionOutcome, start: float) -> None:
+    """
+    Decision metrics (metrics.py): latency by decision and the reason counters;
+    stage timings into the rolling window (timings.py).
+    """
+    observe_decision(
+        outcome.decision.value, outcome.primary_reason, outcome.timeout_guard_reason,
+        time.perf_counter() - start,
+    )
+    if outcome.timings is not None:
+        get_timing_window().record(outcome.timings)
+
 async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml") -> DecisionResponse:
     """
     Main decision pipeline with phased architecture.
@@ -124,10 +173,122 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
     This function orchestrates all stages and is the ONLY place where Decision enum
     is created and written to DecisionResponse.
     """
-    req_id = str(uuid.uuid4())
+    start = time.perf_counter()
+    outcome = await _decide_cached(req, matrix_path, None)
+    _observe_outcome(outcome, start)
+    return outcome.to_response(include_timings=req.timings)
+
+async def decide_timed(
+    req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml"
+) -> Tuple[DecisionResponse, Optional[StageTimings]]:
+    """decide() that also hands back the stage timings (e.g. for a Server-Timing header)."""
+    start = time.perf_counter()
+    outcome = await _decide_cached(req, matrix_path, None)
+    _observe_outcome(outcome, start)
+    return outcome.to_response(include_timings=req.timings), outcome.timings
+
+async def decide_matrices(
+    req: DecisionRequest, matrix_paths: Sequence[str]
+) -> List[DecisionResponse]:
+    """
+    One request decided against several matrices (e.g. a replay policy sweep):
+    classifier and evidence run once, stages 2-6 once per matrix. Responses
+    are in matrix_paths order, each equal to decide(req, path) except for
+    request_id / latency_ms / timings.
+
+    Not a serving path: skips the decision cache, /metrics and the timing
+    window, and ignores verbose (one trace cannot describe several decisions).
+    """
+    if req.verbose:
+        req = req.model_copy(update={"verbose": False})
+    outcomes = await _decide_for_matrices(req, matrix_paths, None)
+    return [outcome.to_response(include_timings=req.timings) for outcome in outcomes]
+
+async def _decide_cached(
+    req: DecisionRequest,
+    matrix_path: str,
+    matrices: Optional[Dict[str, Matrix]],
+) -> DecisionOutcome:
+    """
+    _decide() behind the opt-in whole-decision cache (see decision_cache.py).
+
+    Verbose requests and configuration errors always take the full pipeline.
+    """
+    runtime_config = get_runtime_config()
+    if not runtime_config.decision_cache_enabled or req.verbose:
+        return await _decide(req, matrix_path, matrices, runtime_config)
+
+    timings = StageTimings()
     request_start = time.perf_counter()
+    profile = None
+    if req.structured_input and isinstance(req.structured_input, dict):
+        profile = req.structured_input.get("profile")
+    effective_matrix_path = resolve_matrix_path(profile, matrix_path)
+    try:
+        matrix_version = _load_matrix_for_batch(effective_matrix_path, matrices).version
+    except (FileNotFoundError, ValueError):
+        # Let the pipeline report the configuration error.
+        return await _decide(req, matrix_path, matrices, runtime_config)
+
+    cache = get_decision_cache(runtime_config.decision_cache_size, runtime_config.decision_cache_ttl_s)
+    cache.check_version(current_cache_version(runtime_config.version))
+    key = decision_cache_key(req, effective_matrix_path, matrix_version)
+    cached = cache.get(key)
+    timings.mark("decision_cache")
+    if cached is not None:
+        timings.finish()
+        return outcome_for_hit(cached, req, request_start, timings)
+
+    outcome = await _decide(req, matrix_path, matrices, runtime_config, timings)
+    if outcome.cacheable:
+        cache.put(key, outcome)
+    return outcome
+
+async def _decide(
+    req: DecisionRequest,
+    matrix_path: str,
+    matrices: Optional[Dict[str, Matrix]],
+    runtime_config: Optional[GateRuntimeConfig] = None,
+    timings: Optional[StageTimings] = None,
+) -> DecisionOutcome:
+    """
+    Pipeline body shared by decide() and decide_many() (batch-local matrix memo).
+
+    Runs on plain records (PipelineContext in, DecisionOutcome out); req has
+    already been validated, so no pydantic model is built until the caller
+    converts the outcome with to_response().
+    """
+    return (await _decide_for_matrices(req, (matrix_path,), matrices, runtime_config, timings))[0]
+
+
+async def _decide_for_matrices(
+    req: DecisionRequest,
+    matrix_paths: Sequence[str],
+    matrices: Optional[Dict[str, Matrix]],
+    runtime_config: Optional[GateRuntimeConfig] = None,
+    timings: Optional[StageTimings] = None,
+) -> List[DecisionOutcome]:
+    """
+    One request against each matrix in matrix_paths. Setup, classifier and
+    evidence do not read the matrix and run once; matrix resolution (stage 0)
+    and stages 2-6 run per matrix.
 
-    ctx = GateContext(
+    With more than one matrix, each outcome gets its own StageTimings, started
+    after evidence collection.
+    """
+    req_id = str(uuid.uuid4())
+    request_start = time.perf_counter()
+    # Stage boundaries are marked as the pipeline goes (see timings.py).
+    if timings is None:
+        timings = StageTimings()
+    # One runtime config snapshot for the whole request (reloads never mix values).
+    if runtime_config is None:
+        runtime_config = get_runtime_config()
+    # Likewise one YAML config snapshot: a hot reload never changes a request
+    # that is already running (see config_manager.py).
+    config_snapshot = get_config_snapshot()
+
+    ctx = PipelineContext(
         request_id=req_id,
         session_id=req.session_id,
         user_id=req.user_id,
@@ -139,6 +300,9 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
         verbose=req.verbose,
         context=req.context,
         structured_input=req.structured_input,
+        runtime_config=runtime_config,
+        config_snapshot=config_snapshot,
+        timings=timings,
     )
 
     # Optional LoopState (Phase B: core-level Loop Guard hook).
@@ -148,51 +312,99 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
     if req.context and isinstance(req.context, dict) and "loop_state" in req.context:
         loop_state = parse_loop_state(req.context.get("loop_state"))
 
-    trace = []
+    # Structured trace (verbose only): events are formatted when read, never printed.
+    trace = DecisionTrace(req_id) if req.verbose else None
     if req.verbose:
-        trace.append(f"[TRACE] Request ID: {req_id}")
-        trace.append(f"[TRACE] User Input: \"{req.text}\"")
+        trace.event("request", "id", "Request ID: {request_id}", request_id=req_id)
+        trace.event("request", "text", 'User Input: "{text}"', text=req.text)
         if req.context:
-            trace.append(f"[TRACE] Context: {req.context}")
-        timeout_guard_policy_version = os.getenv(
-            "AI_GATE_TIMEOUT_GUARD_POLICY_VERSION",
-            "v1",
-        )
-        trace.append(
-            f"[TRACE] timeout_guard_policy_version={timeout_guard_policy_version}"
+            trace.event("request", "context", "Context: {context}", context=req.context)
+        trace.event(
+            "request", "timeout_guard_policy_version",
+            "timeout_guard_policy_version={version}",
+            version=runtime_config.timeout_guard_policy_version,
         )
 
-    # Resolve matrix path based on optional profile (Phase D: profile → matrix L1)
+    # Optional profile selecting the matrix (Phase D: profile → matrix L1)
     profile = None
     if req.structured_input and isinstance(req.structured_input, dict):
         profile = req.structured_input.get("profile")
 
+    timings.mark("setup")
+
+    request_matrices = [
+        _load_request_matrix(req, path, profile, loop_state, matrices, trace) for path in matrix_paths
+    ]
+
+    timings.mark("matrix")
+    classifier_result = await classify(ctx)
+    timings.mark("classifier")
+
+    if req.verbose:
+        trace.event(
+            "classifier", "result", "1. Classifier: type={type}, confidence={confidence}",
+            type=classifier_result.type.value, confidence=classifier_result.confidence,
+        )
+
+    # Stage 1: Collect all evidence
+    evidence = await collect_all_evidence(ctx, trace if req.verbose else [])
+    timings.mark("evidence")
+
+    if len(request_matrices) == 1:
+        return [_decide_stages(
+            req, ctx, request_matrices[0], classifier_result, evidence, loop_state, trace,
+            runtime_config, config_snapshot, timings, req_id, request_start,
+        )]
+    postchecks: Dict[bool, PostcheckResult] = {}
+    return [
+        _decide_stages(
+            req, ctx, matrix, classifier_result, evidence, loop_state, trace,
+            runtime_config, config_snapshot, StageTimings(), req_id, request_start, postchecks,
+        )
+        for matrix in request_matrices
+    ]
+
+
+def _load_request_matrix(
+    req: DecisionRequest,
+    matrix_path: str,
+    profile: Optional[str],
+    loop_state: Optional[LoopState],
+    matrices: Optional[Dict[str, Matrix]],
+    trace: Optional[DecisionTrace],
+) -> Matrix:
+    """Stage 0: the request's matrix (profile, then loop-aware routing)."""
+    # Resolve matrix path based on optional profile (Phase D: profile → matrix L1)
     effective_matrix_path = resolve_matrix_path(profile, matrix_path)
 
     # Load matrix with error handling
     try:
-        matrix = load_matrix(effective_matrix_path)
+        matrix = _load_matrix_for_batch(effective_matrix_path, matrices)
     except FileNotFoundError as e:
         if req.verbose:
-            trace.append(f"[TRACE] FATAL: Matrix file not found: {effective_matrix_path}")
-            print("\n".join(trace))
+            trace.event(
+                "matrix", "fatal", "FATAL: Matrix file not found: {path}",
+                path=effective_matrix_path,
+            )
+            emit_trace(trace)
         raise RuntimeError(
             f"System configuration error: Matrix file not found: {effective_matrix_path}. "
             f"System cannot make decisions without matrix configuration."
         ) from e
     except ValueError as e:
         if req.verbose:
-            trace.append(f"[TRACE] FATAL: Invalid matrix configuration: {e}")
-            print("\n".join(trace))
+            trace.event("matrix", "fatal", "FATAL: Invalid matrix configuration: {error}", error=e)
+            emit_trace(trace)
         raise RuntimeError(
             f"System configuration error: Invalid matrix file {effective_matrix_path}: {e}. "
             f"Please check matrix YAML syntax and structure."
         ) from e
     
     if req.verbose:
-        trace.append(
-            f"[TRACE] 0. Profile → Matrix: profile={profile or 'default'}, "
-            f"matrix_path={effective_matrix_path}"
+        trace.event(
+            "matrix", "profile",
+            "0. Profile → Matrix: profile={profile}, matrix_path={path}",
+            profile=profile or "default", path=effective_matrix_path,
         )
 
     # Loop-aware matrix routing (Phase 1): resolve effective path from loop_policy + loop_state
@@ -204,19 +416,25 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
             effective_matrix_path = resolve_effective_matrix_path_for_loop(loop_state, matrix, effective_matrix_path)
             if effective_matrix_path != prev_path:
                 try:
-                    matrix = load_matrix(effective_matrix_path)
+                    matrix = _load_matrix_for_batch(effective_matrix_path, matrices)
                 except FileNotFoundError as e:
                     if req.verbose:
-                        trace.append(f"[TRACE] FATAL: Loop-routed matrix not found: {effective_matrix_path}")
-                        print("\n".join(trace))
+                        trace.event(
+                            "loop_matrix", "fatal", "FATAL: Loop-routed matrix not found: {path}",
+                            path=effective_matrix_path,
+                        )
+                        emit_trace(trace)
                     raise RuntimeError(
                         f"System configuration error: Loop-routed matrix not found: {effective_matrix_path}. "
                         f"Check loop_policy.churn_matrix_path / converged_matrix_path."
                     ) from e
                 except ValueError as e:
                     if req.verbose:
-                        trace.append(f"[TRACE] FATAL: Invalid loop-routed matrix: {e}")
-                        print("\n".join(trace))
+                        trace.event(
+                            "loop_matrix", "fatal", "FATAL: Invalid loop-routed matrix: {error}",
+                            error=e,
+                        )
+                        emit_trace(trace)
                     raise RuntimeError(
                         f"System configuration error: Invalid loop-routed matrix {effective_matrix_path}: {e}"
                     ) from e
@@ -228,30 +446,52 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
                     elif policy.get("benign_streak_threshold") is not None and loop_state.nit_only_streak >= policy.get("benign_streak_threshold", 0):
                         reason = "loop_routing_reason=converged"
                 suffix = f", {reason}" if reason else " (unchanged)"
-                trace.append(
-                    f"[TRACE] 0.1 Loop-Aware Matrix: loop_state=round_index={loop_state.round_index},nit_only_streak={loop_state.nit_only_streak}, "
-                    f"loop_policy_present=True, effective_matrix_path={effective_matrix_path}{suffix}"
+                trace.event(
+                    "loop_matrix", "routed",
+                    "0.1 Loop-Aware Matrix: loop_state=round_index={round_index},nit_only_streak={nit_only_streak}, "
+                    "loop_policy_present=True, effective_matrix_path={path}{suffix}",
+                    round_index=loop_state.round_index, nit_only_streak=loop_state.nit_only_streak,
+                    path=effective_matrix_path, suffix=suffix,
                 )
         elif req.verbose:
             if loop_state is None:
-                trace.append(
-                    f"[TRACE] 0.1 Loop-Aware Matrix: loop_state_parse_failed=True, "
-                    f"effective_matrix_path={effective_matrix_path} (fallback)"
+                trace.event(
+                    "loop_matrix", "parse_failed",
+                    "0.1 Loop-Aware Matrix: loop_state_parse_failed=True, "
+                    "effective_matrix_path={path} (fallback)",
+                    path=effective_matrix_path,
                 )
             else:
-                trace.append(
-                    f"[TRACE] 0.1 Loop-Aware Matrix: loop_state=round_index={loop_state.round_index},nit_only_streak={loop_state.nit_only_streak}, "
-                    f"loop_policy_present=False, effective_matrix_path={effective_matrix_path} (unchanged)"
+                trace.event(
+                    "loop_matrix", "no_policy",
+                    "0.1 Loop-Aware Matrix: loop_state=round_index={round_index},nit_only_streak={nit_only_streak}, "
+                    "loop_policy_present=False, effective_matrix_path={path} (unchanged)",
+                    round_index=loop_state.round_index, nit_only_streak=loop_state.nit_only_streak,
+                    path=effective_matrix_path,
                 )
 
-    classifier_result = await classify(ctx)
-
-    if req.verbose:
-        trace.append(f"[TRACE] 1. Classifier: type={classifier_result.type.value}, confidence={classifier_result.confidence}")
-
-    # Stage 1: Collect all evidence
-    evidence = await collect_all_evidence(ctx, trace if req.verbose else [])
-
+    return matrix
+
+
+def _decide_stages(
+    req: DecisionRequest,
+    ctx: PipelineContext,
+    matrix: Matrix,
+    classifier_result: ClassifierResult,
+    evidence: dict,
+    loop_state: Optional[LoopState],
+    trace: Optional[DecisionTrace],
+    runtime_config: GateRuntimeConfig,
+    config_snapshot: ConfigSnapshot,
+    timings: StageTimings,
+    req_id: str,
+    request_start: float,
+    postchecks: Optional[Dict[bool, PostcheckResult]] = None,
+) -> DecisionOutcome:
+    """
+    Stages 2-6 against one matrix, from the request's classification and
+    evidence. postchecks: postcheck results shared by the request's matrices.
+    """
     # Optional timeout guard meta (Phase 3.x: explain-only → decision overlay).
     meta = {}
     if isinstance(evidence, dict) and "_meta" in evidence:
@@ -273,40 +513,54 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
     else:
         permission_ok = False
 
-    # Stage 2: Apply type upgrade rules
-    final_resp_type = apply_type_upgrade_rules(
-        matrix, classifier_result, action_type, trace if req.verbose else []
-    )
+    # Stages 2-5: precomputed decision table (non-verbose fast path).
+    # Verbose requests always run the staged functions so trace output is unchanged.
+    table_entry = None
+    decision_table = None if req.verbose else _get_decision_table(matrix)
+    if decision_table is not None:
+        table_entry = decision_table.lookup(
+            classifier_result, action_type, risk_level, risk_rules, permission_ok,
+            evidence, routing_data,
+        )
 
-    # Stage 3: Lookup matrix decision (returns intermediate state)
-    matrix_result = lookup_matrix(
-        matrix, final_resp_type, action_type, risk_level, risk_rules, permission_ok,
-        trace if req.verbose else []
-    )
-    # Convert config string to index if present (gate.py is the only conversion point)
-    if "config_decision_str" in matrix_result:
-        decision_index = _config_str_to_index(matrix_result["config_decision_str"])
-    elif "decision_index" in matrix_result:
-        decision_index = matrix_result["decision_index"]
+    if table_entry is not None:
+        final_resp_type, decision_index, primary_reason, rules_fired = table_entry
+        rules_fired = list(rules_fired)
     else:
-        decision_index = 0  # Default fallback
-    primary_reason = matrix_result["primary_reason"]
-    rules_fired = matrix_result["rules_fired"]
+        # Stage 2: Apply type upgrade rules
+        final_resp_type = apply_type_upgrade_rules(
+            matrix, classifier_result, action_type, trace if req.verbose else []
+        )
 
-    # Stage 4: Apply missing evidence policy (returns updated intermediate state)
-    missing_policy_result = apply_missing_evidence_policy(
-        decision_index, primary_reason, evidence, matrix, trace if req.verbose else []
-    )
-    decision_index = missing_policy_result["decision_index"]
-    primary_reason = missing_policy_result["primary_reason"]
+        # Stage 3: Lookup matrix decision (returns intermediate state)
+        matrix_result = lookup_matrix(
+            matrix, final_resp_type, action_type, risk_level, risk_rules, permission_ok,
+            trace if req.verbose else []
+        )
+        # Convert config string to index if present (gate.py is the only conversion point)
+        if "config_decision_str" in matrix_result:
+            decision_index = _config_str_to_index(matrix_result["config_decision_str"])
+        elif "decision_index" in matrix_result:
+            decision_index = matrix_result["decision_index"]
+        else:
+            decision_index = 0  # Default fallback
+        primary_reason = matrix_result["primary_reason"]
+        rules_fired = matrix_result["rules_fired"]
 
-    # Stage 5: Apply conflict resolution and overrides (returns updated intermediate state)
-    conflict_result = apply_conflict_resolution_and_overrides(
-        decision_index, primary_reason, matrix, classifier_result, final_resp_type,
-        action_type, risk_level, permission_ok, routing_data, trace if req.verbose else []
-    )
-    decision_index = conflict_result["decision_index"]
-    primary_reason = conflict_result["primary_reason"]
+        # Stage 4: Apply missing evidence policy (returns updated intermediate state)
+        missing_policy_result = apply_missing_evidence_policy(
+            decision_index, primary_reason, evidence, matrix, trace if req.verbose else []
+        )
+        decision_index = missing_policy_result["decision_index"]
+        primary_reason = missing_policy_result["primary_reason"]
+
+        # Stage 5: Apply conflict resolution and overrides (returns updated intermediate state)
+        conflict_result = apply_conflict_resolution_and_overrides(
+            decision_index, primary_reason, matrix, classifier_result, final_resp_type,
+            action_type, risk_level, permission_ok, routing_data, trace if req.verbose else []
+        )
+        decision_index = conflict_result["decision_index"]
+        primary_reason = conflict_result["primary_reason"]
 
     # Stage 5.5: Loop Guard (core-level hook, default no-op, tighten-only safe)
     # Always execute for L0 consistency and uniform audit/replay semantics.
@@ -319,9 +573,10 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
     if new_decision_index < decision_index:
         # Ignore any attempted relax from custom implementations.
         if req.verbose:
-            trace.append(
-                "[TRACE] 5.5 LoopGuard: attempted relax ignored "
-                f"(from index={decision_index} to index={new_decision_index})"
+            trace.event(
+                "loop_guard", "relax_ignored",
+                "5.5 LoopGuard: attempted relax ignored (from index={from_index} to index={to_index})",
+                from_index=decision_index, to_index=new_decision_index,
             )
     else:
         decision_index = new_decision_index
@@ -329,59 +584,32 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
     # Stage 5.6: Timeout guard-based HITL overlay (tighten-only, explain-driven).
     # Stage 5.7: Timeout guard-based DENY overlay (tighten-only, explain-driven, fail-closed).
     # NOTE: Explain-only meta remains non-decisional; overlays are applied here in gate.py only.
-    timeout_guard_enabled = _env_flag("AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED", True)
-    hitl_overlay_enabled = _env_flag("AI_GATE_TIMEOUT_GUARD_HITL_OVERLAY_ENABLED", True)
-    deny_overlay_enabled = _env_flag("AI_GATE_TIMEOUT_GUARD_DENY_OVERLAY_ENABLED", True)
+    timeout_guard_enabled = runtime_config.timeout_guard_overlay_enabled
+    hitl_overlay_enabled = runtime_config.hitl_overlay_enabled
+    deny_overlay_enabled = runtime_config.deny_overlay_enabled
 
     # Explain-only reason code for timeout guard overlays (Task 4.3).
     timeout_guard_reason = TIMEOUT_GUARD_REASON_NONE
 
     if meta and timeout_guard_enabled:
         # Resolve risk tier for this decision (gate-level only; helpers remain unaware).
-        risk_tier, risk_source = _resolve_risk_tier(req)
+        risk_tier, risk_source = _resolve_risk_tier(req, runtime_config)
         if req.verbose:
-            trace.append(f"[TRACE] risk_tier={risk_tier} (source={risk_source})")
-            policy_version = os.getenv("AI_GATE_TIMEOUT_GUARD_POLICY_VERSION", "v1")
-            trace.append(
-                f"[TRACE] timeout_guard_policy={policy_version} (risk_tier={risk_tier})"
+            trace.event(
+                "timeout_guard", "risk_tier", "risk_tier={risk_tier} (source={source})",
+                risk_tier=risk_tier, source=risk_source,
+            )
+            trace.event(
+                "timeout_guard", "policy", "timeout_guard_policy={version} (risk_tier={risk_tier})",
+                version=runtime_config.timeout_guard_policy_version, risk_tier=risk_tier,
             )
 
-        # Tier-specific overlay allowances (tighten-only, never relax).
-        tier_overlays = {
-            "R0": {
-                "allow_hitl_overlay": False,
-                "allow_deny_overlay": False,
-                "allow_degraded_to_hitl": False,
-            },
-            "R1": {
-                "allow_hitl_overlay": True,
-                "allow_deny_overlay": False,
-                "allow_degraded_to_hitl": False,
-            },
-            "R2": {
-                "allow_hitl_overlay": True,
-                "allow_deny_overlay": True,
-                "allow_degraded_to_hitl": False,
-            },
-            "R3": {
-                "allow_hitl_overlay": True,
-                "allow_deny_overlay": True,
-                "allow_degraded_to_hitl": True,
-            },
-        }
-        tier_cfg = tier_overlays.get(risk_tier, tier_overlays["R2"])
-
-        allow_hitl_overlay = tier_cfg["allow_hitl_overlay"]
-        allow_deny_overlay = tier_cfg["allow_deny_overlay"]
-        allow_degraded_to_hitl = tier_cfg["allow_degraded_to_hitl"]
-
-        # Effective overlays must respect both global feature flags and tier policy.
-        effective_hitl_overlay_enabled = hitl_overlay_enabled and allow_hitl_overlay
-        # DENY overlay is only possible when HITL overlay is also enabled by both
-        # config and tier policy, to avoid ALLOW → DENY without HITL escalations.
-        effective_deny_overlay_enabled = (
-            deny_overlay_enabled and allow_deny_overlay and effective_hitl_overlay_enabled
-        )
+        # Tier-specific overlay allowances (tighten-only, never relax), precomputed
+        # together with the global feature flags in the runtime config snapshot.
+        tier_policy = runtime_config.overlay_policy(risk_tier)
+        allow_degraded_to_hitl = tier_policy.allow_degraded_to_hitl
+        effective_hitl_overlay_enabled = tier_policy.hitl_overlay
+        effective_deny_overlay_enabled = tier_policy.deny_overlay
 
         hitl_index = STRICT_ORDER.index("HITL")
         deny_index = STRICT_ORDER.index("DENY")
@@ -416,16 +644,18 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
             decision_index = deny_index
             timeout_guard_reason = TIMEOUT_GUARD_REASON_HITL_AND_DEGRADED
             if req.verbose:
-                trace.append("[TRACE] gate_decision=DENY (timeout_guard: hitl+degraded)")
+                trace.event("timeout_guard", "deny", "gate_decision=DENY (timeout_guard: hitl+degraded)")
     elif meta and req.verbose:
         # Optional trace-only explanation when overlays are disabled via config.
         if not timeout_guard_enabled:
-            trace.append("[TRACE] timeout_guard_overlay: disabled (feature flag off)")
+            trace.event("timeout_guard", "overlay_disabled", "timeout_guard_overlay: disabled (feature flag off)")
         else:
             if not hitl_overlay_enabled:
-                trace.append("[TRACE] timeout_guard_overlay: HITL overlay disabled")
+                trace.event("timeout_guard", "hitl_overlay_disabled", "timeout_guard_overlay: HITL overlay disabled")
             if not deny_overlay_enabled:
-                trace.append("[TRACE] timeout_guard_overlay: DENY overlay disabled")
+                trace.event("timeout_guard", "deny_overlay_disabled", "timeout_guard_overlay: DENY overlay disabled")
+
+    timings.mark("stages")
 
     # Map intermediate state to Decision enum (ONLY place where Decision is created)
     decision = _map_index_to_decision(decision_index)
@@ -460,35 +690,44 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
         if missing_fields:
             summary += " (incomplete context requires human review)"
 
-    explanation = Explanation(
-        summary=summary,
-        evidence_used=evidence_used,
-        trigger_spans=trigger_spans
-    )
-
-    # Stage 6: Postcheck
-    pc_result = postcheck(req.text, decision == Decision.ONLY_SUGGEST, is_input=True)
+    # Stage 6: Postcheck (depends only on the text and the disclaimer flag, so
+    # several matrices of one request can share results).
+    requires_disclaimer = decision == Decision.ONLY_SUGGEST
+    pc_result = postchecks.get(requires_disclaimer) if postchecks is not None else None
+    if pc_result is None:
+        pc_result = postcheck(
+            req.text,
+            requires_disclaimer,
+            is_input=True,
+            keyword_hits=ctx.analysis.keyword_hits if req.text is not None else None,
+            risk_config=config_snapshot.documents["risk_keywords"],
+        )
+        if postchecks is not None:
+            postchecks[requires_disclaimer] = pc_result
 
     if req.verbose:
-        trace.append(f"[TRACE] 4. Gate Decision:")
-        trace.append(f"[TRACE]   - decision: {decision_str}")
-        trace.append(f"[TRACE]   - primary_reason: {primary_reason}")
-        trace.append(f"[TRACE]   - suggested_action: {suggested_action}")
+        trace.event("decision", "header", "4. Gate Decision:")
+        trace.event("decision", "decision", "  - decision: {decision}", decision=decision_str)
+        trace.event("decision", "primary_reason", "  - primary_reason: {reason}", reason=primary_reason)
+        trace.event("decision", "suggested_action", "  - suggested_action: {action}", action=suggested_action)
         if meta:
             degradation_suggested = bool(meta.get("_degradation_suggested"))
             hitl_suggested = bool(meta.get("_hitl_suggested"))
             if hitl_suggested:
-                trace.append(
-                    "[TRACE]   - timeout_guard: HITL suggested "
-                    "(hitl_suggested=True)"
+                trace.event(
+                    "decision", "timeout_guard_hitl",
+                    "  - timeout_guard: HITL suggested (hitl_suggested=True)",
                 )
             if degradation_suggested:
-                trace.append(
-                    "[TRACE]   - timeout_guard: degraded "
-                    "(degradation_suggested=True)"
+                trace.event(
+                    "decision", "timeout_guard_degraded",
+                    "  - timeout_guard: degraded (degradation_suggested=True)",
                 )
         if timeout_guard_reason != TIMEOUT_GUARD_REASON_NONE:
-            trace.append(f"[TRACE]   - timeout_guard_reason={timeout_guard_reason}")
+            trace.event(
+                "decision", "timeout_guard_reason", "  - timeout_guard_reason={reason}",
+                reason=timeout_guard_reason,
+            )
 
     # Apply postcheck tightening (if needed)
     if not pc_result.passed:
@@ -502,33 +741,42 @@ async def decide(req: DecisionRequest, matrix_path: str = "matrices/v0.1.yaml")
         decision = _map_index_to_decision(decision_index)
         decision_str = STRICT_ORDER[decision_index]
         if req.verbose:
-            trace.append(f"[TRACE]   - postcheck: triggered tightening")
-            trace.append(f"[TRACE]   - issues: {[i.code for i in pc_result.issues]}")
+            issue_codes = [i.code for i in pc_result.issues]
+            trace.event("decision", "postcheck_tightening", "  - postcheck: triggered tightening")
+            trace.event("decision", "postcheck_issues", "  - issues: {issues}", issues=issue_codes)
 
     if req.verbose:
-        trace.append(f"[TRACE] 5. Postcheck:")
+        trace.event("postcheck", "header", "5. Postcheck:")
         if pc_result.passed:
-            trace.append(f"[TRACE]   - ok")
+            trace.event("postcheck", "ok", "  - ok")
         else:
-            trace.append(f"[TRACE]   - issues: {[i.code for i in pc_result.issues]}")
-        print("\n".join(trace))
-
-    policy = PolicyInfo(
-        matrix_version=matrix.version,
-        rules_fired=rules_fired if req.debug else None
-    )
+            trace.event(
+                "postcheck", "issues", "  - issues: {issues}",
+                issues=[i.code for i in pc_result.issues],
+            )
+        emit_trace(trace)
 
+    timings.mark("postcheck")
+    timings.finish()
     total_latency_ms = int((time.perf_counter() - request_start) * 1000)
 
-    # Final Decision enum assignment (ONLY place where Decision is written to response)
-    return DecisionResponse(
+    # Final Decision enum assignment (ONLY place where Decision is written to the outcome)
+    return DecisionOutcome(
         request_id=req_id,
         session_id=req.session_id,
         responsibility_type=final_resp_type,
         decision=decision,  # Decision enum written here
         primary_reason=primary_reason,
         suggested_action=suggested_action,
-        explanation=explanation,
-        policy=policy,
-        latency_ms=total_latency_ms
+        summary=summary,
+        evidence_used=evidence_used,
+        trigger_spans=trigger_spans,
+        matrix_version=matrix.version,
+        rules_fired=rules_fired if req.debug else None,
+        latency_ms=total_latency_ms,
+        trace=trace,
+        # Only decisions made on complete, non-degraded evidence may be memoized.
+        cacheable=len(evidence_used) == 5 and not meta.get("_degradation_suggested"),
+        timeout_guard_reason=timeout_guard_reason,
+        timings=timings,
     )
@@ -4,6 +4,7 @@ Helper functions for gate decision pipeline.
 These functions are pure utilities and do NOT handle Decision enum or decision strings.
 They operate on intermediate states (indices, evidence objects).
 """
+import threading
 import time
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
@@ -17,7 +18,19 @@ from ..evidence.permission import collect as collect_permission
 from ..evidence.tool import collect as collect_tool
 from ..evidence.routing import collect as collect_routing
 from ..evidence.contracts import EvidenceBundle
+from ..evidence.cache import get_cache_policy, get_evidence_cache
+from ..evidence.execution import is_cpu_only
+from ..evidence.remote import get_remote_provider
+from .config import get_config_generation
+from .metrics import observe_evidence, set_circuit_breaker
 from .models import Evidence, GateContext
+from .trace import trace_event
+from .runtime_config import (
+    GateRuntimeConfig,
+    get_runtime_config,
+    parse_contract_validation_flag,
+    parse_evidence_timeout_guard_flag,
+)
 
 
 # =============================================================================
@@ -54,29 +67,23 @@ def is_evidence_timeout_guard_enabled() -> bool:
 
     Environment Variable:
         AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED: Set to "true" or "1" to enable
+
+    This reads the live environment. The request path uses the frozen
+    GateRuntimeConfig snapshot instead (see runtime_config.py).
     """
     import os
 
-    # Check environment variable override
-    env_value = os.getenv("AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED", "").lower()
-    if env_value in ("true", "1", "yes", "on"):
-        return True
-    if env_value in ("false", "0", "no", "off"):
-        return False
-
-    # No override, use default
-    return _EVIDENCE_TIMEOUT_GUARD_ENABLED_DEFAULT
+    return parse_evidence_timeout_guard_flag(os.environ, _EVIDENCE_TIMEOUT_GUARD_ENABLED_DEFAULT)
 
 
 def is_evidence_contract_validation_enabled() -> bool:
     """Whether to validate collect_all_evidence output against EvidenceBundle contract.
     Default True so tests and CI get contract enforcement; set to false to disable.
+    Reads the live environment; the request path uses GateRuntimeConfig.
     """
     import os
-    raw = os.getenv("AI_GATE_EVIDENCE_CONTRACT_VALIDATION_ENABLED", "true").lower()
-    if raw in ("false", "0", "no", "off"):
-        return False
-    return True
+
+    return parse_contract_validation_flag(os.environ)
 
 
 # =============================================================================
@@ -434,6 +441,23 @@ class CircuitBreakerTransition:
     cooldown_duration_ms: int = 0
 
 
+@dataclass(frozen=True)
+class CircuitBreakerPermit:
+    """Permission for one provider call, returned by CircuitBreaker.acquire_call().
+
+    Hand it back with the call's outcome (record_success / record_timeout) or,
+    when the call produced neither, release_permit(). A probe permit holds one
+    of the half_open_max_probes HALF_OPEN slots of the HALF_OPEN period it was
+    issued in (epoch); outcomes of earlier calls never release or complete it.
+    """
+    probe: bool
+    epoch: int
+
+
+# Permits of non-probe calls carry no state: one shared instance.
+_REGULAR_CALL_PERMIT = CircuitBreakerPermit(probe=False, epoch=0)
+
+
 @dataclass(frozen=True)
 class CircuitBreakerSnapshot:
     """Immutable snapshot of circuit breaker state for testing/observability.
@@ -463,9 +487,16 @@ class CircuitBreaker:
     - Tracks cooldown period before allowing probe requests
     - Resets to CLOSED on successful recovery
 
-    Thread-safety: This class is NOT thread-safe. In async environments,
-    ensure all calls to a given CircuitBreaker instance happen within
-    the same async context or use external synchronization.
+    Concurrency: every public method runs under a per-breaker lock, so one
+    instance can be shared by threads and by concurrent tasks. Calls that
+    await between asking and reporting should use acquire_call() and hand the
+    permit back: only outcomes of probe permits from the current HALF_OPEN
+    period release probe slots or close / reopen from HALF_OPEN, which keeps
+    at most half_open_max_probes probes in flight even when results of calls
+    started before the circuit opened arrive late. The permit-less
+    should_call_provider() / record_*() forms keep their original semantics.
+    The transition_emitter runs under the lock, in transition order, and must
+    not call back into the breaker.
 
     Implementation note (Task 2.1 scope):
     - This class ONLY defines the state machine and basic state transitions.
@@ -512,6 +543,9 @@ class CircuitBreaker:
 
         # HALF-OPEN probe concurrency control
         self._half_open_probe_count = 0  # Number of active probes in HALF-OPEN state
+        self._half_open_epoch = 0  # Incremented on every OPEN -> HALF_OPEN transition
+
+        self._lock = threading.Lock()
 
     @property
     def provider_id(self) -> str:
@@ -554,15 +588,16 @@ class CircuitBreaker:
         Returns:
             CircuitBreakerSnapshot with current state fields
         """
-        return CircuitBreakerSnapshot(
-            provider_id=self._provider_id,
-            state=self._state,
-            consecutive_timeouts=self._consecutive_timeouts,
-            consecutive_successes=self._consecutive_successes,
-            open_count=self._open_count,
-            last_state_change_ms=self._last_state_change_ms,
-            cooldown_expires_at_ms=self._cooldown_expires_at_ms,
-        )
+        with self._lock:
+            return CircuitBreakerSnapshot(
+                provider_id=self._provider_id,
+                state=self._state,
+                consecutive_timeouts=self._consecutive_timeouts,
+                consecutive_successes=self._consecutive_successes,
+                open_count=self._open_count,
+                last_state_change_ms=self._last_state_change_ms,
+                cooldown_expires_at_ms=self._cooldown_expires_at_ms,
+            )
 
     def should_call_provider(self, now_ms: int) -> bool:
         """Check if a provider should be called based on circuit breaker state.
@@ -586,33 +621,51 @@ class CircuitBreaker:
             This method may trigger state transitions (OPEN -> HALF_OPEN) when cooldown expires.
             Probe success/failure is tracked separately via record_success() and record_timeout().
         """
-        if self._state == CircuitBreakerState.CLOSED:
-            # Provider is healthy, always allow calls
-            return True
-
-        elif self._state == CircuitBreakerState.OPEN:
-            # Provider is throttled, check if cooldown has expired
-            if now_ms >= self._cooldown_expires_at_ms:
-                # Cooldown expired, transition to HALF_OPEN for probe
-                self._transition_to_half_open(now_ms)
-                # Allow the first probe call
-                self._half_open_probe_count += 1
-                return True
-            else:
-                # Still in cooldown, skip provider
-                return False
-
-        elif self._state == CircuitBreakerState.HALF_OPEN:
-            # Probe state: allow limited concurrent probes
-            if self._half_open_probe_count < self._half_open_max_probes:
-                self._half_open_probe_count += 1
-                return True
-            else:
-                # Too many concurrent probes, skip additional calls
-                return False
+        return self.acquire_call(now_ms) is not None
+
+    def acquire_call(self, now_ms: int) -> Optional[CircuitBreakerPermit]:
+        """should_call_provider() returning a permit for the call (None: skip it)."""
+        with self._lock:
+            if self._state == CircuitBreakerState.CLOSED:
+                # Provider is healthy, always allow calls
+                return _REGULAR_CALL_PERMIT
+
+            elif self._state == CircuitBreakerState.OPEN:
+                # Provider is throttled, check if cooldown has expired
+                if now_ms >= self._cooldown_expires_at_ms:
+                    # Cooldown expired, transition to HALF_OPEN for probe
+                    self._transition_to_half_open(now_ms)
+                    # Allow the first probe call
+                    self._half_open_probe_count += 1
+                    return CircuitBreakerPermit(probe=True, epoch=self._half_open_epoch)
+                else:
+                    # Still in cooldown, skip provider
+                    return None
+
+            elif self._state == CircuitBreakerState.HALF_OPEN:
+                # Probe state: allow limited concurrent probes
+                if self._half_open_probe_count < self._half_open_max_probes:
+                    self._half_open_probe_count += 1
+                    return CircuitBreakerPermit(probe=True, epoch=self._half_open_epoch)
+                else:
+                    # Too many concurrent probes, skip additional calls
+                    return None
+
+            # Fallback (should never reach here)
+            return None
 
-        # Fallback (should never reach here)
-        return False
+    def _is_current_probe(self, permit: CircuitBreakerPermit) -> bool:
+        return (
+            permit.probe
+            and permit.epoch == self._half_open_epoch
+            and self._state == CircuitBreakerState.HALF_OPEN
+        )
+
+    def release_permit(self, permit: CircuitBreakerPermit) -> None:
+        """Give back a permit whose call recorded no outcome (unavailable, cancelled)."""
+        with self._lock:
+            if self._is_current_probe(permit) and self._half_open_probe_count > 0:
+                self._half_open_probe_count -= 1
 
     def _emit_transition(self, from_state: CircuitBreakerState, cooldown_ms: int = 0) -> None:
         """Emit a transition event if an emitter callback is configured.
@@ -624,6 +677,7 @@ class CircuitBreaker:
             from_state: The state we're transitioning from
             cooldown_ms: For transitions to OPEN, the cooldown duration (default 0)
         """
+        set_circuit_breaker(self._provider_id, self._state.value, self._open_count)
         if self._transition_emitter is not None:
             transition = CircuitBreakerTransition(
                 provider_id=self._provider_id,
@@ -635,7 +689,7 @@ class CircuitBreaker:
             )
             self._transition_emitter(transition)
 
-    def record_timeout(self, now_ms: int) -> None:
+    def record_timeout(self, now_ms: int, permit: Optional[CircuitBreakerPermit] = None) -> None:
         """Record a timeout event for this provider.
 
         This may trigger a state transition from CLOSED -> OPEN if the
@@ -643,22 +697,25 @@ class CircuitBreaker:
 
         Args:
             now_ms: Current timestamp in milliseconds
+            permit: The call's permit from acquire_call(), if it has one
         """
-        # Decrement probe count BEFORE state transition if in HALF_OPEN
-        if self._state == CircuitBreakerState.HALF_OPEN and self._half_open_probe_count > 0:
-            self._half_open_probe_count -= 1
-
-        self._consecutive_timeouts += 1
-        self._consecutive_successes = 0
-
-        # Check if we should open the circuit
-        if self._state == CircuitBreakerState.CLOSED and self._consecutive_timeouts >= self._timeout_threshold:
-            self._transition_to_open(now_ms)
-        elif self._state == CircuitBreakerState.HALF_OPEN:
-            # Probe failed, go back to OPEN
-            self._transition_to_open(now_ms)
-
-    def record_success(self, now_ms: int) -> None:
+        with self._lock:
+            # Decrement probe count BEFORE state transition if in HALF_OPEN
+            if self._state == CircuitBreakerState.HALF_OPEN and self._half_open_probe_count > 0 \
+                    and (permit is None or self._is_current_probe(permit)):
+                self._half_open_probe_count -= 1
+
+            self._consecutive_timeouts += 1
+            self._consecutive_successes = 0
+
+            # Check if we should open the circuit
+            if self._state == CircuitBreakerState.CLOSED and self._consecutive_timeouts >= self._timeout_threshold:
+                self._transition_to_open(now_ms)
+            elif self._state == CircuitBreakerState.HALF_OPEN:
+                # Probe failed (or a late timeout arrived), go back to OPEN
+                self._transition_to_open(now_ms)
+
+    def record_success(self, now_ms: int, permit: Optional[CircuitBreakerPermit] = None) -> None:
         """Record a successful response from this provider.
 
         This may trigger a state transition from HALF_OPEN -> CLOSED
@@ -666,17 +723,20 @@ class CircuitBreaker:
 
         Args:
             now_ms: Current timestamp in milliseconds
+            permit: The call's permit from acquire_call(), if it has one; a
+                success without a current probe permit does not close HALF_OPEN
         """
-        # Decrement probe count BEFORE state transition if in HALF_OPEN
-        if self._state == CircuitBreakerState.HALF_OPEN and self._half_open_probe_count > 0:
-            self._half_open_probe_count -= 1
-
-        self._consecutive_timeouts = 0
-        self._consecutive_successes += 1
-
-        if self._state == CircuitBreakerState.HALF_OPEN:
-            # Probe succeeded, close the circuit
-            self._transition_to_closed(now_ms)
+        with self._lock:
+            self._consecutive_timeouts = 0
+            self._consecutive_successes += 1
+
+            if self._state == CircuitBreakerState.HALF_OPEN and (
+                permit is None or self._is_current_probe(permit)
+            ):
+                # Probe succeeded: release its slot and close the circuit
+                if self._half_open_probe_count > 0:
+                    self._half_open_probe_count -= 1
+                self._transition_to_closed(now_ms)
 
     def _transition_to_open(self, now_ms: int) -> None:
         """Transition to OPEN state and calculate cooldown period with exponential backoff.
@@ -724,6 +784,7 @@ class CircuitBreaker:
         """
         from_state = self._state
         self._state = CircuitBreakerState.HALF_OPEN
+        self._half_open_epoch += 1
         self._last_state_change_ms = now_ms
         # Reset probe count when entering HALF_OPEN (will be incremented by should_call_provider)
         self._half_open_probe_count = 0
@@ -763,14 +824,14 @@ class CircuitBreaker:
 
 
 # =============================================================================
-# Circuit Breaker Registry (Task 2.5: In-Memory Only, Non-Concurrent)
+# Circuit Breaker Registry (Task 2.5: In-Memory Only)
 # =============================================================================
 
 # In-memory registry mapping provider_id -> CircuitBreaker instance.
-# This registry is intentionally NOT thread-safe and matches the CircuitBreaker
-# class's non-thread-safe semantics. Callers are responsible for ensuring
-# appropriate single-threaded / single-task usage per provider.
+# Lookups are lock-free; creation is serialized so concurrent first calls for
+# a provider share one instance.
 _circuit_breakers_by_provider: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
 
 
 def get_or_create_circuit_breaker_for_provider(
@@ -789,9 +850,16 @@ def get_or_create_circuit_breaker_for_provider(
     CircuitBreaker instances keyed by provider_id.
 
     Concurrency:
-        This function is NOT thread-safe and does not use any locking. It is
-        intended to be used in the same single-threaded / single-task context
-        as the CircuitBreaker instances it manages.
+        Safe to call from any thread or task. The existing instance is read
+        without locking; creation is serialized, so concurrent first calls for
+        the same provider_id all get the same instance.
+
+    Backend:
+        With the runtime config's circuit_breaker_backend == "shared"
+        (AI_GATE_CIRCUIT_BREAKER_BACKEND), new breakers are SharedCircuitBreaker
+        instances whose state is shared by every worker process on the host
+        (src/core/shared_circuit_breaker.py). The registry itself stays
+        per-process either way.
 
     Parameter semantics:
         - On first creation for a given provider_id, optional constructor
@@ -817,7 +885,20 @@ def get_or_create_circuit_breaker_for_provider(
     existing = _circuit_breakers_by_provider.get(provider_id)
     if existing is not None:
         return existing
+    with _circuit_breakers_lock:
+        existing = _circuit_breakers_by_provider.get(provider_id)
+        if existing is not None:
+            return existing
+        return _create_circuit_breaker(
+            provider_id, timeout_threshold, initial_cooldown_ms, backoff_multiplier,
+            max_cooldown_ms, half_open_max_probes, transition_emitter,
+        )
+
 
+def _create_circuit_breaker(
+    provider_id, timeout_threshold, initial_cooldown_ms, backoff_multiplier,
+    max_cooldown_ms, half_open_max_probes, transition_emitter,
+) -> CircuitBreaker:
     kwargs: Dict[str, Any] = {}
     if timeout_threshold is not None:
         kwargs["timeout_threshold"] = timeout_threshold
@@ -832,11 +913,26 @@ def get_or_create_circuit_breaker_for_provider(
     if transition_emitter is not None:
         kwargs["transition_emitter"] = transition_emitter
 
-    breaker = CircuitBreaker(provider_id=provider_id, **kwargs)
+    runtime_config = get_runtime_config()
+    if runtime_config.circuit_breaker_backend == "shared":
+        from .shared_circuit_breaker import SharedCircuitBreaker, get_shared_segment
+
+        breaker = SharedCircuitBreaker(
+            provider_id, get_shared_segment(runtime_config.circuit_breaker_shm_path), **kwargs
+        )
+    else:
+        breaker = CircuitBreaker(provider_id=provider_id, **kwargs)
     _circuit_breakers_by_provider[provider_id] = breaker
     return breaker
 
 
+def get_circuit_breaker_snapshots() -> List[CircuitBreakerSnapshot]:
+    """Snapshots of the registered breakers (observability, e.g. GET /metrics)."""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers_by_provider.values())
+    return [breaker.get_snapshot() for breaker in breakers]
+
+
 def _reset_circuit_breaker_registry_for_testing() -> None:
     """Reset the in-memory circuit breaker registry (TESTS ONLY).
 
@@ -844,7 +940,8 @@ def _reset_circuit_breaker_registry_for_testing() -> None:
     ensure isolation between test cases. It MUST NOT be called from production
     code paths.
     """
-    _circuit_breakers_by_provider.clear()
+    with _circuit_breakers_lock:
+        _circuit_breakers_by_provider.clear()
 
 
 # =============================================================================
@@ -867,59 +964,227 @@ def extract_evidence(result) -> Evidence:
         return Evidence(provider="unknown", available=False, data={})
     return result
 
+
+# Per-provider evidence budget (seconds) when no EvidenceTimeoutConfig is loaded.
+EVIDENCE_PROVIDER_TIMEOUT_S = 0.08
+
+
+def get_provider_timeout_s(provider_id: str) -> float:
+    """
+    Evidence budget for one provider, in seconds.
+
+    Uses EvidenceTimeoutConfig.provider_timeouts (provider entry, else
+    "default") once the config is loaded, EVIDENCE_PROVIDER_TIMEOUT_S otherwise.
+    """
+    config = _evidence_timeout_config
+    if config is None:
+        return EVIDENCE_PROVIDER_TIMEOUT_S
+    timeouts = config.provider_timeouts
+    return timeouts.get(provider_id, timeouts["default"]) / 1000
+
+
+def _resolve_collector(provider_id: str, local_collect, base_url: Optional[str]):
+    """Remote provider when the runtime config names a service URL, else the local one."""
+    if base_url:
+        return get_remote_provider(provider_id, base_url)
+    return local_collect
+
+
+def _collect_inline(collect_fn, ctx: GateContext, budget_s: float) -> Any:
+    """
+    Run a CPU-only provider to completion without a task or timer.
+
+    Returns the Evidence, or the exception the task path would have produced:
+    asyncio.TimeoutError when the elapsed time exceeds the budget (the result is
+    discarded, as wait_for would), the provider's own exception otherwise. A
+    provider declared CPU-only that suspends is a contract violation and is
+    reported as an error.
+    """
+    started = time.perf_counter()
+    try:
+        coro = collect_fn(ctx)
+        try:
+            coro.send(None)
+        except StopIteration as done:
+            result = done.value
+        else:
+            coro.close()
+            raise RuntimeError(f"CPU-only evidence provider suspended: {collect_fn!r}")
+    except Exception as exc:
+        return exc
+    if time.perf_counter() - started > budget_s:
+        return asyncio.TimeoutError()
+    return result
+
+
+def _evidence_outcome(result: Any) -> str:
+    """Metrics outcome of a provider call result (see metrics.EVIDENCE_OUTCOMES)."""
+    if isinstance(result, asyncio.TimeoutError):
+        return "TIMEOUT"
+    if isinstance(result, BaseException):
+        return "ERROR"
+    if getattr(result, "available", False) is True:
+        return "OK"
+    return "UNAVAILABLE"
+
+
+def _call_timer(call_seconds: List[Optional[float]], i: int, start_time: float):
+    """Done callback storing an I/O provider task's latency in call_seconds[i]."""
+    def _done(_task) -> None:
+        call_seconds[i] = time.perf_counter() - start_time
+    return _done
+
+
 async def collect_all_evidence(ctx: GateContext, trace: List[str]) -> dict:
-    """Concurrently collect all evidence with timeout."""
-    if is_evidence_timeout_guard_enabled():
+    """
+    Collect all evidence with timeout.
+
+    CPU-only providers run inline, one after the other; then I/O providers
+    (including the remote providers selected by the runtime config URLs) run
+    concurrently as tasks. Each provider
+    is bounded by its budget from get_provider_timeout_s(). Providers that
+    declare a cache policy are served from the evidence cache when possible
+    (see src/evidence/cache.py).
+
+    Feature flags come from the runtime config snapshot pinned on the request
+    context (PipelineContext.runtime_config), or the current snapshot.
+    """
+    runtime_config: GateRuntimeConfig = getattr(ctx, "runtime_config", None) or get_runtime_config()
+    timeout_guard_enabled = runtime_config.evidence_timeout_guard_enabled
+    providers = (
+        ("tool", collect_tool),
+        ("routing", collect_routing),
+        ("knowledge", _resolve_collector(
+            "knowledge", collect_knowledge, runtime_config.knowledge_provider_url)),
+        ("risk", collect_risk),
+        ("permission", _resolve_collector(
+            "permission", collect_permission, runtime_config.permission_provider_url)),
+    )
+    if timeout_guard_enabled:
         now_ms = int(time.time() * 1000)
         circuit_breakers: Dict[str, CircuitBreaker] = {}
-        for provider_id in ("tool", "routing", "knowledge", "risk", "permission"):
+        for provider_id, _ in providers:
             circuit_breakers[provider_id] = get_or_create_circuit_breaker_for_provider(provider_id)
-        evidence_tasks = []
-        metas: List[tuple] = []
-        providers = (
-            ("tool", collect_tool),
-            ("routing", collect_routing),
-            ("knowledge", collect_knowledge),
-            ("risk", collect_risk),
-            ("permission", collect_permission),
-        )
-        for provider_id, collect_fn in providers:
-            if circuit_breakers[provider_id].should_call_provider(now_ms):
-                evidence_tasks.append(asyncio.wait_for(collect_fn(ctx), timeout=0.08))
-                metas.append((provider_id, circuit_breakers[provider_id], False))
-            else:
-                evidence_tasks.append(
-                    asyncio.sleep(0, result=Evidence(provider=provider_id, available=False, data={}))
-                )
-                metas.append((provider_id, circuit_breakers[provider_id], True))
+        metas: Optional[List[tuple]] = []
     else:
-        evidence_tasks = [
-            asyncio.wait_for(collect_tool(ctx), timeout=0.08),
-            asyncio.wait_for(collect_routing(ctx), timeout=0.08),
-            asyncio.wait_for(collect_knowledge(ctx), timeout=0.08),
-            asyncio.wait_for(collect_risk(ctx), timeout=0.08),
-            asyncio.wait_for(collect_permission(ctx), timeout=0.08),
-        ]
         metas = None
 
+    # Results are stored per provider slot: Evidence, or the exception (TimeoutError
+    # included) exactly as asyncio.gather(..., return_exceptions=True) reports it.
+    evidence_results: List[Any] = [None] * len(providers)
+    cpu_slots: List[int] = []
+    io_slots: List[int] = []
+    # Provider slots to store in the evidence cache: (index, cache, key, policy, version)
+    cache_slots: List[tuple] = []
+    # Per-slot metrics: outcome fixed before the call (CACHED / SKIPPED) and call latency.
+    fixed_outcomes: List[Optional[str]] = [None] * len(providers)
+    call_seconds: List[Optional[float]] = [None] * len(providers)
+    for i, (provider_id, collect_fn) in enumerate(providers):
+        policy = get_cache_policy(collect_fn) if runtime_config.evidence_cache_enabled else None
+        if policy is not None:
+            cache = get_evidence_cache(provider_id, policy)
+            # Backing config (and its hot-reload generation), runtime snapshot and
+            # the collector itself (local vs remote).
+            cache_version = (
+                policy.version(ctx), get_config_generation(), runtime_config.version, collect_fn,
+            )
+            cache.check_version(cache_version)
+            try:
+                cache_key = policy.key(ctx)
+                hit, cached = cache.get(cache_key)
+            except Exception:
+                # Unhashable / unexpected request shape: bypass the cache.
+                policy = None
+            else:
+                if hit:
+                    # No provider call, so nothing for the circuit breaker to record.
+                    evidence_results[i] = cached
+                    fixed_outcomes[i] = "CACHED"
+                    if timeout_guard_enabled:
+                        metas.append((provider_id, circuit_breakers[provider_id], None))
+                    continue
+                cache_slots.append((i, cache, cache_key, policy, cache_version))
+        if timeout_guard_enabled:
+            breaker = circuit_breakers[provider_id]
+            permit = breaker.acquire_call(now_ms)
+            if permit is None:
+                evidence_results[i] = Evidence(provider=provider_id, available=False, data={})
+                fixed_outcomes[i] = "SKIPPED"
+                metas.append((provider_id, breaker, None))
+                continue
+            metas.append((provider_id, breaker, permit))
+        if is_cpu_only(collect_fn):
+            cpu_slots.append(i)
+        else:
+            io_slots.append(i)
+
     start_time = time.perf_counter()
-    evidence_results = await asyncio.gather(*evidence_tasks, return_exceptions=True)
+    # Sequential, then concurrent: CPU-only providers run inline one after the
+    # other first. The I/O provider tasks are created afterwards and only start
+    # when this coroutine awaits them (gather); they then run concurrently.
+    for i in cpu_slots:
+        provider_id, collect_fn = providers[i]
+        call_start = time.perf_counter()
+        evidence_results[i] = _collect_inline(collect_fn, ctx, get_provider_timeout_s(provider_id))
+        call_seconds[i] = time.perf_counter() - call_start
+    io_tasks = []
+    io_start = time.perf_counter()
+    for i in io_slots:
+        provider_id, collect_fn = providers[i]
+        task = asyncio.ensure_future(
+            asyncio.wait_for(collect_fn(ctx), timeout=get_provider_timeout_s(provider_id))
+        )
+        # Latency from the start of the I/O phase, excluding the inline providers.
+        task.add_done_callback(_call_timer(call_seconds, i, io_start))
+        io_tasks.append(task)
+    if io_tasks:
+        try:
+            io_results = await asyncio.gather(*io_tasks, return_exceptions=True)
+        except BaseException:
+            # Cancelled request: hand back the permits (HALF_OPEN probe slots).
+            for _, breaker, permit in metas or ():
+                if permit is not None:
+                    breaker.release_permit(permit)
+            raise
+        for i, result in zip(io_slots, io_results):
+            evidence_results[i] = result
     total_time = (time.perf_counter() - start_time) * 1000
 
-    if is_evidence_timeout_guard_enabled() and metas is not None:
-        for i, (provider_id, breaker, skipped) in enumerate(metas):
-            if skipped:
+    # Stage timings of the request (PipelineContext; a plain GateContext has none).
+    timings = getattr(ctx, "timings", None)
+    for i, (provider_id, _) in enumerate(providers):
+        seconds = call_seconds[i]
+        observe_evidence(provider_id, fixed_outcomes[i] or _evidence_outcome(evidence_results[i]), seconds)
+        if timings is not None and seconds is not None:
+            timings.add("evidence." + provider_id, int(seconds * 1e9))
+
+    for i, cache, cache_key, policy, cache_version in cache_slots:
+        result = evidence_results[i]
+        if cache.version != cache_version:
+            # Config reloaded while I/O providers were in flight: the result
+            # belongs to the previous version.
+            continue
+        if isinstance(result, Exception):
+            cache.put(cache_key, result, policy.negative_ttl_s)
+        elif getattr(result, "available", False) is True:
+            cache.put(cache_key, result, policy.ttl_s)
+
+    if timeout_guard_enabled and metas is not None:
+        for i, (provider_id, breaker, permit) in enumerate(metas):
+            if permit is None:
+                # Skipped or served from cache: no provider call.
                 continue
             result = evidence_results[i]
             if isinstance(result, asyncio.TimeoutError):
-                breaker.record_timeout(now_ms)
+                breaker.record_timeout(now_ms, permit)
             elif isinstance(result, Exception):
-                breaker.record_timeout(now_ms)
+                breaker.record_timeout(now_ms, permit)
+            elif getattr(result, "available", False) is True:
+                breaker.record_success(now_ms, permit)
             else:
-                if getattr(result, "available", False) is True:
-                    breaker.record_success(now_ms)
+                breaker.release_permit(permit)
 
-    if is_evidence_timeout_guard_enabled():
+    if timeout_guard_enabled:
         provider_ids = ("tool", "routing", "knowledge", "risk", "permission")
         normalized = []
         for i in range(5):
@@ -964,7 +1229,7 @@ async def collect_all_evidence(ctx: GateContext, trace: List[str]) -> dict:
 
     # Aggregate-level degradation / HITL suggestion labels (explain-only).
     meta: Optional[Dict[str, Any]] = None
-    if is_evidence_timeout_guard_enabled():
+    if timeout_guard_enabled:
         budget_exceeded_count = 0
         for ev in (tool_ev, routing_ev, knowledge_ev, risk_ev, permission_ev):
             if ev.data.get("_timeout_budget_exceeded") is True:
@@ -976,23 +1241,56 @@ async def collect_all_evidence(ctx: GateContext, trace: List[str]) -> dict:
         }
 
     if trace:
-        trace.append(f"[TRACE] 2. Evidence Collection (concurrent, {total_time:.0f}ms):")
-        trace.append(f"[TRACE]   - tool: {'ok' if tool_ev.available else 'missing/timeout'}")
+        trace_event(
+            trace, "evidence", "header", "2. Evidence Collection (concurrent, {total_ms:.0f}ms):",
+            total_ms=total_time,
+        )
+        trace_event(
+            trace, "evidence", "tool", "  - tool: {status}",
+            status="ok" if tool_ev.available else "missing/timeout",
+        )
         if tool_ev.available and tool_ev.data.get("tool_id"):
-            trace.append(f"[TRACE]     tool_id={tool_ev.data['tool_id']}, action_type={tool_ev.data['action_type']}")
-        trace.append(f"[TRACE]   - routing: {'ok' if routing_ev.available else 'missing'}")
+            trace_event(
+                trace, "evidence", "tool_detail", "    tool_id={tool_id}, action_type={action_type}",
+                tool_id=tool_ev.data["tool_id"], action_type=tool_ev.data["action_type"],
+            )
+        trace_event(
+            trace, "evidence", "routing", "  - routing: {status}",
+            status="ok" if routing_ev.available else "missing",
+        )
         if routing_ev.available and routing_ev.data.get("hinted_tools"):
             hinted = routing_ev.data.get("hinted_tools", [])
-            conf = routing_ev.data.get("confidence", 0.0)
-            trace.append(f"[TRACE]     hinted_tools={[h['tool_id'] for h in hinted]}, confidence={conf:.2f}")
-        trace.append(f"[TRACE]   - knowledge: {'ok' if knowledge_ev.available else 'missing'}")
-        trace.append(f"[TRACE]   - risk: {'ok' if risk_ev.available else 'missing'}")
+            trace_event(
+                trace, "evidence", "routing_detail", "    hinted_tools={tools}, confidence={confidence:.2f}",
+                tools=[h["tool_id"] for h in hinted], confidence=routing_ev.data.get("confidence", 0.0),
+            )
+        trace_event(
+            trace, "evidence", "knowledge", "  - knowledge: {status}",
+            status="ok" if knowledge_ev.available else "missing",
+        )
+        trace_event(
+            trace, "evidence", "risk", "  - risk: {status}",
+            status="ok" if risk_ev.available else "missing",
+        )
         if risk_ev.available:
-            trace.append(f"[TRACE]     rules_hit={risk_ev.data.get('rules_hit', [])}")
-            trace.append(f"[TRACE]     risk_level={risk_ev.data.get('risk_level', '')}")
-        trace.append(f"[TRACE]   - permission: {'ok' if permission_ev.available else 'missing/timeout'}")
+            trace_event(
+                trace, "evidence", "risk_rules", "    rules_hit={rules_hit}",
+                rules_hit=risk_ev.data.get("rules_hit", []),
+            )
+            trace_event(
+                trace, "evidence", "risk_level", "    risk_level={risk_level}",
+                risk_level=risk_ev.data.get("risk_level", ""),
+            )
+        trace_event(
+            trace, "evidence", "permission", "  - permission: {status}",
+            status="ok" if permission_ev.available else "missing/timeout",
+        )
         if permission_ev.available:
-            trace.append(f"[TRACE]     has_access={permission_ev.data.get('has_access')}, reason={permission_ev.data.get('reason_code')}")
+            trace_event(
+                trace, "evidence", "permission_detail", "    has_access={has_access}, reason={reason}",
+                has_access=permission_ev.data.get("has_access"),
+                reason=permission_ev.data.get("reason_code"),
+            )
 
     result: Dict[str, Any] = {
         "tool": tool_ev,
@@ -1005,7 +1303,7 @@ async def collect_all_evidence(ctx: GateContext, trace: List[str]) -> dict:
     if meta is not None:
         result["_meta"] = meta
 
-    if is_evidence_contract_validation_enabled():
+    if runtime_config.evidence_contract_validation_enabled:
         EvidenceBundle.model_validate(result)
 
     return result
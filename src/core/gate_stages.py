@@ -9,6 +9,7 @@ from typing import List, Optional, Dict, Any
 from .models import ResponsibilityType, ClassifierResult
 from .matrix import Matrix
 from .gate_helpers import tighten_one_step
+from .trace import trace_event
 
 # Decision index constants
 DECISION_IDX_0 = 0
@@ -45,7 +46,11 @@ def apply_type_upgrade_rules(
                 if target == "EntitlementDecision":
                     final_resp_type = ResponsibilityType.EntitlementDecision
                     if trace:
-                        trace.append(f"[TRACE]   - responsibility_type upgraded: Information -> EntitlementDecision (action_type={action_type})")
+                        trace_event(
+                            trace, "type_upgrade", "upgraded",
+                            "  - responsibility_type upgraded: Information -> EntitlementDecision (action_type={action_type})",
+                            action_type=action_type,
+                        )
 
     return final_resp_type
 
@@ -112,17 +117,23 @@ def lookup_matrix(
                 decision_index = DECISION_IDX_0
 
     if trace:
+        trace_event(trace, "matrix_lookup", "header", "3. Matrix Lookup:")
+        trace_event(trace, "matrix_lookup", "version", "  - version: {version}", version=matrix.version)
         if matched_rule:
-            trace.append(f"[TRACE] 3. Matrix Lookup:")
-            trace.append(f"[TRACE]   - version: {matrix.version}")
-            trace.append(f"[TRACE]   - matched: rule_id={matched_rule['rule_id']}, primary_reason={matched_rule['primary_reason']}")
-        else:
-            trace.append(f"[TRACE] 3. Matrix Lookup:")
-            trace.append(f"[TRACE]   - version: {matrix.version}")
-            if decision_index is not None:
-                trace.append(f"[TRACE]   - default: type={final_resp_type.value}, decision_index={decision_index}")
-            elif config_decision_str:
-                trace.append(f"[TRACE]   - default: type={final_resp_type.value}, config_decision_str=present")
+            trace_event(
+                trace, "matrix_lookup", "matched", "  - matched: rule_id={rule_id}, primary_reason={reason}",
+                rule_id=matched_rule["rule_id"], reason=matched_rule["primary_reason"],
+            )
+        elif decision_index is not None:
+            trace_event(
+                trace, "matrix_lookup", "default", "  - default: type={type}, decision_index={decision_index}",
+                type=final_resp_type.value, decision_index=decision_index,
+            )
+        elif config_decision_str:
+            trace_event(
+                trace, "matrix_lookup", "default", "  - default: type={type}, config_decision_str=present",
+                type=final_resp_type.value,
+            )
 
     result = {
         "primary_reason": primary_reason,
@@ -177,7 +188,11 @@ def apply_missing_evidence_policy(
         if primary_reason == REASON_DEFAULT:
             primary_reason = REASON_MISSING_PERMISSION
         if trace:
-            trace.append(f"[TRACE]   - permission missing, policy={policy_action}, decision_index={decision_index}")
+            trace_event(
+                trace, "missing_evidence", "permission",
+                "  - permission missing, policy={policy}, decision_index={decision_index}",
+                policy=policy_action, decision_index=decision_index,
+            )
 
     elif not evidence["risk"].available:
         policy_action = missing_policy.get("missing_risk", "tighten")
@@ -187,7 +202,11 @@ def apply_missing_evidence_policy(
         if primary_reason == REASON_DEFAULT:
             primary_reason = REASON_MISSING_RISK
         if trace:
-            trace.append(f"[TRACE]   - risk missing, tightened: decision_index={decision_index}")
+            trace_event(
+                trace, "missing_evidence", "risk",
+                "  - risk missing, tightened: decision_index={decision_index}",
+                decision_index=decision_index,
+            )
 
     elif not evidence["knowledge"].available:
         policy_action = missing_policy.get("missing_knowledge", "tighten")
@@ -197,7 +216,11 @@ def apply_missing_evidence_policy(
         if primary_reason == REASON_DEFAULT:
             primary_reason = REASON_MISSING_KNOWLEDGE
         if trace:
-            trace.append(f"[TRACE]   - knowledge missing, tightened: decision_index={decision_index}")
+            trace_event(
+                trace, "missing_evidence", "knowledge",
+                "  - knowledge missing, tightened: decision_index={decision_index}",
+                decision_index=decision_index,
+            )
 
     return {
         "decision_index": decision_index,
@@ -239,7 +262,11 @@ def apply_conflict_resolution_and_overrides(
                 if primary_reason == REASON_DEFAULT:
                     primary_reason = "RISK_WITH_PERMISSION_CONFLICT"
                 if trace:
-                    trace.append(f"[TRACE]   - conflict resolution: R3 + permission ok -> decision_index={DECISION_IDX_2}")
+                    trace_event(
+                        trace, "conflict", "r3_permission_ok",
+                        "  - conflict resolution: R3 + permission ok -> decision_index={decision_index}",
+                        decision_index=DECISION_IDX_2,
+                    )
 
     # Low confidence override
     if decision_index != DECISION_IDX_3:
@@ -249,7 +276,11 @@ def apply_conflict_resolution_and_overrides(
             if primary_reason == REASON_DEFAULT:
                 primary_reason = REASON_LOW_CONFIDENCE
             if trace:
-                trace.append(f"[TRACE]   - confidence low, tightened: decision_index={decision_index}")
+                trace_event(
+                    trace, "conflict", "low_confidence",
+                    "  - confidence low, tightened: decision_index={decision_index}",
+                    decision_index=decision_index,
+                )
 
     # Routing weak signal override (max 1 step, never max index)
     if decision_index != DECISION_IDX_3 and routing_data:
@@ -261,8 +292,12 @@ def apply_conflict_resolution_and_overrides(
             if primary_reason == REASON_DEFAULT:
                 primary_reason = REASON_ROUTING_WEAK_SIGNAL
             if trace:
-                tool_ids = [h["tool_id"] for h in hinted_tools]
-                trace.append(f"[TRACE]   - routing weak signal (conf={routing_conf:.2f}, tools={tool_ids}), tightened: decision_index={decision_index}")
+                trace_event(
+                    trace, "conflict", "routing_weak_signal",
+                    "  - routing weak signal (conf={confidence:.2f}, tools={tools}), tightened: decision_index={decision_index}",
+                    confidence=routing_conf, tools=[h["tool_id"] for h in hinted_tools],
+                    decision_index=decision_index,
+                )
 
     return {
         "decision_index": decision_index,
@@ -0,0 +1,210 @@
+"""
+Shared multi-pattern keyword engine.
+
+All text matchers (risk keyword rules, routing hints, tool routing, action type
+inference, classifier operation keywords, postcheck guarantee keywords) answer
+the same question: "does keyword kw occur in text?". Instead of every matcher
+running its own `kw in text` loop, each module registers its keywords once at
+import (register_keywords) or, for keywords that come from a config document,
+a function extracting them (register_keyword_source; read from the config
+registry when the automaton is built, so importing parses no YAML). Each
+matcher reads its slice of a single Aho-Corasick scan:
+
+    hits = scan_keywords(text)
+    matched = [kw for kw in keywords if kw in hits]
+
+`kw in hits` is exactly equivalent to `kw in text` for every registered keyword
+(substring containment, overlapping matches included).
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton reporting which keywords occur in a text."""
+
+    __slots__ = ("_goto", "_fail", "_out", "_always", "_size")
+
+    def __init__(self, keywords: Iterable[str]):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[str, ...]] = [()]
+        always: Set[str] = set()
+
+        unique = dict.fromkeys(keywords)
+        for kw in unique:
+            if not kw:
+                # "" in text is always True.
+                always.add(kw)
+                continue
+            state = 0
+            for ch in kw:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = out[state] + (kw,)
+
+        # Breadth-first failure links; outputs are merged along fail links so
+        # each state reports every keyword ending at that position.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._always = frozenset(always)
+        self._size = len(unique)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def find_all(self, text: str) -> FrozenSet[str]:
+        """Return the set of keywords that occur in text (single pass)."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        root = goto[0]
+        hits: Set[str] = set(self._always)
+        state = 0
+        for ch in text:
+            if state:
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+            else:
+                # Fast path: most characters of real text start no keyword.
+                state = root.get(ch, 0)
+                if not state:
+                    continue
+            if out[state]:
+                hits.update(out[state])
+        return frozenset(hits)
+
+
+# =============================================================================
+# Shared engine (keywords registered by consumer modules at import)
+# =============================================================================
+
+_registered_keywords: Dict[str, None] = {}
+# Config document name -> functions returning the keywords of that document.
+_keyword_sources: Dict[str, List[Callable[[Any], Iterable[str]]]] = {}
+_shared_automaton: Optional[KeywordAutomaton] = None
+# Prebuilt automaton (policy bundle) used instead of a lazy build when it
+# covers exactly the registered keywords: (keywords, automaton).
+_offered: Optional[Tuple[FrozenSet[str], KeywordAutomaton]] = None
+
+
+def _invalidate() -> None:
+    global _shared_automaton
+    _shared_automaton = None
+    _scan_cached.cache_clear()
+
+
+def register_keywords(keywords: Iterable[str]) -> None:
+    """Add keywords to the shared automaton (rebuilt lazily on next scan)."""
+    added = False
+    for kw in keywords:
+        if isinstance(kw, str) and kw not in _registered_keywords:
+            _registered_keywords[kw] = None
+            added = True
+    if added:
+        _invalidate()
+
+
+def register_keyword_source(document: str, keywords_of: Callable[[Any], Iterable[str]]) -> None:
+    """
+    Add the keywords keywords_of(doc) of a config document (config_registry
+    name). They are read when the automaton is built, always from the active
+    document: a config reload replaces them instead of adding to them.
+    """
+    _keyword_sources.setdefault(document, []).append(keywords_of)
+    _invalidate()
+
+
+def keywords_for(documents: Mapping[str, Any]) -> Tuple[str, ...]:
+    """Registered keywords plus those of the keyword sources for documents."""
+    keywords = dict(_registered_keywords)
+    for name, sources in _keyword_sources.items():
+        for keywords_of in sources:
+            keywords.update((kw, None) for kw in keywords_of(documents[name]) if isinstance(kw, str))
+    return tuple(keywords)
+
+
+def registered_keywords() -> Tuple[str, ...]:
+    """Every keyword the shared automaton covers (registration order)."""
+    from .config_registry import get_document
+
+    return keywords_for({name: get_document(name) for name in _keyword_sources})
+
+
+def get_shared_automaton() -> KeywordAutomaton:
+    """Return the automaton over all registered keywords, building it if needed."""
+    global _shared_automaton
+    automaton = _shared_automaton
+    if automaton is None:
+        keywords = registered_keywords()
+        if _offered is not None and _offered[0] == frozenset(keywords):
+            automaton = _offered[1]
+        else:
+            automaton = KeywordAutomaton(keywords)
+        _shared_automaton = automaton
+    return automaton
+
+
+def offer_automaton(automaton: KeywordAutomaton, keywords: Iterable[str]) -> None:
+    """Offer a prebuilt automaton for the next build (see get_shared_automaton)."""
+    global _offered
+    _offered = (frozenset(keywords), automaton)
+
+
+def install_automaton(automaton: KeywordAutomaton, keywords: Iterable[str]) -> bool:
+    """
+    Use a prebuilt automaton (e.g. built off the request path during a config
+    reload) if it was built over exactly the registered keywords.
+
+    Returns False, leaving the lazy rebuild in place, when it does not match.
+    """
+    global _shared_automaton
+    if set(keywords) != set(registered_keywords()):
+        return False
+    _shared_automaton = automaton
+    _scan_cached.cache_clear()
+    return True
+
+
+@lru_cache(maxsize=256)
+def _scan_cached(automaton: KeywordAutomaton, text: str) -> FrozenSet[str]:
+    # Keyed on the automaton's identity too: a request pinned to an older
+    # config snapshot never reads hits of the current automaton.
+    return automaton.find_all(text)
+
+
+def scan_keywords(text: str, automaton: Optional[KeywordAutomaton] = None) -> FrozenSet[str]:
+    """
+    Return every registered keyword occurring in text.
+
+    automaton: the one pinned by the request's config snapshot; the shared
+    automaton when omitted. Results are memoized per (automaton, text), so all
+    matchers of one request share a single scan. Like `kw in text`, a non-str
+    text (e.g. None) raises TypeError; callers that tolerate missing text
+    normalize with `text or ""` first.
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"scan_keywords() expects str, got {type(text).__name__}")
+    if automaton is None:
+        automaton = get_shared_automaton()
+    return _scan_cached(automaton, text)
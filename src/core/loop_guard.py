@@ -17,6 +17,8 @@ from typing import Optional, Dict, Any, List
 
 from pydantic import BaseModel, Field
 
+from .trace import trace_event
+
 
 class LoopState(BaseModel):
     """
@@ -79,10 +81,11 @@ def evaluate_loop_guard(
       attempted relax (index decrease) from custom implementations.
     """
     if loop_state is not None and trace is not None:
-        trace.append(
-            "[TRACE] 5. LoopGuard (default, no-op): "
-            f"round_index={loop_state.round_index}, "
-            f"nit_only_streak={loop_state.nit_only_streak}"
+        trace_event(
+            trace, "loop_guard", "default_noop",
+            "5. LoopGuard (default, no-op): round_index={round_index}, nit_only_streak={nit_only_streak}",
+            round_index=loop_state.round_index,
+            nit_only_streak=loop_state.nit_only_streak,
         )
 
     # Default implementation: strict no-op.
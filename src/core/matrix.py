@@ -1,7 +1,8 @@
 import yaml
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 
-from .config import get_matrix_path
+from .config import bump_config_generation, get_matrix_path
+from .policy_bundle import bundled_matrix, release_policy_bundle
 from .loop_guard import LoopState
 
 class Matrix:
@@ -31,11 +32,51 @@ class Matrix:
         self.conflict_resolution = data.get("conflict_resolution", {})
         # Store full data for access in gate
         self.data = data
+        self._build_rule_index()
+        # Stage 2-5 decision table, compiled on first use by gate.py.
+        self.decision_table = None
 
     def get_default(self, resp_type: str) -> str:
         return self.defaults.get(resp_type, "")
 
-    def match_rule(self, resp_type: str, action_type: str, risk_level: str) -> Optional[dict]:
+    def _build_rule_index(self) -> None:
+        """
+        Compile rules into a (risk_level, action_type) -> first matching rule index.
+
+        Only risk levels / action types that some rule names explicitly can change
+        the outcome; any other value behaves the same as "not mentioned by any rule"
+        and is folded into the None bucket. Rules are walked once in order and only
+        fill keys that are still empty, which preserves first-match semantics
+        (including wildcard rules without risk_level or action_types).
+        """
+        risk_levels = set()
+        action_types = set()
+        for rule in self.rules:
+            match = rule.get("match", {})
+            if match.get("risk_level"):
+                risk_levels.add(match["risk_level"])
+            action_types.update(match.get("action_types", []))
+
+        self._indexed_risk_levels = frozenset(risk_levels)
+        self._indexed_action_types = frozenset(action_types)
+        risk_keys = (None, *risk_levels)
+        action_keys = (None, *action_types)
+        total_keys = len(risk_keys) * len(action_keys)
+
+        index: Dict[Tuple[Optional[str], Optional[str]], dict] = {}
+        for rule in self.rules:
+            match = rule.get("match", {})
+            match_risk = match.get("risk_level")
+            match_types = match.get("action_types", [])
+            for risk_level in ((match_risk,) if match_risk else risk_keys):
+                for action_type in (match_types or action_keys):
+                    index.setdefault((risk_level, action_type), rule)
+            if len(index) == total_keys:
+                break
+        self._rule_index = index
+
+    def _scan_rules(self, action_type: Optional[str], risk_level: Optional[str]) -> Optional[dict]:
+        """Linear first-match scan (reference semantics for the compiled index)."""
         for rule in self.rules:
             match = rule.get("match", {})
             match_risk = match.get("risk_level")
@@ -49,6 +90,11 @@ class Matrix:
             return rule
         return None
 
+    def match_rule(self, resp_type: str, action_type: str, risk_level: str) -> Optional[dict]:
+        key_risk = risk_level if risk_level in self._indexed_risk_levels else None
+        key_action = action_type if action_type in self._indexed_action_types else None
+        return self._rule_index.get((key_risk, key_action))
+
     def get_low_threshold(self) -> float:
         return self.thresholds.get("low", 0.6)
 
@@ -56,9 +102,16 @@ _matrices: dict[str, Matrix] = {}
 
 def load_matrix(path: str) -> Matrix:
     if path not in _matrices:
-        _matrices[path] = Matrix(path)
+        # Precompiled (policy bundle) when available, else parsed from YAML.
+        _matrices[path] = bundled_matrix(path) or Matrix(path)
     return _matrices[path]
 
+def clear_matrix_cache() -> None:
+    """Drop loaded matrices so the next load_matrix() re-reads the YAML."""
+    _matrices.clear()
+    release_policy_bundle()
+    bump_config_generation()
+
 
 # Phase D: Minimal, repo-agnostic profile → matrix resolver (L1 ≤ 20 行)
 # NOTE:
@@ -0,0 +1,402 @@
+"""
+Process metrics of the decision pipeline in Prometheus text format (GET /metrics).
+
+Series:
+- ai_gate_decision_latency_seconds{decision} (histogram)
+- ai_gate_decisions_total{decision}, ai_gate_primary_reasons_total{primary_reason},
+  ai_gate_timeout_guard_reasons_total{timeout_guard_reason}
+- ai_gate_provider_latency_seconds{provider} (histogram, providers actually called)
+- ai_gate_evidence_outcomes_total{provider,outcome}: OK, TIMEOUT, ERROR,
+  UNAVAILABLE (no evidence, no error), SKIPPED (circuit breaker), CACHED
+- ai_gate_circuit_breaker_state{provider} (0 CLOSED, 1 OPEN, 2 HALF_OPEN) and
+  ai_gate_circuit_breaker_open_count{provider} (gauges)
+
+Hot path: every series is one float slot, created on first use (under a lock)
+and then updated in place without locking; the pipeline updates metrics from
+the event loop thread. Histogram buckets are stored per bucket and made
+cumulative when rendered, so an observation is three slot updates.
+
+Multi-worker deployments set AI_GATE_METRICS_DIR: each worker process keeps
+its slots in an mmap'ed file <dir>/metrics_<pid>.db and GET /metrics on any
+worker sums counters and histograms over all files in the directory (files of
+exited workers included, so totals stay monotonic). Gauges are reported per
+worker with a pid label, for live workers only. Empty the directory when the
+deployment (re)starts. Without AI_GATE_METRICS_DIR, /metrics reports the
+serving process only.
+"""
+import math
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .runtime_config import get_runtime_config
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is the last bucket.
+LATENCY_BUCKETS_S = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, math.inf,
+)
+
+EVIDENCE_OUTCOMES = ("OK", "TIMEOUT", "ERROR", "UNAVAILABLE", "SKIPPED", "CACHED")
+
+# family name -> (type, help)
+FAMILIES = {
+    "ai_gate_decision_latency_seconds": ("histogram", "Decision latency by decision."),
+    "ai_gate_decisions_total": ("counter", "Decisions by decision."),
+    "ai_gate_primary_reasons_total": ("counter", "Decisions by primary_reason."),
+    "ai_gate_timeout_guard_reasons_total": ("counter", "Decisions by timeout_guard_reason."),
+    "ai_gate_provider_latency_seconds": ("histogram", "Evidence provider call latency by provider."),
+    "ai_gate_evidence_outcomes_total": ("counter", "Evidence outcomes by provider."),
+    "ai_gate_circuit_breaker_state": ("gauge", "Circuit breaker state (0 CLOSED, 1 OPEN, 2 HALF_OPEN)."),
+    "ai_gate_circuit_breaker_open_count": ("gauge", "Times the provider's circuit breaker opened."),
+}
+
+BREAKER_STATE_CODES = {"CLOSED": 0, "OPEN": 1, "HALF_OPEN": 2}
+
+_HEADER = struct.Struct("<Q")  # bytes used (header included)
+_KEY_LENGTH = struct.Struct("<I")
+_INITIAL_FILE_BYTES = 64 * 1024
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _series_key(name: str, labels: Iterable[Tuple[str, str]]) -> str:
+    """Exposition form of a series: name{label="value",...}."""
+    body = ",".join(f'{label}="{_escape(str(value))}"' for label, value in labels)
+    return f"{name}{{{body}}}"
+
+
+def _format_le(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(bound)
+
+
+class MetricsStore:
+    """
+    Float slots by series key: a list in process, or an mmap'ed file that
+    other workers can read (path given). File layout: a used-bytes header,
+    then entries of key length, key (UTF-8), padding to 8 bytes and the value
+    (float64), so values can be updated in place through a 'd' view.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._index: Dict[str, int] = {}
+        self._mmap = None
+        if path is None:
+            self.values = []
+            return
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.ftruncate(self._fd, _INITIAL_FILE_BYTES)
+        self._mmap = mmap.mmap(self._fd, _INITIAL_FILE_BYTES)
+        self._used = _HEADER.size
+        _HEADER.pack_into(self._mmap, 0, self._used)
+        self._view()
+
+    def _view(self) -> None:
+        self._raw = memoryview(self._mmap)
+        self.values = self._raw.cast("d")
+
+    def slot(self, key: str) -> int:
+        """Index of key's slot in values, created (value 0) on first use."""
+        index = self._index.get(key)
+        if index is not None:
+            return index
+        with self._lock:
+            index = self._index.get(key)
+            if index is None:
+                index = self._append(key)
+                self._index[key] = index
+        return index
+
+    def _append(self, key: str) -> int:
+        if self._mmap is None:
+            self.values.append(0.0)
+            return len(self.values) - 1
+        encoded = key.encode("utf-8")
+        value_offset = self._used + _KEY_LENGTH.size + len(encoded)
+        value_offset += -value_offset % 8
+        end = value_offset + 8
+        if end > len(self._mmap):
+            self.values.release()
+            self._raw.release()
+            self._mmap.resize(max(end, 2 * len(self._mmap)))
+            self._view()
+        _KEY_LENGTH.pack_into(self._mmap, self._used, len(encoded))
+        self._mmap[self._used + _KEY_LENGTH.size:self._used + _KEY_LENGTH.size + len(encoded)] = encoded
+        self.values[value_offset // 8] = 0.0
+        # Publish the entry to readers last.
+        self._used = end
+        _HEADER.pack_into(self._mmap, 0, end)
+        return value_offset // 8
+
+    def items(self) -> List[Tuple[str, float]]:
+        with self._lock:
+            return [(key, self.values[index]) for key, index in self._index.items()]
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self.values.release()
+            self._raw.release()
+            self._mmap.close()
+            os.close(self._fd)
+            self._mmap = None
+
+
+def read_store_file(path: Path) -> List[Tuple[str, float]]:
+    """Series of another worker's store file (entries published so far)."""
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        return []
+    used = min(_HEADER.unpack_from(data, 0)[0], len(data))
+    items = []
+    offset = _HEADER.size
+    while offset + _KEY_LENGTH.size <= used:
+        (length,) = _KEY_LENGTH.unpack_from(data, offset)
+        key_end = offset + _KEY_LENGTH.size + length
+        value_offset = key_end + (-key_end % 8)
+        if value_offset + 8 > used:
+            break
+        value = struct.unpack_from("d", data, value_offset)[0]
+        items.append((data[offset + _KEY_LENGTH.size:key_end].decode("utf-8"), value))
+        offset = value_offset + 8
+    return items
+
+
+_store: Optional[MetricsStore] = None
+_store_lock = threading.Lock()
+# Slot indexes by (family, labels): histograms (buckets, sum, count) and single-slot series
+_histograms: Dict[tuple, tuple] = {}
+_slots: Dict[tuple, int] = {}
+# Hot path: all slots of one observe_decision / observe_evidence label combination
+_decision_series: Dict[tuple, tuple] = {}
+_evidence_series: Dict[tuple, tuple] = {}
+
+
+def get_metrics_store() -> MetricsStore:
+    """This process's store (created on first use)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                metrics_dir = get_runtime_config().metrics_dir
+                path = None
+                if metrics_dir:
+                    Path(metrics_dir).mkdir(parents=True, exist_ok=True)
+                    path = Path(metrics_dir) / f"metrics_{os.getpid()}.db"
+                _store = MetricsStore(path)
+    return _store
+
+
+def reset_metrics() -> None:
+    """Drop this process's store and its values (tests)."""
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+        _store = None
+        _clear_series()
+
+
+def _after_fork() -> None:
+    global _store
+    # A forked worker starts its own store; the parent's file stays the parent's.
+    _store = None
+    _clear_series()
+
+
+def _clear_series() -> None:
+    for series in (_histograms, _slots, _decision_series, _evidence_series):
+        series.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def _histogram(family: str, label: str, value: str) -> tuple:
+    series = _histograms.get((family, value))
+    if series is None:
+        store = get_metrics_store()
+        buckets = tuple(
+            store.slot(_series_key(f"{family}_bucket", ((label, value), ("le", _format_le(b)))))
+            for b in LATENCY_BUCKETS_S
+        )
+        series = (
+            buckets,
+            store.slot(_series_key(f"{family}_sum", ((label, value),))),
+            store.slot(_series_key(f"{family}_count", ((label, value),))),
+        )
+        _histograms[(family, value)] = series
+    return series
+
+
+def _slot(family: str, labels: tuple) -> int:
+    index = _slots.get((family, labels))
+    if index is None:
+        index = get_metrics_store().slot(_series_key(family, labels))
+        _slots[(family, labels)] = index
+    return index
+
+
+def _decision_slots(key: tuple) -> tuple:
+    decision, primary_reason, timeout_guard_reason = key
+    buckets, sum_slot, count_slot = _histogram("ai_gate_decision_latency_seconds", "decision", decision)
+    slots = (
+        buckets, sum_slot, count_slot,
+        _slot("ai_gate_decisions_total", (("decision", decision),)),
+        _slot("ai_gate_primary_reasons_total", (("primary_reason", primary_reason),)),
+        _slot("ai_gate_timeout_guard_reasons_total", (("timeout_guard_reason", timeout_guard_reason),)),
+    )
+    _decision_series[key] = slots
+    return slots
+
+
+def _evidence_slots(key: tuple) -> tuple:
+    provider, outcome = key
+    slots = (
+        _histogram("ai_gate_provider_latency_seconds", "provider", provider),
+        _slot("ai_gate_evidence_outcomes_total", (("provider", provider), ("outcome", outcome))),
+    )
+    _evidence_series[key] = slots
+    return slots
+
+
+def observe_decision(decision: str, primary_reason: str, timeout_guard_reason: str, seconds: float) -> None:
+    """Record one decision (latency by decision, and the decision/reason counters)."""
+    key = (decision, primary_reason, timeout_guard_reason)
+    buckets, sum_slot, count_slot, decision_slot, reason_slot, guard_slot = (
+        _decision_series.get(key) or _decision_slots(key)
+    )
+    values = _store.values
+    values[buckets[bisect_left(LATENCY_BUCKETS_S, seconds)]] += 1
+    values[sum_slot] += seconds
+    values[count_slot] += 1
+    values[decision_slot] += 1
+    values[reason_slot] += 1
+    values[guard_slot] += 1
+
+
+def observe_evidence(provider: str, outcome: str, seconds: Optional[float] = None) -> None:
+    """Record one evidence outcome; seconds is the provider call latency (None: not called)."""
+    key = (provider, outcome)
+    histogram, outcome_slot = _evidence_series.get(key) or _evidence_slots(key)
+    values = _store.values
+    values[outcome_slot] += 1
+    if seconds is not None:
+        values[histogram[0][bisect_left(LATENCY_BUCKETS_S, seconds)]] += 1
+        values[histogram[1]] += seconds
+        values[histogram[2]] += 1
+
+
+def set_circuit_breaker(provider: str, state: str, open_count: int) -> None:
+    """Update the breaker gauges of provider (state is a CircuitBreakerState value)."""
+    store = get_metrics_store()
+    labels = (("provider", provider),)
+    store.values[_slot("ai_gate_circuit_breaker_state", labels)] = float(BREAKER_STATE_CODES[state])
+    store.values[_slot("ai_gate_circuit_breaker_open_count", labels)] = float(open_count)
+
+
+def _family_of(key: str) -> str:
+    name = key[:key.index("{")]
+    for suffix in ("_bucket", "_sum", "_count"):
+        if name.endswith(suffix) and name[:-len(suffix)] in FAMILIES:
+            return name[:-len(suffix)]
+    return name
+
+
+def _with_pid(key: str, pid: int) -> str:
+    brace = key.index("{")
+    body = key[brace + 1:-1]
+    return f'{key[:brace]}{{{body + "," if body else ""}pid="{pid}"}}'
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def collect_series() -> Dict[str, float]:
+    """Series of this process, or of every worker when AI_GATE_METRICS_DIR is set."""
+    store = get_metrics_store()
+    if store.path is None:
+        return dict(store.items())
+    merged: Dict[str, float] = {}
+    for path in sorted(store.path.parent.glob("metrics_*.db")):
+        try:
+            pid = int(path.stem.rsplit("_", 1)[1])
+            items = store.items() if path == store.path else read_store_file(path)
+        except (ValueError, OSError):
+            continue
+        alive = None
+        for key, value in items:
+            if FAMILIES.get(_family_of(key), ("",))[0] == "gauge":
+                if alive is None:
+                    alive = pid == os.getpid() or _pid_alive(pid)
+                if alive:
+                    merged[_with_pid(key, pid)] = value
+            else:
+                merged[key] = merged.get(key, 0.0) + value
+    return merged
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def render_metrics(series: Optional[Dict[str, float]] = None) -> str:
+    """Prometheus text exposition (version 0.0.4) of collect_series()."""
+    if series is None:
+        series = collect_series()
+    by_family: Dict[str, List[Tuple[str, float]]] = {}
+    for key, value in series.items():
+        by_family.setdefault(_family_of(key), []).append((key, value))
+    lines = []
+    for family in sorted(by_family):
+        kind, help_text = FAMILIES.get(family, ("untyped", ""))
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {kind}")
+        entries = by_family[family]
+        entries = _cumulative_buckets(family, entries) if kind == "histogram" else sorted(entries)
+        for key, value in entries:
+            lines.append(f"{key} {_format_value(value)}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _cumulative_buckets(family: str, entries: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
+    """
+    Stored buckets count their own range; exposition buckets are cumulative.
+    Returns each label set's buckets (ascending le), _sum and _count in order.
+    """
+    bucket_prefix = f"{family}_bucket{{"
+    by_labels: Dict[str, List[tuple]] = {}
+    for key, value in entries:
+        if key.startswith(bucket_prefix):
+            le_at = key.rindex('le="')
+            le = float(key[le_at + 4:key.index('"', le_at + 4)].replace("+Inf", "inf"))
+            labels = key[len(bucket_prefix):le_at]
+            by_labels.setdefault(labels, []).append((0, le, key, value))
+        else:
+            brace = key.index("{")
+            order = 1 if key[:brace].endswith("_sum") else 2
+            labels = key[brace + 1:-1]
+            by_labels.setdefault(labels + ("," if labels else ""), []).append((order, 0.0, key, value))
+    result = []
+    for labels in sorted(by_labels):
+        total = 0.0
+        for order, _, key, value in sorted(by_labels[labels]):
+            if order == 0:
+                total += value
+                value = total
+            result.append((key, value))
+    return result
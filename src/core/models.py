@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 from typing import Optional, Literal, Dict, Any
 from enum import Enum
 
@@ -32,6 +32,8 @@ class DecisionRequest(BaseModel):
     )
     debug: bool = False
     verbose: bool = False
+    # Return per-stage timings (src/core/timings.py) in the response.
+    timings: bool = False
     context: Optional[Dict[str, Any]] = Field(None, max_length=100)
     
     @field_validator('text')
@@ -81,6 +83,20 @@ class GateContext(BaseModel):
     verbose: bool = False
     context: Optional[Dict[str, Any]] = None
     structured_input: Optional[Dict[str, Any]] = None
+    # Per-request memoized text analysis (see core/text_analysis.py).
+    _analysis: Any = PrivateAttr(default=None)
+
+    @property
+    def analysis(self):
+        """Lazily created TextAnalysis shared by all stages of this request."""
+        # Read the private storage directly: `self._analysis` goes through
+        # BaseModel.__getattr__, which is slow on this per-provider hot path.
+        private = self.__pydantic_private__
+        analysis = private.get("_analysis")
+        if analysis is None:
+            from .text_analysis import TextAnalysis
+            analysis = private["_analysis"] = TextAnalysis(self.text)
+        return analysis
 
 class Explanation(BaseModel):
     summary: str
@@ -101,6 +117,10 @@ class DecisionResponse(BaseModel):
     explanation: Explanation
     policy: PolicyInfo
     latency_ms: int
+    # Formatted decision trace, only present for verbose requests.
+    trace: Optional[list[str]] = None
+    # Per-stage durations in microseconds, only present when requested (timings=true).
+    timings: Optional[Dict[str, float]] = None
 
 class PostcheckIssue(BaseModel):
     code: str
@@ -0,0 +1,254 @@
+"""
+Compiled policy bundle: every YAML config and matrix in one binary file.
+
+`make compile-policy` (python -m src.core.policy_bundle) validates the watched
+configs (config_registry.WATCHED_CONFIGS) and every matrix in matrices/, then
+writes one file holding the parsed documents, the Matrix objects with their
+rule indexes and compiled decision tables, the tool_id -> tool table and the
+shared keyword automaton.
+
+The bundle is content-hashed: its header carries a digest of every source it
+was compiled from (YAML files and the Python modules that define the compiled
+structures) and a digest of the payload. The config registry and load_matrix()
+ask bundled_document() / bundled_matrix() / bundled_table() first; the bundle is
+read once (single read) and used only if the sources still hash to the
+recorded digest. A stale, corrupt or missing bundle means the config registry
+parses the YAML files instead. A hot reload (config_manager) stops using the bundle.
+
+The payload is a pickle: the bundle is a trusted build artifact, never load
+one from an untrusted location.
+
+Location: build/policy.bundle, overridable with AI_RESPONSIBILITY_GATE_POLICY_BUNDLE.
+"""
+import argparse
+import hashlib
+import logging
+import pickle
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import config as config_paths
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_MAGIC = b"AIGATEPB"
+BUNDLE_FORMAT = 1
+# magic, format, sources digest, payload digest, payload length
+_HEADER = struct.Struct("<8sI32s32sQ")
+
+# Modules whose classes / logic are baked into the payload: a change to any of
+# them makes existing bundles stale. gate.py maps config strings to the
+# decision table axes (_config_str_to_index) and gate_helpers.py holds
+# tighten_one_step, which the compiled stages call.
+_CODE_SOURCES = (
+    "matrix.py", "decision_table.py", "gate.py", "gate_helpers.py", "gate_stages.py",
+    "keyword_engine.py", "policy_bundle.py",
+)
+# Directory of _CODE_SOURCES.
+_CODE_DIR = Path(__file__).parent
+
+
+class PolicyBundleError(ValueError):
+    """The bundle file is missing, corrupt, stale or from another format."""
+
+
+def bundle_sources() -> List[Path]:
+    """Files the bundle is compiled from, in digest order."""
+    from .config_manager import watched_files
+
+    return [*watched_files(), *(_CODE_DIR / name for name in _CODE_SOURCES)]
+
+
+def sources_digest(paths: Optional[List[Path]] = None) -> bytes:
+    """sha256 over the name and content of every source file."""
+    digest = hashlib.sha256()
+    for path in bundle_sources() if paths is None else paths:
+        digest.update(path.name.encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def _matrix_key(path: Path) -> str:
+    """Bundle key of a matrix file: project-relative when possible (portable builds)."""
+    path = path.resolve()
+    try:
+        return path.relative_to(config_paths.get_project_root()).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def compile_policy_bundle() -> Dict[str, Any]:
+    """Validate all configs and matrices and return the bundle payload."""
+    # The gate import registers every consumer module's keywords.
+    from .config_manager import WATCHED_CONFIGS, load_config_document, validate_config_documents
+    from .gate import _get_decision_table
+    from .keyword_engine import KeywordAutomaton, keywords_for
+    from .matrix import Matrix
+
+    documents = {name: load_config_document(name) for name in WATCHED_CONFIGS}
+    validate_config_documents(documents)
+
+    matrices = {}
+    for path in sorted(Path(config_paths.MATRICES_DIR).glob("*.yaml")):
+        matrix = Matrix(path.name)
+        _get_decision_table(matrix)
+        matrices[_matrix_key(path)] = matrix
+
+    keywords = keywords_for(documents)
+    return {
+        "documents": documents,
+        # One nested pickle per matrix: unpickling Matrix / DecisionTable imports
+        # the pipeline modules, so a matrix is only decoded on first use
+        # (bundled_matrix()), never while the bundle itself is read.
+        "matrices": {
+            key: pickle.dumps(matrix, protocol=pickle.HIGHEST_PROTOCOL)
+            for key, matrix in matrices.items()
+        },
+        "tables": {"tools_by_id": {t["tool_id"]: t for t in documents["catalog"]["tools"]}},
+        "keywords": keywords,
+        "automaton": KeywordAutomaton(keywords),
+    }
+
+
+def write_policy_bundle(path: Path) -> bytes:
+    """Compile and write the bundle; returns its sources digest."""
+    payload = pickle.dumps(compile_policy_bundle(), protocol=pickle.HIGHEST_PROTOCOL)
+    digest = sources_digest()
+    header = _HEADER.pack(
+        BUNDLE_MAGIC, BUNDLE_FORMAT, digest, hashlib.sha256(payload).digest(), len(payload)
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(header + payload)
+    # Atomic replace: a starting worker never reads a half-written bundle.
+    tmp.replace(path)
+    return digest
+
+
+def read_policy_bundle(path: Path) -> Dict[str, Any]:
+    """Read and verify a bundle; raises PolicyBundleError when it cannot be used."""
+    try:
+        raw = path.read_bytes()
+    except OSError as e:
+        raise PolicyBundleError(f"Policy bundle not readable: {path}: {e}") from e
+    if len(raw) < _HEADER.size:
+        raise PolicyBundleError(f"Policy bundle truncated: {path}")
+    magic, fmt, digest, payload_digest, length = _HEADER.unpack_from(raw)
+    if magic != BUNDLE_MAGIC or fmt != BUNDLE_FORMAT:
+        raise PolicyBundleError(f"Not a format {BUNDLE_FORMAT} policy bundle: {path}")
+    payload = memoryview(raw)[_HEADER.size:]
+    if len(payload) != length or hashlib.sha256(payload).digest() != payload_digest:
+        raise PolicyBundleError(f"Policy bundle corrupt: {path}")
+    try:
+        current = sources_digest()
+    except OSError as e:
+        raise PolicyBundleError(f"Policy bundle sources not readable: {e}") from e
+    if current != digest:
+        raise PolicyBundleError(f"Policy bundle stale (sources changed since compile): {path}")
+    return pickle.loads(payload)
+
+
+_UNLOADED = object()
+_bundle: Any = _UNLOADED
+# Decoded matrices by bundle key.
+_bundle_matrices: Dict[str, Any] = {}
+
+
+def get_policy_bundle() -> Optional[Dict[str, Any]]:
+    """The verified bundle payload, or None (YAML fallback). Read once per process."""
+    global _bundle
+    if _bundle is _UNLOADED:
+        path = config_paths.POLICY_BUNDLE_PATH
+        if not path.exists():
+            _bundle = None
+        else:
+            try:
+                _bundle = read_policy_bundle(path)
+            except PolicyBundleError as e:
+                logger.warning("%s; loading YAML configs instead", e)
+                _bundle = None
+            else:
+                from .keyword_engine import offer_automaton
+                offer_automaton(_bundle["automaton"], _bundle["keywords"])
+    return _bundle
+
+
+def release_policy_bundle() -> None:
+    """Stop serving from the bundle (configs reloaded from YAML, tests)."""
+    global _bundle
+    _bundle = None
+    _bundle_matrices.clear()
+
+
+def reset_policy_bundle() -> None:
+    """Forget the loaded bundle so the next access reads the file again."""
+    global _bundle
+    _bundle = _UNLOADED
+    _bundle_matrices.clear()
+
+
+def bundled_document(name: str) -> Optional[Any]:
+    """Parsed YAML document (config_registry.WATCHED_CONFIGS name) from the bundle."""
+    bundle = get_policy_bundle()
+    return bundle["documents"].get(name) if bundle is not None else None
+
+
+def bundled_table(name: str) -> Optional[Any]:
+    bundle = get_policy_bundle()
+    return bundle["tables"].get(name) if bundle is not None else None
+
+
+def bundled_matrix(path: str) -> Optional[Any]:
+    """Compiled Matrix for a load_matrix() path, if the bundle has it."""
+    bundle = get_policy_bundle()
+    if bundle is None:
+        return None
+    try:
+        key = _matrix_key(config_paths.get_matrix_path(path))
+    except FileNotFoundError:
+        return None
+    matrix = _bundle_matrices.get(key)
+    if matrix is None:
+        blob = bundle["matrices"].get(key)
+        if blob is None:
+            return None
+        matrix = _bundle_matrices[key] = pickle.loads(blob)
+    return matrix
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile YAML configs and matrices into a policy bundle.")
+    parser.add_argument("--output", type=Path, default=None, help="bundle path (default: build/policy.bundle)")
+    parser.add_argument("--check", action="store_true", help="only verify that the bundle is up to date")
+    args = parser.parse_args(argv)
+    path = args.output or config_paths.POLICY_BUNDLE_PATH
+
+    if args.check:
+        try:
+            read_policy_bundle(path)
+        except PolicyBundleError as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(f"{path}: up to date")
+        return 0
+
+    from .config_manager import ConfigReloadError
+    # Compile from the YAML sources only, never from a previous bundle.
+    release_policy_bundle()
+    try:
+        digest = write_policy_bundle(path)
+    except (ConfigReloadError, FileNotFoundError, ValueError) as e:
+        print(f"compile-policy failed: {e}", file=sys.stderr)
+        return 1
+    print(f"{path}: {path.stat().st_size} bytes, sources sha256 {digest.hex()[:16]}")
+    return 0
+
+
+if __name__ == "__main__":
+    # Run the package module, not this __main__ copy: the pipeline modules
+    # imported while compiling share the package module's bundle state.
+    from .policy_bundle import main as package_main
+    sys.exit(package_main())
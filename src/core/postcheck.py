@@ -1,17 +1,44 @@
-import yaml
+from typing import FrozenSet, Optional
 from .models import Explanation, PostcheckResult, PostcheckIssue
-from .config import get_config_path
+from .config_registry import get_document
+from .keyword_engine import register_keyword_source, scan_keywords
 
-with open(get_config_path("risk_keywords.yaml"), encoding="utf-8") as f:
-    RISK_CONFIG = yaml.safe_load(f)
+register_keyword_source("risk_keywords", lambda config: config["guarantee_claim_keywords"])
 
-GUARANTEE_KEYWORDS = RISK_CONFIG["guarantee_claim_keywords"]
-DISCLAIMER = RISK_CONFIG["disclaimer_templates"]["default"]
 
-def postcheck(text: str, requires_disclaimer: bool, is_input: bool) -> PostcheckResult:
+def __getattr__(name: str):
+    # Historical module attributes, read from the active config.
+    if name == "RISK_CONFIG":
+        return get_document("risk_keywords")
+    if name == "GUARANTEE_KEYWORDS":
+        return get_document("risk_keywords")["guarantee_claim_keywords"]
+    if name == "DISCLAIMER":
+        return get_document("risk_keywords")["disclaimer_templates"]["default"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def postcheck(
+    text: str,
+    requires_disclaimer: bool,
+    is_input: bool,
+    keyword_hits: Optional[FrozenSet[str]] = None,
+    risk_config: Optional[dict] = None,
+) -> PostcheckResult:
+    """
+    keyword_hits: precomputed scan of text (e.g. GateContext.analysis.keyword_hits);
+    scanned here when omitted.
+    risk_config: risk_keywords.yaml pinned by the caller (the request's config
+    snapshot); the active config when omitted.
+    """
     issues = []
 
-    has_guarantee = any(kw in text for kw in GUARANTEE_KEYWORDS)
+    if risk_config is None:
+        risk_config = get_document("risk_keywords")
+    guarantee_keywords = risk_config["guarantee_claim_keywords"]
+    disclaimer = risk_config["disclaimer_templates"]["default"]
+
+    if keyword_hits is None:
+        keyword_hits = scan_keywords(text)
+    has_guarantee = any(kw in keyword_hits for kw in guarantee_keywords)
     if has_guarantee:
         issues.append(PostcheckIssue(
             code="GUARANTEE_KEYWORD_IN_TEXT",
@@ -19,7 +46,7 @@ def postcheck(text: str, requires_disclaimer: bool, is_input: bool) -> Postcheck
             description="Guarantee keyword found in text"
         ))
 
-    if not is_input and requires_disclaimer and DISCLAIMER not in text:
+    if not is_input and requires_disclaimer and disclaimer not in text:
         issues.append(PostcheckIssue(
             code="MISSING_DISCLAIMER",
             severity="error",
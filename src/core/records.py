@@ -0,0 +1,151 @@
+"""
+Plain records for the internal decision pipeline.
+
+Requests are validated once at the boundary (DecisionRequest). Everything
+decide() builds afterwards comes from trusted pipeline code, so the per-request
+context and the decision outcome are slotted classes instead of pydantic models.
+The DecisionResponse model is only materialized when a caller asks for it
+(DecisionOutcome.to_response(), called by decide() / decide_many()).
+
+Public stage contracts are unchanged: classifier and evidence providers still
+return ClassifierResult / Evidence, and still accept a GateContext.
+"""
+from typing import Any, Dict, List, Optional
+
+from .models import (
+    Decision, DecisionResponse, Explanation, PolicyInfo, ResponsibilityType,
+)
+from .trace import DecisionTrace
+from .runtime_config import GateRuntimeConfig
+from .timings import StageTimings
+
+
+class PipelineContext:
+    """
+    Slotted equivalent of GateContext used inside decide().
+
+    Exposes the same attributes (including the lazily created TextAnalysis), so
+    classify() and the evidence providers accept either one.
+    """
+
+    __slots__ = (
+        "request_id", "session_id", "user_id", "text", "debug", "verbose",
+        "context", "structured_input", "runtime_config", "config_snapshot", "_analysis",
+        "timings",
+    )
+
+    def __init__(
+        self,
+        request_id: str,
+        session_id: Optional[str],
+        user_id: Optional[str],
+        text: Optional[str],
+        debug: bool,
+        verbose: bool = False,
+        context: Optional[Dict[str, Any]] = None,
+        structured_input: Optional[Dict[str, Any]] = None,
+        runtime_config: Optional[GateRuntimeConfig] = None,
+        config_snapshot: Optional[Any] = None,
+        timings: Optional[StageTimings] = None,
+    ):
+        self.request_id = request_id
+        self.session_id = session_id
+        self.user_id = user_id
+        self.text = text
+        self.debug = debug
+        self.verbose = verbose
+        self.context = context
+        self.structured_input = structured_input
+        # Runtime config snapshot pinned for this request (see runtime_config.py).
+        self.runtime_config = runtime_config
+        # YAML config snapshot pinned for this request (see config_manager.py).
+        self.config_snapshot = config_snapshot
+        # Stage timings of this decision; collect_all_evidence adds provider calls.
+        self.timings = timings
+        self._analysis = None
+
+    @property
+    def analysis(self):
+        """Lazily created TextAnalysis shared by all stages of this request."""
+        analysis = self._analysis
+        if analysis is None:
+            from .text_analysis import TextAnalysis
+            snapshot = self.config_snapshot
+            if snapshot is None:
+                analysis = TextAnalysis(self.text)
+            else:
+                analysis = TextAnalysis(self.text, snapshot.documents["catalog"], snapshot.automaton)
+            self._analysis = analysis
+        return analysis
+
+
+class DecisionOutcome:
+    """Final pipeline state of one decision, convertible to DecisionResponse."""
+
+    __slots__ = (
+        "request_id", "session_id", "responsibility_type", "decision",
+        "primary_reason", "suggested_action", "summary", "evidence_used",
+        "trigger_spans", "matrix_version", "rules_fired", "latency_ms", "trace",
+        "cacheable", "timeout_guard_reason", "timings",
+    )
+
+    def __init__(
+        self,
+        request_id: str,
+        session_id: Optional[str],
+        responsibility_type: ResponsibilityType,
+        decision: Decision,
+        primary_reason: str,
+        suggested_action: str,
+        summary: str,
+        evidence_used: List[str],
+        trigger_spans: List[str],
+        matrix_version: str,
+        rules_fired: Optional[List[str]],
+        latency_ms: int,
+        trace: Optional[DecisionTrace] = None,
+        cacheable: bool = False,
+        timeout_guard_reason: str = "NONE",
+        timings: Optional[StageTimings] = None,
+    ):
+        self.request_id = request_id
+        self.session_id = session_id
+        self.responsibility_type = responsibility_type
+        self.decision = decision
+        self.primary_reason = primary_reason
+        self.suggested_action = suggested_action
+        self.summary = summary
+        self.evidence_used = evidence_used
+        self.trigger_spans = trigger_spans
+        self.matrix_version = matrix_version
+        self.rules_fired = rules_fired
+        self.latency_ms = latency_ms
+        self.trace = trace
+        # Computed from complete evidence (see decision_cache.py); not part of the response.
+        self.cacheable = cacheable
+        # Explain-only timeout guard overlay reason (gate.py); reported in metrics only.
+        self.timeout_guard_reason = timeout_guard_reason
+        self.timings = timings
+
+    def to_response(self, include_timings: bool = False) -> DecisionResponse:
+        """Materialize (and validate) the public response model."""
+        return DecisionResponse(
+            request_id=self.request_id,
+            session_id=self.session_id,
+            responsibility_type=self.responsibility_type,
+            decision=self.decision,
+            primary_reason=self.primary_reason,
+            suggested_action=self.suggested_action,
+            explanation=Explanation(
+                summary=self.summary,
+                evidence_used=self.evidence_used,
+                trigger_spans=self.trigger_spans,
+            ),
+            policy=PolicyInfo(
+                matrix_version=self.matrix_version,
+                rules_fired=self.rules_fired,
+            ),
+            latency_ms=self.latency_ms,
+            trace=self.trace.lines() if self.trace is not None else None,
+            timings=self.timings.as_us() if include_timings and self.timings is not None else None,
+        )
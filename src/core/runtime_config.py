@@ -0,0 +1,258 @@
+"""
+Immutable runtime configuration snapshot (environment-driven feature flags).
+
+All AI_GATE_* environment variables consulted by the decision pipeline are
+resolved once into a frozen GateRuntimeConfig, including the per-tier timeout
+guard overlay policy. Requests read the snapshot reference once and use it for
+their whole lifetime, so there is no per-request environment access and a
+request never sees a mix of old and new values.
+
+The snapshot is built at import. After changing the environment, call
+reload_runtime_config() to swap in a new snapshot atomically (in-flight
+requests keep the one they started with).
+
+Environment variables:
+- AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED: evidence timeout guard in
+  collect_all_evidence (default off) and timeout guard overlays in gate.py
+  (default on; overlays only act when evidence carries _meta)
+- AI_GATE_TIMEOUT_GUARD_HITL_OVERLAY_ENABLED / _DENY_OVERLAY_ENABLED (default on)
+- AI_GATE_TIMEOUT_GUARD_POLICY_VERSION (default "v1")
+- AI_GATE_RISK_TIER (default "R2")
+- AI_GATE_EVIDENCE_CONTRACT_VALIDATION_ENABLED (default on)
+- AI_GATE_PERMISSION_PROVIDER_URL / AI_GATE_KNOWLEDGE_PROVIDER_URL: base URL
+  of the remote service for that provider (src/evidence/remote.py); unset
+  means the local YAML-backed provider
+- AI_GATE_EVIDENCE_CACHE_ENABLED: per-provider evidence cache
+  (src/evidence/cache.py, default on)
+- AI_GATE_DECISION_CACHE_ENABLED: whole-decision cache (decision_cache.py,
+  default off); AI_GATE_DECISION_CACHE_SIZE (entries, default 10000) and
+  AI_GATE_DECISION_CACHE_TTL_S (default 300)
+- AI_GATE_CIRCUIT_BREAKER_BACKEND: "memory" (per-process breakers, default) or
+  "shared" (state shared by all workers on the host, shared_circuit_breaker.py);
+  AI_GATE_CIRCUIT_BREAKER_SHM_PATH overrides the shared segment file
+- AI_GATE_CONFIG_WATCH_INTERVAL_S: poll interval of the YAML config hot
+  reload watcher (config_manager.py, default 0 = off; POST
+  /admin/config/reload works either way)
+- AI_GATE_SERVER_TIMING_ENABLED: Server-Timing header with the stage timings
+  on POST /decision (timings.py, default on)
+- AI_GATE_METRICS_DIR: directory of per-worker metrics files, so GET /metrics
+  covers every worker (metrics.py; unset: the serving process only)
+"""
+import os
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+RISK_TIERS = ("R0", "R1", "R2", "R3")
+CIRCUIT_BREAKER_BACKENDS = ("memory", "shared")
+DEFAULT_RISK_TIER = "R2"
+
+_TRUE_VALUES = ("1", "true", "yes", "y", "on")
+
+
+def parse_bool_flag(environ: Mapping[str, str], name: str, default: bool) -> bool:
+    """
+    Read a boolean-ish environment variable with a safe default.
+
+    Accepts: "1", "true", "yes", "y", "on" (case-insensitive) as True.
+    Any other explicit value is treated as False.
+    """
+    raw = environ.get(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in _TRUE_VALUES
+
+
+def parse_evidence_timeout_guard_flag(environ: Mapping[str, str], default: bool = False) -> bool:
+    """Evidence timeout guard flag as read by collect_all_evidence (default off)."""
+    env_value = environ.get("AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED", "").lower()
+    if env_value in ("true", "1", "yes", "on"):
+        return True
+    if env_value in ("false", "0", "no", "off"):
+        return False
+    return default
+
+
+def parse_contract_validation_flag(environ: Mapping[str, str]) -> bool:
+    """EvidenceBundle contract validation flag (default on)."""
+    raw = environ.get("AI_GATE_EVIDENCE_CONTRACT_VALIDATION_ENABLED", "true").lower()
+    return raw not in ("false", "0", "no", "off")
+
+
+def parse_number(environ: Mapping[str, str], name: str, default, cast=int):
+    """Read a positive number; missing, invalid or non-positive values use the default."""
+    raw = environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = cast(raw.strip())
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def parse_circuit_breaker_backend(environ: Mapping[str, str]) -> str:
+    """Circuit breaker backend; unknown values fall back to the per-process one."""
+    raw = environ.get("AI_GATE_CIRCUIT_BREAKER_BACKEND", "").strip().lower()
+    return raw if raw in CIRCUIT_BREAKER_BACKENDS else "memory"
+
+
+def normalize_risk_tier(value: str) -> str:
+    """
+    Normalize a risk tier string into one of the supported tiers.
+
+    Supported tiers: R0, R1, R2, R3. Any unknown value falls back to R2.
+    """
+    if not isinstance(value, str):
+        return DEFAULT_RISK_TIER
+    upper = value.strip().upper()
+    if upper in RISK_TIERS:
+        return upper
+    return DEFAULT_RISK_TIER
+
+
+@dataclass(frozen=True)
+class TierOverlayPolicy:
+    """Timeout guard overlays allowed for one risk tier (tighten-only, never relax)."""
+    allow_hitl_overlay: bool
+    allow_deny_overlay: bool
+    allow_degraded_to_hitl: bool
+    # Effective switches: tier policy combined with the global overlay flags.
+    hitl_overlay: bool
+    deny_overlay: bool
+
+
+# Tier-specific overlay allowances: (hitl, deny, degraded_to_hitl).
+_TIER_OVERLAY_ALLOWANCES = {
+    "R0": (False, False, False),
+    "R1": (True, False, False),
+    "R2": (True, True, False),
+    "R3": (True, True, True),
+}
+
+
+def _build_tier_overlays(
+    hitl_overlay_enabled: bool, deny_overlay_enabled: bool
+) -> Mapping[str, TierOverlayPolicy]:
+    overlays = {}
+    for tier, (allow_hitl, allow_deny, allow_degraded) in _TIER_OVERLAY_ALLOWANCES.items():
+        hitl_overlay = hitl_overlay_enabled and allow_hitl
+        overlays[tier] = TierOverlayPolicy(
+            allow_hitl_overlay=allow_hitl,
+            allow_deny_overlay=allow_deny,
+            allow_degraded_to_hitl=allow_degraded,
+            hitl_overlay=hitl_overlay,
+            # DENY overlay is only possible when HITL overlay is also enabled by both
+            # config and tier policy, to avoid ALLOW → DENY without HITL escalations.
+            deny_overlay=deny_overlay_enabled and allow_deny and hitl_overlay,
+        )
+    return MappingProxyType(overlays)
+
+
+@dataclass(frozen=True)
+class GateRuntimeConfig:
+    """Frozen snapshot of the environment-driven pipeline configuration."""
+    # collect_all_evidence: timeout guard, circuit breakers and outcome labels
+    evidence_timeout_guard_enabled: bool
+    evidence_contract_validation_enabled: bool
+    # gate.py: timeout guard overlays (stage 5.6 / 5.7)
+    timeout_guard_overlay_enabled: bool
+    hitl_overlay_enabled: bool
+    deny_overlay_enabled: bool
+    timeout_guard_policy_version: str
+    # Effective risk tier from the environment and where it came from ("env" / "default")
+    risk_tier: str
+    risk_tier_source: str
+    tier_overlays: Mapping[str, TierOverlayPolicy]
+    # Incremented by every reload; lets caches detect configuration changes.
+    version: int = 0
+    # Remote evidence services (None: local provider)
+    permission_provider_url: Optional[str] = None
+    knowledge_provider_url: Optional[str] = None
+    # Per-provider evidence result cache (providers declaring a cache policy)
+    evidence_cache_enabled: bool = True
+    # Whole-decision cache (opt-in)
+    decision_cache_enabled: bool = False
+    decision_cache_size: int = 10000
+    decision_cache_ttl_s: float = 300.0
+    # YAML config hot reload watcher (0: off)
+    config_watch_interval_s: float = 0.0
+    # Evidence provider circuit breakers: per-process ("memory") or host-wide ("shared")
+    circuit_breaker_backend: str = "memory"
+    circuit_breaker_shm_path: Optional[str] = None
+    # Per-worker metrics files for multi-worker GET /metrics (None: in-process)
+    metrics_dir: Optional[str] = None
+    # Server-Timing header on POST /decision
+    server_timing_enabled: bool = True
+
+    def overlay_policy(self, risk_tier: str) -> TierOverlayPolicy:
+        return self.tier_overlays.get(risk_tier) or self.tier_overlays[DEFAULT_RISK_TIER]
+
+    @classmethod
+    def from_env(
+        cls, environ: Optional[Mapping[str, str]] = None, version: int = 0
+    ) -> "GateRuntimeConfig":
+        if environ is None:
+            environ = os.environ
+        hitl_overlay_enabled = parse_bool_flag(
+            environ, "AI_GATE_TIMEOUT_GUARD_HITL_OVERLAY_ENABLED", True
+        )
+        deny_overlay_enabled = parse_bool_flag(
+            environ, "AI_GATE_TIMEOUT_GUARD_DENY_OVERLAY_ENABLED", True
+        )
+
+        risk_tier, risk_tier_source = DEFAULT_RISK_TIER, "default"
+        env_tier = environ.get("AI_GATE_RISK_TIER")
+        if env_tier:
+            risk_tier = normalize_risk_tier(env_tier)
+            risk_tier_source = "env" if risk_tier == env_tier.strip().upper() else "default"
+
+        return cls(
+            evidence_timeout_guard_enabled=parse_evidence_timeout_guard_flag(environ),
+            evidence_contract_validation_enabled=parse_contract_validation_flag(environ),
+            timeout_guard_overlay_enabled=parse_bool_flag(
+                environ, "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED", True
+            ),
+            hitl_overlay_enabled=hitl_overlay_enabled,
+            deny_overlay_enabled=deny_overlay_enabled,
+            timeout_guard_policy_version=environ.get("AI_GATE_TIMEOUT_GUARD_POLICY_VERSION", "v1"),
+            risk_tier=risk_tier,
+            risk_tier_source=risk_tier_source,
+            tier_overlays=_build_tier_overlays(hitl_overlay_enabled, deny_overlay_enabled),
+            version=version,
+            permission_provider_url=environ.get("AI_GATE_PERMISSION_PROVIDER_URL") or None,
+            knowledge_provider_url=environ.get("AI_GATE_KNOWLEDGE_PROVIDER_URL") or None,
+            evidence_cache_enabled=parse_bool_flag(environ, "AI_GATE_EVIDENCE_CACHE_ENABLED", True),
+            decision_cache_enabled=parse_bool_flag(environ, "AI_GATE_DECISION_CACHE_ENABLED", False),
+            decision_cache_size=parse_number(environ, "AI_GATE_DECISION_CACHE_SIZE", 10000),
+            decision_cache_ttl_s=parse_number(environ, "AI_GATE_DECISION_CACHE_TTL_S", 300.0, float),
+            config_watch_interval_s=parse_number(environ, "AI_GATE_CONFIG_WATCH_INTERVAL_S", 0.0, float),
+            circuit_breaker_backend=parse_circuit_breaker_backend(environ),
+            circuit_breaker_shm_path=environ.get("AI_GATE_CIRCUIT_BREAKER_SHM_PATH") or None,
+            metrics_dir=environ.get("AI_GATE_METRICS_DIR") or None,
+            server_timing_enabled=parse_bool_flag(environ, "AI_GATE_SERVER_TIMING_ENABLED", True),
+        )
+
+
+_runtime_config: GateRuntimeConfig = GateRuntimeConfig.from_env()
+_reload_lock = threading.Lock()
+
+
+def get_runtime_config() -> GateRuntimeConfig:
+    """Return the current snapshot (read once per request)."""
+    return _runtime_config
+
+
+def reload_runtime_config(environ: Optional[Mapping[str, str]] = None) -> GateRuntimeConfig:
+    """
+    Rebuild the snapshot from the environment (or the given mapping) and swap it in.
+
+    The new snapshot is fully built before the module reference is replaced, so
+    readers see either the old or the new configuration, never a mix.
+    """
+    global _runtime_config
+    with _reload_lock:
+        snapshot = GateRuntimeConfig.from_env(environ, version=_runtime_config.version + 1)
+        _runtime_config = snapshot
+    return snapshot
@@ -0,0 +1,293 @@
+"""
+Host-wide circuit breaker state in a shared memory segment.
+
+With several uvicorn workers, each process has its own CircuitBreaker per
+provider, so a dead provider has to time out timeout_threshold times in every
+worker before all of them stop calling it. The shared backend
+(AI_GATE_CIRCUIT_BREAKER_BACKEND=shared) keeps the state of every provider's
+breaker in one mmap'ed file that all workers on the host map:
+
+    header | slot 0 | slot 1 | ...      (SLOT_SIZE bytes each)
+
+A slot holds the provider_id and the CircuitBreaker state fields (state,
+counters, cooldown, HALF_OPEN probe count and epoch). Every breaker operation is one
+read-modify-write of its slot under an fcntl record lock on that slot's byte
+range (plus a process-local lock, since record locks do not exclude threads of
+the same process). A transition made by one worker is therefore seen by the
+next should_call_provider() in any worker, and the HALF_OPEN probe limit holds
+across the host. The kernel drops record locks of a process that dies, so a
+crashed worker cannot wedge a slot.
+
+Only the state is shared; thresholds and cooldowns come from each process's
+own configuration, which is identical across workers of one deployment.
+Segment location: AI_GATE_CIRCUIT_BREAKER_SHM_PATH (default: a file in
+/dev/shm, or the temp directory when /dev/shm does not exist, named after
+SEGMENT_FORMAT). POSIX only.
+
+A segment file is never truncated once it exists: other workers may have it
+mapped, and shrinking a mapped file kills them with SIGBUS. Each segment
+format has its own default file name, so workers of two releases running
+side by side (a rolling restart) use separate segments. A file at the
+configured path holding another format or layout is refused
+(SharedBreakerSegmentError) instead of being reinitialized.
+"""
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from .gate_helpers import (
+    CircuitBreaker,
+    CircuitBreakerPermit,
+    CircuitBreakerSnapshot,
+    CircuitBreakerState,
+)
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_MAGIC = b"AIGATECB"
+SEGMENT_FORMAT = 2
+DEFAULT_SLOTS = 64
+SLOT_SIZE = 128
+PROVIDER_ID_BYTES = 48
+
+# magic, format, slot count
+_HEADER = struct.Struct("<8sII")
+# provider_id, state, consecutive_timeouts, consecutive_successes, open_count,
+# last_state_change_ms, cooldown_expires_at_ms, half_open_probe_count, half_open_epoch
+_SLOT = struct.Struct(f"<{PROVIDER_ID_BYTES}sB7x7q")
+
+_STATE_CODES = {
+    CircuitBreakerState.CLOSED: 0,
+    CircuitBreakerState.OPEN: 1,
+    CircuitBreakerState.HALF_OPEN: 2,
+}
+_STATES = {code: state for state, code in _STATE_CODES.items()}
+
+
+def default_segment_path() -> Path:
+    base = Path("/dev/shm")
+    if not base.is_dir():
+        base = Path(tempfile.gettempdir())
+    return base / f"ai_gate_circuit_breakers_v{SEGMENT_FORMAT}_{os.getuid()}"
+
+
+class SharedBreakerSegmentError(ValueError):
+    """The segment file holds another format or layout (see SharedBreakerSegment)."""
+
+
+class SharedBreakerSegment:
+    """
+    The mapped segment file. Slots are claimed by provider_id on first use and
+    never released; a segment is sized for the providers of one deployment.
+    """
+
+    def __init__(self, path: Optional[Path] = None, slots: int = DEFAULT_SLOTS):
+        import fcntl
+
+        self._fcntl = fcntl
+        self.path = Path(path) if path is not None else default_segment_path()
+        self._local_lock = threading.Lock()
+        self._slot_by_provider: Dict[str, int] = {}
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            with self._locked_range(0, SLOT_SIZE):
+                self.slots = self._initialize(slots)
+            self._mmap = mmap.mmap(self._fd, SLOT_SIZE * (1 + self.slots))
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _initialize(self, slots: int) -> int:
+        """
+        Create or adopt the segment (caller holds the header lock); returns the
+        slot count. The file only ever grows: it may be mapped by other workers.
+        """
+        size = os.fstat(self._fd).st_size
+        header = os.pread(self._fd, _HEADER.size, 0) if size >= _HEADER.size else b""
+        if header.strip(b"\0"):
+            magic, fmt, existing = _HEADER.unpack(header)
+            if magic != SEGMENT_MAGIC or fmt != SEGMENT_FORMAT:
+                logger.error(
+                    "Shared circuit breaker segment %s is not a format %d segment (magic %r, format %d); "
+                    "refusing to reinitialize it",
+                    self.path, SEGMENT_FORMAT, magic, fmt,
+                )
+                raise SharedBreakerSegmentError(
+                    f"Shared breaker segment {self.path} has another format ({magic!r}, {fmt}); "
+                    f"expected format {SEGMENT_FORMAT}"
+                )
+            if size < SLOT_SIZE * (1 + existing):
+                # Header written but not fully sized (crash during creation): grow it.
+                os.ftruncate(self._fd, SLOT_SIZE * (1 + existing))
+            return existing
+        # New (or never initialized) file: nothing can have mapped slots of it yet.
+        if size < SLOT_SIZE * (1 + slots):
+            os.ftruncate(self._fd, SLOT_SIZE * (1 + slots))
+        os.pwrite(self._fd, _HEADER.pack(SEGMENT_MAGIC, SEGMENT_FORMAT, slots), 0)
+        return slots
+
+    @contextmanager
+    def _locked_range(self, start: int, length: int) -> Iterator[None]:
+        self._fcntl.lockf(self._fd, self._fcntl.LOCK_EX, length, start, os.SEEK_SET)
+        try:
+            yield
+        finally:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN, length, start, os.SEEK_SET)
+
+    def lock_slot(self, slot: int) -> None:
+        """Exclusive access to one slot, across threads and processes (see unlock_slot)."""
+        self._local_lock.acquire()
+        try:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_EX, SLOT_SIZE, SLOT_SIZE * (1 + slot), os.SEEK_SET)
+        except BaseException:
+            self._local_lock.release()
+            raise
+
+    def unlock_slot(self, slot: int) -> None:
+        try:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN, SLOT_SIZE, SLOT_SIZE * (1 + slot), os.SEEK_SET)
+        finally:
+            self._local_lock.release()
+
+    def slot_for(self, provider_id: str) -> int:
+        """Slot of provider_id, claiming a free one on first use; ValueError when full."""
+        slot = self._slot_by_provider.get(provider_id)
+        if slot is not None:
+            return slot
+        key = provider_id.encode("utf-8")
+        if len(key) > PROVIDER_ID_BYTES:
+            raise ValueError(f"provider_id too long for the shared breaker segment: {provider_id!r}")
+        with self._local_lock, self._locked_range(0, SLOT_SIZE):
+            for slot in range(self.slots):
+                stored = self.read(slot)[0]
+                if stored == key:
+                    break
+                if not stored:
+                    self.write(slot, (key, 0, 0, 0, 0, 0, 0, 0, 0))
+                    break
+            else:
+                raise ValueError(f"Shared breaker segment full ({self.slots} slots): {self.path}")
+        self._slot_by_provider[provider_id] = slot
+        return slot
+
+    def read(self, slot: int) -> tuple:
+        provider_id, *fields = _SLOT.unpack_from(self._mmap, SLOT_SIZE * (1 + slot))
+        return (provider_id.rstrip(b"\0"), *fields)
+
+    def write(self, slot: int, fields: tuple) -> None:
+        _SLOT.pack_into(self._mmap, SLOT_SIZE * (1 + slot), *fields)
+
+    def close(self) -> None:
+        self._mmap.close()
+        os.close(self._fd)
+
+
+class SharedCircuitBreaker(CircuitBreaker):
+    """
+    CircuitBreaker whose state lives in a SharedBreakerSegment slot.
+
+    Each public operation loads the slot into the inherited fields, runs the
+    unchanged CircuitBreaker state machine and stores the result, all under the
+    slot lock. Transition events are emitted by the process that made the
+    transition.
+    """
+
+    def __init__(self, provider_id: str, segment: SharedBreakerSegment, **kwargs):
+        super().__init__(provider_id, **kwargs)
+        self._segment = segment
+        self._slot = segment.slot_for(provider_id)
+        self._key = provider_id.encode("utf-8")
+
+    def _load(self) -> None:
+        (_, state, self._consecutive_timeouts, self._consecutive_successes, self._open_count,
+         self._last_state_change_ms, self._cooldown_expires_at_ms,
+         self._half_open_probe_count, self._half_open_epoch) = self._segment.read(self._slot)
+        self._state = _STATES[state]
+
+    def _store(self) -> None:
+        self._segment.write(self._slot, (
+            self._key, _STATE_CODES[self._state], self._consecutive_timeouts,
+            self._consecutive_successes, self._open_count, self._last_state_change_ms,
+            self._cooldown_expires_at_ms, self._half_open_probe_count, self._half_open_epoch,
+        ))
+
+    def _locked(self, operation, *args):
+        """Run a CircuitBreaker method on the slot's current state, under the slot lock."""
+        segment, slot = self._segment, self._slot
+        segment.lock_slot(slot)
+        try:
+            self._load()
+            result = operation(self, *args)
+            self._store()
+        finally:
+            segment.unlock_slot(slot)
+        return result
+
+    # should_call_provider() goes through acquire_call().
+    def acquire_call(self, now_ms: int) -> Optional[CircuitBreakerPermit]:
+        return self._locked(CircuitBreaker.acquire_call, now_ms)
+
+    def release_permit(self, permit: CircuitBreakerPermit) -> None:
+        self._locked(CircuitBreaker.release_permit, permit)
+
+    def record_timeout(self, now_ms: int, permit: Optional[CircuitBreakerPermit] = None) -> None:
+        self._locked(CircuitBreaker.record_timeout, now_ms, permit)
+
+    def record_success(self, now_ms: int, permit: Optional[CircuitBreakerPermit] = None) -> None:
+        self._locked(CircuitBreaker.record_success, now_ms, permit)
+
+    def get_snapshot(self) -> CircuitBreakerSnapshot:
+        return self._locked(CircuitBreaker.get_snapshot)
+
+    # State properties read the shared slot, not this process's last copy.
+    @property
+    def state(self) -> CircuitBreakerState:
+        return self.get_snapshot().state
+
+    @property
+    def consecutive_timeouts(self) -> int:
+        return self.get_snapshot().consecutive_timeouts
+
+    @property
+    def consecutive_successes(self) -> int:
+        return self.get_snapshot().consecutive_successes
+
+    @property
+    def open_count(self) -> int:
+        return self.get_snapshot().open_count
+
+    @property
+    def last_state_change_ms(self) -> int:
+        return self.get_snapshot().last_state_change_ms
+
+    @property
+    def cooldown_expires_at_ms(self) -> int:
+        return self.get_snapshot().cooldown_expires_at_ms
+
+
+_segment: Optional[SharedBreakerSegment] = None
+_segment_lock = threading.Lock()
+
+
+def get_shared_segment(path: Optional[str] = None) -> SharedBreakerSegment:
+    """The process's segment handle (opened on first use)."""
+    global _segment
+    with _segment_lock:
+        if _segment is None:
+            _segment = SharedBreakerSegment(Path(path) if path else None)
+        return _segment
+
+
+def close_shared_segment() -> None:
+    """Unmap the segment (tests, shutdown); the file and its state stay."""
+    global _segment
+    with _segment_lock:
+        if _segment is not None:
+            _segment.close()
+            _segment = None
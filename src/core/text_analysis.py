@@ -0,0 +1,74 @@
+"""
+Per-request text analysis shared by classifier, evidence providers and postcheck.
+
+Each derived fact (keyword hits, routing hint matches, routed tool_id, inferred
+action_type, routing confidence) is computed at most once per request and then
+read by every consumer through GateContext.analysis.
+
+Text semantics are unchanged from the individual matchers:
+- keyword_hits follows the `text = ctx.text or ""` normalization used by
+  risk / classifier, so it never fails.
+- Routing-derived facts need real text; with text=None they raise TypeError,
+  which evidence collection surfaces as missing evidence (fail-closed).
+"""
+from typing import Any, FrozenSet, Optional
+
+from .keyword_engine import scan_keywords
+from ..evidence._action_routing import match_routing_hints, action_type_from_matches
+
+_UNSET = object()
+
+
+class TextAnalysis:
+    """Lazily computed, memoized facts derived from one request's text."""
+
+    __slots__ = (
+        "text", "catalog", "automaton", "_keyword_hits", "_routing_matches", "_routed_tool_id", "_inferred_action_type",
+    )
+
+    def __init__(self, text: Optional[str], catalog: Optional[dict] = None, automaton: Optional[Any] = None):
+        self.text = text
+        # Tool catalog and keyword automaton pinned by the request's config
+        # snapshot (None: the active ones).
+        self.catalog = catalog
+        self.automaton = automaton
+        self._keyword_hits = _UNSET
+        self._routing_matches = _UNSET
+        self._routed_tool_id = _UNSET
+        self._inferred_action_type = _UNSET
+
+    @property
+    def keyword_hits(self) -> FrozenSet[str]:
+        """All registered keywords occurring in the (normalized) text."""
+        if self._keyword_hits is _UNSET:
+            self._keyword_hits = scan_keywords(self.text or "", self.automaton)
+        return self._keyword_hits
+
+    @property
+    def routing_matches(self) -> list:
+        """Matched routing hints ({tool_id, confidence, source}) in catalog order."""
+        if self._routing_matches is _UNSET:
+            if not isinstance(self.text, str):
+                raise TypeError("routing hint matching requires text")
+            self._routing_matches = match_routing_hints(self.text, self.catalog, self.keyword_hits)
+        return self._routing_matches
+
+    @property
+    def routing_confidence(self) -> float:
+        """Highest routing hint confidence (0.0 when nothing matched)."""
+        return max([m["confidence"] for m in self.routing_matches], default=0.0)
+
+    @property
+    def routed_tool_id(self) -> Optional[str]:
+        """tool_id of the first matched routing hint, if any."""
+        if self._routed_tool_id is _UNSET:
+            matches = self.routing_matches
+            self._routed_tool_id = matches[0]["tool_id"] if matches else None
+        return self._routed_tool_id
+
+    @property
+    def inferred_action_type(self) -> str:
+        """action_type inferred from routing hints (READ when nothing maps)."""
+        if self._inferred_action_type is _UNSET:
+            self._inferred_action_type = action_type_from_matches(self.routing_matches, self.catalog)
+        return self._inferred_action_type
@@ -0,0 +1,121 @@
+"""
+Per-stage timings of one decision, and rolling percentiles over recent decisions.
+
+decide() marks the end of each pipeline stage on a StageTimings (one
+perf_counter_ns() call and one list append per stage); collect_all_evidence()
+adds the call time of each provider it called. Stages:
+
+- decision_cache: whole-decision cache lookup (only when the cache is enabled)
+- setup: request context, trace and profile resolution
+- matrix: matrix load and loop-aware matrix routing
+- classifier
+- evidence: collect_all_evidence() as a whole; evidence.<provider>: that
+  provider's call (providers skipped by their breaker or served from the
+  evidence cache have none)
+- stages: stages 2-5 (decision table or staged functions), loop guard and
+  timeout guard overlays
+- postcheck: response building, postcheck and its tightening
+- total
+
+Timings are returned in the response when the request sets timings=true, sent
+as a Server-Timing header by POST /decision, and recorded into the process's
+TimingWindow, whose percentiles GET /debug/timings reports.
+"""
+from time import perf_counter_ns
+from typing import Dict, List, Optional, Tuple
+
+# Decisions kept per stage by the rolling window.
+DEFAULT_WINDOW = 4096
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class StageTimings:
+    """Stage durations (ns) of one decision, in the order they were recorded."""
+
+    __slots__ = ("start_ns", "_last_ns", "entries")
+
+    def __init__(self):
+        self.start_ns = self._last_ns = perf_counter_ns()
+        self.entries: List[Tuple[str, int]] = []
+
+    def mark(self, stage: str) -> None:
+        """Close stage: the time since the previous mark (or the start)."""
+        now = perf_counter_ns()
+        self.entries.append((stage, now - self._last_ns))
+        self._last_ns = now
+
+    def add(self, stage: str, duration_ns: int) -> None:
+        """Record a duration measured elsewhere (e.g. one provider call)."""
+        self.entries.append((stage, duration_ns))
+
+    def finish(self) -> None:
+        """Record "total": from the start to the last mark."""
+        self.entries.append(("total", self._last_ns - self.start_ns))
+
+    def as_us(self) -> Dict[str, float]:
+        return {stage: round(ns / 1000, 1) for stage, ns in self.entries}
+
+    def server_timing(self) -> str:
+        """Server-Timing header value (durations in milliseconds)."""
+        return ", ".join(f"{stage};dur={ns / 1e6:.3f}" for stage, ns in self.entries)
+
+
+class TimingWindow:
+    """
+    The stage timings of the last `size` decisions (a ring buffer) and their
+    per-stage percentiles. record() is one slot store, without locking;
+    summary() does the per-stage work on a copy of the ring.
+    """
+
+    def __init__(self, size: int = DEFAULT_WINDOW):
+        self.size = size
+        self._ring: List[Optional[list]] = [None] * size
+        self._position = 0
+        self._recorded = 0
+
+    def record(self, timings: StageTimings) -> None:
+        position = self._position
+        self._ring[position] = timings.entries
+        self._position = position + 1 if position + 1 < self.size else 0
+        self._recorded += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per stage: samples in the window and p50..p99.9 / max in microseconds."""
+        by_stage: Dict[str, List[int]] = {}
+        for entries in list(self._ring):
+            if entries is None:
+                continue
+            for stage, ns in entries:
+                by_stage.setdefault(stage, []).append(ns)
+        result = {}
+        for stage in sorted(by_stage):
+            samples = sorted(by_stage[stage])
+            stats = {"window": len(samples)}
+            for p in PERCENTILES:
+                # Nearest rank.
+                rank = max(1, -(-p * len(samples) // 100))
+                stats[f"p{p:g}_us"] = round(samples[int(rank) - 1] / 1000, 1)
+            stats["max_us"] = round(samples[-1] / 1000, 1)
+            result[stage] = stats
+        return result
+
+    @property
+    def recorded(self) -> int:
+        """Decisions recorded since the window was created."""
+        return self._recorded
+
+
+_window: Optional[TimingWindow] = None
+
+
+def get_timing_window() -> TimingWindow:
+    """The process-wide window fed by decide() / decide_many()."""
+    global _window
+    if _window is None:
+        _window = TimingWindow()
+    return _window
+
+
+def reset_timing_window() -> None:
+    global _window
+    _window = None
@@ -0,0 +1,230 @@
+"""
+Structured decision trace (verbose=True).
+
+Trace entries are recorded as compact events (stage, key, template, values) and
+only formatted into the familiar "[TRACE] ..." lines when someone reads them:
+the response (DecisionResponse.trace) or a pluggable sink. Nothing is written
+to stdout, so concurrent verbose requests neither interleave output nor block
+on terminal I/O.
+
+Stage functions keep their `trace: List[str]` parameter. trace_event() records
+a structured event on a DecisionTrace and falls back to appending the formatted
+line to a plain list (legacy callers, tests).
+
+Sinks (set_trace_sink):
+- RingBufferTraceSink: last N traces in memory (debugging / admin endpoints)
+- JsonlTraceSink: one JSON object per decision appended to a file by a
+  background writer thread (emit() never does file I/O on the event loop)
+- LoggingTraceSink: standard logging (formatted only if the level is enabled)
+"""
+import json
+import logging
+import queue
+import threading
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+TRACE_PREFIX = "[TRACE] "
+
+
+class TraceEvent:
+    """One trace entry; `template` is formatted with `values` on demand."""
+
+    __slots__ = ("stage", "key", "template", "values")
+
+    def __init__(self, stage: str, key: str, template: str, values: Dict[str, Any]):
+        self.stage = stage
+        self.key = key
+        self.template = template
+        self.values = values
+
+    def format(self) -> str:
+        return TRACE_PREFIX + self.template.format(**self.values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"stage": self.stage, "key": self.key, "values": self.values}
+
+
+class DecisionTrace:
+    """
+    Trace of one decision.
+
+    List-compatible where stage functions need it (append(), truthiness,
+    iteration yields formatted lines), so it can be passed wherever a
+    `trace: List[str]` is accepted.
+    """
+
+    __slots__ = ("request_id", "events")
+
+    def __init__(self, request_id: Optional[str] = None):
+        self.request_id = request_id
+        self.events: List[TraceEvent] = []
+
+    def event(self, stage: str, key: str, template: str, **values: Any) -> None:
+        self.events.append(TraceEvent(stage, key, template, values))
+
+    def append(self, line: str) -> None:
+        """Record a pre-formatted line (legacy `trace.append(...)` callers)."""
+        text = line[len(TRACE_PREFIX):] if line.startswith(TRACE_PREFIX) else line
+        self.events.append(TraceEvent("text", "line", "{line}", {"line": text}))
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __iter__(self) -> Iterator[str]:
+        return (ev.format() for ev in self.events)
+
+    def lines(self) -> List[str]:
+        return [ev.format() for ev in self.events]
+
+    def render(self) -> str:
+        return "\n".join(self)
+
+    __str__ = render
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "request_id": self.request_id,
+            "events": [ev.to_dict() for ev in self.events],
+        }
+
+
+def trace_event(trace, stage: str, key: str, template: str, **values: Any) -> None:
+    """Record an event on a DecisionTrace, or append its formatted line to a list."""
+    if isinstance(trace, DecisionTrace):
+        trace.events.append(TraceEvent(stage, key, template, values))
+    else:
+        trace.append(TRACE_PREFIX + template.format(**values))
+
+
+# =============================================================================
+# Sinks
+# =============================================================================
+
+class TraceSink(Protocol):
+    def emit(self, trace: DecisionTrace) -> None: ...
+
+
+class RingBufferTraceSink:
+    """Keep the most recent `capacity` traces in memory."""
+
+    def __init__(self, capacity: int = 256):
+        self._traces: deque = deque(maxlen=capacity)
+
+    def emit(self, trace: DecisionTrace) -> None:
+        self._traces.append(trace)
+
+    def snapshot(self) -> List[DecisionTrace]:
+        return list(self._traces)
+
+    def get(self, request_id: str) -> Optional[DecisionTrace]:
+        for trace in reversed(self._traces):
+            if trace.request_id == request_id:
+                return trace
+        return None
+
+
+_STOP = object()
+
+
+class JsonlTraceSink:
+    """
+    Append one JSON object per decision trace to a file.
+
+    emit() runs on the event loop (end of decide()), so it only serializes the
+    trace and queues the line; a daemon writer thread appends whatever is
+    queued in one write per batch. At most max_pending lines wait in the
+    queue: when the disk cannot keep up, further traces are dropped (counted
+    in `dropped`) rather than blocking requests.
+
+    flush() waits until every trace emitted so far is written; close() flushes
+    and stops the writer. Lines still queued when the process exits without
+    close() are lost.
+    """
+
+    def __init__(self, path: str, max_pending: int = 10_000):
+        self._path = path
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self.dropped = 0
+        self._writer = threading.Thread(target=self._run, name="jsonl-trace-sink", daemon=True)
+        self._writer.start()
+
+    def emit(self, trace: DecisionTrace) -> None:
+        if self._closed:
+            self.dropped += 1
+            return
+        line = json.dumps(trace.to_dict(), ensure_ascii=False, default=str) + "\n"
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [item for item in items if item is not _STOP]
+            try:
+                if lines:
+                    with open(self._path, "a", encoding="utf-8") as f:
+                        f.write("".join(lines))
+            except OSError:
+                logger.exception("Failed to write %d decision traces to %s", len(lines), self._path)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if len(lines) != len(items):
+                return
+
+    def flush(self) -> None:
+        """Block until every trace emitted so far has been written (or failed)."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write what is queued and stop the writer thread; later traces are dropped."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+
+
+class LoggingTraceSink:
+    """Send traces to a logger; lines are only formatted if the level is enabled."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self._logger = logger or logging.getLogger("ai_gate.trace")
+        self._level = level
+
+    def emit(self, trace: DecisionTrace) -> None:
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(self._level, "decision trace %s\n%s", trace.request_id, trace)
+
+
+_trace_sink: Optional[TraceSink] = None
+
+
+def set_trace_sink(sink: Optional[TraceSink]) -> Optional[TraceSink]:
+    """Install the process-wide trace sink (None disables). Returns the previous one."""
+    global _trace_sink
+    previous = _trace_sink
+    _trace_sink = sink
+    return previous
+
+
+def get_trace_sink() -> Optional[TraceSink]:
+    return _trace_sink
+
+
+def emit_trace(trace: DecisionTrace) -> None:
+    """Hand a finished trace to the configured sink (no-op without one)."""
+    sink = _trace_sink
+    if sink is not None:
+        sink.emit(trace)
@@ -1,26 +1,114 @@
 """
 Shared action type inference logic.
-Used by ToolEvidence and PermissionEvidence to maintain consistency.
+Used by ToolEvidence, RoutingEvidence and PermissionEvidence to maintain consistency.
 """
-import yaml
-from ..core.config import get_tools_path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from ..core.config_registry import derived, get_document, tool_action_types
+from ..core.keyword_engine import register_keyword_source, scan_keywords
 
-with open(get_tools_path("catalog.yaml"), encoding="utf-8") as f:
-    TOOL_CATALOG = yaml.safe_load(f)
+register_keyword_source(
+    "catalog",
+    lambda catalog: (kw for hint in catalog.get("routing_hints", []) for kw in hint.get("keywords", [])),
+)
 
-ROUTING_HINTS = TOOL_CATALOG.get("routing_hints", [])
+def __getattr__(name: str):
+    # Historical module attributes, read from the active config.
+    if name == "TOOL_CATALOG":
+        return get_document("catalog")
+    if name == "ROUTING_HINTS":
+        return get_document("catalog").get("routing_hints", [])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class RoutingIndex:
+    """
+    A tool catalog compiled for routing: keyword -> positions of the routing
+    hints listing it (once per listing), plus each hint's tool_id and the
+    action_type that tool_id maps to (None when it is not in the catalog).
+
+    Matching walks the keywords found in the text instead of every hint, so
+    its cost does not grow with the catalog.
+    """
+    __slots__ = ("hint_tool_ids", "hint_action_types", "by_keyword")
+
+    def __init__(self, catalog: dict):
+        hints = catalog.get("routing_hints", [])
+        action_types = tool_action_types(catalog)
+        self.hint_tool_ids = [hint.get("tool_id") for hint in hints]
+        self.hint_action_types = [
+            action_types.get(tool_id) if tool_id else None for tool_id in self.hint_tool_ids
+        ]
+        by_keyword: Dict[str, List[int]] = {}
+        for position, hint in enumerate(hints):
+            for kw in hint.get("keywords", []):
+                if isinstance(kw, str):
+                    by_keyword.setdefault(kw, []).append(position)
+        self.by_keyword: Dict[str, Tuple[int, ...]] = {kw: tuple(p) for kw, p in by_keyword.items()}
+
+    def match_counts(self, keyword_hits: FrozenSet[str]) -> Dict[int, int]:
+        """Hint position -> number of its keywords in keyword_hits."""
+        counts: Dict[int, int] = {}
+        by_keyword = self.by_keyword
+        for kw in keyword_hits:
+            for position in by_keyword.get(kw, ()):
+                counts[position] = counts.get(position, 0) + 1
+        return counts
+
+    def action_type(self, keyword_hits: FrozenSet[str]) -> str:
+        """action_type of the first matched hint whose tool_id is in the catalog."""
+        hint_action_types = self.hint_action_types
+        first = None
+        for kw in keyword_hits:
+            for position in self.by_keyword.get(kw, ()):
+                if hint_action_types[position] is not None and (first is None or position < first):
+                    first = position
+        return "READ" if first is None else hint_action_types[first]
+
+
+def routing_index(catalog: Optional[dict] = None) -> RoutingIndex:
+    """RoutingIndex of the catalog (the active one when omitted), built once per catalog."""
+    if catalog is None:
+        catalog = get_document("catalog")
+    return derived("routing_index", catalog, RoutingIndex)
+
+def match_routing_hints(
+    text: str, catalog: Optional[dict] = None, keyword_hits: Optional[FrozenSet[str]] = None,
+) -> list:
+    """
+    Match routing hints and return list of {tool_id, confidence, source} in hint order.
+    catalog: pinned tool catalog (request config snapshot); the active one when omitted.
+    keyword_hits: precomputed scan of text (TextAnalysis.keyword_hits); scanned
+    here when omitted.
+    """
+    if keyword_hits is None:
+        keyword_hits = scan_keywords(text)
+    index = routing_index(catalog)
+    counts = index.match_counts(keyword_hits)
+    matched = []
+    for position in sorted(counts):
+        # Simple confidence: 0.6 base + 0.1 per keyword match, max 0.9
+        matched.append({
+            "tool_id": index.hint_tool_ids[position],
+            "confidence": min(0.6 + (counts[position] * 0.1), 0.9),
+            "source": "keyword"
+        })
+    return matched
+
+def action_type_from_matches(matches: list, catalog: Optional[dict] = None) -> str:
+    """
+    Map routing hint matches to an action_type.
+    The first matched hint whose tool_id exists in the catalog wins.
+    Returns: READ, WRITE, MONEY, ENTITLEMENT, or POLICY
+    """
+    action_types = tool_action_types(catalog)
+    for match in matches:
+        action_type = action_types.get(match["tool_id"])
+        if action_type is not None:
+            return action_type
+    return "READ"  # Safe default
 
 def infer_action_type_from_text(text: str) -> str:
     """
     Infer action_type from text using routing hints.
     Returns: READ, WRITE, MONEY, ENTITLEMENT, or POLICY
     """
-    for hint in ROUTING_HINTS:
-        if any(kw in text for kw in hint.get("keywords", [])):
-            tool_id = hint.get("tool_id")
-            if tool_id:
-                tool = TOOL_CATALOG.get("tools", [])
-                for t in tool:
-                    if t.get("tool_id") == tool_id:
-                        return t.get("action_type", "READ")
-    return "READ"  # Safe default
+    return routing_index().action_type(scan_keywords(text))
@@ -0,0 +1,153 @@
+"""
+Per-provider evidence result cache (TTL + LRU).
+
+Providers whose output depends on a small slice of the request declare a cache
+policy with @cached_evidence: a key function over the request context, a
+version function naming the backing config (read from the request's pinned
+config snapshot, so both take the context), and TTLs. collect_all_evidence
+looks results up before calling the provider and stores what it returns:
+
+- Evidence is cached for ttl_s.
+- Failures (timeout / error) are cached for negative_ttl_s, so a failing
+  backend is not hammered on every request. They are replayed as the same
+  exception, so labels and _meta are unchanged.
+- Each provider cache holds at most maxsize entries (least recently used out).
+- Entries are dropped when the version changes (backing config version
+  combined with the config reload generation, the runtime config snapshot
+  version and the collector, so switching between a local and a remote
+  provider starts empty).
+
+A cache hit does not call the provider and does not touch its circuit breaker.
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_TTL_S = 60.0
+DEFAULT_NEGATIVE_TTL_S = 1.0
+DEFAULT_MAXSIZE = 1024
+
+
+def _no_version(ctx: Any) -> Hashable:
+    return None
+
+
+@dataclass(frozen=True)
+class EvidenceCachePolicy:
+    key: Callable[[Any], Hashable]
+    version: Callable[[Any], Hashable] = _no_version
+    ttl_s: float = DEFAULT_TTL_S
+    negative_ttl_s: float = DEFAULT_NEGATIVE_TTL_S
+    maxsize: int = DEFAULT_MAXSIZE
+
+
+def cached_evidence(
+    key: Callable[[Any], Hashable],
+    version: Callable[[Any], Hashable] = _no_version,
+    ttl_s: float = DEFAULT_TTL_S,
+    negative_ttl_s: float = DEFAULT_NEGATIVE_TTL_S,
+    maxsize: int = DEFAULT_MAXSIZE,
+) -> Callable:
+    """Declare the cache policy of an async collect(ctx) function."""
+    policy = EvidenceCachePolicy(key, version, ttl_s, negative_ttl_s, maxsize)
+
+    def decorator(collect_fn: Callable) -> Callable:
+        collect_fn.evidence_cache = policy
+        return collect_fn
+
+    return decorator
+
+
+def get_cache_policy(collect_fn: Any) -> Optional[EvidenceCachePolicy]:
+    """The declared policy, or None for collectors without one."""
+    policy = getattr(collect_fn, "evidence_cache", None)
+    return policy if isinstance(policy, EvidenceCachePolicy) else None
+
+
+class EvidenceCache:
+    """TTL + LRU cache for one provider. Single event loop; not thread-safe."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.version: Hashable = None
+        # key -> (expires_at, value); value is Evidence or the cached exception
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def check_version(self, version: Hashable) -> None:
+        """Drop every entry if the backing config version changed."""
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self.version = version
+
+    def get(self, key: Hashable, now: Optional[float] = None) -> Tuple[bool, Any]:
+        """Return (hit, value)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now is None:
+                now = time.monotonic()
+            if entry[0] > now:
+                self._entries.move_to_end(key)
+                value = entry[1]
+                if isinstance(value, BaseException):
+                    self.negative_hits += 1
+                else:
+                    self.hits += 1
+                return True, value
+            del self._entries[key]
+        self.misses += 1
+        return False, None
+
+    def put(self, key: Hashable, value: Any, ttl_s: float, now: Optional[float] = None) -> None:
+        if ttl_s <= 0:
+            return
+        if now is None:
+            now = time.monotonic()
+        self._entries[key] = (now + ttl_s, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+_caches: Dict[str, EvidenceCache] = {}
+
+
+def get_evidence_cache(provider_id: str, policy: EvidenceCachePolicy) -> EvidenceCache:
+    cache = _caches.get(provider_id)
+    if cache is None:
+        cache = _caches[provider_id] = EvidenceCache(policy.maxsize)
+    return cache
+
+
+def evidence_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Per-provider counters (hits, negative_hits, misses, evictions, ...)."""
+    return {provider_id: cache.stats() for provider_id, cache in _caches.items()}
+
+
+def clear_evidence_caches() -> None:
+    """Drop all caches and counters."""
+    _caches.clear()
@@ -0,0 +1,33 @@
+"""
+Evidence provider execution modes.
+
+Providers declare how collect_all_evidence should run them:
+
+- "cpu": pure in-memory computation that never awaits. Run inline (no task,
+  no timer handle); elapsed time is still checked against the provider budget
+  and an overrun is reported as a timeout.
+- "io": may await network / disk. Run as a task under asyncio.wait_for.
+
+Undeclared collectors default to "io", the conservative mode.
+"""
+from typing import Any, Callable
+
+PROVIDER_MODE_CPU = "cpu"
+PROVIDER_MODE_IO = "io"
+
+
+def cpu_only(collect_fn: Callable) -> Callable:
+    """Mark an async collect(ctx) function as CPU-only (never awaits)."""
+    collect_fn.execution_mode = PROVIDER_MODE_CPU
+    return collect_fn
+
+
+def does_io(collect_fn: Callable) -> Callable:
+    """Mark an async collect(ctx) function as doing I/O (task + timeout)."""
+    collect_fn.execution_mode = PROVIDER_MODE_IO
+    return collect_fn
+
+
+def is_cpu_only(collect_fn: Any) -> bool:
+    """True only for collectors explicitly declared CPU-only."""
+    return getattr(collect_fn, "execution_mode", PROVIDER_MODE_IO) == PROVIDER_MODE_CPU
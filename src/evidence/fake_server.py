@@ -0,0 +1,146 @@
+"""
+In-process stand-in for the permission / knowledge services.
+
+A minimal asyncio HTTP/1.1 server (keep-alive, JSON bodies) that answers the
+contract of the reference providers in remote.py from the same YAML config the
+local providers use, so remote and local evidence are identical. Used by tests
+and benchmarks; not a production server.
+
+    async with FakeEvidenceServer(latency_ms=2) as server:
+        os.environ["AI_GATE_PERMISSION_PROVIDER_URL"] = server.base_url
+
+Counters (requests, connections, max_in_flight) let tests check pooling and
+concurrency limits. FakeEvidenceServerThread runs the server on its own event
+loop thread, so benchmarks do not charge server work to the client's loop.
+"""
+import asyncio
+import json
+import threading
+from typing import Any, Dict, Optional, Set, Tuple
+
+from ..core.config_registry import get_document
+from .permission import evaluate_permission
+
+
+class FakeEvidenceServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.requests = 0
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._handlers: Set[asyncio.Task] = set()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "FakeEvidenceServer":
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for task in list(self._handlers):
+                task.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeEvidenceServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def route(self, method: str, path: str, body: Any) -> Tuple[int, Dict[str, Any]]:
+        if method == "POST" and path == "/permission":
+            data = evaluate_permission(body["user_role"], body["action_type"])
+            return 200, {"has_access": data["has_access"], "reason_code": data["reason_code"]}
+        if method == "GET" and path == "/knowledge":
+            kb_meta = get_document("kb_meta")
+            return 200, {
+                "kb_version": kb_meta["version"],
+                "expired": kb_meta["expired"],
+                "kb_id": kb_meta["kb_id"],
+            }
+        return 404, {"error": "not found"}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", "0"))
+                raw = await reader.readexactly(length) if length else b""
+
+                self.requests += 1
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    if self.latency_ms:
+                        await asyncio.sleep(self.latency_ms / 1000)
+                    try:
+                        status, payload = self.route(method, path, json.loads(raw) if raw else None)
+                    except (KeyError, TypeError, ValueError):
+                        status, payload = 400, {"error": "bad request"}
+                finally:
+                    self.in_flight -= 1
+
+                out = json.dumps(payload).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(out)}\r\n"
+                    f"Connection: keep-alive\r\n\r\n".encode("latin-1") + out
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Server shutdown (stop()); end the handler quietly.
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+
+class FakeEvidenceServerThread:
+    """Run a FakeEvidenceServer on a dedicated event loop thread."""
+
+    def __init__(self, **kwargs):
+        self.server = FakeEvidenceServer(**kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="fake-evidence-server", daemon=True
+        )
+
+    def __enter__(self) -> FakeEvidenceServer:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        return self.server
+
+    def __exit__(self, *exc_info) -> None:
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
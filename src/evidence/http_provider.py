@@ -0,0 +1,125 @@
+"""
+Async I/O evidence provider SDK.
+
+HttpEvidenceProvider is the base class for evidence providers backed by a
+remote service. All HTTP providers share one pooled httpx.AsyncClient
+(keep-alive connections, created lazily per event loop), and each provider
+instance caps its own in-flight requests with a semaphore.
+
+Providers are called like the module-level collect(ctx) functions and are
+declared as I/O: collect_all_evidence runs them as tasks under the
+per-provider timeout from EvidenceTimeoutConfig.provider_timeouts. Any failure
+(connection error, non-2xx status, bad payload) is raised and labeled by
+collect_all_evidence exactly like a local provider error.
+
+Subclasses implement build_request() and parse_response().
+"""
+import asyncio
+import ssl
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from ..core.models import Evidence, GateContext
+from .execution import PROVIDER_MODE_IO
+
+# Pool sizing for the shared client (all HTTP providers, all hosts).
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+HTTP_KEEPALIVE_EXPIRY_S = 30.0
+# Transport-level backstop only; the evidence budget is enforced by wait_for.
+HTTP_DEFAULT_TIMEOUT_S = 1.0
+
+DEFAULT_MAX_CONCURRENCY = 32
+
+# event loop -> shared client. Connections are bound to the loop they were
+# opened on, so each loop (server worker, test, benchmark) gets its own pool.
+_shared_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+# Building an SSL context costs tens of ms; do it once per process.
+_ssl_context: Optional[ssl.SSLContext] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Return the pooled client for the running event loop (created on first use).
+
+    Creating the first client is expensive (TLS setup); call this once at
+    startup so no request pays for it inside its evidence budget.
+    """
+    global _ssl_context
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        for stale_loop in [l for l in _shared_clients if l.is_closed()]:
+            del _shared_clients[stale_loop]
+        if _ssl_context is None:
+            _ssl_context = ssl.create_default_context()
+        client = httpx.AsyncClient(
+            verify=_ssl_context,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_S,
+            ),
+            timeout=HTTP_DEFAULT_TIMEOUT_S,
+        )
+        _shared_clients[loop] = client
+    return client
+
+
+async def aclose_shared_http_client() -> None:
+    """Close the running loop's pooled client (application shutdown)."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class HttpEvidenceProvider:
+    """
+    Base class for evidence providers that call an HTTP service.
+
+    Instances are async callables: ``await provider(ctx) -> Evidence``.
+    """
+
+    provider_id: str = ""
+    # Read by is_cpu_only(): remote providers always go through the task path.
+    execution_mode = PROVIDER_MODE_IO
+
+    def __init__(self, base_url: str, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.base_url!r})"
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            for stale_loop in [l for l in self._semaphores if l.is_closed()]:
+                del self._semaphores[stale_loop]
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    def build_request(self, ctx: GateContext) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+        """Return (method, path, json_body) for this request."""
+        raise NotImplementedError
+
+    def parse_response(self, ctx: GateContext, payload: Any) -> Evidence:
+        """Turn the decoded JSON response into Evidence."""
+        raise NotImplementedError
+
+    async def collect(self, ctx: GateContext) -> Evidence:
+        method, path, body = self.build_request(ctx)
+        async with self._semaphore():
+            response = await get_shared_http_client().request(
+                method, self.base_url + path, json=body
+            )
+        response.raise_for_status()
+        return self.parse_response(ctx, response.json())
+
+    async def __call__(self, ctx: GateContext) -> Evidence:
+        return await self.collect(ctx)
@@ -1,17 +1,29 @@
-import yaml
 from ..core.models import Evidence, GateContext
-from ..core.config import get_config_path
+from ..core.config_registry import get_document, pinned_document
+from .cache import cached_evidence
+from .execution import cpu_only
 
-with open(get_config_path("kb_meta.yaml"), encoding="utf-8") as f:
-    KB_META = yaml.safe_load(f)
+def __getattr__(name: str):
+    # Historical module attribute, read from the active config.
+    if name == "KB_META":
+        return get_document("kb_meta")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+def _knowledge_cache_key(ctx: GateContext) -> None:
+    # Knowledge evidence depends only on kb_meta.yaml.
+    return None
+
+
+@cpu_only
+@cached_evidence(key=_knowledge_cache_key, version=lambda ctx: pinned_document(ctx, "kb_meta")["version"])
 async def collect(ctx: GateContext) -> Evidence:
+    kb_meta = pinned_document(ctx, "kb_meta")
     return Evidence(
         provider="knowledge",
         available=True,
         data={
-            "kb_version": KB_META["version"],
-            "expired": KB_META["expired"],
-            "kb_id": KB_META["kb_id"]
+            "kb_version": kb_meta["version"],
+            "expired": kb_meta["expired"],
+            "kb_id": kb_meta["kb_id"]
         }
     )
@@ -1,39 +1,35 @@
-import yaml
+from typing import Optional
+
 from ..core.models import Evidence, GateContext
-from ..core.config import get_config_path
-from ._action_routing import infer_action_type_from_text
+from ..core.config_registry import get_document, pinned_document
+from .cache import cached_evidence
+from .execution import cpu_only
 
-with open(get_config_path("permission_policies.yaml"), encoding="utf-8") as f:
-    PERMISSION_POLICIES = yaml.safe_load(f)
+def __getattr__(name: str):
+    # Historical module attributes, read from the active config.
+    if name == "PERMISSION_POLICIES":
+        return get_document("permission_policies")
+    if name == "ACTION_PERMISSIONS":
+        return get_document("permission_policies").get("action_permissions", {})
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-ACTION_PERMISSIONS = PERMISSION_POLICIES.get("action_permissions", {})
 
-async def collect(ctx: GateContext) -> Evidence:
+def evaluate_permission(user_role: str, action_type: str, policies: Optional[dict] = None) -> dict:
     """
-    Permission evidence provider (decoupled from routing/tool_id).
-
-    Based on abstract action_type, not concrete tool_id.
-    This maintains Evidence independence - routing signals don't pollute permission checks.
+    Evaluate role x action_type against permission_policies.yaml.
 
-    Action type inference:
-    1. Explicit action_type from context (highest priority)
-    2. Inferred from text using shared routing logic (fallback)
-    3. Default to READ (safe default)
+    Returns the permission Evidence data. Shared by the local provider and the
+    reference permission service (src/evidence/fake_server.py).
+    policies: permission_policies.yaml pinned by the caller (the request's
+    config snapshot); the active config when omitted.
     """
-    user_role = ctx.context.get("role", "normal_user") if ctx.context else "normal_user"
-
-    # Get action_type: explicit context > inference > default
-    if ctx.context and "action_type" in ctx.context:
-        action_type = ctx.context["action_type"]
-    else:
-        # Use shared inference logic (same as ToolEvidence)
-        action_type = infer_action_type_from_text(ctx.text)
-
-    # Check permission based on action_type
     has_access = False
     reason_code = "PERMISSION_OK"
 
-    action_config = ACTION_PERMISSIONS.get(action_type, {})
+    if policies is None:
+        policies = get_document("permission_policies")
+    action_permissions = policies.get("action_permissions", {})
+    action_config = action_permissions.get(action_type, {})
     allowed_roles = action_config.get("default_roles", [])
     restricted_roles = action_config.get("restricted", [])
 
@@ -49,13 +45,44 @@ async def collect(ctx: GateContext) -> Evidence:
         has_access = False
         reason_code = "ERR_IAM_UNKNOWN_ROLE"
 
+    return {
+        "has_access": has_access,
+        "user_role": user_role,
+        "action_type": action_type,
+        "reason_code": reason_code
+    }
+
+
+def resolve_permission_query(ctx: GateContext) -> tuple:
+    """(user_role, action_type) for a request; shared with the HTTP provider."""
+    user_role = ctx.context.get("role", "normal_user") if ctx.context else "normal_user"
+
+    # Get action_type: explicit context > inference > default
+    if ctx.context and "action_type" in ctx.context:
+        action_type = ctx.context["action_type"]
+    else:
+        # Use shared inference logic (same as ToolEvidence), memoized per request
+        action_type = ctx.analysis.inferred_action_type
+    return user_role, action_type
+
+
+@cpu_only
+@cached_evidence(key=resolve_permission_query, version=lambda ctx: pinned_document(ctx, "permission_policies").get("version"))
+async def collect(ctx: GateContext) -> Evidence:
+    """
+    Permission evidence provider (decoupled from routing/tool_id).
+
+    Based on abstract action_type, not concrete tool_id.
+    This maintains Evidence independence - routing signals don't pollute permission checks.
+
+    Action type inference:
+    1. Explicit action_type from context (highest priority)
+    2. Inferred from text using shared routing logic (fallback)
+    3. Default to READ (safe default)
+    """
+    user_role, action_type = resolve_permission_query(ctx)
     return Evidence(
         provider="permission",
         available=True,
-        data={
-            "has_access": has_access,
-            "user_role": user_role,
-            "action_type": action_type,
-            "reason_code": reason_code
-        }
+        data=evaluate_permission(user_role, action_type, pinned_document(ctx, "permission_policies")),
     )
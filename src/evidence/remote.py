@@ -0,0 +1,81 @@
+"""
+Reference HTTP-backed evidence providers (permission, knowledge).
+
+Enabled per provider by the runtime config (AI_GATE_PERMISSION_PROVIDER_URL /
+AI_GATE_KNOWLEDGE_PROVIDER_URL); when unset the local YAML-backed providers
+are used. Evidence data has the same shape as the local providers.
+
+Service contract (see fake_server.py for a stand-in implementation):
+- POST {base}/permission  {"user_role", "action_type"}
+  -> {"has_access", "reason_code"}
+- GET  {base}/knowledge
+  -> {"kb_version", "expired", "kb_id"}
+"""
+from typing import Any, Callable, Dict, Tuple
+
+from ..core.models import Evidence, GateContext
+from .cache import EvidenceCachePolicy
+from .http_provider import HttpEvidenceProvider
+from .permission import resolve_permission_query
+
+
+# Remote data can change without a local config version; rely on a short TTL.
+REMOTE_CACHE_TTL_S = 5.0
+
+
+class HttpPermissionProvider(HttpEvidenceProvider):
+    provider_id = "permission"
+    evidence_cache = EvidenceCachePolicy(key=resolve_permission_query, ttl_s=REMOTE_CACHE_TTL_S)
+
+    def build_request(self, ctx: GateContext):
+        user_role, action_type = resolve_permission_query(ctx)
+        return "POST", "/permission", {"user_role": user_role, "action_type": action_type}
+
+    def parse_response(self, ctx: GateContext, payload: Any) -> Evidence:
+        user_role, action_type = resolve_permission_query(ctx)
+        return Evidence(
+            provider="permission",
+            available=True,
+            data={
+                "has_access": payload["has_access"] is True,
+                "user_role": user_role,
+                "action_type": action_type,
+                "reason_code": payload["reason_code"],
+            },
+        )
+
+
+class HttpKnowledgeProvider(HttpEvidenceProvider):
+    provider_id = "knowledge"
+    evidence_cache = EvidenceCachePolicy(key=lambda ctx: None, ttl_s=REMOTE_CACHE_TTL_S)
+
+    def build_request(self, ctx: GateContext):
+        return "GET", "/knowledge", None
+
+    def parse_response(self, ctx: GateContext, payload: Any) -> Evidence:
+        return Evidence(
+            provider="knowledge",
+            available=True,
+            data={
+                "kb_version": payload["kb_version"],
+                "expired": payload["expired"],
+                "kb_id": payload["kb_id"],
+            },
+        )
+
+
+REMOTE_PROVIDERS = {
+    "permission": HttpPermissionProvider,
+    "knowledge": HttpKnowledgeProvider,
+}
+
+_instances: Dict[Tuple[str, str], HttpEvidenceProvider] = {}
+
+
+def get_remote_provider(provider_id: str, base_url: str) -> Callable:
+    """Return the (cached) remote provider for provider_id at base_url."""
+    key = (provider_id, base_url)
+    provider = _instances.get(key)
+    if provider is None:
+        provider = _instances[key] = REMOTE_PROVIDERS[provider_id](base_url)
+    return provider
@@ -1,6 +1,8 @@
+from typing import Optional
+
 import yaml
-from pathlib import Path
 from ..core.models import Evidence, GateContext
+from ..core.keyword_engine import register_keyword_source
 
 # Risk level ordering: higher number = higher risk
 # Phase C: add \"R0\" as an explicit lowest-risk level for generic use.
@@ -12,39 +14,61 @@ def _get_higher_risk_level(level1: str, level2: str) -> str:
     rank2 = RISK_LEVEL_ORDER.get(level2, 0)
     return level1 if rank1 >= rank2 else level2
 
-# Load config using centralized path management
-from ..core.config import get_config_path
+from ..core.config_registry import pinned_document
+from .execution import cpu_only
+
+
+def _risk_rules(ctx: Optional[GateContext] = None) -> dict:
+    """risk_rules.yaml pinned by the request's config snapshot, else from the config registry (parsed on first use)."""
+    try:
+        return pinned_document(ctx, "risk_rules")
+    except FileNotFoundError as e:
+        raise RuntimeError(f"Failed to load risk rules configuration: {e}") from e
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in risk_rules.yaml: {e}") from e
+
+
+def _keyword_rule_keywords(risk_rules: dict):
+    return (
+        kw for rule in risk_rules.get("rules", [])
+        if rule.get("type") == "keyword" for kw in rule.get("keywords", [])
+    )
+
+register_keyword_source("risk_rules", _keyword_rule_keywords)
 
-try:
-    with open(get_config_path("risk_rules.yaml"), encoding="utf-8") as f:
-        RISK_RULES = yaml.safe_load(f)
-except FileNotFoundError as e:
-    raise RuntimeError(f"Failed to load risk rules configuration: {e}") from e
-except yaml.YAMLError as e:
-    raise ValueError(f"Invalid YAML in risk_rules.yaml: {e}") from e
 
-DEFAULTS = RISK_RULES.get("defaults", {})
-RULES = RISK_RULES.get("rules", [])
+def __getattr__(name: str):
+    # Historical module attributes, read from the active config.
+    if name == "RISK_RULES":
+        return _risk_rules()
+    if name == "DEFAULTS":
+        return _risk_rules().get("defaults", {})
+    if name == "RULES":
+        return _risk_rules().get("rules", [])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+@cpu_only
 async def collect(ctx: GateContext) -> Evidence:
     # Phase D: start from explicit lowest risk level R0, and only tighten upwards.
     risk_level = "R0"
     rules_hit = []
     trigger_spans = []
 
-    # Normalize text to be safe when ctx.text is None.
-    text = ctx.text or ""
+    # Keyword hits over normalized text (safe when ctx.text is None), shared per request.
+    keyword_hits = ctx.analysis.keyword_hits
 
     # Get tool_id from context (explicit only, no routing hints here)
     tool_id = ctx.context.get("tool_id") if ctx.context else None
 
-    for rule in RULES:
+    risk_rules = _risk_rules(ctx)
+    defaults = risk_rules.get("defaults", {})
+    for rule in risk_rules.get("rules", []):
         rule_id = rule["rule_id"]
         rule_type = rule["type"]
 
         if rule_type == "keyword":
             keywords = rule.get("keywords", [])
-            matched = [kw for kw in keywords if kw in text]
+            matched = [kw for kw in keywords if kw in keyword_hits]
             if matched:
                 rules_hit.append(rule_id)
                 trigger_spans.extend(matched)
@@ -58,7 +82,7 @@ async def collect(ctx: GateContext) -> Evidence:
                 field = rule["field"]
                 op = rule["op"]
                 value_key = rule.get("value_from_default")
-                threshold = DEFAULTS.get(value_key, 0)
+                threshold = defaults.get(value_key, 0)
                 if ctx.context and field in ctx.context:
                     field_val = ctx.context[field]
                     if op == ">=" and field_val >= threshold:
@@ -1,48 +1,58 @@
-import yaml
 from ..core.models import Evidence, GateContext
-from ..core.config import get_tools_path
+from ..core.config_registry import get_document, pinned_document, tools_by_id
+from ._action_routing import match_routing_hints
+from .cache import cached_evidence
+from .execution import cpu_only
 
-with open(get_tools_path("catalog.yaml"), encoding="utf-8") as f:
-    TOOL_CATALOG = yaml.safe_load(f)
-
-TOOLS = {t["tool_id"]: t for t in TOOL_CATALOG["tools"]}
+def __getattr__(name: str):
+    # Historical module attributes, read from the active config.
+    if name == "TOOL_CATALOG":
+        return get_document("catalog")
+    if name == "TOOLS":
+        return tools_by_id()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_tool_info(tool_id: str) -> dict:
     """Get tool info from catalog"""
-    return TOOLS.get(tool_id)
+    return tools_by_id().get(tool_id)
 
 def _match_tool_from_routing(text: str) -> str:
     """Match tool from routing hints (for evidence collection only, not decision)"""
-    ROUTING_HINTS = TOOL_CATALOG.get("routing_hints", [])
-    for hint in ROUTING_HINTS:
-        if any(kw in text for kw in hint.get("keywords", [])):
-            return hint.get("tool_id")
-    return None
+    matches = match_routing_hints(text)
+    return matches[0]["tool_id"] if matches else None
 
-async def collect(ctx: GateContext) -> Evidence:
+def resolve_tool_id(ctx: GateContext) -> tuple:
     """
-    Tool catalog evidence provider.
+    (tool_id, source) for a request.
     Priority:
     1. Explicit tool_id from context (highest confidence)
     2. Routing hints match (for evidence collection, marked as hints)
-    3. Safe defaults (READ, I1, normal_user)
+    3. None (safe defaults apply)
     """
-    tool_id = None
-    source = "default"
-
     # Priority 1: Explicit tool_id from context
     if ctx.context and "tool_id" in ctx.context:
-        tool_id = ctx.context["tool_id"]
-        source = "context_explicit"
+        return ctx.context["tool_id"], "context_explicit"
     # Priority 2: Routing hints (for backward compatibility and evidence collection)
-    else:
-        hinted_tool = _match_tool_from_routing(ctx.text)
-        if hinted_tool:
-            tool_id = hinted_tool
-            source = "routing_hint"
+    hinted_tool = ctx.analysis.routed_tool_id
+    if hinted_tool:
+        return hinted_tool, "routing_hint"
+    return None, "default"
+
+@cpu_only
+@cached_evidence(key=resolve_tool_id, version=lambda ctx: pinned_document(ctx, "catalog").get("version"))
+async def collect(ctx: GateContext) -> Evidence:
+    """
+    Tool catalog evidence provider.
+    Priority:
+    1. Explicit tool_id from context (highest confidence)
+    2. Routing hints match (for evidence collection, marked as hints)
+    3. Safe defaults (READ, I1, normal_user)
+    """
+    tool_id, source = resolve_tool_id(ctx)
+    tools = tools_by_id(pinned_document(ctx, "catalog"))
 
-    if tool_id and tool_id in TOOLS:
-        tool = TOOLS[tool_id]
+    if tool_id and tool_id in tools:
+        tool = tools[tool_id]
         return Evidence(
             provider="tool",
             available=True,
@@ -1,10 +1,14 @@
-import yaml
-from ..core.config import get_config_path
+from ..core.config_registry import get_document
 
-with open(get_config_path("risk_keywords.yaml"), encoding="utf-8") as f:
-    CONFIG = yaml.safe_load(f)
 
-DISCLAIMER = CONFIG["disclaimer_templates"]["default"]
+def __getattr__(name: str):
+    # Historical module attributes, read from the active config.
+    if name == "CONFIG":
+        return get_document("risk_keywords")
+    if name == "DISCLAIMER":
+        return get_document("risk_keywords")["disclaimer_templates"]["default"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def generate_with_disclaimer(content: str) -> str:
-    return f"{content}\n\n{DISCLAIMER}"
+    disclaimer = get_document("risk_keywords")["disclaimer_templates"]["default"]
+    return f"{content}\n\n{disclaimer}"
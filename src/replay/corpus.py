@@ -0,0 +1,228 @@
+"""
+Synthetic request corpus for benchmarking and replay.
+
+Generates DecisionRequest payloads as streaming JSONL (one line at a time,
+constant memory, so millions of lines are fine), drawn from the policy's own
+vocabularies:
+
+- risk keywords: keyword rules of config/risk_rules.yaml and
+  guarantee_claim_keywords of config/risk_keywords.yaml
+- routing keywords and tool ids: tools/catalog.yaml routing_hints
+- roles: config/permission_policies.yaml
+- structured signals: the project signal allowlist (pr_loop_adapter.py)
+
+Requests come in sessions of 1..max_turns turns sharing a session_id; a
+session with loop_state carries round_index 0, 1, ... across its turns. The
+output depends only on the options and the vocabulary files: the same seed
+gives the same bytes.
+
+Formats:
+- requests: one DecisionRequest body per line
+- cases: one replay case per line ({"case_id", "turns": [{"input": ...}]},
+  one per session, without expected decisions)
+
+Usage:
+    python -m src.replay.corpus --count 1000000 --seed 7 --output corpus.jsonl [--format cases]
+"""
+import argparse
+import json
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+import yaml
+
+from ..core.config import get_project_root
+from .pr_loop_adapter import PROJECT_SIGNALS_ALLOWLIST
+
+FORMATS = ("requests", "cases")
+
+# Neutral phrases mixed between the vocabulary keywords.
+FILLER = (
+    "你好", "请问", "麻烦帮我看一下", "谢谢", "我想问一下", "这个", "昨天买的", "急",
+    "能不能快点", "客服", "在吗", "我的订单", "怎么回事", "好的", "还没收到", "帮忙处理",
+)
+
+
+@dataclass(frozen=True)
+class Vocabulary:
+    risk_keywords: Tuple[str, ...]
+    # tool_id -> routing keywords
+    routing: Dict[str, Tuple[str, ...]]
+    tool_ids: Tuple[str, ...]
+    roles: Tuple[str, ...]
+    high_amount_threshold: float
+    signals: Tuple[str, ...]
+
+
+def _load_yaml(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def load_vocabulary(root: Optional[Path] = None) -> Vocabulary:
+    """Read the keyword, tool and role vocabularies from the config files under root."""
+    root = Path(root) if root is not None else get_project_root()
+    risk_rules = _load_yaml(root / "config" / "risk_rules.yaml")
+    risk_keywords = _load_yaml(root / "config" / "risk_keywords.yaml")
+    catalog = _load_yaml(root / "tools" / "catalog.yaml")
+    permissions = _load_yaml(root / "config" / "permission_policies.yaml")
+
+    keywords = []
+    for rule in risk_rules.get("rules", []):
+        if rule.get("type") == "keyword":
+            keywords.extend(rule.get("keywords", []))
+    keywords.extend(risk_keywords.get("guarantee_claim_keywords", []))
+    routing = {
+        hint["tool_id"]: tuple(hint.get("keywords", []))
+        for hint in catalog.get("routing_hints", [])
+    }
+    return Vocabulary(
+        risk_keywords=tuple(dict.fromkeys(keywords)),
+        routing=routing,
+        tool_ids=tuple(tool["tool_id"] for tool in catalog.get("tools", [])),
+        roles=tuple(permissions.get("roles", {})),
+        high_amount_threshold=float(risk_rules.get("defaults", {}).get("high_amount_threshold", 5000)),
+        signals=tuple(sorted(PROJECT_SIGNALS_ALLOWLIST)),
+    )
+
+
+@dataclass(frozen=True)
+class CorpusOptions:
+    count: int = 1000
+    seed: int = 7
+    # Text length in phrases (keywords and filler).
+    min_phrases: int = 1
+    max_phrases: int = 6
+    # Share of phrases that are risk / routing keywords.
+    keyword_density: float = 0.4
+    # Per-request probability of a context (tool_id, amount, order_id, role).
+    context_rate: float = 0.6
+    # Per-request probability of structured_input signals.
+    signals_rate: float = 0.1
+    # Per-session probability of context.loop_state.
+    loop_state_rate: float = 0.05
+    max_turns: int = 3
+
+
+def _text(rng: random.Random, vocab: Vocabulary, options: CorpusOptions) -> Tuple[str, Optional[str]]:
+    """The text and the tool whose routing keyword it contains (if any)."""
+    phrases = []
+    routed_tool = None
+    for _ in range(rng.randint(options.min_phrases, options.max_phrases)):
+        if rng.random() >= options.keyword_density:
+            phrases.append(rng.choice(FILLER))
+        elif rng.random() < 0.5:
+            phrases.append(rng.choice(vocab.risk_keywords))
+        else:
+            tool_id = rng.choice(tuple(vocab.routing))
+            phrases.append(rng.choice(vocab.routing[tool_id]))
+            routed_tool = routed_tool or tool_id
+    return "，".join(phrases), routed_tool
+
+
+def _context(rng: random.Random, vocab: Vocabulary, routed_tool: Optional[str]) -> dict:
+    # Mostly the tool the text routes to, as a real caller would pass.
+    tool_id = routed_tool if routed_tool and rng.random() < 0.8 else rng.choice(vocab.tool_ids)
+    context = {"tool_id": tool_id, "role": rng.choice(vocab.roles)}
+    if rng.random() < 0.5:
+        # Around the high-amount threshold, a quarter of them above it.
+        threshold = vocab.high_amount_threshold
+        context["amount"] = rng.randrange(1, int(threshold * 4 / 3))
+    if rng.random() < 0.8:
+        context["order_id"] = f"O{rng.randrange(10 ** 9):09d}"
+    return context
+
+
+def generate_sessions(options: CorpusOptions, vocab: Optional[Vocabulary] = None) -> Iterator[List[dict]]:
+    """Sessions (lists of request bodies) until options.count requests have been generated."""
+    vocab = vocab or load_vocabulary()
+    rng = random.Random(options.seed)
+    produced = 0
+    session_index = 0
+    while produced < options.count:
+        session_index += 1
+        session_id = f"syn-{options.seed}-{session_index}"
+        user_id = f"user-{rng.randrange(10_000)}"
+        turns = min(rng.randint(1, options.max_turns), options.count - produced)
+        with_loop_state = rng.random() < options.loop_state_rate
+        nit_only_streak = 0
+        session = []
+        for round_index in range(turns):
+            text, routed_tool = _text(rng, vocab, options)
+            body = {"session_id": session_id, "user_id": user_id, "text": text}
+            context = _context(rng, vocab, routed_tool) if rng.random() < options.context_rate else {}
+            if with_loop_state:
+                nit_only_streak = nit_only_streak + 1 if rng.random() < 0.5 else 0
+                context["loop_state"] = {"round_index": round_index, "nit_only_streak": nit_only_streak}
+            if context:
+                body["context"] = context
+            if rng.random() < options.signals_rate:
+                body["structured_input"] = {"signals": rng.sample(vocab.signals, rng.randint(1, 2))}
+            session.append(body)
+        produced += turns
+        yield session
+
+
+def generate_requests(options: CorpusOptions, vocab: Optional[Vocabulary] = None) -> Iterator[dict]:
+    """options.count request bodies."""
+    for session in generate_sessions(options, vocab):
+        yield from session
+
+
+def write_corpus(out: TextIO, options: CorpusOptions, fmt: str = "requests",
+                 vocab: Optional[Vocabulary] = None) -> int:
+    """Write the corpus as JSONL to out; returns the number of lines written."""
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r} (expected one of {', '.join(FORMATS)})")
+    lines = 0
+    if fmt == "requests":
+        records = generate_requests(options, vocab)
+    else:
+        records = (
+            {"case_id": session[0]["session_id"], "turns": [{"input": body} for body in session]}
+            for session in generate_sessions(options, vocab)
+        )
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        lines += 1
+    return lines
+
+
+def main(argv=None):
+    defaults = CorpusOptions()
+    parser = argparse.ArgumentParser(description="Generate a synthetic DecisionRequest corpus (JSONL).")
+    parser.add_argument("--count", type=int, default=defaults.count, help="requests to generate")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--min-phrases", type=int, default=defaults.min_phrases)
+    parser.add_argument("--max-phrases", type=int, default=defaults.max_phrases)
+    parser.add_argument("--keyword-density", type=float, default=defaults.keyword_density)
+    parser.add_argument("--context-rate", type=float, default=defaults.context_rate)
+    parser.add_argument("--signals-rate", type=float, default=defaults.signals_rate)
+    parser.add_argument("--loop-state-rate", type=float, default=defaults.loop_state_rate)
+    parser.add_argument("--max-turns", type=int, default=defaults.max_turns)
+    parser.add_argument("--format", choices=FORMATS, default="requests")
+    parser.add_argument("--output", help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+    if not 1 <= args.min_phrases <= args.max_phrases:
+        parser.error("need 1 <= --min-phrases <= --max-phrases")
+    if args.max_turns < 1:
+        parser.error("--max-turns must be at least 1")
+
+    options = CorpusOptions(
+        count=args.count, seed=args.seed, min_phrases=args.min_phrases, max_phrases=args.max_phrases,
+        keyword_density=args.keyword_density, context_rate=args.context_rate,
+        signals_rate=args.signals_rate, loop_state_rate=args.loop_state_rate, max_turns=args.max_turns,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            lines = write_corpus(out, options, args.format)
+        print(f"Wrote {lines} lines to {args.output}", file=sys.stderr)
+    else:
+        write_corpus(sys.stdout, options, args.format)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,33 @@
-import json
 import asyncio
 import argparse
 from pathlib import Path
 from typing import Any
-from .run import replay_one, calculate_metrics
+from .run import calculate_metrics
+from .multi import replay_one_multi, split_results
+from .parallel import load_cases, replay_all
 
 CASES_DIR = Path("cases")
 REPORT_PATH = Path("replay_diff_report.md")
 
+async def replay_pair(case: dict, base: str, cand: str) -> tuple:
+    """The case replayed against the base and the candidate matrix (evidence collected once)."""
+    result = await replay_one_multi(case, (base, cand))
+    return split_results(result, 0), split_results(result, 1)
+
 async def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--base", required=True)
     parser.add_argument("--cand", required=True)
     parser.add_argument("--cases", required=True)
+    parser.add_argument("--workers", type=int, default=1, help="replay processes (parallel.py)")
     args = parser.parse_args()
 
-    case_files = list(Path(args.cases).glob("*.json"))
+    pairs = await replay_all(load_cases(args.cases), replay_pair, args.workers, base=args.base, cand=args.cand)
     base_results = []
     cand_results = []
     per_case_changes = []
 
-    for cf in case_files:
-        with open(cf, encoding="utf-8") as f:
-            case = json.load(f)
-
-        base_r = await replay_one(case, args.base)
-        cand_r = await replay_one(case, args.cand)
-
+    for base_r, cand_r in pairs:
         base_results.append(base_r)
         cand_results.append(cand_r)
 
@@ -0,0 +1,167 @@
+"""
+Multi-matrix replay: every turn decided against N matrices in one pipeline run.
+
+The classifier and the five evidence providers do not read the matrix, so
+gate.decide_matrices() runs them once per turn and only stages 2-6 per
+matrix; a sweep over ten matrices costs little more than one replay. Results
+equal a replay_one() per matrix (see split_results).
+
+Reports per-matrix metrics (calculate_metrics) and, for every pair of
+matrices, how many turns changed decision and the transitions (A → B).
+Uses the parallel engine (parallel.py) with --workers > 1.
+
+Usage:
+    python -m src.replay.multi --matrices matrices/v0.1.yaml matrices/v0.2.yaml [...] [--cases cases/] [--workers 8] [--json out.json]
+"""
+import argparse
+import asyncio
+import json
+from collections import Counter
+from itertools import combinations
+from pathlib import Path
+from typing import List, Sequence
+
+from ..core.gate import decide_matrices
+from ..core.models import DecisionRequest
+from .parallel import load_cases, replay_all
+from .run import CASES_DIR, calculate_metrics
+
+REPORT_PATH = Path("replay_multi_report.md")
+# Per-case changes listed per matrix pair in the Markdown report.
+MAX_LISTED_CHANGES = 50
+
+
+async def replay_one_multi(case: dict, matrix_paths: Sequence[str]) -> dict:
+    """
+    replay_one() against every matrix at once: each turn's "predicted" is the
+    list of decisions, in matrix_paths order.
+    """
+    results = {"case_id": case["case_id"], "turns": []}
+
+    turns = case.get("turns", [])
+    if not turns:
+        turns = [{"input": case["input"], "expected_decision": case["expected"]["decision"]}]
+
+    for turn in turns:
+        input_data = turn["input"]
+        expected = turn.get("expected_decision") or turn.get("expected", {}).get("decision")
+
+        req = DecisionRequest(
+            session_id=input_data.get("session_id"),
+            user_id=input_data.get("user_id"),
+            text=input_data.get("text"),
+            structured_input=input_data.get("structured_input"),
+            debug=input_data.get("debug", False),
+            context=input_data.get("context")
+        )
+
+        responses = await decide_matrices(req, matrix_paths)
+        results["turns"].append({
+            "input": input_data.get("text"),
+            "expected": expected,
+            "predicted": [resp.decision.value for resp in responses],
+        })
+
+    return results
+
+
+def split_results(multi_result: dict, index: int) -> dict:
+    """The replay_one()-shaped result of one matrix (by position) from a multi result."""
+    turns = []
+    for turn in multi_result["turns"]:
+        predicted = turn["predicted"][index]
+        expected = turn["expected"]
+        turns.append({
+            "input": turn["input"],
+            "expected": expected,
+            "predicted": predicted,
+            "match": predicted == expected if expected is not None else None,
+        })
+    return {"case_id": multi_result["case_id"], "turns": turns}
+
+
+def pairwise_changes(multi_results: List[dict], i: int, j: int) -> dict:
+    """Turns whose decision differs between matrix i and matrix j."""
+    total = 0
+    transitions = Counter()
+    changes = []
+    for result in multi_results:
+        for turn_idx, turn in enumerate(result["turns"]):
+            total += 1
+            old, new = turn["predicted"][i], turn["predicted"][j]
+            if old != new:
+                transitions[f"{old} → {new}"] += 1
+                changes.append({
+                    "case_id": result["case_id"], "turn_idx": turn_idx, "input": turn["input"],
+                    "old_decision": old, "new_decision": new,
+                })
+    return {
+        "changed": len(changes),
+        "change_rate": len(changes) / total if total > 0 else 0,
+        "transitions": dict(sorted(transitions.items())),
+        "changes": changes,
+    }
+
+
+def build_report(multi_results: List[dict], matrix_paths: Sequence[str]) -> dict:
+    return {
+        "matrices": list(matrix_paths),
+        "metrics": {
+            path: calculate_metrics([split_results(r, i) for r in multi_results])
+            for i, path in enumerate(matrix_paths)
+        },
+        "pairs": [
+            {"base": matrix_paths[i], "cand": matrix_paths[j], **pairwise_changes(multi_results, i, j)}
+            for i, j in combinations(range(len(matrix_paths)), 2)
+        ],
+    }
+
+
+def write_markdown(report: dict, path: Path) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Multi-Matrix Replay Report\n\n")
+        f.write("## Per-Matrix Metrics\n\n")
+        f.write("| Matrix | Total | Accuracy | False Accept | False Reject |\n")
+        f.write("|--------|-------|----------|--------------|--------------|\n")
+        for matrix, m in report["metrics"].items():
+            f.write(f"| {matrix} | {m['total']} | {m['accuracy']:.2%} | {m['false_accept']} | {m['false_reject']} |\n")
+
+        f.write("\n## Pairwise Changes\n\n")
+        f.write("| Base | Candidate | Changed | decision_change_rate |\n")
+        f.write("|------|-----------|---------|----------------------|\n")
+        for pair in report["pairs"]:
+            f.write(f"| {pair['base']} | {pair['cand']} | {pair['changed']} | {pair['change_rate']:.2%} |\n")
+
+        for pair in report["pairs"]:
+            if not pair["changed"]:
+                continue
+            f.write(f"\n### {pair['base']} → {pair['cand']}\n\n")
+            for transition, count in pair["transitions"].items():
+                f.write(f"- {transition}: {count}\n")
+            f.write("\n")
+            for ch in pair["changes"][:MAX_LISTED_CHANGES]:
+                f.write(f"- {ch['case_id']} turn {ch['turn_idx']}: {ch['old_decision']} → {ch['new_decision']}\n")
+                f.write(f"  - Input: \"{ch['input']}\"\n")
+            if len(pair["changes"]) > MAX_LISTED_CHANGES:
+                f.write(f"- … {len(pair['changes']) - MAX_LISTED_CHANGES} more\n")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--matrices", nargs="+", required=True)
+    parser.add_argument("--cases", default=str(CASES_DIR), help="directory of *.json cases or a JSONL file")
+    parser.add_argument("--workers", type=int, default=1, help="replay processes (parallel.py)")
+    parser.add_argument("--json", help="also write the report (with all changes) as JSON")
+    args = parser.parse_args()
+
+    multi_results = await replay_all(load_cases(args.cases), replay_one_multi, args.workers, matrix_paths=args.matrices)
+    report = build_report(multi_results, args.matrices)
+    write_markdown(report, REPORT_PATH)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"Multi-matrix report saved to {REPORT_PATH}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
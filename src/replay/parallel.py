@@ -0,0 +1,171 @@
+"""
+Parallel replay: cases sharded across a process pool.
+
+Cases are sent to the workers in chunks of consecutive cases; a case is never
+split, so the turns / rounds of a multi-turn case run in order inside one
+worker. Results come back in input order (chunks are collected first in,
+first out), whatever the number of workers, so the output is the same as a
+serial replay: decide() keeps no per-session state between turns, and traces
+come from each DecisionResponse (verbose replays), not from captured stdout.
+
+Workers are spawned (not forked) and each keeps one event loop for all its
+chunks. At most 2 * workers chunks are in flight, so a corpus streamed from
+JSONL is never fully loaded.
+
+Replay functions are the existing per-case coroutines (run.replay_one,
+run_pr_loop.replay_pr_loop_case, run_permission_replay.replay_permission_case);
+they must be module-level so workers can import them.
+
+Usage:
+    python -m src.replay.parallel --cases cases/ --workers 8 [--kind replay|pr_loop|permission] [--matrix matrices/v0.1.yaml] [--output results.jsonl]
+    python -m src.replay.parallel --cases corpus.jsonl --workers 8 --output results.jsonl
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional
+
+CaseReplay = Callable[..., Awaitable[dict]]
+
+DEFAULT_CHUNK_SIZE = 32
+
+# Per-worker event loop (set by _init_worker).
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def load_cases(path) -> Iterator[dict]:
+    """Cases from a directory (*.json, sorted by name) or a JSONL file (one case per line)."""
+    path = Path(path)
+    if path.is_dir():
+        for case_file in sorted(path.glob("*.json")):
+            with open(case_file, encoding="utf-8") as f:
+                yield json.load(f)
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _chunks(cases: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    chunk = []
+    for case in cases:
+        chunk.append(case)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _init_worker() -> None:
+    global _worker_loop
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+
+def _replay_chunk(replay_fn: CaseReplay, cases: List[dict], kwargs: Dict[str, Any]) -> List[dict]:
+    async def run():
+        return [await replay_fn(case, **kwargs) for case in cases]
+
+    return _worker_loop.run_until_complete(run())
+
+
+def _iter_serial(cases: Iterable[dict], replay_fn: CaseReplay, kwargs: Dict[str, Any]) -> Iterator[dict]:
+    loop = asyncio.new_event_loop()
+    try:
+        for case in cases:
+            yield loop.run_until_complete(replay_fn(case, **kwargs))
+    finally:
+        loop.close()
+
+
+def iter_replay(
+    cases: Iterable[dict],
+    replay_fn: CaseReplay,
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs,
+) -> Iterator[dict]:
+    """
+    Replay cases on `workers` processes (in this process, serially, when
+    workers <= 1); yields each case's result in input order. Not for use
+    inside a running event loop (see replay_all).
+    """
+    if workers <= 1:
+        yield from _iter_serial(cases, replay_fn, kwargs)
+        return
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker) as pool:
+        pending = deque()
+        for chunk in _chunks(cases, chunk_size):
+            pending.append(pool.submit(_replay_chunk, replay_fn, chunk, kwargs))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+async def replay_all(
+    cases: Iterable[dict],
+    replay_fn: CaseReplay,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs,
+) -> List[dict]:
+    """
+    Results of replay_fn(case, **kwargs) for every case, in case order: in
+    this event loop when workers <= 1, else on a process pool.
+    """
+    if workers <= 1:
+        return [await replay_fn(case, **kwargs) for case in cases]
+    return await asyncio.to_thread(lambda: list(iter_replay(cases, replay_fn, workers, chunk_size, **kwargs)))
+
+
+def _replay_function(kind: str) -> CaseReplay:
+    if kind == "pr_loop":
+        from .run_pr_loop import replay_pr_loop_case
+        return replay_pr_loop_case
+    if kind == "permission":
+        from .run_permission_replay import replay_permission_case
+        return replay_permission_case
+    from .run import replay_one
+    return replay_one
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay cases across a process pool.")
+    parser.add_argument("--cases", default="cases", help="directory of *.json cases or a JSONL file")
+    parser.add_argument("--kind", choices=("replay", "pr_loop", "permission"), default="replay")
+    parser.add_argument("--matrix", help="matrix for --kind replay (default: replay_one's)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--output", help="write one result per line (JSONL, case order)")
+    args = parser.parse_args(argv)
+
+    kwargs = {"matrix_path": args.matrix} if args.kind == "replay" and args.matrix else {}
+    replay_fn = _replay_function(args.kind)
+    results = iter_replay(load_cases(args.cases), replay_fn, args.workers, args.chunk_size, **kwargs)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else None
+    replayed = turns = 0
+    try:
+        for result in results:
+            replayed += 1
+            turns += len(result.get("turns") or result.get("rounds") or [])
+            if out is not None:
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if out is not None:
+            out.close()
+    print(f"Replayed {replayed} cases ({turns} turns) with {args.workers} worker(s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
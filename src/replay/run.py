@@ -1,5 +1,6 @@
 import json
 import asyncio
+import argparse
 from pathlib import Path
 from typing import Any
 from ..core.models import DecisionRequest, Decision
@@ -25,7 +26,8 @@ async def replay_one(case: dict, matrix_path: str = "matrices/v0.1.yaml") -> dic
         req = DecisionRequest(
             session_id=input_data.get("session_id"),
             user_id=input_data.get("user_id"),
-            text=input_data["text"],
+            text=input_data.get("text"),
+            structured_input=input_data.get("structured_input"),
             debug=input_data.get("debug", False),
             context=input_data.get("context")
         )
@@ -33,17 +35,19 @@ async def replay_one(case: dict, matrix_path: str = "matrices/v0.1.yaml") -> dic
         resp = await decide(req, matrix_path)
         predicted = resp.decision.value
 
+        # Unlabeled turns (e.g. a synthetic corpus) have no expected decision.
         results["turns"].append({
-            "input": input_data["text"],
+            "input": input_data.get("text"),
             "expected": expected,
             "predicted": predicted,
-            "match": predicted == expected
+            "match": predicted == expected if expected is not None else None
         })
 
     return results
 
 def calculate_metrics(all_results: list) -> dict:
     total = 0
+    labeled = 0
     correct = 0
     false_accept = 0
     false_reject = 0
@@ -51,6 +55,9 @@ def calculate_metrics(all_results: list) -> dict:
     for r in all_results:
         for turn in r["turns"]:
             total += 1
+            if turn["expected"] is None:
+                continue
+            labeled += 1
             if turn["match"]:
                 correct += 1
             else:
@@ -64,27 +71,29 @@ def calculate_metrics(all_results: list) -> dict:
 
     return {
         "total": total,
+        "labeled": labeled,
         "correct": correct,
-        "accuracy": correct / total if total > 0 else 0,
+        "accuracy": correct / labeled if labeled > 0 else 0,
         "false_accept": false_accept,
         "false_reject": false_reject
     }
 
 async def main():
-    case_files = list(CASES_DIR.glob("*.json"))
-    all_results = []
+    from .parallel import load_cases, replay_all
 
-    for cf in case_files:
-        with open(cf, encoding="utf-8") as f:
-            case = json.load(f)
-        result = await replay_one(case)
-        all_results.append(result)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", default=str(CASES_DIR), help="directory of *.json cases or a JSONL file")
+    parser.add_argument("--matrix", default="matrices/v0.1.yaml")
+    parser.add_argument("--workers", type=int, default=1, help="replay processes (parallel.py)")
+    args = parser.parse_args()
+
+    all_results = await replay_all(load_cases(args.cases), replay_one, args.workers, matrix_path=args.matrix)
 
     metrics = calculate_metrics(all_results)
 
     with open(REPORT_PATH, "w", encoding="utf-8") as f:
         f.write("# Replay Report\n\n")
-        f.write(f"**Matrix:** matrices/v0.1.yaml\n\n")
+        f.write(f"**Matrix:** {args.matrix}\n\n")
         f.write("## Metrics\n\n")
         f.write(f"- Total: {metrics['total']}\n")
         f.write(f"- Correct: {metrics['correct']}\n")
@@ -96,7 +105,7 @@ async def main():
         for r in all_results:
             f.write(f"### {r['case_id']}\n\n")
             for t in r["turns"]:
-                status = "✓" if t["match"] else "✗"
+                status = "✓" if t["match"] else ("·" if t["expected"] is None else "✗")
                 f.write(f"- {status} Input: \"{t['input']}\"\n")
                 f.write(f"  - Expected: {t['expected']}, Got: {t['predicted']}\n")
             f.write("\n")
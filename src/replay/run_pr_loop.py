@@ -4,14 +4,12 @@ PR Loop Real Case Replay.
 Reads cases from cases/pr_loop_real/*.json, maps PR signals via adapter,
 calls core_decide per round, and outputs results.
 """
+import argparse
 import asyncio
-import io
-import json
-import sys
-from contextlib import redirect_stdout
 from pathlib import Path
 
 from ..core.gate import decide as core_decide
+from .parallel import load_cases, replay_all
 from .pr_loop_adapter import map_pr_signals_to_project_signals, round_to_decision_request
 
 CASES_DIR = Path("cases") / "pr_loop_real"
@@ -64,11 +62,9 @@ async def replay_pr_loop_case(case: dict, verbose: bool = False) -> dict:
             verbose=verbose,
         )
 
-        trace_capture = io.StringIO()
-        with redirect_stdout(trace_capture):
-            resp = await core_decide(req, matrix_path=matrix_path)
+        resp = await core_decide(req, matrix_path=matrix_path)
 
-        trace_output = trace_capture.getvalue() if verbose else None
+        trace_output = "\n".join(resp.trace) if verbose and resp.trace else None
 
         expected = round_data.get("expected_decision")
         predicted = resp.decision.value
@@ -106,19 +102,18 @@ def _print_round(round_result: dict, verbose: bool) -> None:
 
 
 async def main():
-    verbose = "--verbose" in sys.argv or "-v" in sys.argv
-    case_files = sorted(CASES_DIR.glob("*.json")) if CASES_DIR.exists() else []
-
-    if not case_files:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--verbose", "-v", action="store_true", help="print each round's decision trace")
+    parser.add_argument("--workers", type=int, default=1, help="replay processes (parallel.py)")
+    args = parser.parse_args()
+    verbose = args.verbose
+
+    cases = list(load_cases(CASES_DIR)) if CASES_DIR.is_dir() else []
+    if not cases:
         print(f"No cases found in {CASES_DIR}")
         return
 
-    all_results = []
-    for cf in case_files:
-        with open(cf, encoding="utf-8") as f:
-            case = json.load(f)
-        result = await replay_pr_loop_case(case, verbose=verbose)
-        all_results.append(result)
+    all_results = await replay_all(cases, replay_pr_loop_case, args.workers, verbose=verbose)
 
     for res in all_results:
         print(f"\n{'='*60}")
@@ -0,0 +1,80 @@
+"""
+Config registry (config_registry.py): nothing parsed at import, each YAML file
+parsed once however many modules read it, derived indexes rebuilt on reload.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+import yaml
+
+from src.core import config as config_paths
+from src.core import config_registry, policy_bundle, postcheck
+from src.core.config_registry import get_document, install_documents, tool_action_types, tools_by_id
+from src.evidence import _action_routing, knowledge, permission, risk, tool
+from src.generation import llm_stub
+
+
+@pytest.fixture
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(policy_bundle, "_bundle", None)
+    config_registry.clear_documents()
+    yield
+    config_registry.clear_documents()
+
+
+def test_each_file_parsed_once(fresh_registry, monkeypatch):
+    parsed = []
+    safe_load = yaml.safe_load
+
+    def counting_safe_load(stream):
+        parsed.append(os.path.basename(stream.name))
+        return safe_load(stream)
+
+    monkeypatch.setattr(config_registry.yaml, "safe_load", counting_safe_load)
+
+    # catalog.yaml feeds tool and routing, risk_keywords.yaml postcheck and llm_stub.
+    assert tool.TOOLS and _action_routing.ROUTING_HINTS and tool.TOOL_CATALOG
+    assert postcheck.DISCLAIMER == llm_stub.DISCLAIMER
+    assert risk.RULES and permission.ACTION_PERMISSIONS and knowledge.KB_META
+    _action_routing.infer_action_type_from_text("我要申请退款")
+
+    assert sorted(parsed) == sorted([
+        "catalog.yaml", "risk_keywords.yaml", "risk_rules.yaml",
+        "permission_policies.yaml", "kb_meta.yaml",
+    ])
+
+
+def test_import_parses_no_yaml():
+    probe = (
+        "import yaml\n"
+        "calls = []\n"
+        "_safe_load = yaml.safe_load\n"
+        "yaml.safe_load = lambda *a, **k: calls.append(1) or _safe_load(*a, **k)\n"
+        "import src.api\n"
+        "from src.core.config_registry import loaded_documents\n"
+        "print(len(calls), len(loaded_documents()))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(config_paths.get_project_root()),
+               AI_RESPONSIBILITY_GATE_POLICY_BUNDLE=os.path.join("build", "missing.bundle"))
+    out = subprocess.run(
+        [sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True,
+        cwd=config_paths.get_project_root(),
+    ).stdout.split()
+    assert out == ["0", "0"]
+
+
+def test_derived_indexes_follow_installed_catalog(fresh_registry):
+    catalog = get_document("catalog")
+    index = tools_by_id()
+    assert tools_by_id() is index
+    assert set(index) == {t["tool_id"] for t in catalog["tools"]}
+
+    first = catalog["tools"][0]
+    renamed = dict(first, action_type="ENTITLEMENT")
+    # Duplicate tool_id: lookup keeps the last entry, action type inference the first.
+    install_documents({"catalog": dict(catalog, tools=[first, renamed])})
+    assert tools_by_id() is not index
+    assert tools_by_id()[first["tool_id"]] is renamed
+    assert tool_action_types()[first["tool_id"]] == first.get("action_type", "READ")
@@ -0,0 +1,186 @@
+"""
+YAML config hot reload (config_manager.py): validated snapshot swap, rejected
+reloads, in-flight requests pinned to their snapshot, mtime watcher.
+"""
+import asyncio
+import shutil
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.core import config as config_paths
+from src.core import gate, postcheck
+from src.core.config_manager import (
+    ConfigReloadError,
+    ConfigWatcher,
+    build_config_snapshot,
+    get_config_snapshot,
+    install_config_snapshot,
+    reload_config,
+)
+from src.core.models import DecisionRequest, Evidence, GateContext
+from src.evidence import knowledge, permission, risk, tool
+
+
+@pytest.fixture
+def config_dirs(tmp_path):
+    """Writable copies of config/, tools/ and matrices/; the repo config is restored after."""
+    dirs = {}
+    with pytest.MonkeyPatch.context() as mp:
+        for attr in ("CONFIG_DIR", "TOOLS_DIR", "MATRICES_DIR"):
+            target = tmp_path / attr.lower()
+            shutil.copytree(getattr(config_paths, attr), target)
+            mp.setattr(config_paths, attr, target)
+            dirs[attr] = target
+        reload_config()
+        yield dirs
+    reload_config()
+
+
+def _edit_yaml(path, edit):
+    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    edit(data)
+    path.write_text(yaml.safe_dump(data, allow_unicode=True), encoding="utf-8")
+
+
+def _add_guarantee_keyword(dirs, keyword):
+    _edit_yaml(
+        dirs["CONFIG_DIR"] / "risk_keywords.yaml",
+        lambda data: data["guarantee_claim_keywords"].append(keyword),
+    )
+
+
+@pytest.mark.asyncio
+async def test_reload_installs_new_rules(config_dirs):
+    before = get_config_snapshot()
+    _edit_yaml(
+        config_dirs["CONFIG_DIR"] / "risk_rules.yaml",
+        lambda data: data["rules"].append(
+            {"rule_id": "HOT_RELOAD_R3", "type": "keyword", "keywords": ["热更新测试"], "risk_level": "R3"}
+        ),
+    )
+
+    snapshot = reload_config()
+
+    assert snapshot.generation > before.generation
+    assert get_config_snapshot() is snapshot
+    ctx = GateContext(request_id="r", session_id=None, user_id=None, text="热更新测试", debug=False)
+    evidence = await risk.collect(ctx)
+    assert "HOT_RELOAD_R3" in evidence.data["rules_hit"]
+    assert evidence.data["risk_level"] == "R3"
+
+
+def test_invalid_file_keeps_active_snapshot(config_dirs):
+    active = get_config_snapshot()
+    rules = risk.RULES
+    (config_dirs["CONFIG_DIR"] / "risk_rules.yaml").write_text("rules: [1, 2", encoding="utf-8")
+
+    with pytest.raises(ConfigReloadError, match="risk_rules.yaml"):
+        reload_config()
+
+    assert get_config_snapshot() is active
+    assert risk.RULES is rules
+
+
+def test_older_snapshot_never_replaces_newer(config_dirs):
+    older = build_config_snapshot()
+    newer = install_config_snapshot(build_config_snapshot())
+
+    assert install_config_snapshot(older) is newer
+    assert get_config_snapshot() is newer
+
+
+@pytest.mark.asyncio
+async def test_in_flight_request_finishes_on_its_snapshot(config_dirs):
+    # "操作" is already a registered keyword (classifier), so both snapshots see it
+    # in the request's keyword hits; only the guarantee keyword list differs.
+    text = "我想查询一下操作记录"
+    _add_guarantee_keyword(config_dirs, "操作")
+    next_snapshot = build_config_snapshot()
+    entered = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_knowledge(ctx):
+        # Undeclared collector: runs as an I/O task, so the request suspends here.
+        entered.set()
+        await release.wait()
+        return Evidence(provider="knowledge", available=True, data=dict(
+            kb_version=knowledge.KB_META["version"], expired=False, kb_id=knowledge.KB_META["kb_id"],
+        ))
+
+    with patch("src.core.gate_helpers.collect_knowledge", new=slow_knowledge), \
+            patch("src.core.gate_helpers.get_provider_timeout_s", return_value=5.0):
+        in_flight = asyncio.ensure_future(gate.decide(DecisionRequest(text=text)))
+        await entered.wait()
+        install_config_snapshot(next_snapshot)
+        release.set()
+        old = await in_flight
+        new = await gate.decide(DecisionRequest(text=text))
+
+    assert not old.primary_reason.startswith("POSTCHECK_FAIL")
+    assert new.primary_reason == "POSTCHECK_FAIL:GUARANTEE_KEYWORD_IN_TEXT"
+    assert "操作" in postcheck.GUARANTEE_KEYWORDS
+
+
+@pytest.mark.asyncio
+async def test_providers_read_the_pinned_snapshot_across_a_swap(config_dirs):
+    req = DecisionRequest(
+        text="我要申请退款",
+        context={"tool_id": "refund.create", "amount": 1000, "order_id": "O1", "role": "normal_user"},
+        debug=True,
+    )
+    before = await gate.decide(req)
+    _edit_yaml(config_dirs["CONFIG_DIR"] / "risk_rules.yaml",
+               lambda data: data["defaults"].update(high_amount_threshold=100))
+    _edit_yaml(config_dirs["CONFIG_DIR"] / "permission_policies.yaml",
+               lambda data: data["action_permissions"]["MONEY"].update(default_roles=["finance_operator"]))
+    _edit_yaml(config_dirs["TOOLS_DIR"] / "catalog.yaml",
+               lambda data: [t.update(impact_level="I1") for t in data["tools"] if t["tool_id"] == "refund.create"])
+    next_snapshot = build_config_snapshot()
+    entered = asyncio.Event()
+    release = asyncio.Event()
+    seen = {}
+
+    def slow(provider, collect):
+        # Undeclared collectors run as I/O tasks: each suspends, then reads config.
+        async def collect_after_swap(ctx):
+            entered.set()
+            await release.wait()
+            seen[provider] = await collect(ctx)
+            return seen[provider]
+        return collect_after_swap
+
+    with patch("src.core.gate_helpers.collect_tool", new=slow("tool", tool.collect)), \
+            patch("src.core.gate_helpers.collect_risk", new=slow("risk", risk.collect)), \
+            patch("src.core.gate_helpers.collect_permission", new=slow("permission", permission.collect)), \
+            patch("src.core.gate_helpers.get_provider_timeout_s", return_value=5.0):
+        in_flight = asyncio.ensure_future(gate.decide(req))
+        await entered.wait()
+        install_config_snapshot(next_snapshot)
+        release.set()
+        old = await in_flight
+    new = await gate.decide(req)
+
+    assert seen["tool"].data["impact_level"] == "I3"
+    assert seen["risk"].data["risk_level"] != "R3"
+    assert seen["permission"].data["has_access"] is True
+    exclude = {"request_id", "latency_ms", "timings"}
+    assert old.model_dump(exclude=exclude) == before.model_dump(exclude=exclude)
+    assert new.model_dump(exclude=exclude) != before.model_dump(exclude=exclude)
+
+
+@pytest.mark.asyncio
+async def test_watcher_reloads_on_change_and_skips_rejected_files(config_dirs):
+    watcher = ConfigWatcher(interval_s=60)
+    assert await watcher.poll_once() is False
+
+    _add_guarantee_keyword(config_dirs, "热更新保证")
+    assert await watcher.poll_once() is True
+    assert "热更新保证" in postcheck.GUARANTEE_KEYWORDS
+
+    (config_dirs["TOOLS_DIR"] / "catalog.yaml").write_text("tools: [", encoding="utf-8")
+    assert await watcher.poll_once() is False
+    assert await watcher.poll_once() is False
+    assert watcher.failures == 1
+    assert watcher.reloads == 1
@@ -0,0 +1,88 @@
+"""
+Batch decisions: decide_many() and POST /decision/batch.
+
+Results come back in input order, match single /decision calls, and a failing
+item only fails itself.
+"""
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import app
+from src.core import gate
+from src.core.models import DecisionRequest
+
+TEXTS = ["这个产品收益率多少？", "产品保本吗", "我要申请退款", "帮我改地址"]
+
+
+@pytest.mark.asyncio
+async def test_decide_many_matches_single_decisions_in_order():
+    reqs = [DecisionRequest(text=t, debug=True) for t in TEXTS]
+    batch = await gate.decide_many(reqs)
+    assert len(batch) == len(reqs)
+    for req, resp in zip(reqs, batch):
+        single = await gate.decide(req)
+        assert resp.decision == single.decision
+        assert resp.primary_reason == single.primary_reason
+        assert resp.policy == single.policy
+
+
+@pytest.mark.asyncio
+async def test_decide_many_loads_each_matrix_once_and_isolates_errors():
+    loaded = []
+    real_load = gate.load_matrix
+
+    def counting_load(path):
+        loaded.append(path)
+        return real_load(path)
+
+    reqs = [
+        DecisionRequest(text="你好"),
+        DecisionRequest(text="你好", structured_input={"profile": "pr_review_loop"}),
+        DecisionRequest(text="再见"),
+    ]
+    with patch("src.core.gate.load_matrix", new=counting_load):
+        results = await gate.decide_many(reqs)
+    assert sorted(loaded) == ["matrices/pr_loop_demo.yaml", "matrices/v0.1.yaml"]
+    assert results[1].policy.matrix_version == "pr_loop_demo_v0.1"
+
+    results = await gate.decide_many(reqs, matrix_path="matrices/does_not_exist.yaml")
+    assert isinstance(results[0], RuntimeError)
+    assert results[1].policy.matrix_version == "pr_loop_demo_v0.1"
+
+
+def test_batch_endpoint_per_item_results():
+    client = TestClient(app)
+    response = client.post(
+        "/decision/batch",
+        json={"requests": [{"text": TEXTS[0]}, {"debug": True}, {"text": TEXTS[1], "debug": True}]},
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["index"] for r in results] == [0, 1, 2]
+    assert results[0]["response"]["decision"] and results[0]["error"] is None
+    assert results[1]["response"] is None and results[1]["error"]["status_code"] == 422
+    assert results[2]["response"]["policy"]["rules_fired"] is not None
+
+    single = client.post("/decision", json={"text": TEXTS[1], "debug": True}).json()
+    assert results[2]["response"]["decision"] == single["decision"]
+
+
+def test_batch_endpoint_rejects_empty_batch():
+    client = TestClient(app)
+    assert client.post("/decision/batch", json={"requests": []}).status_code == 422
+
+
+def test_batch_endpoint_logs_unexpected_item_errors(caplog):
+    async def failing_decide_many(reqs):
+        return [KeyError("boom") for _ in reqs]
+
+    client = TestClient(app)
+    with patch("src.api.decide_many", new=failing_decide_many), caplog.at_level("ERROR", logger="src.api"):
+        response = client.post("/decision/batch", json={"requests": [{"text": TEXTS[0]}]})
+
+    assert response.status_code == 200
+    assert response.json()["results"][0]["error"] == {"status_code": 500, "detail": "Internal Server Error"}
+    [record] = caplog.records
+    assert record.exc_info[0] is KeyError
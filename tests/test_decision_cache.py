@@ -0,0 +1,136 @@
+"""
+Opt-in whole-decision cache (canonical request hash, LRU + frequency admission,
+invalidation on matrix / config reload).
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.core import gate
+from src.core.decision_cache import DecisionCache, clear_decision_cache, decision_cache_stats
+from src.core.matrix import clear_matrix_cache
+from src.core.models import DecisionRequest
+from src.core.runtime_config import reload_runtime_config
+from src.evidence import risk
+
+ENABLED = {"AI_GATE_DECISION_CACHE_ENABLED": "true"}
+
+
+@pytest.fixture
+def decision_cache():
+    reload_runtime_config(ENABLED)
+    clear_decision_cache()
+    yield
+    clear_decision_cache()
+    reload_runtime_config()
+
+
+def _counting_collect(calls):
+    real_collect = gate.collect_all_evidence
+
+    async def collect(ctx, trace):
+        calls.append(ctx.request_id)
+        return await real_collect(ctx, trace)
+
+    return collect
+
+
+def _req(text="退款多久到账", **kwargs) -> DecisionRequest:
+    return DecisionRequest(text=text, context={"role": "normal_user"}, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_hit_skips_pipeline_with_fresh_request_id(decision_cache):
+    calls = []
+    with patch("src.core.gate.collect_all_evidence", new=_counting_collect(calls)):
+        first = await gate.decide(_req(session_id="s-1"))
+        second = await gate.decide(_req(session_id="s-2"))
+
+    assert len(calls) == 1
+    assert second.request_id != first.request_id
+    assert second.session_id == "s-2"
+    assert second.model_dump(exclude={"request_id", "session_id", "latency_ms"}) == \
+        first.model_dump(exclude={"request_id", "session_id", "latency_ms"})
+    assert decision_cache_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_key_covers_context_and_debug(decision_cache):
+    calls = []
+    with patch("src.core.gate.collect_all_evidence", new=_counting_collect(calls)):
+        await gate.decide(_req())
+        await gate.decide(_req(debug=True))
+        await gate.decide(DecisionRequest(text="退款多久到账", context={"role": "admin"}))
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_verbose_and_degraded_requests_bypass_cache(decision_cache):
+    calls = []
+    with patch("src.core.gate.collect_all_evidence", new=_counting_collect(calls)):
+        await gate.decide(_req(verbose=True))
+        await gate.decide(_req(verbose=True))
+    assert len(calls) == 2
+
+    real_collect = gate.collect_all_evidence
+
+    async def degraded_collect(ctx, trace):
+        calls.append(ctx.request_id)
+        evidence = await real_collect(ctx, trace)
+        evidence["permission"] = type("E", (), {"available": False, "data": {}})()
+        return evidence
+
+    calls.clear()
+    with patch("src.core.gate.collect_all_evidence", new=degraded_collect):
+        await gate.decide(_req("degraded"))
+        await gate.decide(_req("degraded"))
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_reload_invalidates(decision_cache, monkeypatch):
+    calls = []
+    with patch("src.core.gate.collect_all_evidence", new=_counting_collect(calls)):
+        await gate.decide(_req())
+        clear_matrix_cache()
+        await gate.decide(_req())
+        reload_runtime_config(ENABLED)
+        await gate.decide(_req())
+        monkeypatch.setitem(risk.RISK_RULES, "version", "reloaded")
+        await gate.decide(_req())
+        await gate.decide(_req())
+    assert len(calls) == 4
+    assert decision_cache_stats()["invalidations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled_by_default():
+    clear_decision_cache()
+    calls = []
+    with patch("src.core.gate.collect_all_evidence", new=_counting_collect(calls)):
+        await gate.decide(_req())
+        await gate.decide(_req())
+    assert len(calls) == 2
+    assert decision_cache_stats() == {}
+
+
+def test_frequency_admission_protects_hot_entries():
+    cache = DecisionCache(maxsize=2, ttl_s=60)
+    for key in ("hot-a", "hot-b"):
+        for _ in range(5):
+            cache.get(key, now=0)
+        cache.put(key, object(), now=0)
+
+    # One-off keys lose against the LRU victim's frequency.
+    for i in range(20):
+        assert cache.get(f"once-{i}", now=0) is None
+        assert cache.put(f"once-{i}", object(), now=0) is False
+    assert cache.get("hot-a", now=0) is not None
+    assert cache.get("hot-b", now=0) is not None
+
+    # A key that becomes frequent is admitted and evicts the LRU entry.
+    for _ in range(10):
+        cache.get("rising", now=0)
+    assert cache.put("rising", object(), now=0) is True
+    assert cache.stats()["evictions"] == 1
+    assert cache.get("hot-a", now=0) is None
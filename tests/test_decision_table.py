@@ -0,0 +1,84 @@
+"""
+Precomputed stage 2-5 decision table.
+
+The table must agree with the staged functions for raw (unbucketed) inputs,
+and decide() must return the same decision whether it takes the table fast
+path (verbose=False) or the staged path (verbose=True).
+"""
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core import gate
+from src.core.decision_table import _run_stages
+from src.core.matrix import Matrix
+from src.core.models import ClassifierResult, DecisionRequest, ResponsibilityType
+
+
+class _Ev:
+    def __init__(self, available: bool):
+        self.available = available
+
+
+@pytest.mark.parametrize("matrix_name", ["v0.1.yaml", "v0.2.yaml", "pr_loop_demo.yaml", "permission_demo.yaml"])
+def test_table_matches_staged_functions(matrix_name):
+    matrix = Matrix(matrix_name)
+    table = gate._get_decision_table(matrix)
+    low = matrix.get_low_threshold()
+
+    action_types = ["READ", "WRITE", "MONEY", "ENTITLEMENT", "POLICY", "DELETE"]
+    risk_levels = ["R0", "R1", "R2", "R3", "R9"]
+    confidences = [0.0, low - 0.01, low, 0.85]
+    routings = [
+        {},
+        {"confidence": 0.6, "hinted_tools": [{"tool_id": "x", "confidence": 0.6}]},
+        {"confidence": 0.7, "hinted_tools": [{"tool_id": "x", "confidence": 0.7}]},
+        {"confidence": 0.9, "hinted_tools": []},
+    ]
+    availability = list(itertools.product([True, False], repeat=3))
+
+    for resp_type, action_type, risk_level, guarantee, permission_ok, conf, routing, avail in itertools.product(
+        ResponsibilityType, action_types, risk_levels, [False, True], [False, True],
+        confidences, routings, availability,
+    ):
+        classifier_result = ClassifierResult(type=resp_type, confidence=conf, trigger_spans=[])
+        risk_rules = ["KW_X", "RISK_GUARANTEE_CLAIM"] if guarantee else ["KW_X"]
+        evidence = {
+            "permission": _Ev(avail[0]),
+            "risk": _Ev(avail[1]),
+            "knowledge": _Ev(avail[2]),
+        }
+        expected = _run_stages(
+            matrix, gate._config_str_to_index, classifier_result, action_type,
+            risk_level, risk_rules, permission_ok, evidence, routing,
+        )
+        got = table.lookup(
+            classifier_result, action_type, risk_level, risk_rules, permission_ok,
+            evidence, routing,
+        )
+        assert got == expected
+
+
+def test_table_compiled_once_per_matrix():
+    matrix = Matrix("v0.1.yaml")
+    first = gate._get_decision_table(matrix)
+    assert gate._get_decision_table(matrix) is first
+
+
+@pytest.mark.asyncio
+async def test_decide_fast_path_matches_verbose_staged_path(capsys):
+    for cf in sorted(Path("cases").glob("*.json")):
+        case = json.loads(cf.read_text(encoding="utf-8"))
+        turns = case.get("turns") or [{"input": case["input"]}]
+        for turn in turns:
+            data = turn["input"]
+            common = dict(text=data["text"], debug=True, context=data.get("context"))
+            fast = await gate.decide(DecisionRequest(verbose=False, **common))
+            staged = await gate.decide(DecisionRequest(verbose=True, **common))
+            assert fast.decision == staged.decision
+            assert fast.primary_reason == staged.primary_reason
+            assert fast.responsibility_type == staged.responsibility_type
+            assert fast.policy == staged.policy
+    capsys.readouterr()
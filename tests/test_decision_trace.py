@@ -0,0 +1,146 @@
+"""
+Structured decision trace.
+
+verbose=True records trace events that are formatted on demand and returned on
+the response / handed to the configured sink; nothing is printed to stdout.
+"""
+import asyncio
+import json
+import logging
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.core import gate
+from src.core.models import DecisionRequest
+from src.core.trace import (
+    DecisionTrace,
+    JsonlTraceSink,
+    LoggingTraceSink,
+    RingBufferTraceSink,
+    set_trace_sink,
+    trace_event,
+)
+
+
+def _make_req(text: str = "我要申请退款", verbose: bool = True) -> DecisionRequest:
+    return DecisionRequest(text=text, verbose=verbose, context={"role": "normal_user"})
+
+
+@pytest.mark.asyncio
+async def test_verbose_trace_returned_on_response_not_stdout(capsys):
+    resp = await gate.decide(_make_req())
+
+    assert capsys.readouterr().out == ""
+    assert resp.trace[0] == f"[TRACE] Request ID: {resp.request_id}"
+    assert "[TRACE] 2. Evidence Collection" in "\n".join(resp.trace)
+    assert resp.trace[-2:] == ["[TRACE] 5. Postcheck:", "[TRACE]   - ok"]
+
+
+@pytest.mark.asyncio
+async def test_non_verbose_response_has_no_trace():
+    resp = await gate.decide(_make_req(verbose=False))
+    assert resp.trace is None
+
+
+def test_events_are_formatted_lazily():
+    class Probe:
+        formatted = 0
+
+        def __format__(self, spec):
+            Probe.formatted += 1
+            return "probe"
+
+    trace = DecisionTrace("r-1")
+    trace.event("stage", "key", "value={value}", value=Probe())
+    assert Probe.formatted == 0
+    assert trace.lines() == ["[TRACE] value=probe"]
+    assert Probe.formatted == 1
+
+
+def test_trace_event_falls_back_to_plain_list():
+    lines = []
+    trace_event(lines, "conflict", "low_confidence", "  - tightened: decision_index={i}", i=2)
+    assert lines == ["[TRACE]   - tightened: decision_index=2"]
+
+    trace = DecisionTrace()
+    trace.append("[TRACE] legacy line")
+    assert trace.lines() == ["[TRACE] legacy line"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_verbose_requests_keep_separate_traces():
+    sink = RingBufferTraceSink(capacity=8)
+    previous = set_trace_sink(sink)
+    try:
+        responses = await asyncio.gather(*(gate.decide(_make_req()) for _ in range(4)))
+    finally:
+        set_trace_sink(previous)
+
+    assert len(sink.snapshot()) == 4
+    for resp in responses:
+        trace = sink.get(resp.request_id)
+        assert trace is not None
+        assert trace.lines() == resp.trace
+        assert all(resp.request_id not in line for line in trace.lines()[1:])
+
+
+@pytest.mark.asyncio
+async def test_jsonl_sink_writes_structured_events(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    sink = JsonlTraceSink(str(path))
+    previous = set_trace_sink(sink)
+    try:
+        resp = await gate.decide(_make_req())
+    finally:
+        set_trace_sink(previous)
+        sink.close()
+
+    record = json.loads(path.read_text(encoding="utf-8").strip())
+    assert record["request_id"] == resp.request_id
+    first = record["events"][0]
+    assert first == {"stage": "request", "key": "id", "values": {"request_id": resp.request_id}}
+    assert any(ev["stage"] == "matrix_lookup" for ev in record["events"])
+
+
+@pytest.mark.asyncio
+async def test_jsonl_sink_writes_off_the_event_loop(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    writer_threads = set()
+    real_open = open
+
+    def recording_open(*args, **kwargs):
+        if str(args[0]) == str(path):
+            writer_threads.add(threading.current_thread().name)
+        return real_open(*args, **kwargs)
+
+    sink = JsonlTraceSink(str(path))
+    previous = set_trace_sink(sink)
+    try:
+        with patch("builtins.open", new=recording_open):
+            responses = await asyncio.gather(*(gate.decide(_make_req()) for _ in range(20)))
+            sink.flush()
+    finally:
+        set_trace_sink(previous)
+        sink.close()
+
+    assert writer_threads == {"jsonl-trace-sink"}
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert sorted(r["request_id"] for r in records) == sorted(resp.request_id for resp in responses)
+
+    sink.emit(DecisionTrace("after-close"))
+    assert sink.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_logging_sink(caplog):
+    previous = set_trace_sink(LoggingTraceSink(level=logging.INFO))
+    try:
+        with caplog.at_level(logging.INFO, logger="ai_gate.trace"):
+            resp = await gate.decide(_make_req())
+    finally:
+        set_trace_sink(previous)
+
+    assert resp.request_id in caplog.text
+    assert "[TRACE] 5. Postcheck:" in caplog.text
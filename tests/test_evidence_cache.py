@@ -0,0 +1,123 @@
+"""
+Per-provider evidence cache (TTL + LRU, negative caching, version invalidation).
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.core import gate_helpers
+from src.core.models import GateContext
+from src.core.runtime_config import GateRuntimeConfig
+from src.evidence import permission
+from src.evidence.cache import (
+    EvidenceCache,
+    cached_evidence,
+    clear_evidence_caches,
+    evidence_cache_stats,
+)
+from src.evidence.execution import cpu_only
+
+
+def _make_ctx(role: str = "normal_user", config: GateRuntimeConfig = None) -> GateContext:
+    ctx = GateContext(
+        request_id="evidence-cache-test",
+        session_id=None,
+        user_id=None,
+        text="我要申请退款",
+        debug=False,
+        verbose=False,
+        context={"role": role},
+        structured_input=None,
+    )
+    if config is not None:
+        object.__setattr__(ctx, "runtime_config", config)
+    return ctx
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    clear_evidence_caches()
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+    yield
+    clear_evidence_caches()
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+
+
+def test_cache_ttl_lru_and_counters():
+    cache = EvidenceCache(maxsize=2)
+    cache.put("a", 1, ttl_s=10, now=0)
+    cache.put("b", 2, ttl_s=10, now=0)
+    assert cache.get("a", now=5) == (True, 1)
+    cache.put("c", 3, ttl_s=10, now=5)  # evicts "b" (least recently used)
+    assert cache.get("b", now=5) == (False, None)
+    assert cache.get("a", now=11) == (False, None)  # expired
+    cache.put("err", ValueError("x"), ttl_s=1, now=5)
+    assert cache.get("err", now=5)[0] is True
+    assert cache.stats() == {
+        "size": 2, "hits": 1, "negative_hits": 1, "misses": 2, "evictions": 1, "invalidations": 0,
+    }
+
+    cache.check_version("v1")
+    assert len(cache) == 0 and cache.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_permission_evidence_cached_by_role_and_action():
+    first = await gate_helpers.collect_all_evidence(_make_ctx(), [])
+    second = await gate_helpers.collect_all_evidence(_make_ctx(), [])
+    await gate_helpers.collect_all_evidence(_make_ctx(role="admin"), [])
+
+    assert second["permission"] == first["permission"]
+    stats = evidence_cache_stats()
+    assert stats["permission"]["hits"] == 1
+    assert stats["permission"]["misses"] == 2
+    assert stats["knowledge"]["hits"] == 2
+    assert "risk" not in stats and "routing" not in stats
+
+
+@pytest.mark.asyncio
+async def test_failures_are_negatively_cached_without_breaker_recording():
+    calls = []
+
+    @cpu_only
+    @cached_evidence(key=permission.resolve_permission_query, negative_ttl_s=60)
+    async def failing_permission(ctx):
+        calls.append(ctx.request_id)
+        raise ConnectionError("backend down")
+
+    config = GateRuntimeConfig.from_env({"AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED": "true"})
+    with patch("src.core.gate_helpers.collect_permission", new=failing_permission):
+        first = await gate_helpers.collect_all_evidence(_make_ctx(config=config), [])
+        second = await gate_helpers.collect_all_evidence(_make_ctx(config=config), [])
+
+    assert len(calls) == 1
+    for result in (first, second):
+        assert result["permission"].data == {"_outcome": "ERROR", "_timeout_budget_exceeded": True}
+    breaker = gate_helpers.get_or_create_circuit_breaker_for_provider("permission")
+    assert breaker.get_snapshot().consecutive_timeouts == 1
+    assert evidence_cache_stats()["permission"]["negative_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_config_version_change_invalidates(monkeypatch):
+    await gate_helpers.collect_all_evidence(_make_ctx(), [])
+    monkeypatch.setitem(permission.PERMISSION_POLICIES, "version", "next")
+    await gate_helpers.collect_all_evidence(_make_ctx(), [])
+
+    stats = evidence_cache_stats()["permission"]
+    assert stats["invalidations"] == 1
+    assert stats["hits"] == 0
+
+    # A new runtime config snapshot also invalidates.
+    await gate_helpers.collect_all_evidence(
+        _make_ctx(config=GateRuntimeConfig.from_env({}, version=999)), []
+    )
+    assert evidence_cache_stats()["permission"]["invalidations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_can_be_disabled():
+    config = GateRuntimeConfig.from_env({"AI_GATE_EVIDENCE_CACHE_ENABLED": "false"})
+    await gate_helpers.collect_all_evidence(_make_ctx(config=config), [])
+    await gate_helpers.collect_all_evidence(_make_ctx(config=config), [])
+    assert evidence_cache_stats() == {}
@@ -7,15 +7,15 @@ Decision table (fail-closed, explain-only → gate overlay):
 - _hitl_suggested == False and _degradation_suggested == True   → ALLOW (degraded trace)
 - both False                                                    → ALLOW
 """
-import io
 import os
-from contextlib import contextmanager, redirect_stdout
+from contextlib import contextmanager
 from unittest.mock import patch
 
 import pytest
 
 from src.core.models import DecisionRequest, Decision
 from src.core import gate
+from src.core.runtime_config import reload_runtime_config
 
 
 def _make_req(verbose: bool = True) -> DecisionRequest:
@@ -113,6 +113,7 @@ async def test_no_meta_flag_false_behaves_as_before_with_deny_overlay():
     """
     env_key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.pop(env_key, None)
+    reload_runtime_config()
     try:
         req = _make_req(verbose=False)
         resp = await gate.decide(req)
@@ -120,6 +121,7 @@ async def test_no_meta_flag_false_behaves_as_before_with_deny_overlay():
     finally:
         if old is not None:
             os.environ[env_key] = old
+        reload_runtime_config()
 
 
 @pytest.mark.asyncio
@@ -217,14 +219,13 @@ async def test_degradation_suggested_without_hitl_results_in_allow_and_degraded_
     async def fake_collect_all_evidence(ctx, trace):
         return fake_evidence
 
-    buf = io.StringIO()
     with _stub_gate_pipeline(decision_index=0), patch(
         "src.core.gate.collect_all_evidence", new=fake_collect_all_evidence
-    ), redirect_stdout(buf):
+    ):
         resp = await gate.decide(req)
 
     assert resp.decision is Decision.ALLOW
-    trace_output = buf.getvalue()
+    trace_output = "\n".join(resp.trace)
     assert "degraded" in trace_output
 
 
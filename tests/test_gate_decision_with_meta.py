@@ -7,15 +7,14 @@ Matrix:
   _degradation_suggested == True    → decision remains ALLOW, but trace marks degraded
 - both False                        → decision unchanged
 """
-import io
 import os
-from contextlib import redirect_stdout
 from unittest.mock import patch
 
 import pytest
 
 from src.core.models import DecisionRequest, Decision
 from src.core import gate
+from src.core.runtime_config import reload_runtime_config
 
 
 def _make_req(verbose: bool = True) -> DecisionRequest:
@@ -35,6 +34,7 @@ async def test_no_meta_flag_false_behaves_as_before():
     # Ensure feature flag is off so collect_all_evidence won't attach _meta.
     env_key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.pop(env_key, None)
+    reload_runtime_config()
     try:
         req = _make_req(verbose=False)
         # Just ensure decide runs without raising and returns a valid Decision.
@@ -43,6 +43,7 @@ async def test_no_meta_flag_false_behaves_as_before():
     finally:
         if old is not None:
             os.environ[env_key] = old
+        reload_runtime_config()
 
 
 @pytest.mark.asyncio
@@ -90,14 +91,13 @@ async def test_degradation_suggested_allows_with_degraded_trace():
     async def fake_collect_all_evidence(ctx, trace):
         return fake_evidence
 
-    buf = io.StringIO()
-    with patch("src.core.gate.collect_all_evidence", new=fake_collect_all_evidence), redirect_stdout(buf):
+    with patch("src.core.gate.collect_all_evidence", new=fake_collect_all_evidence):
         resp = await gate.decide(req)
 
     # Decision should remain whatever the base matrix decides (no relax).
     assert isinstance(resp.decision, Decision)
     # Trace should contain a degraded note.
-    trace_output = buf.getvalue()
+    trace_output = "\n".join(resp.trace)
     assert "degraded" in trace_output
 
 
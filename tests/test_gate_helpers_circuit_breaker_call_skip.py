@@ -13,6 +13,7 @@ import pytest
 
 from src.core.models import GateContext, Evidence
 from src.core import gate_helpers
+from src.core.runtime_config import reload_runtime_config
 
 
 def _make_ctx() -> GateContext:
@@ -34,6 +35,7 @@ async def test_flag_false_registry_not_touched():
     gate_helpers._reset_circuit_breaker_registry_for_testing()
     env_key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.pop(env_key, None)
+    reload_runtime_config()
     try:
         ctx = _make_ctx()
         trace = []
@@ -49,6 +51,7 @@ async def test_flag_false_registry_not_touched():
     finally:
         if old is not None:
             os.environ[env_key] = old
+        reload_runtime_config()
 
 
 @pytest.mark.asyncio
@@ -58,6 +61,7 @@ async def test_flag_true_skip_does_not_call_provider():
     env_key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.get(env_key)
     os.environ[env_key] = "true"
+    reload_runtime_config()
     try:
         now_ms = int(time.time() * 1000)
         breaker = gate_helpers.get_or_create_circuit_breaker_for_provider("tool")
@@ -78,6 +82,7 @@ async def test_flag_true_skip_does_not_call_provider():
             os.environ.pop(env_key, None)
         else:
             os.environ[env_key] = old
+        reload_runtime_config()
         gate_helpers._reset_circuit_breaker_registry_for_testing()
 
 
@@ -88,6 +93,7 @@ async def test_flag_true_call_invokes_provider():
     env_key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.get(env_key)
     os.environ[env_key] = "true"
+    reload_runtime_config()
     try:
         with patch(
             "src.core.gate_helpers.collect_tool",
@@ -110,4 +116,5 @@ async def test_flag_true_call_invokes_provider():
             os.environ.pop(env_key, None)
         else:
             os.environ[env_key] = old
+        reload_runtime_config()
         gate_helpers._reset_circuit_breaker_registry_for_testing()
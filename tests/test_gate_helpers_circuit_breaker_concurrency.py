@@ -0,0 +1,129 @@
+"""
+CircuitBreaker under concurrent callers: permits tie an outcome to the
+HALF_OPEN period it was admitted in, calls without an outcome hand their probe
+slot back, and the breaker / registry are safe to share between threads.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from src.core import gate_helpers
+from src.core.gate_helpers import CircuitBreaker, CircuitBreakerState
+
+
+def _open_breaker(**kwargs) -> CircuitBreaker:
+    breaker = CircuitBreaker("tool", timeout_threshold=3, initial_cooldown_ms=1000, **kwargs)
+    for _ in range(3):
+        breaker.record_timeout(1_000)
+    assert breaker.state == CircuitBreakerState.OPEN
+    return breaker
+
+
+def test_stale_outcome_does_not_touch_current_probe():
+    breaker = CircuitBreaker("tool", timeout_threshold=3, initial_cooldown_ms=1000, half_open_max_probes=1)
+    # Admitted while CLOSED, still in flight when the circuit opens.
+    stale = breaker.acquire_call(1_000)
+    assert stale is not None and not stale.probe
+    for _ in range(3):
+        breaker.record_timeout(1_000)
+
+    probe = breaker.acquire_call(2_500)
+    assert probe.probe and breaker.state == CircuitBreakerState.HALF_OPEN
+    breaker.record_success(2_600, stale)
+    assert breaker.state == CircuitBreakerState.HALF_OPEN
+    # The single probe slot is still taken.
+    assert breaker.acquire_call(2_600) is None
+
+    breaker.record_success(2_700, probe)
+    assert breaker.state == CircuitBreakerState.CLOSED
+
+
+def test_probe_of_previous_half_open_period_is_ignored():
+    breaker = _open_breaker(half_open_max_probes=1)
+    old_probe = breaker.acquire_call(2_500)
+    breaker.record_timeout(2_500)  # permit-less timeout reopens the circuit
+    assert breaker.state == CircuitBreakerState.OPEN
+
+    current = breaker.acquire_call(5_000)
+    assert current.probe and current.epoch != old_probe.epoch
+    breaker.release_permit(old_probe)
+    assert breaker.acquire_call(5_000) is None
+    breaker.release_permit(current)
+    assert breaker.acquire_call(5_000) is not None
+
+
+@pytest.mark.asyncio
+async def test_probe_limit_holds_with_interleaved_tasks():
+    breaker = _open_breaker(half_open_max_probes=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def caller(i: int):
+        nonlocal in_flight, max_in_flight
+        permit = breaker.acquire_call(2_500)
+        if permit is None:
+            return
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if i % 2:
+            breaker.release_permit(permit)
+        else:
+            breaker.record_timeout(2_500, permit)
+
+    await asyncio.gather(*(caller(i) for i in range(200)))
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_unavailable_evidence_releases_probe(monkeypatch):
+    from src.core.models import Evidence, GateContext
+    from src.core.runtime_config import reload_runtime_config
+
+    monkeypatch.setenv("AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED", "true")
+    monkeypatch.setenv("AI_GATE_EVIDENCE_CACHE_ENABLED", "false")
+    reload_runtime_config()
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+    try:
+        breaker = gate_helpers.get_or_create_circuit_breaker_for_provider("tool", half_open_max_probes=1)
+        for _ in range(3):
+            breaker.record_timeout(0)
+        ctx = GateContext(
+            request_id="cb-concurrency", session_id=None, user_id=None, text="test",
+            debug=False, verbose=False, context={}, structured_input=None,
+        )
+
+        async def unavailable_tool(ctx):
+            return Evidence(provider="tool", available=False, data={})
+
+        monkeypatch.setattr(gate_helpers, "collect_tool", unavailable_tool)
+        for _ in range(3):
+            await gate_helpers.collect_all_evidence(ctx, [])
+        # Every request took the single probe and handed it back.
+        assert breaker.state == CircuitBreakerState.HALF_OPEN
+        assert breaker.acquire_call(10**13) is not None
+    finally:
+        gate_helpers._reset_circuit_breaker_registry_for_testing()
+        reload_runtime_config()
+
+
+def test_registry_returns_one_breaker_per_provider_across_threads():
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+    barrier = threading.Barrier(16)
+    seen = []
+
+    def worker():
+        barrier.wait()
+        seen.append(gate_helpers.get_or_create_circuit_breaker_for_provider("routing"))
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    try:
+        assert len({id(b) for b in seen}) == 1
+    finally:
+        gate_helpers._reset_circuit_breaker_registry_for_testing()
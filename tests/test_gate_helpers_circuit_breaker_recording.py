@@ -14,6 +14,7 @@ import pytest
 
 from src.core.models import GateContext, Evidence
 from src.core import gate_helpers
+from src.core.runtime_config import reload_runtime_config
 
 
 def _make_ctx() -> GateContext:
@@ -32,6 +33,7 @@ def _make_ctx() -> GateContext:
 def _env_off():
     key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.pop(key, None)
+    reload_runtime_config()
     return key, old
 
 
@@ -39,6 +41,7 @@ def _env_on():
     key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.get(key)
     os.environ[key] = "true"
+    reload_runtime_config()
     return key, old
 
 
@@ -47,6 +50,7 @@ def _restore_env(key, old):
         os.environ.pop(key, None)
     else:
         os.environ[key] = old
+    reload_runtime_config()
 
 
 @pytest.mark.asyncio
@@ -9,6 +9,7 @@ import pytest
 
 from src.core.models import GateContext
 from src.core import gate_helpers
+from src.core.runtime_config import reload_runtime_config
 
 
 def _make_ctx() -> GateContext:
@@ -31,6 +32,7 @@ async def test_flag_false_registry_not_accessed():
     # Ensure flag is off (default or explicit)
     env_key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.pop(env_key, None)
+    reload_runtime_config()
     try:
         ctx = _make_ctx()
         trace = []
@@ -39,6 +41,7 @@ async def test_flag_false_registry_not_accessed():
     finally:
         if old is not None:
             os.environ[env_key] = old
+        reload_runtime_config()
 
 
 @pytest.mark.asyncio
@@ -48,6 +51,7 @@ async def test_flag_true_only_creates_instances_output_unchanged():
     env_key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.get(env_key)
     os.environ[env_key] = "true"
+    reload_runtime_config()
     try:
         ctx = _make_ctx()
         trace = []
@@ -65,4 +69,5 @@ async def test_flag_true_only_creates_instances_output_unchanged():
             os.environ.pop(env_key, None)
         else:
             os.environ[env_key] = old
+        reload_runtime_config()
         gate_helpers._reset_circuit_breaker_registry_for_testing()
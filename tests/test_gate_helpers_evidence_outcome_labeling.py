@@ -12,6 +12,7 @@ import pytest
 
 from src.core.models import GateContext, Evidence
 from src.core import gate_helpers
+from src.core.runtime_config import reload_runtime_config
 
 
 def _make_ctx():
@@ -30,6 +31,7 @@ def _make_ctx():
 def _env_off():
     key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.pop(key, None)
+    reload_runtime_config()
     return key, old
 
 
@@ -37,6 +39,7 @@ def _env_on():
     key = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
     old = os.environ.get(key)
     os.environ[key] = "true"
+    reload_runtime_config()
     return key, old
 
 
@@ -45,6 +48,7 @@ def _restore(key, old):
         os.environ.pop(key, None)
     else:
         os.environ[key] = old
+    reload_runtime_config()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,156 @@
+"""
+Inline execution of CPU-only evidence providers.
+
+Providers marked @cpu_only run without a task / wait_for; their elapsed time is
+checked against the same budget, so TIMEOUT / ERROR labels, circuit breaker
+recording and _meta stay as on the task path. Undeclared providers keep the
+task + wait_for path.
+"""
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.core import gate_helpers
+from src.core.models import Evidence, GateContext
+from src.core.records import PipelineContext
+from src.core.runtime_config import reload_runtime_config
+from src.core.timings import StageTimings
+from src.evidence import knowledge, permission, risk, routing, tool
+from src.evidence.execution import cpu_only, is_cpu_only
+
+KEY = "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED"
+
+
+def _make_ctx() -> GateContext:
+    return GateContext(
+        request_id="inline-provider-test",
+        session_id=None,
+        user_id=None,
+        text="我要申请退款",
+        debug=False,
+        verbose=False,
+        context={"role": "normal_user"},
+        structured_input=None,
+    )
+
+
+def _env_on():
+    old = os.environ.get(KEY)
+    os.environ[KEY] = "true"
+    reload_runtime_config()
+    return old
+
+
+def _restore(old):
+    if old is None:
+        os.environ.pop(KEY, None)
+    else:
+        os.environ[KEY] = old
+    reload_runtime_config()
+
+
+def test_builtin_providers_are_cpu_only():
+    for module in (tool, routing, knowledge, risk, permission):
+        assert is_cpu_only(module.collect)
+
+
+@pytest.mark.asyncio
+async def test_cpu_only_providers_do_not_use_wait_for():
+    with patch.object(gate_helpers.asyncio, "wait_for", side_effect=AssertionError("task path")):
+        result = await gate_helpers.collect_all_evidence(_make_ctx(), [])
+    assert all(result[pid].available for pid in ("tool", "routing", "knowledge", "risk", "permission"))
+
+
+@pytest.mark.asyncio
+async def test_cpu_only_budget_overrun_is_labeled_timeout():
+    @cpu_only
+    async def slow_risk(ctx):
+        time.sleep(0.01)
+        return Evidence(provider="risk", available=True, data={"risk_level": "R1"})
+
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+    old = _env_on()
+    try:
+        with patch("src.core.gate_helpers.collect_risk", new=slow_risk), \
+                patch.object(gate_helpers, "EVIDENCE_PROVIDER_TIMEOUT_S", 0.001):
+            result = await gate_helpers.collect_all_evidence(_make_ctx(), [])
+        breaker = gate_helpers.get_or_create_circuit_breaker_for_provider("risk")
+    finally:
+        _restore(old)
+        gate_helpers._reset_circuit_breaker_registry_for_testing()
+
+    assert result["risk"].available is False
+    assert result["risk"].data == {"_outcome": "TIMEOUT", "_timeout_budget_exceeded": True}
+    assert result["tool"].data["_outcome"] == "OK"
+    assert result["_meta"] == {"_degradation_suggested": True, "_hitl_suggested": False}
+    assert breaker.get_snapshot().consecutive_timeouts == 1
+
+
+@pytest.mark.asyncio
+async def test_cpu_only_exception_and_suspension_are_labeled_error():
+    @cpu_only
+    async def failing_tool(ctx):
+        raise ValueError("boom")
+
+    @cpu_only
+    async def suspending_routing(ctx):
+        await asyncio.sleep(0)
+        return Evidence(provider="routing", available=True, data={})
+
+    old = _env_on()
+    try:
+        with patch("src.core.gate_helpers.collect_tool", new=failing_tool), \
+                patch("src.core.gate_helpers.collect_routing", new=suspending_routing):
+            result = await gate_helpers.collect_all_evidence(_make_ctx(), [])
+    finally:
+        _restore(old)
+        gate_helpers._reset_circuit_breaker_registry_for_testing()
+
+    for pid in ("tool", "routing"):
+        assert result[pid].data == {"_outcome": "ERROR", "_timeout_budget_exceeded": True}
+    assert result["_meta"] == {"_degradation_suggested": True, "_hitl_suggested": True}
+
+
+@pytest.mark.asyncio
+async def test_undeclared_provider_keeps_wait_for_timeout():
+    async def slow_knowledge(ctx):
+        await asyncio.sleep(0.05)
+        return Evidence(provider="knowledge", available=True, data={})
+
+    old = _env_on()
+    try:
+        with patch("src.core.gate_helpers.collect_knowledge", new=slow_knowledge), \
+                patch.object(gate_helpers, "EVIDENCE_PROVIDER_TIMEOUT_S", 0.01):
+            result = await gate_helpers.collect_all_evidence(_make_ctx(), [])
+    finally:
+        _restore(old)
+        gate_helpers._reset_circuit_breaker_registry_for_testing()
+
+    assert result["knowledge"].data == {"_outcome": "TIMEOUT", "_timeout_budget_exceeded": True}
+
+
+@pytest.mark.asyncio
+async def test_io_provider_latency_excludes_inline_providers():
+    @cpu_only
+    async def slow_risk(ctx):
+        time.sleep(0.05)
+        return Evidence(provider="risk", available=True, data={"risk_level": "R1"})
+
+    async def fast_knowledge(ctx):
+        # Undeclared collector: task path.
+        return Evidence(provider="knowledge", available=True, data={})
+
+    ctx = PipelineContext(
+        request_id="inline-provider-test", session_id=None, user_id=None, text="我要申请退款",
+        debug=False, context={"role": "normal_user"}, timings=StageTimings(),
+    )
+    with patch("src.core.gate_helpers.collect_risk", new=slow_risk), \
+            patch("src.core.gate_helpers.collect_knowledge", new=fast_knowledge):
+        await gate_helpers.collect_all_evidence(ctx, [])
+
+    timings = ctx.timings.as_us()
+    assert timings["evidence.risk"] >= 50_000
+    assert timings["evidence.knowledge"] < 25_000
@@ -8,15 +8,15 @@ We validate that:
 - R3: degraded_only → HITL (tighten-only enhancement).
 - Risk tier and policy selection are visible in verbose trace.
 """
-import io
 import os
-from contextlib import contextmanager, redirect_stdout
+from contextlib import contextmanager
 from unittest.mock import patch
 
 import pytest
 
 from src.core import gate
 from src.core.models import DecisionRequest, Decision
+from src.core.runtime_config import reload_runtime_config
 
 
 def _make_req(verbose: bool = False) -> DecisionRequest:
@@ -46,6 +46,7 @@ def _with_env(overrides):
                 os.environ.pop(key, None)
             else:
                 os.environ[key] = value
+        reload_runtime_config()
         yield
     finally:
         for key, old in old_values.items():
@@ -53,6 +54,7 @@ def _with_env(overrides):
                 os.environ.pop(key, None)
             else:
                 os.environ[key] = old
+        reload_runtime_config()
 
 
 @contextmanager
@@ -271,7 +273,6 @@ async def test_risk_tier_and_policy_visible_in_trace():
     async def fake_collect_all_evidence(ctx, trace):
         return _fake_evidence(meta)
 
-    buf = io.StringIO()
     with _with_env(
         {
             "AI_GATE_RISK_TIER": "R2",
@@ -282,11 +283,11 @@ async def test_risk_tier_and_policy_visible_in_trace():
         }
     ), _stub_gate_pipeline(decision_index=0), patch(
         "src.core.gate.collect_all_evidence", new=fake_collect_all_evidence
-    ), redirect_stdout(buf):
+    ):
         resp = await gate.decide(req)
 
     assert isinstance(resp.decision, Decision)
-    trace_output = buf.getvalue()
+    trace_output = "\n".join(resp.trace)
     assert "risk_tier=R2 (source=env)" in trace_output
     assert "timeout_guard_policy=v2 (risk_tier=R2)" in trace_output
 
@@ -15,6 +15,7 @@ import pytest
 
 from src.core import gate
 from src.core.models import DecisionRequest, Decision
+from src.core.runtime_config import reload_runtime_config
 
 
 def _make_req(verbose: bool = False) -> DecisionRequest:
@@ -44,6 +45,7 @@ def _with_env(overrides):
                 os.environ.pop(key, None)
             else:
                 os.environ[key] = value
+        reload_runtime_config()
         yield
     finally:
         for key, old in old_values.items():
@@ -51,6 +53,7 @@ def _with_env(overrides):
                 os.environ.pop(key, None)
             else:
                 os.environ[key] = old
+        reload_runtime_config()
 
 
 @contextmanager
@@ -5,15 +5,15 @@ We validate that:
 - When AI_GATE_TIMEOUT_GUARD_POLICY_VERSION is set, verbose trace includes it.
 - When unset, default version \"v1\" is used in trace.
 """
-import io
 import os
-from contextlib import contextmanager, redirect_stdout
+from contextlib import contextmanager
 from unittest.mock import patch
 
 import pytest
 
 from src.core import gate
 from src.core.models import DecisionRequest, Decision
+from src.core.runtime_config import reload_runtime_config
 
 
 def _make_req(verbose: bool = True) -> DecisionRequest:
@@ -43,6 +43,7 @@ def _with_env(overrides):
                 os.environ.pop(key, None)
             else:
                 os.environ[key] = value
+        reload_runtime_config()
         yield
     finally:
         for key, old in old_values.items():
@@ -50,6 +51,7 @@ def _with_env(overrides):
                 os.environ.pop(key, None)
             else:
                 os.environ[key] = old
+        reload_runtime_config()
 
 
 @contextmanager
@@ -151,16 +153,15 @@ async def test_policy_version_trace_uses_env_value_when_set():
     async def fake_collect_all_evidence(ctx, trace):
         return _fake_evidence_without_meta()
 
-    buf = io.StringIO()
     with _with_env({"AI_GATE_TIMEOUT_GUARD_POLICY_VERSION": "vX"}), _stub_gate_pipeline(
         decision_index=0
     ), patch(
         "src.core.gate.collect_all_evidence", new=fake_collect_all_evidence
-    ), redirect_stdout(buf):
+    ):
         resp = await gate.decide(req)
 
     assert isinstance(resp.decision, Decision)
-    trace_output = buf.getvalue()
+    trace_output = "\n".join(resp.trace)
     assert "timeout_guard_policy_version=vX" in trace_output
 
 
@@ -174,15 +175,14 @@ async def test_policy_version_trace_defaults_to_v1_when_unset():
     async def fake_collect_all_evidence(ctx, trace):
         return _fake_evidence_without_meta()
 
-    buf = io.StringIO()
     with _with_env({"AI_GATE_TIMEOUT_GUARD_POLICY_VERSION": None}), _stub_gate_pipeline(
         decision_index=0
     ), patch(
         "src.core.gate.collect_all_evidence", new=fake_collect_all_evidence
-    ), redirect_stdout(buf):
+    ):
         resp = await gate.decide(req)
 
     assert isinstance(resp.decision, Decision)
-    trace_output = buf.getvalue()
+    trace_output = "\n".join(resp.trace)
     assert "timeout_guard_policy_version=v1" in trace_output
 
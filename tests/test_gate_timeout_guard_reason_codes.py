@@ -7,15 +7,15 @@ We validate that:
 - R2 + hitl+degraded → decision DENY and reason=HITL_AND_DEGRADED.
 - No meta / overlays not triggered → decision ALLOW and no timeout_guard_reason line.
 """
-import io
 import os
-from contextlib import contextmanager, redirect_stdout
+from contextlib import contextmanager
 from unittest.mock import patch
 
 import pytest
 
 from src.core import gate
 from src.core.models import DecisionRequest, Decision
+from src.core.runtime_config import reload_runtime_config
 
 
 def _make_req(verbose: bool = True) -> DecisionRequest:
@@ -45,6 +45,7 @@ def _with_env(overrides):
                 os.environ.pop(key, None)
             else:
                 os.environ[key] = value
+        reload_runtime_config()
         yield
     finally:
         for key, old in old_values.items():
@@ -52,6 +53,7 @@ def _with_env(overrides):
                 os.environ.pop(key, None)
             else:
                 os.environ[key] = old
+        reload_runtime_config()
 
 
 @contextmanager
@@ -160,7 +162,6 @@ async def test_r1_hitl_suggested_reason_is_hitl_suggested():
     async def fake_collect_all_evidence(ctx, trace):
         return _fake_evidence(meta)
 
-    buf = io.StringIO()
     with _with_env(
         {
             "AI_GATE_RISK_TIER": "R1",
@@ -170,11 +171,11 @@ async def test_r1_hitl_suggested_reason_is_hitl_suggested():
         }
     ), _stub_gate_pipeline(decision_index=0), patch(
         "src.core.gate.collect_all_evidence", new=fake_collect_all_evidence
-    ), redirect_stdout(buf):
+    ):
         resp = await gate.decide(req)
 
     assert resp.decision is Decision.HITL
-    trace_output = buf.getvalue()
+    trace_output = "\n".join(resp.trace)
     assert "timeout_guard_reason=HITL_SUGGESTED" in trace_output
 
 
@@ -192,7 +193,6 @@ async def test_r3_degraded_only_reason_is_degraded_only():
     async def fake_collect_all_evidence(ctx, trace):
         return _fake_evidence(meta)
 
-    buf = io.StringIO()
     with _with_env(
         {
             "AI_GATE_RISK_TIER": "R3",
@@ -202,11 +202,11 @@ async def test_r3_degraded_only_reason_is_degraded_only():
         }
     ), _stub_gate_pipeline(decision_index=0), patch(
         "src.core.gate.collect_all_evidence", new=fake_collect_all_evidence
-    ), redirect_stdout(buf):
+    ):
         resp = await gate.decide(req)
 
     assert resp.decision is Decision.HITL
-    trace_output = buf.getvalue()
+    trace_output = "\n".join(resp.trace)
     assert "timeout_guard_reason=DEGRADED_ONLY" in trace_output
 
 
@@ -224,7 +224,6 @@ async def test_r2_hitl_and_degraded_reason_is_hitl_and_degraded():
     async def fake_collect_all_evidence(ctx, trace):
         return _fake_evidence(meta)
 
-    buf = io.StringIO()
     with _with_env(
         {
             "AI_GATE_RISK_TIER": "R2",
@@ -234,11 +233,11 @@ async def test_r2_hitl_and_degraded_reason_is_hitl_and_degraded():
         }
     ), _stub_gate_pipeline(decision_index=0), patch(
         "src.core.gate.collect_all_evidence", new=fake_collect_all_evidence
-    ), redirect_stdout(buf):
+    ):
         resp = await gate.decide(req)
 
     assert resp.decision is Decision.DENY
-    trace_output = buf.getvalue()
+    trace_output = "\n".join(resp.trace)
     assert "timeout_guard_reason=HITL_AND_DEGRADED" in trace_output
 
 
@@ -253,7 +252,6 @@ async def test_no_meta_no_timeout_guard_reason_in_trace():
     async def fake_collect_all_evidence(ctx, trace):
         return _fake_evidence(meta=None)
 
-    buf = io.StringIO()
     with _with_env(
         {
             "AI_GATE_RISK_TIER": "R2",
@@ -263,10 +261,10 @@ async def test_no_meta_no_timeout_guard_reason_in_trace():
         }
     ), _stub_gate_pipeline(decision_index=0), patch(
         "src.core.gate.collect_all_evidence", new=fake_collect_all_evidence
-    ), redirect_stdout(buf):
+    ):
         resp = await gate.decide(req)
 
     assert resp.decision is Decision.ALLOW
-    trace_output = buf.getvalue()
+    trace_output = "\n".join(resp.trace)
     assert "timeout_guard_reason=" not in trace_output
 
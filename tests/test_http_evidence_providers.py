@@ -0,0 +1,133 @@
+"""
+Async I/O evidence provider SDK (HttpEvidenceProvider) and the reference
+remote permission / knowledge providers, against the in-process fake server.
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.core import gate_helpers
+from src.core.models import GateContext
+from src.core.runtime_config import GateRuntimeConfig
+from src.evidence import knowledge, permission
+from src.evidence.execution import is_cpu_only
+from src.evidence.fake_server import FakeEvidenceServer
+from src.evidence.http_provider import aclose_shared_http_client, get_shared_http_client
+from src.evidence.remote import HttpKnowledgeProvider, HttpPermissionProvider
+
+
+def _make_ctx(runtime_config=None, role: str = "normal_user") -> GateContext:
+    ctx = GateContext(
+        request_id="http-provider-test",
+        session_id=None,
+        user_id=None,
+        text="我要申请退款",
+        debug=False,
+        verbose=False,
+        context={"role": role},
+        structured_input=None,
+    )
+    if runtime_config is not None:
+        object.__setattr__(ctx, "runtime_config", runtime_config)
+    return ctx
+
+
+def _remote_config(server: FakeEvidenceServer, guard: bool = False) -> GateRuntimeConfig:
+    # Evidence cache off: every call reaches the server.
+    return GateRuntimeConfig.from_env({
+        "AI_GATE_EVIDENCE_CACHE_ENABLED": "false",
+        "AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED": "true" if guard else "false",
+        "AI_GATE_PERMISSION_PROVIDER_URL": server.base_url,
+        "AI_GATE_KNOWLEDGE_PROVIDER_URL": server.base_url,
+    })
+
+
+@pytest.mark.asyncio
+async def test_remote_providers_match_local_evidence():
+    async with FakeEvidenceServer() as server:
+        try:
+            for role in ("normal_user", "admin", "guest"):
+                ctx = _make_ctx(role=role)
+                remote_perm = await HttpPermissionProvider(server.base_url)(ctx)
+                assert remote_perm == await permission.collect(ctx)
+            remote_kb = await HttpKnowledgeProvider(server.base_url)(_make_ctx())
+            assert remote_kb == await knowledge.collect(_make_ctx())
+        finally:
+            await aclose_shared_http_client()
+    assert not is_cpu_only(HttpPermissionProvider(server.base_url))
+
+
+@pytest.mark.asyncio
+async def test_collect_all_evidence_uses_remote_providers_with_keep_alive():
+    async with FakeEvidenceServer() as server:
+        config = _remote_config(server)
+        try:
+            for _ in range(5):
+                result = await gate_helpers.collect_all_evidence(_make_ctx(config), [])
+        finally:
+            await aclose_shared_http_client()
+    local = await gate_helpers.collect_all_evidence(_make_ctx(GateRuntimeConfig.from_env({})), [])
+
+    assert server.requests == 10
+    # Both providers share one pooled client; sequential requests reuse connections.
+    assert server.connections <= 2
+    assert result["permission"] == local["permission"]
+    assert result["knowledge"] == local["knowledge"]
+
+
+@pytest.mark.asyncio
+async def test_per_provider_concurrency_limit():
+    async with FakeEvidenceServer(latency_ms=10) as server:
+        provider = HttpPermissionProvider(server.base_url, max_concurrency=2)
+        try:
+            results = await asyncio.gather(*(provider(_make_ctx()) for _ in range(6)))
+        finally:
+            await aclose_shared_http_client()
+    assert all(ev.available for ev in results)
+    assert server.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_timeouts_come_from_evidence_timeout_config(tmp_path: Path):
+    config_path = tmp_path / "evidence_timeouts.yaml"
+    source = Path(__file__).parent.parent / "config" / "evidence_timeouts.yaml"
+    config_path.write_text(
+        source.read_text(encoding="utf-8").replace("permission: 80ms", "permission: 10ms"),
+        encoding="utf-8",
+    )
+    gate_helpers._evidence_timeout_config = None
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+    try:
+        gate_helpers.load_evidence_timeout_config(config_path)
+        assert gate_helpers.get_provider_timeout_s("permission") == 0.01
+        assert gate_helpers.get_provider_timeout_s("unlisted") == 0.08
+
+        async with FakeEvidenceServer(latency_ms=40) as server:
+            get_shared_http_client()  # startup warm-up, outside the budget
+            try:
+                result = await gate_helpers.collect_all_evidence(
+                    _make_ctx(_remote_config(server, guard=True)), []
+                )
+            finally:
+                await aclose_shared_http_client()
+    finally:
+        gate_helpers._evidence_timeout_config = None
+        gate_helpers._reset_circuit_breaker_registry_for_testing()
+
+    assert result["permission"].data == {"_outcome": "TIMEOUT", "_timeout_budget_exceeded": True}
+    assert result["knowledge"].data["_outcome"] == "OK"
+
+
+@pytest.mark.asyncio
+async def test_unreachable_service_is_labeled_error():
+    server = await FakeEvidenceServer().start()
+    config = _remote_config(server, guard=True)
+    await server.stop()
+    try:
+        result = await gate_helpers.collect_all_evidence(_make_ctx(config), [])
+    finally:
+        await aclose_shared_http_client()
+        gate_helpers._reset_circuit_breaker_registry_for_testing()
+    assert result["permission"].data == {"_outcome": "ERROR", "_timeout_budget_exceeded": True}
+    assert result["_meta"]["_hitl_suggested"] is True
@@ -0,0 +1,66 @@
+"""
+Shared Aho-Corasick keyword engine.
+
+`kw in find_all(text)` must be exactly equivalent to `kw in text` for every
+keyword, including overlapping / nested keywords and the empty keyword.
+"""
+import random
+
+import pytest
+
+from src.core.keyword_engine import KeywordAutomaton, scan_keywords
+from src.evidence.routing import ROUTING_HINTS
+from src.evidence.risk import RULES
+from src.core.postcheck import GUARANTEE_KEYWORDS
+
+
+def test_overlapping_and_nested_keywords():
+    keywords = ["退", "退款", "申请退款", "款", "he", "she", "his", "hers"]
+    automaton = KeywordAutomaton(keywords)
+    text = "我想申请退款, ushers"
+    hits = automaton.find_all(text)
+    assert hits == {kw for kw in keywords if kw in text}
+    assert "his" not in hits
+
+
+def test_empty_keyword_and_empty_text():
+    automaton = KeywordAutomaton(["", "abc"])
+    assert automaton.find_all("") == {""}
+    assert automaton.find_all("xabcx") == {"", "abc"}
+
+
+def test_random_texts_match_substring_semantics():
+    rng = random.Random(7)
+    alphabet = "退款改价投诉保本赔偿ab"
+    keywords = sorted({
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(60)
+    })
+    automaton = KeywordAutomaton(keywords)
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet + "xyz") for _ in range(rng.randint(0, 40)))
+        assert automaton.find_all(text) == {kw for kw in keywords if kw in text}
+
+
+def test_shared_engine_covers_registered_config_keywords():
+    text = "保证收益的产品我要投诉, 帮我申请退款并修改地址"
+    hits = scan_keywords(text)
+    configured = set(GUARANTEE_KEYWORDS)
+    for rule in RULES:
+        configured.update(rule.get("keywords", []))
+    for hint in ROUTING_HINTS:
+        configured.update(hint.get("keywords", []))
+    assert {kw for kw in configured if kw in hits} == {kw for kw in configured if kw in text}
+
+
+def test_scan_keywords_rejects_non_str_like_substring_check():
+    with pytest.raises(TypeError):
+        scan_keywords(None)
+
+
+def test_scan_cache_is_keyed_by_automaton():
+    text = "热更新测试，申请退款"
+    shared = scan_keywords(text)
+    pinned = KeywordAutomaton(["热更新测试"])
+    assert scan_keywords(text, pinned) == {"热更新测试"}
+    assert scan_keywords(text) == shared
+    assert "热更新测试" not in shared
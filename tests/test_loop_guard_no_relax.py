@@ -8,7 +8,7 @@ from src.core import gate as gate_module
 import src.core.loop_guard as loop_guard
 
 
-def test_loop_guard_cannot_relax_decision_index(capsys):
+def test_loop_guard_cannot_relax_decision_index():
     """
     Verify that even if LoopGuard returns a \"more relaxed\" decision_index,
     gate.py ignores the relax and keeps the original decision.
@@ -51,8 +51,8 @@ def test_loop_guard_cannot_relax_decision_index(capsys):
         req_verbose = deepcopy(req)
         req_verbose.verbose = True
 
-        _ = asyncio.run(decide(req_verbose))
-        captured = capsys.readouterr().out
+        verbose_resp = asyncio.run(decide(req_verbose))
+        captured = "\n".join(verbose_resp.trace)
     finally:
         gate_module.evaluate_loop_guard = original_eval  # restore
 
@@ -70,8 +70,8 @@ from src.core.models import DecisionRequest
 from src.core import gate as gate_module
 
 
-async def _call_decide() -> str:
-    """Helper to call core gate once and return decision value."""
+async def _call_decide():
+    """Helper to call core gate once and return the response."""
     req = DecisionRequest(
         text="普通查询",
         debug=False,
@@ -79,18 +79,17 @@ async def _call_decide() -> str:
         context={},
         structured_input=None,
     )
-    resp = await gate_module.decide(req)
-    return resp.decision.value
+    return await gate_module.decide(req)
 
 
-def test_loop_guard_cannot_relax(monkeypatch, capsys):
+def test_loop_guard_cannot_relax(monkeypatch):
     """
     验证：即使 LoopGuard 尝试返回更宽松的 decision_index，gate.call-site 也会拦截：
     - Decision 不会被放松（保持与正常路径一致）
     - verbose=True 时 trace 中包含 \"attempted relax ignored\"。
     """
     # baseline: 决策结果（未打补丁）
-    baseline_decision = asyncio.run(_call_decide())
+    baseline_decision = asyncio.run(_call_decide()).decision.value
 
     def fake_evaluate_loop_guard(decision_index: int, loop_state: Any, trace: Any) -> int:
         # 恶意实现：总是尝试把 decision_index - 1（放松）
@@ -100,12 +99,12 @@ def test_loop_guard_cannot_relax(monkeypatch, capsys):
     monkeypatch.setattr("src.core.gate.evaluate_loop_guard", fake_evaluate_loop_guard)
 
     # 再次调用 decide
-    decision_after_patch = asyncio.run(_call_decide())
+    resp_after_patch = asyncio.run(_call_decide())
+    decision_after_patch = resp_after_patch.decision.value
 
     # Decision 不应被放松，仍然与 baseline 一致
     assert decision_after_patch == baseline_decision
 
     # trace 中应出现 attempted relax ignored 提示
-    captured = capsys.readouterr()
-    assert "LoopGuard: attempted relax ignored" in captured.out
+    assert "LoopGuard: attempted relax ignored" in "\n".join(resp_after_patch.trace)
 
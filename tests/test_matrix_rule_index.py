@@ -0,0 +1,68 @@
+"""
+Compiled (risk_level, action_type) rule index in Matrix.
+
+The index must return exactly what the linear first-match scan returns,
+including wildcard rules (no risk_level / no action_types) and values that
+no rule mentions.
+"""
+import itertools
+
+import yaml
+
+from src.core.matrix import Matrix
+
+
+def _write_matrix(tmp_path, rules) -> str:
+    path = tmp_path / "matrix.yaml"
+    path.write_text(
+        yaml.safe_dump({"version": "test", "defaults": {}, "rules": rules}),
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+def test_index_matches_linear_scan_for_repo_matrices():
+    risk_levels = ["R0", "R1", "R2", "R3", "R9"]
+    action_types = ["READ", "WRITE", "MONEY", "ENTITLEMENT", "POLICY", "UNKNOWN"]
+    for name in ("v0.1.yaml", "v0.2.yaml", "pr_loop_demo.yaml", "permission_demo.yaml"):
+        matrix = Matrix(name)
+        for risk_level, action_type in itertools.product(risk_levels, action_types):
+            expected = matrix._scan_rules(action_type, risk_level)
+            assert matrix.match_rule("Information", action_type, risk_level) is expected
+
+
+def test_index_keeps_first_match_order_with_wildcards(tmp_path):
+    rules = [
+        {"rule_id": "R3_MONEY", "match": {"risk_level": "R3", "action_types": ["MONEY"]},
+         "decision": "HITL", "primary_reason": "A"},
+        {"rule_id": "ANY_RISK_WRITE", "match": {"action_types": ["WRITE"]},
+         "decision": "ONLY_SUGGEST", "primary_reason": "B"},
+        {"rule_id": "R3_ANY_ACTION", "match": {"risk_level": "R3"},
+         "decision": "DENY", "primary_reason": "C"},
+        {"rule_id": "R2_WRITE_SHADOWED", "match": {"risk_level": "R2", "action_types": ["WRITE"]},
+         "decision": "DENY", "primary_reason": "D"},
+        {"rule_id": "CATCH_ALL", "match": {}, "decision": "ALLOW", "primary_reason": "E"},
+    ]
+    matrix = Matrix(_write_matrix(tmp_path, rules))
+
+    def rule_id(action_type, risk_level):
+        return matrix.match_rule("Information", action_type, risk_level)["rule_id"]
+
+    assert rule_id("MONEY", "R3") == "R3_MONEY"
+    assert rule_id("WRITE", "R3") == "ANY_RISK_WRITE"
+    assert rule_id("WRITE", "R2") == "ANY_RISK_WRITE"
+    assert rule_id("READ", "R3") == "R3_ANY_ACTION"
+    assert rule_id("NOT_IN_ANY_RULE", "R3") == "R3_ANY_ACTION"
+    assert rule_id("MONEY", "R1") == "CATCH_ALL"
+    assert rule_id("READ", "R_UNKNOWN") == "CATCH_ALL"
+
+
+def test_index_returns_none_without_match(tmp_path):
+    rules = [
+        {"rule_id": "R2_WRITE", "match": {"risk_level": "R2", "action_types": ["WRITE"]},
+         "decision": "ONLY_SUGGEST", "primary_reason": "A"},
+    ]
+    matrix = Matrix(_write_matrix(tmp_path, rules))
+    assert matrix.match_rule("Information", "WRITE", "R1") is None
+    assert matrix.match_rule("Information", "READ", "R2") is None
+    assert matrix.match_rule("Information", "WRITE", "R2")["rule_id"] == "R2_WRITE"
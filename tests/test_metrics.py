@@ -0,0 +1,96 @@
+"""
+GET /metrics (metrics.py): decision / evidence / breaker series in Prometheus
+text format, and aggregation over worker files with AI_GATE_METRICS_DIR.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import app
+from src.core import config as config_paths
+from src.core import gate_helpers, metrics
+from src.core.runtime_config import reload_runtime_config
+
+_WORKER = """
+from src.core import metrics
+metrics.observe_decision("DENY", "R_TEST", "NONE", 0.003)
+metrics.observe_evidence("tool", "TIMEOUT", 0.08)
+metrics.set_circuit_breaker("tool", "OPEN", 1)
+"""
+
+
+@pytest.fixture
+def fresh_metrics():
+    metrics.reset_metrics()
+    yield
+    metrics.reset_metrics()
+
+
+def _series(text: str) -> dict:
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines() if line and not line.startswith("#")
+    }
+
+
+def test_metrics_endpoint_reports_decisions_evidence_and_breakers(fresh_metrics):
+    client = TestClient(app)
+    for text in ["帮我查订单物流", "我要申请退款", "你好"]:
+        assert client.post("/decision", json={"text": text}).status_code == 200
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+    gate_helpers.get_or_create_circuit_breaker_for_provider("knowledge")
+    try:
+        response = client.get("/metrics")
+    finally:
+        gate_helpers._reset_circuit_breaker_registry_for_testing()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE ai_gate_decision_latency_seconds histogram" in response.text
+    series = _series(response.text)
+    decisions = {k: v for k, v in series.items() if k.startswith("ai_gate_decisions_total")}
+    assert sum(decisions.values()) == 3
+    assert sum(v for k, v in series.items() if k.startswith("ai_gate_primary_reasons_total")) == 3
+    assert series['ai_gate_timeout_guard_reasons_total{timeout_guard_reason="NONE"}'] == 3
+    for provider in ("tool", "routing", "knowledge", "risk", "permission"):
+        outcomes = [
+            v for k, v in series.items()
+            if k.startswith(f'ai_gate_evidence_outcomes_total{{provider="{provider}",')
+        ]
+        assert sum(outcomes) == 3
+    for key, count in decisions.items():
+        decision = key[key.index("{"):]
+        # Buckets are cumulative: +Inf equals _count.
+        inf_key = f'ai_gate_decision_latency_seconds_bucket{decision[:-1]},le="+Inf"}}'
+        assert series[inf_key] == count == series[f"ai_gate_decision_latency_seconds_count{decision}"]
+    assert series['ai_gate_circuit_breaker_state{provider="knowledge"}'] == 0
+
+
+def test_metrics_dir_sums_worker_files(tmp_path, fresh_metrics):
+    reload_runtime_config({"AI_GATE_METRICS_DIR": str(tmp_path)})
+    try:
+        metrics.observe_decision("DENY", "R_TEST", "NONE", 0.0001)
+        metrics.set_circuit_breaker("tool", "CLOSED", 0)
+        # Another worker that has exited since.
+        subprocess.run(
+            [sys.executable, "-c", _WORKER],
+            env=dict(os.environ, PYTHONPATH=str(config_paths.get_project_root()), AI_GATE_METRICS_DIR=str(tmp_path)),
+            check=True,
+        )
+        assert len(list(tmp_path.glob("metrics_*.db"))) == 2
+        series = _series(metrics.render_metrics())
+    finally:
+        metrics.reset_metrics()
+        reload_runtime_config()
+
+    assert series['ai_gate_decisions_total{decision="DENY"}'] == 2
+    assert series['ai_gate_decision_latency_seconds_bucket{decision="DENY",le="0.0005"}'] == 1
+    assert series['ai_gate_decision_latency_seconds_bucket{decision="DENY",le="+Inf"}'] == 2
+    assert series['ai_gate_decision_latency_seconds_sum{decision="DENY"}'] == pytest.approx(0.0031)
+    assert series['ai_gate_evidence_outcomes_total{provider="tool",outcome="TIMEOUT"}'] == 1
+    # Gauges: one series per live worker (the exited one is dropped).
+    gauges = {k: v for k, v in series.items() if k.startswith("ai_gate_circuit_breaker_state")}
+    assert gauges == {f'ai_gate_circuit_breaker_state{{provider="tool",pid="{os.getpid()}"}}': 0}
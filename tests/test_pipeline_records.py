@@ -0,0 +1,66 @@
+"""
+Record-based internal pipeline.
+
+decide() runs on PipelineContext / DecisionOutcome and only materializes the
+DecisionResponse model at the end; stage contracts and the response are unchanged.
+"""
+import pytest
+
+from src.core import gate
+from src.core.classifier import classify
+from src.core.gate_helpers import collect_all_evidence
+from src.core.models import DecisionRequest, DecisionResponse, GateContext
+from src.core.records import DecisionOutcome, PipelineContext
+
+_CTX_FIELDS = dict(
+    request_id="records-test",
+    session_id="s-1",
+    user_id="u-1",
+    text="我要申请退款",
+    debug=False,
+    verbose=False,
+    context={"tool_id": "refund.create", "amount": 100, "order_id": "o-1"},
+    structured_input=None,
+)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_context_is_interchangeable_with_gate_context():
+    record_ctx = PipelineContext(**_CTX_FIELDS)
+    model_ctx = GateContext(**_CTX_FIELDS)
+
+    assert (await classify(record_ctx)) == (await classify(model_ctx))
+
+    record_ev = await collect_all_evidence(record_ctx, [])
+    model_ev = await collect_all_evidence(model_ctx, [])
+    assert record_ev.keys() == model_ev.keys()
+    for key in ("tool", "routing", "knowledge", "risk", "permission"):
+        assert record_ev[key].available == model_ev[key].available
+        assert record_ev[key].data == model_ev[key].data
+
+
+def test_pipeline_context_memoizes_analysis():
+    ctx = PipelineContext(**_CTX_FIELDS)
+    assert ctx.analysis is ctx.analysis
+    assert ctx.analysis.text == _CTX_FIELDS["text"]
+
+
+@pytest.mark.asyncio
+async def test_decide_converts_outcome_to_response_once():
+    req = DecisionRequest(text="我要申请退款", context=_CTX_FIELDS["context"], debug=True)
+
+    outcome = await gate._decide(req, "matrices/v0.1.yaml", None)
+    assert isinstance(outcome, DecisionOutcome)
+
+    response = outcome.to_response()
+    assert isinstance(response, DecisionResponse)
+    assert response.request_id == outcome.request_id
+    assert response.decision == outcome.decision
+    assert response.explanation.evidence_used == outcome.evidence_used
+    assert response.policy.rules_fired == outcome.rules_fired
+
+    via_decide = await gate.decide(req)
+    assert isinstance(via_decide, DecisionResponse)
+    assert via_decide.model_dump(exclude={"request_id", "latency_ms"}) == response.model_dump(
+        exclude={"request_id", "latency_ms"}
+    )
@@ -0,0 +1,120 @@
+"""
+Compiled policy bundle (policy_bundle.py): round trip, staleness / corruption
+detection with YAML fallback, and a cold start that parses no YAML.
+"""
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+import yaml
+
+from src.core import config as config_paths
+from src.core import policy_bundle
+from src.core.config_manager import WATCHED_CONFIGS, load_config_document
+from src.core.keyword_engine import get_shared_automaton
+from src.core.matrix import Matrix
+from src.core.policy_bundle import PolicyBundleError, read_policy_bundle, write_policy_bundle
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    path = tmp_path / "policy.bundle"
+    write_policy_bundle(path)
+    return path
+
+
+def test_round_trip_matches_yaml(bundle_path):
+    bundle = read_policy_bundle(bundle_path)
+
+    for name in WATCHED_CONFIGS:
+        assert bundle["documents"][name] == load_config_document(name)
+    assert set(bundle["tables"]["tools_by_id"]) == {
+        t["tool_id"] for t in bundle["documents"]["catalog"]["tools"]
+    }
+
+    text = "我要申请退款，保证收益稳赚不赔"
+    assert bundle["automaton"].find_all(text) == get_shared_automaton().find_all(text)
+
+    compiled = policy_bundle.pickle.loads(bundle["matrices"]["matrices/v0.1.yaml"])
+    fresh = Matrix("v0.1.yaml")
+    assert compiled.version == fresh.version
+    assert compiled.decision_table is not None
+    for risk_level in ("R0", "R1", "R2", "R3"):
+        for action_type in ("READ", "WRITE", "MONEY", "ENTITLEMENT"):
+            assert compiled.match_rule("", action_type, risk_level) == \
+                fresh.match_rule("", action_type, risk_level)
+
+
+def test_stale_bundle_is_rejected(tmp_path, monkeypatch):
+    config_dir = tmp_path / "config"
+    shutil.copytree(config_paths.CONFIG_DIR, config_dir)
+    monkeypatch.setattr(config_paths, "CONFIG_DIR", config_dir)
+    path = tmp_path / "policy.bundle"
+    write_policy_bundle(path)
+    read_policy_bundle(path)
+
+    kb_meta = yaml.safe_load((config_dir / "kb_meta.yaml").read_text(encoding="utf-8"))
+    kb_meta["expired"] = True
+    (config_dir / "kb_meta.yaml").write_text(yaml.safe_dump(kb_meta), encoding="utf-8")
+
+    with pytest.raises(PolicyBundleError, match="stale"):
+        read_policy_bundle(path)
+
+
+@pytest.mark.parametrize("module, symbol", [
+    ("gate.py", "def _config_str_to_index"),
+    ("gate_helpers.py", "def tighten_one_step"),
+])
+def test_compiled_code_change_makes_bundle_stale(tmp_path, monkeypatch, module, symbol):
+    code_dir = tmp_path / "core"
+    shutil.copytree(policy_bundle._CODE_DIR, code_dir, ignore=shutil.ignore_patterns("__pycache__"))
+    monkeypatch.setattr(policy_bundle, "_CODE_DIR", code_dir)
+    path = tmp_path / "policy.bundle"
+    write_policy_bundle(path)
+    read_policy_bundle(path)
+
+    source = (code_dir / module).read_text(encoding="utf-8")
+    assert symbol in source
+    (code_dir / module).write_text(source.replace(symbol, symbol + "_v2"), encoding="utf-8")
+
+    with pytest.raises(PolicyBundleError, match="stale"):
+        read_policy_bundle(path)
+
+
+def test_corrupt_bundle_falls_back_to_yaml(bundle_path, monkeypatch):
+    raw = bytearray(bundle_path.read_bytes())
+    raw[-1] ^= 0xFF
+    bundle_path.write_bytes(bytes(raw))
+    with pytest.raises(PolicyBundleError, match="corrupt"):
+        read_policy_bundle(bundle_path)
+
+    monkeypatch.setattr(config_paths, "POLICY_BUNDLE_PATH", bundle_path)
+    policy_bundle.reset_policy_bundle()
+    try:
+        assert policy_bundle.get_policy_bundle() is None
+        assert policy_bundle.bundled_document("kb_meta") is None
+    finally:
+        policy_bundle.release_policy_bundle()
+
+
+def test_cold_start_from_bundle_parses_no_yaml(bundle_path):
+    probe = (
+        "import yaml\n"
+        "calls = []\n"
+        "_safe_load = yaml.safe_load\n"
+        "yaml.safe_load = lambda *a, **k: calls.append(1) or _safe_load(*a, **k)\n"
+        "import src.api\n"
+        "from src.core.matrix import load_matrix\n"
+        "from src.core.policy_bundle import get_policy_bundle\n"
+        "matrix = load_matrix('matrices/v0.1.yaml')\n"
+        "print(get_policy_bundle() is not None, len(calls), matrix.decision_table is not None)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(config_paths.get_project_root()),
+               AI_RESPONSIBILITY_GATE_POLICY_BUNDLE=str(bundle_path))
+    out = subprocess.run(
+        [sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True,
+        cwd=config_paths.get_project_root(),
+    ).stdout.split()
+    assert out == ["True", "0", "True"]
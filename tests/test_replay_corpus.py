@@ -0,0 +1,50 @@
+"""
+Synthetic corpus generator (src/replay/corpus.py): deterministic per seed,
+exact request count, and every line a valid DecisionRequest drawn from the
+configured vocabularies.
+"""
+import io
+import json
+
+from src.core.models import DecisionRequest
+from src.replay.corpus import CorpusOptions, generate_requests, load_vocabulary, write_corpus
+
+
+def _corpus(options: CorpusOptions, fmt: str = "requests") -> str:
+    out = io.StringIO()
+    write_corpus(out, options, fmt)
+    return out.getvalue()
+
+
+def test_corpus_is_deterministic_per_seed():
+    options = CorpusOptions(count=500, seed=3)
+    assert _corpus(options) == _corpus(options)
+    assert _corpus(options) != _corpus(CorpusOptions(count=500, seed=4))
+
+
+def test_corpus_requests_are_valid_and_use_the_vocabulary():
+    vocab = load_vocabulary()
+    assert "保本" in vocab.risk_keywords and "refund.create" in vocab.tool_ids
+    options = CorpusOptions(count=300, seed=1, keyword_density=1.0, context_rate=1.0,
+                            signals_rate=0.5, loop_state_rate=0.5)
+    bodies = list(generate_requests(options, vocab))
+    assert len(bodies) == 300
+
+    keywords = set(vocab.risk_keywords).union(*vocab.routing.values())
+    for body in bodies:
+        DecisionRequest(**body)
+        assert all(phrase in keywords for phrase in body["text"].split("，"))
+        assert body["context"]["tool_id"] in vocab.tool_ids
+        assert body["context"]["role"] in vocab.roles
+    assert any("loop_state" in body["context"] for body in bodies)
+    assert any("signals" in body.get("structured_input", {}) for body in bodies)
+
+
+def test_corpus_cases_format_groups_sessions():
+    lines = _corpus(CorpusOptions(count=200, seed=2, max_turns=4, loop_state_rate=1.0), "cases").splitlines()
+    cases = [json.loads(line) for line in lines]
+    assert sum(len(case["turns"]) for case in cases) == 200
+    for case in cases:
+        inputs = [turn["input"] for turn in case["turns"]]
+        assert {i["session_id"] for i in inputs} == {case["case_id"]}
+        assert [i["context"]["loop_state"]["round_index"] for i in inputs] == list(range(len(inputs)))
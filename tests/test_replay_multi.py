@@ -0,0 +1,45 @@
+"""
+Multi-matrix replay (src/replay/multi.py): decide_matrices() runs classifier
+and evidence once and gives each matrix the decision decide() would, so the
+multi replay equals one replay_one() per matrix.
+"""
+import pytest
+
+from src.core.gate import decide, decide_matrices
+from src.core.models import DecisionRequest
+from src.replay.corpus import CorpusOptions, generate_requests
+from src.replay.multi import build_report, replay_one_multi, split_results
+from src.replay.parallel import load_cases
+from src.replay.run import replay_one
+
+MATRICES = ["matrices/v0.1.yaml", "matrices/v0.2.yaml", "matrices/pr_loop_demo.yaml"]
+PER_REQUEST_FIELDS = {"request_id", "latency_ms", "timings"}
+
+
+@pytest.mark.asyncio
+async def test_decide_matrices_equals_decide_per_matrix():
+    options = CorpusOptions(count=200, seed=9, signals_rate=0.3, loop_state_rate=0.3)
+    for body in generate_requests(options):
+        req = DecisionRequest(**body, debug=True)
+        responses = await decide_matrices(req, MATRICES)
+        assert len(responses) == len(MATRICES)
+        for path, response in zip(MATRICES, responses):
+            expected = await decide(req, path)
+            assert response.model_dump(exclude=PER_REQUEST_FIELDS) == expected.model_dump(exclude=PER_REQUEST_FIELDS)
+
+
+@pytest.mark.asyncio
+async def test_multi_replay_matches_replay_one_and_reports_pairs():
+    cases = list(load_cases("cases"))
+    multi = [await replay_one_multi(case, MATRICES) for case in cases]
+    for i, path in enumerate(MATRICES):
+        assert [split_results(r, i) for r in multi] == [await replay_one(case, path) for case in cases]
+
+    report = build_report(multi, MATRICES)
+    assert list(report["metrics"]) == MATRICES
+    assert report["metrics"]["matrices/v0.1.yaml"]["accuracy"] == 1.0
+    assert [(p["base"], p["cand"]) for p in report["pairs"]] == [
+        (MATRICES[0], MATRICES[1]), (MATRICES[0], MATRICES[2]), (MATRICES[1], MATRICES[2]),
+    ]
+    for pair in report["pairs"]:
+        assert pair["changed"] == len(pair["changes"]) == sum(pair["transitions"].values())
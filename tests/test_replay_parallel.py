@@ -0,0 +1,42 @@
+"""
+Parallel replay (src/replay/parallel.py): results on a process pool are the
+serial results, in case order, for plain and multi-round cases and for a
+JSONL corpus.
+"""
+import io
+
+from src.replay.corpus import CorpusOptions, write_corpus
+from src.replay.parallel import iter_replay, load_cases
+from src.replay.run import replay_one
+from src.replay.run_pr_loop import replay_pr_loop_case
+
+
+def test_parallel_replay_matches_serial_in_case_order():
+    cases = list(load_cases("cases"))
+    serial = list(iter_replay(cases, replay_one, workers=1))
+    parallel = list(iter_replay(cases, replay_one, workers=2, chunk_size=1))
+    assert parallel == serial
+    assert [r["case_id"] for r in parallel] == [c["case_id"] for c in cases]
+
+
+def test_parallel_replay_keeps_rounds_in_order_with_traces():
+    cases = list(load_cases("cases/pr_loop_real"))
+    serial = list(iter_replay(cases, replay_pr_loop_case, workers=1, verbose=True))
+    parallel = list(iter_replay(cases, replay_pr_loop_case, workers=2, chunk_size=1, verbose=True))
+    assert [r["case_id"] for r in parallel] == [r["case_id"] for r in serial]
+    for p, s in zip(parallel, serial):
+        assert [r["round_index"] for r in p["rounds"]] == list(range(len(s["rounds"])))
+        assert [r["decision"] for r in p["rounds"]] == [r["decision"] for r in s["rounds"]]
+        assert all(r["trace"] for r in p["rounds"])
+
+
+def test_parallel_replay_of_jsonl_corpus(tmp_path):
+    out = io.StringIO()
+    write_corpus(out, CorpusOptions(count=120, seed=5), "cases")
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text(out.getvalue(), encoding="utf-8")
+
+    serial = list(iter_replay(load_cases(corpus), replay_one, workers=1))
+    parallel = list(iter_replay(load_cases(corpus), replay_one, workers=3, chunk_size=4))
+    assert parallel == serial
+    assert sum(len(r["turns"]) for r in parallel) == 120
@@ -4,6 +4,8 @@ from pathlib import Path
 
 import pytest
 
+from src.core.config_registry import clear_documents
+
 
 @pytest.mark.parametrize("missing", [True, False])
 def test_risk_rules_yaml_error_message(monkeypatch, tmp_path, missing: bool):
@@ -29,20 +31,23 @@ def test_risk_rules_yaml_error_message(monkeypatch, tmp_path, missing: bool):
     # 确保后续 import 使用的是当前 monkeypatch 后的配置路径，
     # 具体的 sys.modules 管理在下方统一处理。
 
-    # 根据缺失/语法错误，期望不同的异常类型
-    # 使用重新 import 的方式触发顶层加载逻辑，避免对 reload 语义过度耦合。
+    # 配置由 config_registry 在首次使用时加载：清空已加载的文档并绕过 policy bundle，
+    # 重新 import 后访问 RISK_RULES 触发加载逻辑。
+    monkeypatch.setattr("src.core.policy_bundle._bundle", None)
+    clear_documents()
     sys.modules.pop("src.evidence.risk", None)
+    risk = importlib.import_module("src.evidence.risk")
 
     if missing:
         with pytest.raises(RuntimeError) as exc_info:
-            importlib.import_module("src.evidence.risk")
+            risk.RISK_RULES
         msg = str(exc_info.value)
         assert "Failed to load risk rules configuration" in msg
         # 仅依赖文件名，避免对完整路径格式过度耦合
         assert cfg_path.name in msg
     else:
         with pytest.raises(ValueError) as exc_info:
-            importlib.import_module("src.evidence.risk")
+            risk.RISK_RULES
         msg = str(exc_info.value)
         assert "Invalid YAML in risk_rules.yaml" in msg
         assert "risk_rules.yaml" in msg
@@ -0,0 +1,82 @@
+"""
+RoutingIndex (_action_routing.py): indexed routing hint matching and action
+type inference return exactly what the linear scans over the catalog did.
+"""
+import random
+
+import pytest
+
+from src.core.config_registry import get_document, install_documents
+from src.core.keyword_engine import scan_keywords
+from src.evidence._action_routing import (
+    action_type_from_matches,
+    infer_action_type_from_text,
+    match_routing_hints,
+)
+
+_ALPHABET = "甲乙丙丁戊己"
+
+
+def _linear_matches(text: str, catalog: dict) -> list:
+    keyword_hits = scan_keywords(text)
+    matched = []
+    for hint in catalog.get("routing_hints", []):
+        match_count = sum(1 for kw in hint.get("keywords", []) if kw in keyword_hits)
+        if match_count > 0:
+            matched.append({
+                "tool_id": hint.get("tool_id"),
+                "confidence": min(0.6 + (match_count * 0.1), 0.9),
+                "source": "keyword",
+            })
+    return matched
+
+
+def _linear_action_type(matches: list, catalog: dict) -> str:
+    for match in matches:
+        if match["tool_id"]:
+            for t in catalog.get("tools", []):
+                if t.get("tool_id") == match["tool_id"]:
+                    return t.get("action_type", "READ")
+    return "READ"
+
+
+@pytest.fixture
+def synthetic_catalog():
+    rng = random.Random(3)
+    tools = [
+        {"tool_id": f"t{i}", "action_type": rng.choice(["READ", "WRITE", "MONEY"])} for i in range(20)
+    ]
+    # Duplicate tool_id (first entry wins for action type) and a tool without action_type.
+    tools += [{"tool_id": "t0", "action_type": "ENTITLEMENT"}, {"tool_id": "t20"}]
+    hints = []
+    for i in range(40):
+        # Short keywords from a small alphabet: overlaps, shared and repeated keywords.
+        keywords = ["".join(rng.choice(_ALPHABET) for _ in range(rng.randint(1, 2))) for _ in range(3)]
+        tool_id = rng.choice([f"t{j}" for j in range(21)] + ["unknown", None])
+        hints.append({"tool_id": tool_id, "keywords": keywords})
+    catalog = {"version": "synthetic", "tools": tools, "routing_hints": hints}
+
+    original = get_document("catalog")
+    install_documents({"catalog": catalog})
+    yield catalog
+    install_documents({"catalog": original})
+
+
+def test_index_matches_linear_scan(synthetic_catalog):
+    rng = random.Random(11)
+    texts = ["", "你好"] + ["".join(rng.choice(_ALPHABET + "，好") for _ in range(8)) for _ in range(300)]
+    for text in texts:
+        expected = _linear_matches(text, synthetic_catalog)
+        assert match_routing_hints(text) == expected
+        assert match_routing_hints(text, synthetic_catalog) == expected
+        expected_action_type = _linear_action_type(expected, synthetic_catalog)
+        assert action_type_from_matches(expected) == expected_action_type
+        assert infer_action_type_from_text(text) == expected_action_type
+
+
+def test_shipped_catalog_matches_linear_scan():
+    catalog = get_document("catalog")
+    for text in ["帮我查订单物流", "我要申请退款，不处理就投诉", "改价", "这个政策能不能退", "你好"]:
+        expected = _linear_matches(text, catalog)
+        assert match_routing_hints(text) == expected
+        assert infer_action_type_from_text(text) == _linear_action_type(expected, catalog)
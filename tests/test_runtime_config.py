@@ -0,0 +1,112 @@
+"""
+Frozen GateRuntimeConfig snapshot.
+
+Environment flags are resolved once into an immutable snapshot; requests pin the
+snapshot they started with and reload_runtime_config() swaps it atomically.
+"""
+import dataclasses
+from unittest.mock import patch
+
+import pytest
+
+from src.core import gate, runtime_config
+from src.core.models import Decision, DecisionRequest
+from src.core.runtime_config import GateRuntimeConfig, get_runtime_config, reload_runtime_config
+
+
+def _evidence(meta):
+    ok = lambda data: type("E", (), {"available": True, "data": data})()  # noqa: E731
+    return {
+        "tool": ok({}),
+        "routing": ok({}),
+        "knowledge": ok({}),
+        "risk": ok({"risk_level": "R1", "rules_hit": []}),
+        "permission": ok({"has_access": True}),
+        "_meta": meta,
+    }
+
+
+def test_defaults_match_previous_env_semantics():
+    config = GateRuntimeConfig.from_env({})
+    assert config.evidence_timeout_guard_enabled is False
+    assert config.timeout_guard_overlay_enabled is True
+    assert config.evidence_contract_validation_enabled is True
+    assert config.hitl_overlay_enabled is True
+    assert config.deny_overlay_enabled is True
+    assert config.timeout_guard_policy_version == "v1"
+    assert (config.risk_tier, config.risk_tier_source) == ("R2", "default")
+
+
+def test_tier_overlays_precomputed_with_global_flags():
+    config = GateRuntimeConfig.from_env({"AI_GATE_TIMEOUT_GUARD_HITL_OVERLAY_ENABLED": "false"})
+    for tier in ("R0", "R1", "R2", "R3"):
+        policy = config.overlay_policy(tier)
+        assert policy.hitl_overlay is False
+        # DENY overlay requires the HITL overlay.
+        assert policy.deny_overlay is False
+
+    config = GateRuntimeConfig.from_env({})
+    assert config.overlay_policy("R1").deny_overlay is False
+    assert config.overlay_policy("R3").allow_degraded_to_hitl is True
+    assert config.overlay_policy("bogus") is config.overlay_policy("R2")
+
+
+def test_risk_tier_normalization():
+    assert GateRuntimeConfig.from_env({"AI_GATE_RISK_TIER": " r3 "}).risk_tier == "R3"
+    invalid = GateRuntimeConfig.from_env({"AI_GATE_RISK_TIER": "R9"})
+    assert (invalid.risk_tier, invalid.risk_tier_source) == ("R2", "default")
+
+
+def test_snapshot_is_immutable():
+    config = GateRuntimeConfig.from_env({})
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.risk_tier = "R3"
+    with pytest.raises(TypeError):
+        config.tier_overlays["R0"] = config.tier_overlays["R3"]
+
+
+def test_reload_swaps_snapshot_and_bumps_version():
+    before = get_runtime_config()
+    try:
+        after = reload_runtime_config({"AI_GATE_RISK_TIER": "R0"})
+        assert get_runtime_config() is after
+        assert after.version == before.version + 1
+        assert after.risk_tier == "R0"
+    finally:
+        reload_runtime_config()
+
+
+@pytest.mark.asyncio
+async def test_decide_does_not_read_environment_per_request():
+    req = DecisionRequest(text="test", context={})
+    with patch.object(runtime_config.GateRuntimeConfig, "from_env", side_effect=AssertionError):
+        resp = await gate.decide(req)
+    assert isinstance(resp.decision, Decision)
+
+
+@pytest.mark.asyncio
+async def test_in_flight_request_keeps_its_snapshot():
+    """A reload during evidence collection does not affect the running request."""
+    req = DecisionRequest(text="test", context={})
+    reload_runtime_config({})
+    meta = {"_hitl_suggested": True, "_degradation_suggested": True}
+
+    async def reloading_collect(ctx, trace):
+        # Overlays disabled for every request that starts after this point.
+        reload_runtime_config({"AI_GATE_EVIDENCE_TIMEOUT_GUARD_ENABLED": "false"})
+        return _evidence(meta)
+
+    try:
+        with patch("src.core.gate.collect_all_evidence", new=reloading_collect):
+            in_flight = await gate.decide(req)
+
+        async def plain_collect(ctx, trace):
+            return _evidence(meta)
+
+        with patch("src.core.gate.collect_all_evidence", new=plain_collect):
+            next_request = await gate.decide(req)
+    finally:
+        reload_runtime_config()
+
+    assert in_flight.decision is Decision.DENY
+    assert next_request.decision is not Decision.DENY
@@ -0,0 +1,116 @@
+"""
+Shared circuit breaker backend (shared_circuit_breaker.py): state transitions
+and the HALF_OPEN probe limit are seen by every process mapping the segment.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.core import config as config_paths
+from src.core import gate_helpers, shared_circuit_breaker
+from src.core.gate_helpers import CircuitBreakerState, get_or_create_circuit_breaker_for_provider
+from src.core.runtime_config import GateRuntimeConfig, reload_runtime_config
+from src.core.shared_circuit_breaker import SharedBreakerSegment, SharedCircuitBreaker
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="shared segment needs fcntl / mmap")
+
+_WORKER = """
+import sys
+from pathlib import Path
+from src.core.shared_circuit_breaker import SharedBreakerSegment, SharedCircuitBreaker
+breaker = SharedCircuitBreaker(
+    "permission", SharedBreakerSegment(Path(sys.argv[1])),
+    timeout_threshold=3, initial_cooldown_ms=1000,
+)
+now_ms = int(sys.argv[3])
+if sys.argv[2] == "fail":
+    for _ in range(3):
+        breaker.record_timeout(now_ms)
+print(breaker.should_call_provider(now_ms), breaker.state.value)
+"""
+
+
+def _other_worker(segment_path, action: str, now_ms: int) -> list:
+    return subprocess.run(
+        [sys.executable, "-c", _WORKER, str(segment_path), action, str(now_ms)],
+        env=dict(os.environ, PYTHONPATH=str(config_paths.get_project_root())),
+        capture_output=True, text=True, check=True,
+    ).stdout.split()
+
+
+@pytest.fixture
+def segment_path(tmp_path):
+    return tmp_path / "breakers"
+
+
+def test_open_in_one_worker_is_seen_by_another(segment_path):
+    breaker = SharedCircuitBreaker(
+        "permission", SharedBreakerSegment(segment_path), timeout_threshold=3, initial_cooldown_ms=1000,
+    )
+    assert breaker.should_call_provider(1_000)
+
+    # Another worker pays the three timeouts; this one never called the provider.
+    assert _other_worker(segment_path, "fail", 1_000) == ["False", "OPEN"]
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert breaker.open_count == 1
+    assert not breaker.should_call_provider(1_500)
+
+
+def test_half_open_probe_limit_holds_across_workers(segment_path):
+    breaker = SharedCircuitBreaker(
+        "permission", SharedBreakerSegment(segment_path), timeout_threshold=3,
+        initial_cooldown_ms=1000, half_open_max_probes=1,
+    )
+    for _ in range(3):
+        breaker.record_timeout(1_000)
+
+    # Cooldown over: the other worker takes the single probe, this one is skipped.
+    assert _other_worker(segment_path, "probe", 2_500) == ["True", "HALF_OPEN"]
+    assert not breaker.should_call_provider(2_500)
+    breaker.record_success(2_600)
+    assert breaker.state == CircuitBreakerState.CLOSED
+
+
+def test_registry_uses_shared_backend_when_configured(segment_path):
+    assert GateRuntimeConfig.from_env({}).circuit_breaker_backend == "memory"
+    assert GateRuntimeConfig.from_env({"AI_GATE_CIRCUIT_BREAKER_BACKEND": "bogus"}).circuit_breaker_backend == "memory"
+
+    gate_helpers._reset_circuit_breaker_registry_for_testing()
+    reload_runtime_config({
+        "AI_GATE_CIRCUIT_BREAKER_BACKEND": "shared",
+        "AI_GATE_CIRCUIT_BREAKER_SHM_PATH": str(segment_path),
+    })
+    try:
+        breaker = get_or_create_circuit_breaker_for_provider("knowledge", timeout_threshold=1)
+        assert isinstance(breaker, SharedCircuitBreaker)
+        breaker.record_timeout(1_000)
+        # A fresh handle on the same segment (a restarted worker) sees the open breaker.
+        again = SharedCircuitBreaker("knowledge", SharedBreakerSegment(segment_path))
+        assert again.state == CircuitBreakerState.OPEN
+    finally:
+        gate_helpers._reset_circuit_breaker_registry_for_testing()
+        shared_circuit_breaker.close_shared_segment()
+        reload_runtime_config()
+
+
+def test_segment_of_another_format_is_refused_not_truncated(segment_path):
+    old = SharedBreakerSegment(segment_path, slots=4)
+    breaker = SharedCircuitBreaker("permission", old, timeout_threshold=1)
+    breaker.record_timeout(1_000)
+    size = segment_path.stat().st_size
+    try:
+        header = shared_circuit_breaker._HEADER
+        with open(segment_path, "r+b") as f:
+            f.write(header.pack(shared_circuit_breaker.SEGMENT_MAGIC, shared_circuit_breaker.SEGMENT_FORMAT + 1, 4))
+
+        with pytest.raises(shared_circuit_breaker.SharedBreakerSegmentError, match="format"):
+            SharedBreakerSegment(segment_path)
+        # Still mapped by the old worker: same size, slot intact.
+        assert segment_path.stat().st_size == size
+        assert old.read(0)[0] == b"permission"
+    finally:
+        old.close()
+
+    assert f"_v{shared_circuit_breaker.SEGMENT_FORMAT}_" in shared_circuit_breaker.default_segment_path().name
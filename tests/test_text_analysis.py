@@ -0,0 +1,64 @@
+"""
+Per-request TextAnalysis on GateContext.
+
+Routing-derived facts are computed once per request and shared by the tool,
+routing and permission providers; results match the standalone matchers.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.core import gate_helpers, text_analysis
+from src.core.models import GateContext
+from src.evidence._action_routing import infer_action_type_from_text
+from src.evidence.routing import _match_hints
+from src.evidence.tool import _match_tool_from_routing
+
+
+def _make_ctx(text) -> GateContext:
+    return GateContext(
+        request_id="text-analysis-test",
+        session_id=None,
+        user_id=None,
+        text=text,
+        debug=False,
+        verbose=False,
+        context={},
+        structured_input=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_routing_hints_matched_once_per_request():
+    calls = []
+    real = text_analysis.match_routing_hints
+
+    def counting(text, *args):
+        calls.append(text)
+        return real(text, *args)
+
+    ctx = _make_ctx("我要申请退款，不处理就投诉")
+    with patch("src.core.text_analysis.match_routing_hints", new=counting):
+        evidence = await gate_helpers.collect_all_evidence(ctx, [])
+
+    assert len(calls) == 1
+    assert evidence["tool"].data["tool_id"] == "refund.create"
+    assert evidence["permission"].data["action_type"] == "MONEY"
+    assert {h["tool_id"] for h in evidence["routing"].data["hinted_tools"]} == {
+        "refund.create", "complaint.handle",
+    }
+
+
+@pytest.mark.parametrize("text", ["帮我查订单物流", "改价", "这个政策能不能退", "你好"])
+def test_analysis_matches_standalone_matchers(text):
+    analysis = _make_ctx(text).analysis
+    assert analysis.routing_matches == _match_hints(text)
+    assert analysis.routed_tool_id == _match_tool_from_routing(text)
+    assert analysis.inferred_action_type == infer_action_type_from_text(text)
+
+
+def test_analysis_without_text():
+    analysis = _make_ctx(None).analysis
+    assert analysis.keyword_hits == frozenset()
+    with pytest.raises(TypeError):
+        analysis.routing_matches
@@ -0,0 +1,74 @@
+"""
+Per-stage timings (timings.py): optional in the response, Server-Timing
+header on POST /decision, rolling percentiles at GET /debug/timings.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import app
+from src.core.runtime_config import reload_runtime_config
+from src.core.timings import StageTimings, TimingWindow, reset_timing_window
+
+PIPELINE_STAGES = {"setup", "matrix", "classifier", "evidence", "stages", "postcheck", "total"}
+
+
+@pytest.fixture
+def client():
+    reset_timing_window()
+    yield TestClient(app)
+    reset_timing_window()
+
+
+def test_timings_in_response_and_server_timing_header(client):
+    response = client.post("/decision", json={"text": "帮我查订单物流", "timings": True})
+    assert response.status_code == 200
+    timings = response.json()["timings"]
+    assert PIPELINE_STAGES <= set(timings)
+    assert {"evidence.tool", "evidence.risk"} <= set(timings)
+    assert all(v >= 0 for v in timings.values())
+    sequential = sum(timings[s] for s in PIPELINE_STAGES - {"total"})
+    assert timings["total"] == pytest.approx(sequential, abs=1.0)
+
+    header = response.headers["server-timing"]
+    names = [part.split(";")[0] for part in header.split(", ")]
+    assert names[-1] == "total" and set(timings) == set(names)
+
+    # Not requested: no timings in the body, header still sent.
+    plain = client.post("/decision", json={"text": "帮我查订单物流"})
+    assert plain.json()["timings"] is None
+    assert "total;dur=" in plain.headers["server-timing"]
+
+
+def test_server_timing_header_can_be_disabled(client):
+    reload_runtime_config({"AI_GATE_SERVER_TIMING_ENABLED": "false"})
+    try:
+        response = client.post("/decision", json={"text": "你好"})
+    finally:
+        reload_runtime_config()
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+
+
+def test_debug_timings_reports_percentiles(client):
+    for _ in range(3):
+        client.post("/decision", json={"text": "你好"})
+    summary = client.get("/debug/timings").json()
+    assert summary["recorded"] == 3
+    total = summary["stages"]["total"]
+    assert total["window"] == 3
+    assert 0 <= total["p50_us"] <= total["p99_us"] <= total["max_us"]
+
+
+def test_timing_window_percentiles_over_ring():
+    window = TimingWindow(size=100)
+    for i in range(1, 251):
+        timings = StageTimings()
+        timings.add("stage", i * 1000)
+        window.record(timings)
+    stats = window.summary()["stage"]
+    # The window holds the last 100 decisions: 151..250 us.
+    assert window.recorded == 250 and stats["window"] == 100
+    assert stats["p50_us"] == 200.0
+    assert stats["p90_us"] == 240.0
+    assert stats["p99_us"] == 249.0
+    assert stats["max_us"] == 250.0